@@ -0,0 +1,105 @@
+"""
+benchmarks/json_codec.py
+Encode and decode times of each available JSON codec on a large batch.
+
+The response mimics a batch geocode with census and ACS field appends.
+Run with:
+
+    python benchmarks/json_codec.py [--batch 10000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from geocodio.codec import get_codec
+
+
+def make_response(batch: int) -> dict:
+    acs = {
+        "meta": {
+            "source": "American Community Survey from the US Census Bureau",
+            "survey_years": "2018-2022",
+        },
+        "median_household_income": {
+            "Total": {"value": 112570, "margin_of_error": 4021}
+        },
+        "population_by_age_range": {
+            f"{low}-{low + 4} years": {
+                "value": 100 + low,
+                "margin_of_error": 20,
+                "percentage": 0.05,
+            }
+            for low in range(0, 85, 5)
+        },
+    }
+    result = {
+        "address_components": {
+            "number": "1109",
+            "predirectional": "N",
+            "street": "Highland",
+            "suffix": "St",
+            "formatted_street": "N Highland St",
+            "city": "Arlington",
+            "county": "Arlington County",
+            "state": "VA",
+            "zip": "22201",
+            "country": "US",
+        },
+        "formatted_address": "1109 N Highland St, Arlington, VA 22201",
+        "location": {"lat": 38.886672, "lng": -77.094735},
+        "accuracy": 1,
+        "accuracy_type": "rooftop",
+        "source": "Arlington",
+        "fields": {
+            "timezone": {
+                "name": "America/New_York",
+                "utc_offset": -5,
+                "observes_dst": True,
+            },
+            "acs-economics": acs,
+        },
+    }
+    return {
+        "results": [
+            {
+                "query": f"{i} N Highland St, Arlington VA",
+                "response": {"input": {}, "results": [result]},
+            }
+            for i in range(batch)
+        ]
+    }
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_response(args.batch)
+    body = get_codec("json").dumps(payload)
+    size = len(body) / 1e6
+    print(f"{args.batch:,}-result response, {size:.1f} MB, median of {args.repeat}")
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"  {name:<8} not installed")
+            continue
+        decode = timed(lambda: codec.loads(body), args.repeat)
+        encode = timed(lambda: codec.dumps(payload), args.repeat)
+        print(f"  {name:<8} decode {decode:8.1f} ms   encode {encode:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+benchmarks/metrics_overhead.py
+Cost of MetricsCollector per request, with and without thread contention.
+
+Each request is replayed as the hooks the client calls for it (on_request,
+on_response and on_parse_complete). Run with:
+
+    python benchmarks/metrics_overhead.py [--requests 200000] [--threads 8]
+"""
+
+import argparse
+import threading
+import time
+
+from geocodio.hooks import ParseEvent, RequestEvent
+from geocodio.metrics import MetricsCollector
+
+
+def replay(metrics: MetricsCollector, count: int) -> None:
+    request = RequestEvent(
+        "POST",
+        "/v1.9/geocode",
+        lookups=250,
+        status_code=200,
+        bytes_sent=9000,
+        bytes_received=120000,
+        timings={"total": 0.043},
+    )
+    parsed = ParseEvent("/v1.9/geocode", 250, None, {"parse": 0.004})
+    for _ in range(count):
+        metrics.on_request(request)
+        metrics.on_response(request)
+        metrics.on_parse_complete(parsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    metrics = MetricsCollector()
+    start = time.perf_counter()
+    replay(metrics, args.requests)
+    single = (time.perf_counter() - start) / args.requests
+
+    metrics = MetricsCollector()
+    per_thread = args.requests // args.threads
+    threads = [
+        threading.Thread(target=replay, args=(metrics, per_thread))
+        for _ in range(args.threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    contended = (time.perf_counter() - start) / (per_thread * args.threads)
+
+    start = time.perf_counter()
+    metrics.snapshot()
+    snapshot = time.perf_counter() - start
+
+    print(f"1 thread:          {single * 1e6:6.2f} us per request")
+    print(
+        f"{args.threads} threads:         {contended * 1e6:6.2f} us per request"
+        " (wall clock)"
+    )
+    print(f"snapshot():        {snapshot * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
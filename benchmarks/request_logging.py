@@ -0,0 +1,101 @@
+"""
+benchmarks/request_logging.py
+Per-request logging overhead of ``Geocodio._request`` for a 10,000-address batch.
+
+The API is replaced by an in-memory ``httpx.MockTransport``, so the numbers
+only cover client-side work. Run with:
+
+    python benchmarks/request_logging.py [--batch 10000] [--repeat 20]
+"""
+
+import argparse
+import io
+import json
+import logging
+import statistics
+import time
+
+import httpx
+
+from geocodio import Geocodio
+from geocodio.client import logger
+
+
+def make_client(batch: int, **options) -> Geocodio:
+    body = json.dumps(
+        {
+            "results": [
+                {
+                    "query": f"{i} Main St, Springfield IL",
+                    "response": {"input": {}, "results": []},
+                }
+                for i in range(batch)
+            ]
+        }
+    ).encode()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    return Geocodio(
+        api_key="BENCH", hostname="api.test", transport=transport, **options
+    )
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of ``fn()`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = [f"{i} Main St, Springfield IL" for i in range(args.batch)]
+    logging.basicConfig(level=logging.WARNING)
+    quiet = logging.getLogger("httpx")
+    quiet.setLevel(logging.WARNING)
+
+    client = make_client(args.batch)
+    verbose = make_client(args.batch, log_body_limit=2048)
+
+    def send(c: Geocodio):
+        return lambda: c._request("POST", "/v1.9/geocode", {}, json=payload)
+
+    def raw():
+        client._http.request(
+            "POST", "/v1.9/geocode", json=payload, headers=client._headers()
+        ).content
+
+    def eager():
+        # What every call paid before: the f-strings were built even when DEBUG was off
+        resp = client._request("POST", "/v1.9/geocode", {}, json=payload)
+        f"JSON body: {payload}"
+        f"Response body: {resp.content}"
+
+    logger.setLevel(logging.INFO)
+    baseline = timed(raw, args.repeat)
+    rows = [
+        ("httpx only", baseline),
+        ("_request, INFO", timed(send(client), args.repeat)),
+        ("_request, INFO, eager f-strings", timed(eager, args.repeat)),
+    ]
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.StreamHandler(io.StringIO()))
+    logger.propagate = False
+    rows.append(("_request, DEBUG, bodies off", timed(send(client), args.repeat)))
+    rows.append(
+        ("_request, DEBUG, log_body_limit=2048", timed(send(verbose), args.repeat))
+    )
+
+    print(f"{args.batch:,}-address batch, median of {args.repeat} requests")
+    for label, ms in rows:
+        print(f"  {label:<38} {ms:8.2f} ms  ({ms - baseline:+6.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+benchmarks/typed_decoding.py
+Response bytes to result objects: codec plus dataclass models versus typed
+msgspec structs.
+
+Uses the batch geocode response from json_codec.py and a distance matrix
+with the same number of cells. Run with:
+
+    python benchmarks/typed_decoding.py [--batch 10000] [--repeat 5]
+"""
+
+import argparse
+import math
+
+from json_codec import make_response, timed
+
+from geocodio import Geocodio
+from geocodio.models import DistanceMatrixResponse
+from geocodio.typed import TypedDecoder
+
+
+def make_matrix(cells: int) -> dict:
+    side = max(1, math.isqrt(cells))
+    destinations = [
+        {
+            "query": f"38.{j},-77.{j}",
+            "location": [38.0 + j / 1000, -77.0 - j / 1000],
+            "id": f"d{j}",
+            "distance_miles": 1.5 * j,
+            "distance_km": 2.4 * j,
+            "duration_seconds": 60 * j,
+        }
+        for j in range(side)
+    ]
+    return {
+        "mode": "driving",
+        "results": [
+            {
+                "origin": {
+                    "query": f"39.{i},-76.{i}",
+                    "location": [39.0, -76.0],
+                    "id": f"o{i}",
+                },
+                "destinations": destinations,
+            }
+            for i in range(side)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    typed = TypedDecoder()
+    print(f"median of {args.repeat}")
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            client = Geocodio("BENCHMARK_KEY", json_codec=name)
+        except ImportError:
+            print(f"  {name:<8} not installed")
+            continue
+        codec = client.json_codec
+        body = codec.dumps(make_response(args.batch))
+        matrix = codec.dumps(make_matrix(args.batch))
+
+        models = timed(
+            lambda: client._parse_geocoding_response(codec.loads(body)), args.repeat
+        )
+        structs = timed(lambda: typed.geocoding(body, batch=True), args.repeat)
+        print(f"  geocode, {args.batch:,} results  {name:<8} models {models:8.1f} ms   "
+              f"typed {structs:8.1f} ms   {models / structs:4.1f}x")
+
+        models = timed(
+            lambda: DistanceMatrixResponse.from_api(codec.loads(matrix)), args.repeat
+        )
+        structs = timed(lambda: typed.distance_matrix(matrix), args.repeat)
+        print(f"  matrix,  {args.batch:,} cells    {name:<8} models {models:8.1f} ms   "
+              f"typed {structs:8.1f} ms   {models / structs:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
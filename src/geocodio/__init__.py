@@ -5,6 +5,14 @@ A Python client for the Geocodio API.
 
 from ._version import __version__
 from .client import Geocodio
+from .async_client import AsyncGeocodio
+from .cache import CacheBackend, MemoryCache, SQLiteCache, CacheStats
+from .retry import RetryPolicy, RetryStats
+from .ratelimit import RateLimiter
+from .hooks import CallbackHooks, ClientHooks, ParseEvent, RequestEvent
+from .metrics import MetricsCollector
+from .spatial import DestinationIndex
+from .matrix import CompactDistanceMatrix, DenseDistanceMatrix
 
 # Distance API exports
 from .distance import (
@@ -25,11 +33,29 @@ from .models import (
     DistanceDestination,
     DistanceOrigin,
     DistanceJobResponse,
+    DistanceJobState,
     DistanceMatrixResult,
 )
 
 __all__ = [
     "Geocodio",
+    "AsyncGeocodio",
+    # Caching
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "CacheStats",
+    # Retries
+    "RetryPolicy",
+    "RetryStats",
+    # Rate limiting
+    "RateLimiter",
+    # Lifecycle hooks
+    "ClientHooks",
+    "CallbackHooks",
+    "RequestEvent",
+    "ParseEvent",
+    "MetricsCollector",
     "__version__",
     # Distance types
     "Coordinate",
@@ -38,7 +64,11 @@ __all__ = [
     "DistanceDestination",
     "DistanceOrigin",
     "DistanceJobResponse",
+    "DistanceJobState",
     "DistanceMatrixResult",
+    "DestinationIndex",
+    "CompactDistanceMatrix",
+    "DenseDistanceMatrix",
     # Distance mode constants
     "DISTANCE_MODE_STRAIGHTLINE",
     "DISTANCE_MODE_DRIVING",
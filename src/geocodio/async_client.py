@@ -0,0 +1,1003 @@
+"""
+src/geocodio/async_client.py
+High‑level asyncio client for the Geocodio API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import time
+from collections import deque
+from contextlib import aclosing
+from itertools import islice
+from typing import (
+    Any, AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, BinaryIO, Callable,
+    Iterable, List, Union, Dict, Tuple, Optional, Literal, overload,
+)
+
+import httpx
+
+from geocodio.batch import merge_batch_payloads
+from geocodio.download import (
+    DEFAULT_CHUNK_SIZE, Destination, ProgressCallback, discard_partial, is_path,
+    partial_size, resume_offset,
+)
+from geocodio.upload import UploadSource
+from geocodio.jobs import (
+    DEFAULT_MAX_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL, JobSchedule,
+    distance_job_progress, list_progress,
+)
+from geocodio.sharding import merge_csv_files, split_csv
+from geocodio.matrix import CompactDistanceMatrix
+from geocodio.client import _BaseGeocodio, _PreparedRequest, logger
+from geocodio.exceptions import GeocodioError, RangeNotSatisfiableError
+from geocodio.hooks import PhaseTimer
+from geocodio.models import (
+    GeocodingResponse, BatchGeocodingItem, ListResponse, PaginatedResponse,
+    DistanceResponse, DistanceMatrixResponse, DistanceJobResponse,
+)
+from geocodio.distance import (
+    Coordinate,
+    DISTANCE_MODE_STRAIGHTLINE,
+    DISTANCE_UNITS_MILES,
+    DISTANCE_ORDER_BY_DISTANCE,
+    DISTANCE_SORT_ASC,
+)
+
+
+async def _aiter_chunks(
+        items: Union[Iterable[Any], AsyncIterable[Any]], chunk_size: int
+) -> AsyncIterator[Tuple[int, List[Any]]]:
+    """
+    Async counterpart of :func:`geocodio.batch.iter_chunks` that also accepts
+    async iterables.
+    """
+    offset = 0
+    if not hasattr(items, "__aiter__"):
+        iterator = iter(items)
+        while chunk := list(islice(iterator, chunk_size)):
+            yield offset, chunk
+            offset += len(chunk)
+        return
+
+    batch: List[Any] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) == chunk_size:
+            yield offset, batch
+            offset += len(batch)
+            batch = []
+    if batch:
+        yield offset, batch
+
+
+class AsyncGeocodio(_BaseGeocodio):
+    """
+    Asyncio counterpart of :class:`geocodio.Geocodio`.
+
+    Every public method of the sync client is available as a coroutine with the
+    same arguments and return types. Requests share one ``httpx.AsyncClient``,
+    so many lookups can run concurrently on a single event loop.
+
+    Example:
+        >>> async with AsyncGeocodio("YOUR_API_KEY") as client:
+        ...     responses = await asyncio.gather(
+        ...         client.geocode("1600 Pennsylvania Ave, Washington, DC"),
+        ...         client.reverse((38.9002898, -76.9990361)),
+        ...     )
+    """
+
+    def _create_http_client(self, options: Dict[str, Any]) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**options)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    async def warm_up(self, connections: int = 1) -> int:
+        """
+        Open connections ahead of the first request.
+        See :meth:`geocodio.Geocodio.warm_up`.
+        """
+        count = self._warm_up_count(connections)
+
+        async def ping() -> bool:
+            try:
+                await self._http.request(
+                    "HEAD", "/", headers=self._headers(), timeout=self.single_timeout
+                )
+            except httpx.HTTPError as exc:
+                self._warm_up_failed(exc)
+                return False
+            return True
+
+        return sum(await asyncio.gather(*(ping() for _ in range(count))))
+
+    async def __aenter__(self) -> "AsyncGeocodio":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Public methods
+    # ──────────────────────────────────────────────────────────────────────────
+
+    async def geocode(
+        self,
+        address: Union[
+            str,
+            Dict[str, str],
+            List[Union[str, Dict[str, str]]],
+            Dict[str, Union[str, Dict[str, str]]],
+        ],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        country: Optional[str] = None,
+        # Distance parameters
+        destinations: Optional[
+            List[Union[str, Tuple[float, float], "Coordinate"]]
+        ] = None,
+        distance_mode: Optional[str] = None,
+        distance_units: Optional[str] = None,
+        distance_max_results: Optional[int] = None,
+        distance_max_distance: Optional[float] = None,
+        distance_max_duration: Optional[int] = None,
+        distance_min_distance: Optional[float] = None,
+        distance_min_duration: Optional[int] = None,
+        distance_order_by: Optional[str] = None,
+        distance_sort_order: Optional[str] = None,
+    ) -> GeocodingResponse:
+        req = self._build_geocode_request(
+            address, fields, limit, country, destinations,
+            distance_mode, distance_units, distance_max_results,
+            distance_max_distance, distance_max_duration,
+            distance_min_distance, distance_min_duration,
+            distance_order_by, distance_sort_order,
+        )
+        return self._parse_lookup(
+            req, await self._send_lookup(req), keys=self._batch_keys(req)
+        )
+
+    async def reverse(
+        self,
+        coordinate: Union[
+            str, Tuple[float, float], List[Union[str, Tuple[float, float]]]
+        ],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        # Distance parameters
+        destinations: Optional[
+            List[Union[str, Tuple[float, float], "Coordinate"]]
+        ] = None,
+        distance_mode: Optional[str] = None,
+        distance_units: Optional[str] = None,
+        distance_max_results: Optional[int] = None,
+        distance_max_distance: Optional[float] = None,
+        distance_max_duration: Optional[int] = None,
+        distance_min_distance: Optional[float] = None,
+        distance_min_duration: Optional[int] = None,
+        distance_order_by: Optional[str] = None,
+        distance_sort_order: Optional[str] = None,
+    ) -> GeocodingResponse:
+        req = self._build_reverse_request(
+            coordinate, fields, limit, destinations,
+            distance_mode, distance_units, distance_max_results,
+            distance_max_distance, distance_max_duration,
+            distance_min_distance, distance_min_duration,
+            distance_order_by, distance_sort_order,
+        )
+        return self._parse_lookup(
+            req, await self._send_lookup(req), keys=self._batch_keys(req)
+        )
+
+    async def geocode_stream(
+        self,
+        addresses: Union[
+            Iterable[Union[str, Dict[str, str]]],
+            AsyncIterable[Union[str, Dict[str, str]]],
+        ],
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **options,
+    ) -> AsyncIterator[Tuple[int, BatchGeocodingItem]]:
+        """
+        Geocode a (sync or async) iterable of addresses, yielding
+        ``(index, item)`` pairs as chunks complete.
+        See :meth:`geocodio.Geocodio.geocode_stream`.
+        """
+        async with aclosing(
+            self._stream_lookup(
+                self._build_geocode_request, addresses, chunk_size, concurrency,
+                ordered, options,
+            )
+        ) as pairs:
+            async for pair in pairs:
+                yield pair
+
+    async def reverse_stream(
+        self,
+        coordinates: Union[
+            Iterable[Union[str, Tuple[float, float]]],
+            AsyncIterable[Union[str, Tuple[float, float]]],
+        ],
+        chunk_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+        **options,
+    ) -> AsyncIterator[Tuple[int, BatchGeocodingItem]]:
+        """
+        Reverse geocode a (sync or async) iterable of coordinates, yielding
+        ``(index, item)`` pairs as chunks complete.
+        See :meth:`geocodio.Geocodio.reverse_stream`.
+        """
+        async with aclosing(
+            self._stream_lookup(
+                self._build_reverse_request, coordinates, chunk_size, concurrency,
+                ordered, options,
+            )
+        ) as pairs:
+            async for pair in pairs:
+                yield pair
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Internal helpers
+    # ──────────────────────────────────────────────────────────────────────────
+
+    async def _send_lookup(self, req: _PreparedRequest) -> Union[dict, bytes]:
+        """Send a geocode/reverse request through the cache, if one is configured."""
+        cache = self.cache
+        if cache is None:
+            return await self._dispatch_lookup(req, raw=self.typed_decoding)
+
+        plan = self._plan_cached_lookup(cache, req)
+        payload = (
+            await self._dispatch_lookup(plan.miss_request)
+            if plan.miss_request
+            else None
+        )
+        return self._complete_cached_lookup(cache, plan, payload)
+
+    async def _stream_lookup(
+            self,
+            build: Callable[..., _PreparedRequest],
+            inputs: Union[Iterable, AsyncIterable],
+            chunk_size: Optional[int],
+            concurrency: Optional[int],
+            ordered: bool,
+            options: dict,
+    ) -> AsyncGenerator[Tuple[int, BatchGeocodingItem], None]:
+        chunk_size, concurrency = self._stream_settings(chunk_size, concurrency)
+
+        async def run(offset: int, chunk: list) -> List[Tuple[int, BatchGeocodingItem]]:
+            req = build(chunk, **options)
+            response = self._parse_lookup(req, await self._send_lookup(req))
+            return self._stream_pairs(offset, response)
+
+        pending: "deque[asyncio.Task]" = deque()
+
+        async def collect(keep: int) -> AsyncIterator[Tuple[int, BatchGeocodingItem]]:
+            # Yield finished chunks until at most ``keep`` are still in flight
+            while len(pending) > keep:
+                if ordered:
+                    for pair in await pending.popleft():
+                        yield pair
+                    continue
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.remove(task)
+                    for pair in task.result():
+                        yield pair
+
+        try:
+            async for offset, chunk in _aiter_chunks(inputs, chunk_size):
+                pending.append(asyncio.ensure_future(run(offset, chunk)))
+                async for pair in collect(concurrency - 1):
+                    yield pair
+            async for pair in collect(0):
+                yield pair
+        finally:
+            for task in pending:
+                task.cancel()
+            # Wait for the cancellations so no request outlives the stream
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @overload
+    async def _dispatch_lookup(
+        self, req: _PreparedRequest, raw: Literal[False] = ...
+    ) -> dict:
+        ...
+
+    @overload
+    async def _dispatch_lookup(
+        self, req: _PreparedRequest, raw: bool
+    ) -> Union[dict, bytes]:
+        ...
+
+    async def _dispatch_lookup(
+        self, req: _PreparedRequest, raw: bool = False
+    ) -> Union[dict, bytes]:
+        """Async counterpart of :meth:`geocodio.Geocodio._dispatch_lookup`."""
+        chunks = self._split_batch_request(req) if req.json is not None else [req]
+        if len(chunks) == 1:
+            response = await self._request(
+                req.method,
+                req.endpoint,
+                req.params,
+                json=req.json,
+                timeout=req.timeout,
+                idempotent=True,
+                lookups=self._lookup_count(req),
+            )
+            return response.content if raw else self._decode(response)
+
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def send(chunk: _PreparedRequest) -> dict:
+            async with semaphore:
+                response = await self._request(
+                    chunk.method,
+                    chunk.endpoint,
+                    chunk.params,
+                    json=chunk.json,
+                    timeout=chunk.timeout,
+                    idempotent=True,
+                    lookups=self._lookup_count(chunk),
+                )
+                return self._decode(response)
+
+        logger.debug(
+            "Sending batch as %d chunks of up to %d lookups",
+            len(chunks),
+            self.batch_size,
+        )
+        payloads = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        return merge_batch_payloads(list(payloads))
+
+    async def _request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[dict] = None,
+            json: Optional[Union[dict, list]] = None,
+            files: Optional[dict] = None,
+            timeout: Optional[float] = None,
+            idempotent: Optional[bool] = None,
+            lookups: int = 0,
+            headers: Optional[dict] = None,
+            content: Any = None,
+            stream: bool = False,
+    ) -> httpx.Response:
+        if timeout is None:
+            timeout = self.single_timeout
+        self._log_request(method, endpoint, params, timeout, json, files)
+
+        headers = {**self._headers(), **(headers or {})}
+        if json is not None:
+            content = self._encode_body(json, headers)
+            json = None
+
+        attempt = 1
+        while True:
+            event = self._start_attempt(method, endpoint, lookups, attempt)
+            started = time.perf_counter()
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(lookups)
+                if event is not None:
+                    event.timings["rate_limit"] = time.perf_counter() - started
+            extensions = None
+            if event is not None:
+                extensions = {"trace": PhaseTimer(event.timings).atrace}
+                self._emit("on_request", event)
+            try:
+                if stream:
+                    request = self._http.build_request(
+                        method,
+                        endpoint,
+                        params=params,
+                        json=json,
+                        files=files,
+                        content=content,
+                        headers=headers,
+                        timeout=timeout,
+                        extensions=extensions,
+                    )
+                    resp = await self._http.send(request, stream=True)
+                else:
+                    resp = await self._http.request(
+                        method,
+                        endpoint,
+                        params=params,
+                        json=json,
+                        files=files,
+                        content=content,
+                        headers=headers,
+                        timeout=timeout,
+                        extensions=extensions,
+                    )
+            except Exception as exc:
+                if event is not None:
+                    self._finish_attempt(event, started, exception=exc)
+                delay = self._retry_delay(
+                    method, endpoint, idempotent, attempt, exception=exc
+                )
+                if delay is None:
+                    self._failed(event, exc)
+                    raise
+            else:
+                if event is not None:
+                    self._finish_attempt(event, started, response=resp)
+                delay = self._retry_delay(
+                    method, endpoint, idempotent, attempt, response=resp
+                )
+                if delay is None:
+                    break
+                await resp.aclose()
+            self._retrying(event, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if stream and resp.status_code >= 400:
+            # Error bodies are small; read them so they can be reported
+            await resp.aread()
+
+        self._log_response(resp, stream)
+        try:
+            return self._handle_error_response(resp)
+        except GeocodioError as exc:
+            self._failed(event, exc)
+            raise
+
+    async def _download_to(
+            self,
+            kind: str,
+            ident: Union[str, int],
+            endpoint: str,
+            destination: Destination,
+            progress: Optional[ProgressCallback],
+            chunk_size: int,
+            resume: bool,
+    ) -> Union[str, BinaryIO]:
+        """
+        Stream a download body to ``destination`` chunk by chunk.
+
+        With ``resume`` an existing partial file is continued with a ``Range``
+        request, and a connection dropped mid-body is resumed from the last
+        byte written whenever the retry policy allows another attempt.
+        """
+        if resume and not is_path(destination):
+            raise ValueError("resume=True requires a file path destination")
+        offset = partial_size(destination) if resume else 0
+        attempt = 1
+        restarted = False
+        while True:
+            # Ranges count bytes of the encoded body, so resumable downloads
+            # ask for it unencoded
+            headers = {"Accept-Encoding": "identity"} if resume else {}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            try:
+                response = await self._request(
+                    "GET",
+                    endpoint,
+                    timeout=self.list_timeout,
+                    headers=headers,
+                    stream=True,
+                )
+            except RangeNotSatisfiableError:
+                # Only a ranged request can be answered by starting over, and only once
+                if not offset or restarted:
+                    raise
+                logger.info(
+                    "Partial %s %s does not match the remote file; "
+                    "downloading it again", kind, ident,
+                )
+                discard_partial(destination)
+                offset = 0
+                restarted = True
+                continue
+            try:
+                if kind == "list" and self._is_download_error(response):
+                    await response.aread()
+                    self._raise_list_download_error(ident, response)
+                position = resume_offset(response, offset)
+                if position is None:
+                    logger.info(
+                        "Server returned an unexpected range for %s %s; "
+                        "downloading it again", kind, ident,
+                    )
+                    discard_partial(destination)
+                    offset = 0
+                    continue
+                sink = self._open_download_sink(
+                    kind, ident, destination, progress,
+                    *position,
+                    keep_partial=resume,
+                    chunk_size=chunk_size,
+                )
+                try:
+                    # Unbuffered, so bytes received before a dropped connection are kept
+                    async for chunk in response.aiter_bytes():
+                        sink.write(chunk)
+                except httpx.TransportError as exc:
+                    sink.abort()
+                    delay = (
+                        self._retry_delay("GET", endpoint, True, attempt, exception=exc)
+                        if resume
+                        else None
+                    )
+                    if delay is None:
+                        raise
+                    offset = sink.size
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                except BaseException as e:
+                    sink.abort()
+                    if isinstance(e, OSError):
+                        raise self._download_failed(kind, ident, e)
+                    raise
+                return self._finish_download(kind, ident, sink)
+            finally:
+                await response.aclose()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # List API methods
+    # ──────────────────────────────────────────────────────────────────────────
+
+    async def create_list(
+            self,
+            file: Optional[UploadSource] = None,
+            filename: Optional[str] = None,
+            direction: str = _BaseGeocodio.DIRECTION_FORWARD,
+            format_: Optional[str] = "{{A}}",
+            callback_url: Optional[str] = None,
+            fields: list[str] | None = None,
+            compress: bool = False,
+    ) -> ListResponse:
+        """Create a new geocoding list. See :meth:`geocodio.Geocodio.create_list`."""
+        req = self._build_create_list_request(
+            file, filename, direction, format_, callback_url, fields, compress
+        )
+        if req.upload is not None:
+            response = await self._request(
+                req.method, req.endpoint, req.params, content=req.upload.aiter_bytes(),
+                headers={"Content-Type": req.upload.content_type}, timeout=req.timeout,
+            )
+        else:
+            response = await self._request(
+                req.method,
+                req.endpoint,
+                req.params,
+                files=req.files,
+                timeout=req.timeout,
+            )
+        return self._parse_list_response(self._decode(response), response=response)
+
+    async def get_lists(self, page: int = 1) -> PaginatedResponse:
+        """Retrieve one page of lists. See :meth:`geocodio.Geocodio.get_lists`."""
+        endpoint = f"{self.BASE_PATH}/lists"
+        params: Dict[str, int] = {}
+        if page > 1:
+            params["page"] = page
+        response = await self._request(
+            "GET", endpoint, params, timeout=self.list_timeout
+        )
+        return self._parse_lists_page(response)
+
+    async def iter_lists(self, prefetch: bool = True) -> AsyncIterator[ListResponse]:
+        """
+        Iterate over every list on the account.
+        See :meth:`geocodio.Geocodio.iter_lists`.
+        """
+        async for item in self._iter_pages(self.get_lists, prefetch):
+            yield item
+
+    async def _iter_pages(
+        self, fetch: Callable[[int], Awaitable[PaginatedResponse]], prefetch: bool,
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the items of each page from ``fetch(page)``, fetching at most one
+        page ahead.
+        """
+        upcoming: Optional[asyncio.Task] = None
+        try:
+            page = await fetch(1)
+            while True:
+                number = self._next_page_number(page)
+                if prefetch and number:
+                    upcoming = asyncio.ensure_future(fetch(number))
+                for item in page.data:
+                    yield item
+                if number is None:
+                    return
+                page = await upcoming if upcoming is not None else await fetch(number)
+                upcoming = None
+        finally:
+            if (
+                upcoming is not None
+                and not upcoming.cancel()
+                and not upcoming.cancelled()
+            ):
+                upcoming.exception()  # already finished: mark any error as retrieved
+
+    async def get_list(self, list_id: str) -> ListResponse:
+        """Retrieve a list by ID. See :meth:`geocodio.Geocodio.get_list`."""
+        endpoint = f"{self.BASE_PATH}/lists/{list_id}"
+        response = await self._request("GET", endpoint, {}, timeout=self.list_timeout)
+        return self._parse_list_response(self._decode(response), response=response)
+
+    async def delete_list(self, list_id: str) -> None:
+        """Delete a list. See :meth:`geocodio.Geocodio.delete_list`."""
+        endpoint = f"{self.BASE_PATH}/lists/{list_id}"
+        await self._request("DELETE", endpoint, {}, timeout=self.list_timeout)
+
+    async def _delete_list_quietly(self, list_id: str) -> bool:
+        """Delete a list during cleanup, logging instead of raising on failure."""
+        try:
+            await self.delete_list(list_id)
+        except (GeocodioError, httpx.HTTPError):
+            logger.warning("Could not delete list %s", list_id, exc_info=True)
+            return False
+        return True
+
+    async def download(
+            self,
+            list_id: str,
+            filename: Optional[Destination] = None,
+            progress: Optional[ProgressCallback] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            resume: bool = False,
+    ) -> str | bytes | BinaryIO:
+        """Download a geocoded list. See :meth:`geocodio.Geocodio.download`."""
+        endpoint = f"{self.BASE_PATH}/lists/{list_id}/download"
+        if filename is None:
+            response = await self._request(
+                "GET", endpoint, {}, timeout=self.list_timeout
+            )
+            return self._save_list_download(list_id, response)
+
+        return await self._download_to(
+            "list", list_id, endpoint, filename, progress, chunk_size, resume
+        )
+
+    async def geocode_file(
+            self,
+            path: Union[str, "os.PathLike[str]"],
+            output: Optional[Destination] = None,
+            shards: int = 4,
+            header: bool = True,
+            direction: str = _BaseGeocodio.DIRECTION_FORWARD,
+            format_: Optional[str] = "{{A}}",
+            fields: list[str] | None = None,
+            compress: bool = False,
+            timeout: Optional[float] = None,
+            min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+            max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+            keep_lists: bool = False,
+    ) -> str | BinaryIO:
+        """
+        Geocode a large CSV file across several lists.
+        See :meth:`geocodio.Geocodio.geocode_file`.
+        """
+        plan = await asyncio.to_thread(split_csv, path, shards, header)
+        if output is None:
+            stem, _ = os.path.splitext(os.path.abspath(os.fspath(path)))
+            output = f"{stem}.geocoded.csv"
+
+        created = await asyncio.gather(
+            *(
+                self.create_list(
+                    shard, shard.name, direction, format_,
+                    fields=fields,
+                    compress=compress,
+                )
+                for shard in plan.shards
+            ),
+            return_exceptions=True,
+        )
+        list_ids, error = self._created_list_ids(created)
+        if error is not None:
+            remaining = list_ids
+            if not keep_lists:
+                deleted = await asyncio.gather(
+                    *(self._delete_list_quietly(i) for i in list_ids)
+                )
+                remaining = [i for i, ok in zip(list_ids, deleted) if not ok]
+            raise self._shard_upload_failed(error, list_ids, remaining)
+        logger.info("Geocoding %s as %d lists: %s", path, len(list_ids), list_ids)
+
+        schedule = JobSchedule(
+            list_ids, timeout, min_interval, max_interval, label="Lists"
+        )
+        async for finished in self._poll_until_finished(
+            schedule, self.get_list, list_progress, len(list_ids)
+        ):
+            self._check_list_finished(finished)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            parts = [os.path.join(tmp, f"{i}.csv") for i in range(len(list_ids))]
+            await asyncio.gather(
+                *(
+                    self.download(list_id, part)
+                    for list_id, part in zip(list_ids, parts)
+                )
+            )
+            merged = await asyncio.to_thread(
+                merge_csv_files, parts, output, skip_header=header
+            )
+
+        if not keep_lists:
+            await asyncio.gather(*(self.delete_list(list_id) for list_id in list_ids))
+        return merged
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Distance API methods
+    # ──────────────────────────────────────────────────────────────────────────
+
+    async def distance(
+        self,
+        origin: Union[str, Tuple[float, float], "Coordinate"],
+        destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+        mode: str = DISTANCE_MODE_STRAIGHTLINE,
+        units: str = DISTANCE_UNITS_MILES,
+        max_results: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        max_duration: Optional[int] = None,
+        min_distance: Optional[float] = None,
+        min_duration: Optional[int] = None,
+        order_by: str = DISTANCE_ORDER_BY_DISTANCE,
+        sort_order: str = DISTANCE_SORT_ASC,
+    ) -> DistanceResponse:
+        """
+        Single origin to many destinations.
+        See :meth:`geocodio.Geocodio.distance`.
+        """
+        local = self._local_distance_request(
+            [origin], destinations, mode, units, max_results, max_distance,
+            min_distance, sort_order,
+        )
+        if local is not None:
+            return self._single_origin_response(local)
+
+        req = self._build_distance_request(
+            origin, destinations, mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        response = await self._request(
+            req.method, req.endpoint, req.params, timeout=req.timeout
+        )
+        return self._timed_parse(
+            req.endpoint, 1 + len(destinations), lambda: self._parse_distance(response)
+        )
+
+    async def distance_matrix(
+        self,
+        origins: List[Union[str, Tuple[float, float], "Coordinate"]],
+        destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+        mode: str = DISTANCE_MODE_STRAIGHTLINE,
+        units: str = DISTANCE_UNITS_MILES,
+        max_results: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        max_duration: Optional[int] = None,
+        min_distance: Optional[float] = None,
+        min_duration: Optional[int] = None,
+        order_by: str = DISTANCE_ORDER_BY_DISTANCE,
+        sort_order: str = DISTANCE_SORT_ASC,
+        compact: bool = False,
+    ) -> Union[DistanceMatrixResponse, CompactDistanceMatrix]:
+        """
+        Origins × destinations matrix.
+        See :meth:`geocodio.Geocodio.distance_matrix`.
+        """
+        local = self._local_distance_request(
+            origins, destinations, mode, units, max_results, max_distance, min_distance,
+            sort_order,
+        )
+        if local is not None:
+            return self._finish_matrix(local, destinations, compact)
+
+        plan = self._plan_matrix_tiles(
+            origins, destinations, mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        if plan is not None:
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+            async def send(tile: _PreparedRequest) -> dict:
+                async with semaphore:
+                    response = await self._request(
+                        tile.method,
+                        tile.endpoint,
+                        json=tile.json,
+                        timeout=tile.timeout,
+                        idempotent=True,
+                    )
+                    return self._decode(response)
+
+            payloads = await asyncio.gather(*(send(tile) for tile in plan.requests))
+            return self._timed_parse(
+                plan.requests[0].endpoint, len(origins) + len(destinations),
+                lambda: self._merge_matrix_tiles(plan, list(payloads), compact),
+            )
+
+        req = self._build_distance_matrix_request(
+            origins, destinations, mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        response = await self._request(
+            req.method,
+            req.endpoint,
+            json=req.json,
+            timeout=req.timeout,
+            idempotent=True,
+        )
+        return self._timed_parse(
+            req.endpoint,
+            len(origins) + len(destinations),
+            lambda: self._finish_matrix(
+                self._parse_distance_matrix(response), destinations, compact
+            ),
+        )
+
+    async def create_distance_matrix_job(
+        self,
+        name: str,
+        origins: Union[List[Union[str, Tuple[float, float], "Coordinate"]], int],
+        destinations: Union[List[Union[str, Tuple[float, float], "Coordinate"]], int],
+        mode: str = DISTANCE_MODE_STRAIGHTLINE,
+        units: str = DISTANCE_UNITS_MILES,
+        callback_url: Optional[str] = None,
+        max_results: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        max_duration: Optional[int] = None,
+        min_distance: Optional[float] = None,
+        min_duration: Optional[int] = None,
+        order_by: str = DISTANCE_ORDER_BY_DISTANCE,
+        sort_order: str = DISTANCE_SORT_ASC,
+    ) -> DistanceJobResponse:
+        """
+        Create a distance matrix job.
+        See :meth:`geocodio.Geocodio.create_distance_matrix_job`.
+        """
+        req = self._build_create_distance_matrix_job_request(
+            name, origins, destinations, mode, units, callback_url, max_results,
+            max_distance, max_duration, min_distance, min_duration, order_by,
+            sort_order,
+        )
+        response = await self._request(
+            req.method, req.endpoint, json=req.json, timeout=req.timeout
+        )
+        return DistanceJobResponse.from_api(self._decode(response))
+
+    async def distance_matrix_job_status(
+        self, job_id: Union[str, int]
+    ) -> DistanceJobResponse:
+        """Get the status of a distance matrix job."""
+        endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}"
+        response = await self._request("GET", endpoint, timeout=self.list_timeout)
+        return DistanceJobResponse.from_api(self._decode(response))
+
+    async def distance_matrix_jobs(self, page: int = 1) -> PaginatedResponse:
+        """List all distance matrix jobs."""
+        endpoint = f"{self.BASE_PATH}/distance-jobs"
+        params: Dict[str, int] = {}
+        if page > 1:
+            params["page"] = page
+
+        response = await self._request(
+            "GET", endpoint, params, timeout=self.list_timeout
+        )
+        return self._parse_distance_jobs_page(response)
+
+    async def iter_distance_jobs(
+        self, prefetch: bool = True
+    ) -> AsyncIterator[DistanceJobResponse]:
+        """
+        Iterate over every distance matrix job.
+        See :meth:`geocodio.Geocodio.iter_distance_jobs`.
+        """
+        async for job in self._iter_pages(self.distance_matrix_jobs, prefetch):
+            yield job
+
+    async def wait_for_distance_job(
+        self,
+        job_id: Union[str, int],
+        timeout: Optional[float] = 600.0,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> DistanceJobResponse:
+        """
+        Poll a distance matrix job until it completes.
+        See :meth:`geocodio.Geocodio.wait_for_distance_job`.
+        """
+        jobs = self.iter_completed_distance_jobs(
+            [job_id], timeout, 1, min_interval, max_interval
+        )
+        try:
+            job = await jobs.__anext__()
+        finally:
+            await jobs.aclose()
+        return self._check_distance_job(job_id, job)
+
+    async def iter_completed_distance_jobs(
+        self,
+        job_ids: Iterable[Union[str, int]],
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> AsyncGenerator[DistanceJobResponse, None]:
+        """
+        Track several distance matrix jobs and yield each one as it finishes.
+
+        See :meth:`geocodio.Geocodio.iter_completed_distance_jobs`. Up to
+        ``concurrency`` due status checks run concurrently on the event loop.
+        """
+        schedule = JobSchedule(job_ids, timeout, min_interval, max_interval)
+        async for job in self._poll_until_finished(
+            schedule, self.distance_matrix_job_status, distance_job_progress,
+            concurrency,
+        ):
+            yield job
+
+    async def _poll_until_finished(
+        self,
+        schedule: JobSchedule,
+        fetch: Callable[[Any], Awaitable[Any]],
+        progress: Callable[[Any], Tuple[bool, Optional[float]]],
+        concurrency: Optional[int],
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Poll everything in ``schedule`` from one loop, yielding each status
+        once it is finished.
+        """
+        concurrency = max(1, concurrency or self.batch_concurrency)
+        while schedule:
+            schedule.check_deadline()
+            due = schedule.pop_due(concurrency)
+            if not due:
+                await asyncio.sleep(schedule.time_until_due())
+                continue
+            statuses = await asyncio.gather(*(fetch(item_id) for item_id in due))
+            for item_id, status in zip(due, statuses):
+                if schedule.record(item_id, *progress(status)):
+                    yield status
+
+    async def get_distance_matrix_job_results(
+        self, job_id: Union[str, int]
+    ) -> DistanceMatrixResponse:
+        """Download and parse distance matrix job results."""
+        endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}/download"
+        response = await self._request("GET", endpoint, timeout=self.list_timeout)
+        return self._parse_distance_job_results(response)
+
+    async def download_distance_matrix_job(
+        self,
+        job_id: Union[str, int],
+        filename: Destination,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = False,
+    ) -> str | BinaryIO:
+        """
+        Download distance matrix job results to a file.
+        See :meth:`geocodio.Geocodio.download_distance_matrix_job`.
+        """
+        endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}/download"
+        return await self._download_to(
+            "distance job", job_id, endpoint, filename, progress, chunk_size, resume
+        )
+
+    async def delete_distance_matrix_job(self, job_id: Union[str, int]) -> None:
+        """Delete a distance matrix job."""
+        endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}"
+        await self._request("DELETE", endpoint, timeout=self.list_timeout)
+
+
+__all__ = ["AsyncGeocodio"]
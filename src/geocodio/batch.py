@@ -0,0 +1,112 @@
+"""
+src/geocodio/batch.py
+Helpers for splitting batch geocode/reverse payloads into chunks and
+reassembling the chunked API responses.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+# Geocodio accepts up to 10,000 lookups in a single batch request.
+MAX_BATCH_SIZE = 10000
+DEFAULT_BATCH_CONCURRENCY = 4
+
+BatchPayload = Union[List[Any], Dict[str, List[Any]]]
+
+
+def batch_length(payload: BatchPayload) -> int:
+    """Number of lookups in a batch request body."""
+    if isinstance(payload, dict):
+        return len(payload.get("addresses", []))
+    return len(payload)
+
+
+def chunk_batch_payload(payload: BatchPayload, chunk_size: int) -> List[BatchPayload]:
+    """
+    Split a batch request body into bodies of at most ``chunk_size`` lookups.
+
+    Supports both plain list bodies and the keyed
+    ``{"addresses": [...], "keys": [...]}`` body; keyed chunks keep each
+    address paired with its key.
+
+    Args:
+        payload: The JSON body of a batch geocode or reverse request.
+        chunk_size: Maximum number of lookups per chunk.
+
+    Returns:
+        The chunked bodies, in input order.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    if isinstance(payload, dict):
+        addresses = payload.get("addresses", [])
+        keys = payload.get("keys", [])
+        return [
+            {"addresses": addresses[i:i + chunk_size], "keys": keys[i:i + chunk_size]}
+            for i in range(0, len(addresses), chunk_size)
+        ] or [payload]
+
+    return [
+        payload[i : i + chunk_size] for i in range(0, len(payload), chunk_size)
+    ] or [payload]
+
+
+def merge_batch_payloads(payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Reassemble the JSON responses of chunked batch requests into one response.
+
+    ``payloads`` must be in the same order as the chunks were produced.
+    List results are concatenated; keyed (dict) results are merged in order.
+    """
+    if len(payloads) == 1:
+        return payloads[0]
+
+    merged: Dict[str, Any] = {}
+    results: Union[List[Any], Dict[str, Any], None] = None
+    for payload in payloads:
+        chunk_results = payload.get("results", [])
+        if results is None:
+            results = {} if isinstance(chunk_results, dict) else []
+        if isinstance(results, dict):
+            results.update(chunk_results)
+        else:
+            results.extend(chunk_results)
+    merged["results"] = results if results is not None else []
+    return merged
+
+
+def iter_chunks(
+    items: Iterable[Any], chunk_size: int
+) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Lazily split an iterable into ``(offset, chunk)`` pairs.
+
+    Only one chunk is pulled from ``items`` at a time, so arbitrarily large
+    inputs (e.g. rows streamed from a CSV) are never held in memory at once.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    iterator = iter(items)
+    offset = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+__all__ = [
+    "MAX_BATCH_SIZE",
+    "DEFAULT_BATCH_CONCURRENCY",
+    "batch_length",
+    "chunk_batch_payload",
+    "merge_batch_payloads",
+    "iter_chunks",
+]
@@ -0,0 +1,399 @@
+"""
+src/geocodio/cache.py
+Response caching for geocode() and reverse() lookups.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Backends
+# ──────────────────────────────────────────────────────────────────────────────
+
+class CacheBackend(ABC):
+    """
+    Storage for cached lookup responses.
+
+    Values are the decoded JSON of a single lookup response
+    (``{"input": ..., "results": [...]}``). Subclasses must implement
+    ``get``, ``set`` and ``clear``; ``get_many``/``set_many`` can be overridden for
+    backends that support bulk access.
+
+    The client hands cached values to callers inside the returned models, so
+    a backend must not share the objects it stores: ``set`` keeps a copy and
+    ``get`` returns a fresh one.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store ``value`` under ``key``."""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return a mapping of the found keys to their cached values."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, Dict[str, Any]]) -> None:
+        """Store every key/value pair in ``items``."""
+        for key, value in items.items():
+            self.set(key, value)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached entry."""
+
+
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe in-memory cache with LRU eviction and an optional TTL.
+
+    Entries are kept as compact JSON text, so a response modified by the
+    caller never changes what later lookups get from the cache.
+
+    Args:
+        max_size: Maximum number of entries kept; the least recently used entry
+            is evicted first.
+        ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._data[key] = (expires_at, encoded)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache stored in a SQLite database file.
+
+    Responses are stored as compact JSON text. The database runs in WAL mode
+    and each thread gets its own connection, so many readers can query the
+    cache while another thread writes to it. A thread's connection is closed
+    when the thread exits.
+
+    Args:
+        path: Path to the database file; created if missing.
+        max_entries: Maximum number of entries kept. Entries are evicted in the
+            order they were written (first in, first out); reading an entry
+            does not keep it. None means unbounded.
+        ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+    """
+
+    # SQLite's default limit on bound parameters per statement is 999 on older builds.
+    _MAX_PARAMS = 900
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local = threading.local()
+        self._connections: Set[sqlite3.Connection] = set()
+        self._lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocodio_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " expires_at REAL"
+            ")"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS geocodio_cache_created_at"
+            " ON geocodio_cache (created_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS geocodio_cache_expires_at"
+            " ON geocodio_cache (expires_at)"
+        )
+        # Row count kept up to date by triggers, so eviction does not scan the table
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocodio_cache_count (n INTEGER NOT NULL)"
+        )
+        if conn.execute("SELECT 1 FROM geocodio_cache_count").fetchone() is None:
+            conn.execute(
+                "INSERT INTO geocodio_cache_count (n)"
+                " SELECT COUNT(*) FROM geocodio_cache"
+            )
+        conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS geocodio_cache_count_insert"
+            " AFTER INSERT ON geocodio_cache"
+            " BEGIN UPDATE geocodio_cache_count SET n = n + 1; END"
+        )
+        conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS geocodio_cache_count_delete"
+            " AFTER DELETE ON geocodio_cache"
+            " BEGIN UPDATE geocodio_cache_count SET n = n - 1; END"
+        )
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            with self._lock:
+                self._connections.add(conn)
+            # Thread-local data is dropped when its thread exits, which closes
+            # the connection
+            weakref.finalize(
+                holder, _release_connection, conn, self._connections, self._lock
+            )
+        return holder.conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self.set_many({key: value})
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        keys = list(keys)
+        conn = self._connection()
+        now = time.time()
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(keys), self._MAX_PARAMS):
+            chunk = keys[start:start + self._MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value FROM geocodio_cache WHERE key IN ({placeholders})"
+                " AND (expires_at IS NULL OR expires_at > ?)",
+                (*chunk, now),
+            )
+            for key, value in rows:
+                found[key] = json.loads(value)
+        return found
+
+    def set_many(self, items: Mapping[str, Dict[str, Any]]) -> None:
+        if not items:
+            return
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+        rows = [
+            (key, json.dumps(value, separators=(",", ":")), now, expires_at)
+            for key, value in items.items()
+        ]
+        conn = self._connection()
+        with conn:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete
+            # skips the count trigger
+            conn.executemany(
+                "INSERT INTO geocodio_cache (key, value, created_at, expires_at)"
+                " VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value,"
+                " created_at = excluded.created_at, expires_at = excluded.expires_at",
+                rows,
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the oldest entries above ``max_entries``."""
+        if self.ttl:
+            conn.execute(
+                "DELETE FROM geocodio_cache"
+                " WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,),
+            )
+        if self.max_entries is not None:
+            excess = self._count(conn) - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM geocodio_cache WHERE key IN "
+                    "(SELECT key FROM geocodio_cache ORDER BY created_at ASC LIMIT ?)",
+                    (excess,),
+                )
+
+    def clear(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM geocodio_cache")
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection) -> int:
+        (count,) = conn.execute("SELECT n FROM geocodio_cache_count").fetchone()
+        return count
+
+    def __len__(self) -> int:
+        return self._count(self._connection())
+
+
+class _ThreadConnection:
+    """
+    One thread's SQLiteCache connection; the finalizer closes it once the
+    thread's locals are dropped.
+    """
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release_connection(
+    conn: sqlite3.Connection, connections: Set[sqlite3.Connection], lock: threading.Lock
+) -> None:
+    with lock:
+        connections.discard(conn)
+    conn.close()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Statistics
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a client's cache, counted per lookup."""
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Keys
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _normalize_text(value: str) -> str:
+    return " ".join(value.split()).lower()
+
+
+def _normalize_coordinate_text(value: str) -> str:
+    parts = [p.strip() for p in value.split(",")]
+    try:
+        return ",".join(repr(float(p)) for p in parts[:2])
+    except ValueError:
+        return _normalize_text(value)
+
+
+def normalize_query(kind: str, query: Union[str, Tuple, List, Dict[str, Any]]) -> Any:
+    """
+    Normalize a single lookup so equivalent inputs share a cache key.
+
+    Address strings are case-folded with whitespace collapsed, structured
+    addresses are normalized field by field, and coordinates are reduced to
+    their float values.
+    """
+    if isinstance(query, dict):
+        return {k: _normalize_text(str(v)) for k, v in sorted(query.items()) if v}
+    if isinstance(query, (tuple, list)):
+        return ",".join(repr(float(p)) for p in query[:2])
+    if kind == "reverse":
+        return _normalize_coordinate_text(str(query))
+    return _normalize_text(str(query))
+
+
+def make_cache_key(kind: str, query: Any, options: Mapping[str, Any]) -> str:
+    """
+    Build the cache key for one lookup.
+
+    Args:
+        kind: "geocode" or "reverse".
+        query: The address or coordinate being looked up.
+        options: Request parameters that change the response, such as
+            ``fields``, ``limit``, ``country`` and the distance parameters.
+    """
+    material = json.dumps(
+        [
+            kind,
+            normalize_query(kind, query),
+            sorted((k, v) for k, v in options.items()),
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+__all__ = [
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "CacheStats",
+    "normalize_query",
+    "make_cache_key",
+]
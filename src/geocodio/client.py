@@ -5,9 +5,19 @@ High‑level synchronous client for the Geocodio API.
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
-from typing import List, Union, Dict, Tuple, Optional
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any, BinaryIO, Callable, Generator, Iterable, Iterator, List, Sequence, Union, Dict,
+    Tuple, Optional, Literal, TypeVar, overload, cast,
+)
 
 import httpx
 
@@ -23,8 +33,9 @@ from geocodio.models import (
     CensusData, ACSSurveyData, StateLegislativeDistrict, SchoolDistrict,
     Demographics, Economics, Families, Housing, Social,
     FederalRiding, ProvincialRiding, StatisticsCanadaData, ListResponse, PaginatedResponse,
-    ZIP4Data, FFIECData,
-    DistanceResponse, DistanceMatrixResponse, DistanceJobResponse,
+    ZIP4Data, FFIECData, LazyGeocodingResult, BatchGeocodingItem,
+    BatchGeocodingResponse,
+    DistanceResponse, DistanceMatrixResponse, DistanceJobResponse, DistanceJobState,
 )
 from geocodio.distance import (
     Coordinate,
@@ -39,16 +50,116 @@ from geocodio.distance import (
     DISTANCE_SORT_DESC,
     normalize_distance_mode,
 )
-from geocodio.exceptions import InvalidRequestError, AuthenticationError, GeocodioServerError, BadRequestError
+from geocodio.batch import (
+    MAX_BATCH_SIZE,
+    DEFAULT_BATCH_CONCURRENCY,
+    batch_length,
+    chunk_batch_payload,
+    iter_chunks,
+    merge_batch_payloads,
+)
+from geocodio.cache import CacheBackend, CacheStats, make_cache_key
+from geocodio.retry import (
+    IDEMPOTENT_METHODS, RetryPolicy, RetryStats, parse_retry_after,
+)
+from geocodio.exceptions import (
+    InvalidRequestError, AuthenticationError, GeocodioServerError, BadRequestError,
+    RateLimitError, RangeNotSatisfiableError, DistanceJobFailedError, GeocodioError,
+)
+from geocodio.ratelimit import RateLimiter
+from geocodio.local_distance import local_distance_matrix
+from geocodio.logs import TruncatedBody
+from geocodio.hooks import ClientHooks, ParseEvent, PhaseTimer, RequestEvent
+from geocodio.codec import JSONCodec, get_codec
+from geocodio.download import (
+    DEFAULT_CHUNK_SIZE, Destination, DownloadSink, ProgressCallback, discard_partial,
+    is_path, partial_size, resume_offset,
+)
+from geocodio.upload import (
+    MultipartUpload, UploadSource, is_streaming_source, source_filename,
+)
+from geocodio.jobs import (
+    DEFAULT_MAX_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL, LIST_STATE_FAILED,
+    JobSchedule, distance_job_progress, list_progress,
+)
+from geocodio.sharding import merge_csv_files, split_csv
+from geocodio.matrix import (
+    CompactDistanceMatrix, merge_tiles, plan_tiles, tile_body_coordinates,
+)
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True, frozen=True)
+class _PreparedRequest:
+    """
+    A fully built API request, independent of the transport that sends it.
+
+    Produced by the ``_build_*`` helpers so the sync and async clients share
+    the exact same request construction.
+    """
+
+    method: str
+    endpoint: str
+    params: Optional[dict] = None
+    json: Optional[Union[dict, list]] = None
+    files: Optional[dict] = None
+    timeout: Optional[float] = None
+    upload: Optional[MultipartUpload] = None
+
 
+@dataclass(slots=True)
+class _CachePlan:
+    """
+    Outcome of checking the cache for a geocode/reverse request.
+
+    ``cached`` holds one entry per lookup (None for a miss); ``miss_request``
+    is the request for just the misses, or None when everything was cached.
+    """
+
+    batch: bool
+    queries: list
+    keys: List[str]
+    cached: List[Optional[dict]]
+    miss_indexes: List[int]
+    miss_request: Optional[_PreparedRequest]
+
+
+@dataclass(slots=True)
+class _TiledMatrixPlan:
+    """
+    Requests for a distance matrix split into tiles, plus what is needed to
+    merge them.
+    """
+
+    origins: List[Coordinate]
+    destinations: List[Coordinate]
+    requests: List[_PreparedRequest]
+    mode: str
+    units: str
+    max_results: Optional[int]
+    order_by: str
+    sort_order: str
+
+
+class _BaseGeocodio(ABC):
+    """
+    Configuration, request building and response parsing shared by
+    :class:`Geocodio` and :class:`geocodio.async_client.AsyncGeocodio`.
+
+    Subclasses provide the HTTP client (``_create_http_client``) and the
+    transport-specific ``_request`` plus the public API methods.
+    """
 
-class Geocodio:
     BASE_PATH = "/v1.11"  # keep in sync with Geocodio's current version
     DEFAULT_SINGLE_TIMEOUT = 5.0
     DEFAULT_BATCH_TIMEOUT = 1800.0  # 30 minutes
     LIST_API_TIMEOUT = 60.0
     USER_AGENT = f"geocodio-library-python/{__version__}"
 
+    DIRECTION_FORWARD = "forward"
+    DIRECTION_REVERSE = "reverse"
+
     @staticmethod
     def get_status_exception_mappings() -> Dict[
         int, type[BadRequestError | InvalidRequestError | AuthenticationError | GeocodioServerError]
@@ -61,6 +172,8 @@ class Geocodio:
             400: BadRequestError,
             422: InvalidRequestError,
             403: AuthenticationError,
+            416: RangeNotSatisfiableError,
+            429: RateLimitError,
             500: GeocodioServerError,
         }
 
@@ -72,7 +185,96 @@ class Geocodio:
         batch_timeout: Optional[float] = None,
         list_timeout: Optional[float] = None,
         verify_ssl: bool = True,
+        batch_size: Optional[int] = None,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        cache: Optional[CacheBackend] = None,
+        lazy_parsing: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: bool = False,
+        transport: Optional[
+            Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+        ] = None,
+        local_straightline: bool = False,
+        matrix_tile_origins: Optional[int] = None,
+        matrix_tile_destinations: Optional[int] = None,
+        log_body_limit: Optional[int] = None,
+        hooks: Optional[Union[ClientHooks, Sequence[ClientHooks]]] = None,
+        json_codec: Union[None, str, JSONCodec] = None,
+        typed_decoding: bool = False,
     ):
+        """
+        Args:
+            api_key: Geocodio API key. Falls back to the GEOCODIO_API_KEY
+                environment variable.
+            hostname: API hostname, e.g. "api-hipaa.geocod.io" or
+                "api.enterprise.geocod.io".
+            single_timeout: Timeout in seconds for single lookups.
+            batch_timeout: Timeout in seconds for each batch request.
+            list_timeout: Timeout in seconds for List API and distance job requests.
+            verify_ssl: Whether to verify TLS certificates.
+            batch_size: Maximum lookups per batch request. Larger batches passed to
+                geocode() or reverse() are split into chunks of this size. Defaults to
+                the API maximum of 10,000.
+            batch_concurrency: Maximum number of batch chunks in flight at once.
+            cache: Optional cache backend (e.g. ``MemoryCache``) for geocode() and
+                reverse() responses. Batch calls only send the lookups that miss.
+            lazy_parsing: Return ``LazyGeocodingResult`` objects that keep the raw
+                response and only build nested models (address components, fields
+                such as ``census2020`` or ``acs``) when they are first accessed.
+            retry: Optional ``RetryPolicy`` for transient failures (timeouts,
+                connection errors, 429 and 5xx responses). Retries are disabled
+                when omitted.
+            rate_limiter: Optional ``RateLimiter`` applied before every request.
+                Throttled calls wait instead of failing; share one limiter between
+                clients to cap their combined traffic.
+            max_connections: Maximum number of open connections in the pool.
+                Defaults to httpx's limit of 100.
+            max_keepalive_connections: Maximum number of idle connections kept
+                open for reuse. Defaults to httpx's limit of 20.
+            keepalive_expiry: Seconds an idle connection is kept open. Defaults
+                to httpx's 5 seconds.
+            http2: Negotiate HTTP/2 so concurrent requests share one multiplexed
+                connection. Requires the ``h2`` package
+                (``pip install geocodio-library-python[http2]``).
+            transport: Custom httpx transport (``httpx.HTTPTransport`` for
+                ``Geocodio``, ``httpx.AsyncHTTPTransport`` for ``AsyncGeocodio``),
+                e.g. to set local addresses, retries at the socket level, or a mock
+                transport in tests. When given, ``verify_ssl`` and the pool options
+                must be configured on the transport itself.
+            local_straightline: Compute straight-line (``mode="straightline"`` or
+                ``"haversine"``) distance() and distance_matrix() calls locally
+                instead of calling the API. Distances are great-circle distances
+                and are not rounded.
+            matrix_tile_origins: Maximum origins per distance_matrix() request.
+                Larger matrices are split into tiles that are sent concurrently
+                (up to ``batch_concurrency`` at once) and merged.
+            matrix_tile_destinations: Maximum destinations per distance_matrix()
+                request. Tiling is disabled when both tile options are None.
+            log_body_limit: Log request and response bodies at DEBUG level,
+                truncated to this many characters. Bodies are never logged
+                when None (the default), so large batches add no logging cost.
+            hooks: A ``ClientHooks`` instance, or a list of them, notified of
+                every request attempt, retry, error and parsed response.
+            json_codec: JSON library for request and response bodies:
+                ``"orjson"``, ``"msgspec"``, ``"json"`` (standard library),
+                ``"auto"`` (orjson or msgspec when installed, else the standard
+                library) or a ``JSONCodec`` instance. Defaults to the standard
+                library.
+            typed_decoding: Decode geocode/reverse, distance(), distance_matrix()
+                and matrix job results straight from the response bytes
+                into the msgspec structs of ``geocodio.typed``. The structs
+                have the declared attributes of the regular models, but they
+                are not instances of the ``geocodio.models`` classes nor
+                dataclasses, and nested models have no ``extras`` (keys they
+                do not declare are dropped; ``fields.extras`` is kept).
+                Requires the ``msgspec`` package
+                (``pip install geocodio-library-python[msgspec]``) and cannot be
+                combined with ``lazy_parsing``.
+        """
         self.api_key: str = api_key or os.getenv("GEOCODIO_API_KEY", "")
         if not self.api_key:
             raise AuthenticationError(
@@ -82,20 +284,169 @@ class Geocodio:
         self.single_timeout = single_timeout or self.DEFAULT_SINGLE_TIMEOUT
         self.batch_timeout = batch_timeout or self.DEFAULT_BATCH_TIMEOUT
         self.list_timeout = list_timeout or self.LIST_API_TIMEOUT
-        self._http = httpx.Client(base_url=f"https://{self.hostname}", verify=verify_ssl)
+        self.batch_size = batch_size or MAX_BATCH_SIZE
+        if not 1 <= self.batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                f"batch_size must be between 1 and {MAX_BATCH_SIZE}, "
+                f"got {self.batch_size}"
+            )
+        if batch_concurrency < 1:
+            raise ValueError(
+                f"batch_concurrency must be at least 1, got {batch_concurrency}"
+            )
+        self.batch_concurrency = batch_concurrency
+        self.cache = cache
+        self.cache_stats = CacheStats()
+        self.lazy_parsing = lazy_parsing
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.local_straightline = local_straightline
+        for name, value in (("matrix_tile_origins", matrix_tile_origins),
+                            ("matrix_tile_destinations", matrix_tile_destinations)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+        self.matrix_tile_origins = matrix_tile_origins
+        self.matrix_tile_destinations = matrix_tile_destinations
+        if log_body_limit is not None and log_body_limit < 0:
+            raise ValueError(
+                f"log_body_limit must not be negative, got {log_body_limit}"
+            )
+        self.log_body_limit = log_body_limit
+        if hooks is None:
+            hooks = []
+        self.hooks: List[ClientHooks] = (
+            [hooks] if isinstance(hooks, ClientHooks) else list(hooks)
+        )
+        self.json_codec = get_codec(json_codec)
+        if typed_decoding and lazy_parsing:
+            raise ValueError("typed_decoding and lazy_parsing cannot be combined")
+        self.typed_decoding = typed_decoding
+        self._typed_decoder = self._create_typed_decoder() if typed_decoding else None
+        self._http = self._create_http_client(
+            self._http_client_options(
+                verify_ssl, max_connections, max_keepalive_connections,
+                keepalive_expiry, http2, transport,
+            )
+        )
+
+    def _http_client_options(
+            self,
+            verify_ssl: bool,
+            max_connections: Optional[int],
+            max_keepalive_connections: Optional[int],
+            keepalive_expiry: Optional[float],
+            http2: bool,
+            transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]],
+    ) -> Dict[str, Any]:
+        """
+        Keyword arguments for the httpx client, shared by the sync and async
+        clients.
+        """
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package. "
+                "Install it with: pip install geocodio-library-python[http2]"
+            )
+        defaults = httpx.Limits()
+        limits = httpx.Limits(
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else defaults.max_connections
+            ),
+            max_keepalive_connections=(
+                max_keepalive_connections
+                if max_keepalive_connections is not None
+                else defaults.max_keepalive_connections
+            ),
+            keepalive_expiry=(
+                keepalive_expiry
+                if keepalive_expiry is not None
+                else defaults.keepalive_expiry
+            ),
+        )
+        options: Dict[str, Any] = {
+            "base_url": f"https://{self.hostname}",
+            "verify": verify_ssl,
+            "limits": limits,
+            "http2": http2,
+        }
+        if transport is not None:
+            options["transport"] = transport
+        return options
+
+    @abstractmethod
+    def _create_http_client(self, options: Dict[str, Any]):
+        """Build the transport's HTTP client from ``_http_client_options``."""
+
+    def _warm_up_count(self, connections: int) -> int:
+        if connections < 1:
+            raise ValueError(f"connections must be at least 1, got {connections}")
+        return connections
+
+    def _warm_up_failed(self, exc: Exception) -> None:
+        logger.warning("Connection warm-up to %s failed: %s", self.hostname, exc)
 
     # ──────────────────────────────────────────────────────────────────────────
-    # Public methods
+    # Request builders
     # ──────────────────────────────────────────────────────────────────────────
 
-    def geocode(
+    def _headers(self) -> Dict[str, str]:
+        """Authorization and user-agent headers sent with every request."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "User-Agent": self.USER_AGENT
+        }
+
+    def _add_distance_params(
+            self,
+            params: Dict[str, Union[str, int, List[str]]],
+            destinations: Optional[List[Union[str, Tuple[float, float], "Coordinate"]]],
+            distance_mode: Optional[str],
+            distance_units: Optional[str],
+            distance_max_results: Optional[int],
+            distance_max_distance: Optional[float],
+            distance_max_duration: Optional[int],
+            distance_min_distance: Optional[float],
+            distance_min_duration: Optional[int],
+            distance_order_by: Optional[str],
+            distance_sort_order: Optional[str],
+    ) -> None:
+        """Add the inline distance parameters used by geocode() and reverse()."""
+        if not destinations:
+            return
+        dest_strs = [
+            self._coordinate_to_string(self._normalize_coordinate(d))
+            for d in destinations
+        ]
+        params["destinations[]"] = dest_strs
+        if distance_mode:
+            params["distance_mode"] = normalize_distance_mode(distance_mode)
+        if distance_units:
+            params["distance_units"] = distance_units
+        if distance_max_results is not None:
+            params["distance_max_results"] = distance_max_results
+        if distance_max_distance is not None:
+            params["distance_max_distance"] = distance_max_distance
+        if distance_max_duration is not None:
+            params["distance_max_duration"] = distance_max_duration
+        if distance_min_distance is not None:
+            params["distance_min_distance"] = distance_min_distance
+        if distance_min_duration is not None:
+            params["distance_min_duration"] = distance_min_duration
+        if distance_order_by:
+            params["distance_order_by"] = distance_order_by
+        if distance_sort_order:
+            params["distance_sort"] = distance_sort_order
+
+    def _build_geocode_request(
             self,
             address: Union[
                 str, Dict[str, str], List[Union[str, Dict[str, str]]], Dict[str, Union[str, Dict[str, str]]]],
             fields: Optional[List[str]] = None,
             limit: Optional[int] = None,
             country: Optional[str] = None,
-            # Distance parameters
             destinations: Optional[List[Union[str, Tuple[float, float], "Coordinate"]]] = None,
             distance_mode: Optional[str] = None,
             distance_units: Optional[str] = None,
@@ -106,7 +457,7 @@ class Geocodio:
             distance_min_duration: Optional[int] = None,
             distance_order_by: Optional[str] = None,
             distance_sort_order: Optional[str] = None,
-    ) -> GeocodingResponse:
+    ) -> _PreparedRequest:
         params: Dict[str, Union[str, int, List[str]]] = {}
         if fields:
             params["fields"] = ",".join(fields)
@@ -116,38 +467,19 @@ class Geocodio:
             params["country"] = country
 
         # Add distance parameters if destinations provided
-        if destinations:
-            dest_strs = [
-                self._coordinate_to_string(self._normalize_coordinate(d))
-                for d in destinations
-            ]
-            params["destinations[]"] = dest_strs
-            if distance_mode:
-                params["distance_mode"] = normalize_distance_mode(distance_mode)
-            if distance_units:
-                params["distance_units"] = distance_units
-            if distance_max_results is not None:
-                params["distance_max_results"] = distance_max_results
-            if distance_max_distance is not None:
-                params["distance_max_distance"] = distance_max_distance
-            if distance_max_duration is not None:
-                params["distance_max_duration"] = distance_max_duration
-            if distance_min_distance is not None:
-                params["distance_min_distance"] = distance_min_distance
-            if distance_min_duration is not None:
-                params["distance_min_duration"] = distance_min_duration
-            if distance_order_by:
-                params["distance_order_by"] = distance_order_by
-            if distance_sort_order:
-                params["distance_sort"] = distance_sort_order
-
-        endpoint: str
+        self._add_distance_params(
+            params, destinations, distance_mode, distance_units,
+            distance_max_results, distance_max_distance, distance_max_duration,
+            distance_min_distance, distance_min_duration,
+            distance_order_by, distance_sort_order,
+        )
+
+        endpoint = f"{self.BASE_PATH}/geocode"
         data: Union[List, Dict] | None
 
         # Handle different input types
         if isinstance(address, dict) and not any(isinstance(v, dict) for v in address.values()):
             # Single structured address
-            endpoint = f"{self.BASE_PATH}/geocode"
             # Map our parameter names to API parameter names
             param_map = {
                 "street": "street",
@@ -165,28 +497,28 @@ class Geocodio:
             data = None
         elif isinstance(address, list):
             # Batch addresses - send list directly
-            endpoint = f"{self.BASE_PATH}/geocode"
             data = address
         elif isinstance(address, dict) and any(isinstance(v, dict) for v in address.values()):
             # Batch addresses with custom keys
-            endpoint = f"{self.BASE_PATH}/geocode"
             data = {"addresses": list(address.values()), "keys": list(address.keys())}
         else:
             # Single address string
-            endpoint = f"{self.BASE_PATH}/geocode"
             params["q"] = address
             data = None
 
-        timeout = self.batch_timeout if data else self.single_timeout
-        response = self._request("POST" if data else "GET", endpoint, params, json=data, timeout=timeout)
-        return self._parse_geocoding_response(response.json())
+        return _PreparedRequest(
+            method="POST" if data else "GET",
+            endpoint=endpoint,
+            params=params,
+            json=data,
+            timeout=self.batch_timeout if data else self.single_timeout,
+        )
 
-    def reverse(
+    def _build_reverse_request(
             self,
             coordinate: Union[str, Tuple[float, float], List[Union[str, Tuple[float, float]]]],
             fields: Optional[List[str]] = None,
             limit: Optional[int] = None,
-            # Distance parameters
             destinations: Optional[List[Union[str, Tuple[float, float], "Coordinate"]]] = None,
             distance_mode: Optional[str] = None,
             distance_units: Optional[str] = None,
@@ -197,7 +529,7 @@ class Geocodio:
             distance_min_duration: Optional[int] = None,
             distance_order_by: Optional[str] = None,
             distance_sort_order: Optional[str] = None,
-    ) -> GeocodingResponse:
+    ) -> _PreparedRequest:
         params: Dict[str, Union[str, int, List[str]]] = {}
         if fields:
             params["fields"] = ",".join(fields)
@@ -205,37 +537,18 @@ class Geocodio:
             params["limit"] = int(limit)
 
         # Add distance parameters if destinations provided
-        if destinations:
-            dest_strs = [
-                self._coordinate_to_string(self._normalize_coordinate(d))
-                for d in destinations
-            ]
-            params["destinations[]"] = dest_strs
-            if distance_mode:
-                params["distance_mode"] = normalize_distance_mode(distance_mode)
-            if distance_units:
-                params["distance_units"] = distance_units
-            if distance_max_results is not None:
-                params["distance_max_results"] = distance_max_results
-            if distance_max_distance is not None:
-                params["distance_max_distance"] = distance_max_distance
-            if distance_max_duration is not None:
-                params["distance_max_duration"] = distance_max_duration
-            if distance_min_distance is not None:
-                params["distance_min_distance"] = distance_min_distance
-            if distance_min_duration is not None:
-                params["distance_min_duration"] = distance_min_duration
-            if distance_order_by:
-                params["distance_order_by"] = distance_order_by
-            if distance_sort_order:
-                params["distance_sort"] = distance_sort_order
-
-        endpoint: str
+        self._add_distance_params(
+            params, destinations, distance_mode, distance_units,
+            distance_max_results, distance_max_distance, distance_max_duration,
+            distance_min_distance, distance_min_duration,
+            distance_order_by, distance_sort_order,
+        )
+
+        endpoint = f"{self.BASE_PATH}/reverse"
         data: Union[List[str], None]
 
         # Batch vs single coordinate
         if isinstance(coordinate, list):
-            endpoint = f"{self.BASE_PATH}/reverse"
             coords_as_strings = []
             for coord in coordinate:
                 if isinstance(coord, tuple):
@@ -244,54 +557,700 @@ class Geocodio:
                     coords_as_strings.append(coord)
             data = coords_as_strings
         else:
-            endpoint = f"{self.BASE_PATH}/reverse"
             if isinstance(coordinate, tuple):
                 params["q"] = f"{coordinate[0]},{coordinate[1]}"
             else:
                 params["q"] = coordinate  # "lat,lng"
             data = None
 
-        timeout = self.batch_timeout if data else self.single_timeout
-        response = self._request("POST" if data else "GET", endpoint, params, json=data, timeout=timeout)
-        return self._parse_geocoding_response(response.json())
+        return _PreparedRequest(
+            method="POST" if data else "GET",
+            endpoint=endpoint,
+            params=params,
+            json=data,
+            timeout=self.batch_timeout if data else self.single_timeout,
+        )
+
+    def _stream_settings(
+        self, chunk_size: Optional[int], concurrency: Optional[int]
+    ) -> Tuple[int, int]:
+        chunk_size = self.batch_size if chunk_size is None else chunk_size
+        concurrency = self.batch_concurrency if concurrency is None else concurrency
+        if not 1 <= chunk_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                f"chunk_size must be between 1 and {MAX_BATCH_SIZE}, got {chunk_size}"
+            )
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        return chunk_size, concurrency
+
+    @staticmethod
+    def _stream_pairs(
+        offset: int, response: GeocodingResponse
+    ) -> List[Tuple[int, BatchGeocodingItem]]:
+        """Pair each item of a streamed chunk with its position in the overall input."""
+        items = getattr(response, "items", None) or []
+        return [(offset + i, item) for i, item in enumerate(items)]
+
+    @staticmethod
+    def _lookup_count(req: _PreparedRequest) -> int:
+        """Number of lookups a geocode/reverse request bills for."""
+        return batch_length(req.json) if req.json is not None else 1
+
+    @staticmethod
+    def _batch_keys(req: _PreparedRequest) -> Optional[List[str]]:
+        """Custom keys of a keyed batch request, if any."""
+        return req.json.get("keys") if isinstance(req.json, dict) else None
+
+    def _split_batch_request(self, req: _PreparedRequest) -> List[_PreparedRequest]:
+        """Split a batch request into requests of at most ``batch_size`` lookups."""
+        return [
+            _PreparedRequest(
+                req.method, req.endpoint, req.params, json=chunk, timeout=req.timeout
+            )
+            for chunk in chunk_batch_payload(req.json or [], self.batch_size)
+        ]
+
+    # Request parameters that identify the lookup itself rather than options.
+    _QUERY_PARAMS = frozenset(
+        {"q", "street", "street2", "city", "county", "state", "postal_code"}
+    )
+
+    def _plan_cached_lookup(
+        self, cache: CacheBackend, req: _PreparedRequest
+    ) -> _CachePlan:
+        """Look up every query of a geocode/reverse request in ``cache``."""
+        kind = req.endpoint.rsplit("/", 1)[-1]
+        params = req.params or {}
+        options: Dict[str, Any] = {
+            k: v for k, v in params.items() if k not in self._QUERY_PARAMS
+        }
+        if "fields" in options:
+            options["fields"] = ",".join(sorted(options["fields"].split(",")))
+
+        batch = req.json is not None
+        if req.json is None:
+            queries: list = [
+                params.get("q")
+                or {k: v for k, v in params.items() if k in self._QUERY_PARAMS}
+            ]
+        elif isinstance(req.json, dict):
+            queries = list(req.json.get("addresses", []))
+        else:
+            queries = list(req.json)
+
+        keys = [make_cache_key(kind, query, options) for query in queries]
+        found = cache.get_many(keys)
+        cached = [found.get(key) for key in keys]
+        miss_indexes = [i for i, value in enumerate(cached) if value is None]
+        self.cache_stats.record(
+            hits=len(keys) - len(miss_indexes), misses=len(miss_indexes)
+        )
+
+        miss_request: Optional[_PreparedRequest] = None
+        if miss_indexes and not batch:
+            miss_request = req
+        elif miss_indexes:
+            if isinstance(req.json, dict):
+                keys_in = req.json.get("keys", [])
+                body: Union[list, dict] = {
+                    "addresses": [queries[i] for i in miss_indexes],
+                    "keys": [keys_in[i] for i in miss_indexes],
+                }
+            else:
+                body = [queries[i] for i in miss_indexes]
+            miss_request = _PreparedRequest(
+                req.method, req.endpoint, req.params, json=body, timeout=req.timeout
+            )
+
+        return _CachePlan(batch, queries, keys, cached, miss_indexes, miss_request)
+
+    def _complete_cached_lookup(
+        self, cache: CacheBackend, plan: _CachePlan, payload: Optional[dict]
+    ) -> dict:
+        """
+        Store freshly fetched lookups in ``cache`` and merge them with the cache
+        hits.
+        """
+        if not plan.batch:
+            if payload is None:
+                # Nothing was fetched, so the single lookup was a hit
+                return cast(dict, plan.cached[0])
+            if payload.get("results"):
+                cache.set(plan.keys[0], payload)
+            return payload
+
+        fresh: Dict[str, dict] = {}
+        if payload is not None:
+            results = payload.get("results", [])
+            if isinstance(results, dict):
+                results = list(results.values())
+            for index, item in zip(plan.miss_indexes, results):
+                response = item.get("response", {})
+                plan.cached[index] = response
+                if response.get("results") and "error" not in response:
+                    fresh[plan.keys[index]] = response
+        if fresh:
+            cache.set_many(fresh)
+
+        return {
+            "results": [
+                {"query": query, "response": response or {"results": []}}
+                for query, response in zip(plan.queries, plan.cached)
+            ]
+        }
+
+    def _build_create_list_request(
+            self,
+            file: Optional[UploadSource],
+            filename: Optional[str],
+            direction: str,
+            format_: Optional[str],
+            callback_url: Optional[str],
+            fields: list[str] | None,
+            compress: bool = False,
+    ) -> _PreparedRequest:
+        params: Dict[str, Union[str, int]] = {}
+        endpoint = f"{self.BASE_PATH}/lists"
+
+        if file is None or (not is_streaming_source(file) and not file):
+            raise ValueError("File data is required to create a list.")
+        filename = filename or source_filename(file) or "file.csv"
+        files = None
+        upload = None
+        if compress or is_streaming_source(file):
+            # Streamed from its source as the request is sent
+            upload = MultipartUpload(file, filename, compress=compress)
+        else:
+            files = {
+                "file": (filename, file),
+            }
+        if direction:
+            params["direction"] = direction
+        if format_:
+            params["format"] = format_
+        if callback_url:
+            params["callback"] = callback_url
+        if fields:
+            # Join fields with commas as required by the API
+            params["fields"] = ",".join(fields)
+
+        return _PreparedRequest(
+            "POST",
+            endpoint,
+            params,
+            files=files,
+            timeout=self.list_timeout,
+            upload=upload,
+        )
+
+    def _local_distance_request(
+            self,
+            origins: List[Union[str, Tuple[float, float], "Coordinate"]],
+            destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+            mode: str,
+            units: str,
+            max_results: Optional[int],
+            max_distance: Optional[float],
+            min_distance: Optional[float],
+            sort_order: str,
+    ) -> Optional[DistanceMatrixResponse]:
+        """
+        Answer a straight-line request locally if ``local_straightline`` is
+        enabled, else None.
+        """
+        if (
+            not self.local_straightline
+            or normalize_distance_mode(mode) != DISTANCE_MODE_STRAIGHTLINE
+        ):
+            return None
+        return local_distance_matrix(
+            [self._normalize_coordinate(o) for o in origins],
+            [self._normalize_coordinate(d) for d in destinations],
+            units, max_results, max_distance, min_distance, sort_order,
+        )
+
+    def _plan_matrix_tiles(
+            self,
+            origins: List[Union[str, Tuple[float, float], "Coordinate"]],
+            destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+            mode: str,
+            units: str,
+            max_results: Optional[int],
+            max_distance: Optional[float],
+            max_duration: Optional[int],
+            min_distance: Optional[float],
+            min_duration: Optional[int],
+            order_by: str,
+            sort_order: str,
+    ) -> Optional[_TiledMatrixPlan]:
+        """
+        Split a distance matrix request into tiles, or return None if it fits
+        in one request.
+
+        Every tile repeats the filters, including ``max_results``: the nearest N
+        of each tile always contain the nearest N overall, which the merge then
+        selects. Coordinates are sent with their global index as ``id`` so
+        cells can be placed no matter how the API filtered or ordered them.
+        """
+        if self.matrix_tile_origins is None and self.matrix_tile_destinations is None:
+            return None
+        tile_origins = self.matrix_tile_origins or max(len(origins), 1)
+        tile_destinations = self.matrix_tile_destinations or max(len(destinations), 1)
+        if len(origins) <= tile_origins and len(destinations) <= tile_destinations:
+            return None
+
+        origin_coords = [self._normalize_coordinate(o) for o in origins]
+        dest_coords = [self._normalize_coordinate(d) for d in destinations]
+        template = self._build_distance_matrix_request(
+            [], [], mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        requests = [
+            _PreparedRequest(
+                template.method,
+                template.endpoint,
+                json={
+                    **cast(Dict[str, Any], template.json),
+                    "origins": tile_body_coordinates(origin_coords, origin_range),
+                    "destinations": tile_body_coordinates(dest_coords, dest_range),
+                },
+                timeout=template.timeout,
+            )
+            for origin_range, dest_range in plan_tiles(
+                len(origin_coords), len(dest_coords), tile_origins, tile_destinations
+            )
+        ]
+        logger.debug("Splitting %dx%d distance matrix into %d tiles",
+                     len(origin_coords), len(dest_coords), len(requests))
+        return _TiledMatrixPlan(
+            origin_coords, dest_coords, requests, normalize_distance_mode(mode),
+            units, max_results, order_by, sort_order,
+        )
+
+    def _merge_matrix_tiles(
+            self,
+            plan: _TiledMatrixPlan,
+            payloads: List[dict],
+            compact: bool,
+    ) -> Union[DistanceMatrixResponse, CompactDistanceMatrix]:
+        merged = merge_tiles(
+            payloads, plan.origins, plan.destinations, plan.mode,
+            plan.units, plan.max_results, plan.order_by, plan.sort_order,
+        )
+        if compact:
+            return merged
+        if self._typed_decoder is not None:
+            # Tiles are merged into regular models; convert so typed clients get
+            # structs either way
+            return self._typed_decoder.distance_matrix(merged.to_response())
+        return merged.to_response()
+
+    def _finish_matrix(
+            self,
+            response: DistanceMatrixResponse,
+            destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+            compact: bool,
+    ) -> Union[DistanceMatrixResponse, CompactDistanceMatrix]:
+        if not compact:
+            return response
+        return CompactDistanceMatrix.from_response(
+            response, [self._normalize_coordinate(d) for d in destinations]
+        )
+
+    @staticmethod
+    def _single_origin_response(matrix: DistanceMatrixResponse) -> DistanceResponse:
+        result = matrix.results[0]
+        return DistanceResponse(
+            origin=result.origin, mode=matrix.mode, destinations=result.destinations
+        )
+
+    def _build_distance_request(
+        self,
+        origin: Union[str, Tuple[float, float], "Coordinate"],
+        destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+        mode: str,
+        units: str,
+        max_results: Optional[int],
+        max_distance: Optional[float],
+        max_duration: Optional[int],
+        min_distance: Optional[float],
+        min_duration: Optional[int],
+        order_by: str,
+        sort_order: str,
+    ) -> _PreparedRequest:
+        endpoint = f"{self.BASE_PATH}/distance"
+
+        # Normalize and convert origin to string
+        origin_coord = self._normalize_coordinate(origin)
+        origin_str = self._coordinate_to_string(origin_coord)
+
+        # Normalize and convert destinations to strings
+        dest_strs = [
+            self._coordinate_to_string(self._normalize_coordinate(d))
+            for d in destinations
+        ]
+
+        # Build params
+        params: Dict[str, Union[str, int, float, List[str]]] = {
+            "origin": origin_str,
+            "destinations[]": dest_strs,
+            "mode": normalize_distance_mode(mode),
+            "units": units,
+        }
+
+        # Add optional filter parameters
+        if max_results is not None:
+            params["max_results"] = max_results
+        if max_distance is not None:
+            params["max_distance"] = max_distance
+        if max_duration is not None:
+            params["max_duration"] = max_duration
+        if min_distance is not None:
+            params["min_distance"] = min_distance
+        if min_duration is not None:
+            params["min_duration"] = min_duration
+        if order_by != DISTANCE_ORDER_BY_DISTANCE:
+            params["order_by"] = order_by
+        if sort_order != DISTANCE_SORT_ASC:
+            params["sort"] = sort_order
+
+        return _PreparedRequest("GET", endpoint, params, timeout=self.single_timeout)
+
+    def _build_distance_matrix_request(
+        self,
+        origins: List[Union[str, Tuple[float, float], "Coordinate"]],
+        destinations: List[Union[str, Tuple[float, float], "Coordinate"]],
+        mode: str,
+        units: str,
+        max_results: Optional[int],
+        max_distance: Optional[float],
+        max_duration: Optional[int],
+        min_distance: Optional[float],
+        min_duration: Optional[int],
+        order_by: str,
+        sort_order: str,
+    ) -> _PreparedRequest:
+        endpoint = f"{self.BASE_PATH}/distance-matrix"
+
+        # Normalize and convert origins to dicts for POST
+        origin_dicts = [
+            self._coordinate_to_dict(self._normalize_coordinate(o))
+            for o in origins
+        ]
+
+        # Normalize and convert destinations to dicts for POST
+        dest_dicts = [
+            self._coordinate_to_dict(self._normalize_coordinate(d))
+            for d in destinations
+        ]
+
+        # Build request body
+        body: Dict[str, Union[str, int, float, List[Dict]]] = {
+            "origins": origin_dicts,
+            "destinations": dest_dicts,
+            "mode": normalize_distance_mode(mode),
+            "units": units,
+        }
+
+        # Add optional filter parameters
+        if max_results is not None:
+            body["max_results"] = max_results
+        if max_distance is not None:
+            body["max_distance"] = max_distance
+        if max_duration is not None:
+            body["max_duration"] = max_duration
+        if min_distance is not None:
+            body["min_distance"] = min_distance
+        if min_duration is not None:
+            body["min_duration"] = min_duration
+        if order_by != DISTANCE_ORDER_BY_DISTANCE:
+            body["order_by"] = order_by
+        if sort_order != DISTANCE_SORT_ASC:
+            body["sort"] = sort_order
+
+        return _PreparedRequest("POST", endpoint, json=body, timeout=self.batch_timeout)
+
+    def _build_create_distance_matrix_job_request(
+        self,
+        name: str,
+        origins: Union[List[Union[str, Tuple[float, float], "Coordinate"]], int],
+        destinations: Union[List[Union[str, Tuple[float, float], "Coordinate"]], int],
+        mode: str,
+        units: str,
+        callback_url: Optional[str],
+        max_results: Optional[int],
+        max_distance: Optional[float],
+        max_duration: Optional[int],
+        min_distance: Optional[float],
+        min_duration: Optional[int],
+        order_by: str,
+        sort_order: str,
+    ) -> _PreparedRequest:
+        endpoint = f"{self.BASE_PATH}/distance-jobs"
+
+        # Handle origins - either list of coordinates or list ID
+        if isinstance(origins, int):
+            origins_data = origins
+        else:
+            origins_data = [
+                self._coordinate_to_dict(self._normalize_coordinate(o))
+                for o in origins
+            ]
+
+        # Handle destinations - either list of coordinates or list ID
+        if isinstance(destinations, int):
+            destinations_data = destinations
+        else:
+            destinations_data = [
+                self._coordinate_to_dict(self._normalize_coordinate(d))
+                for d in destinations
+            ]
+
+        # Build request body
+        body: Dict[str, Union[str, int, float, List[Dict]]] = {
+            "name": name,
+            "origins": origins_data,
+            "destinations": destinations_data,
+            "mode": normalize_distance_mode(mode),
+            "units": units,
+        }
+
+        # Add optional parameters
+        if callback_url:
+            body["callback_url"] = callback_url
+        if max_results is not None:
+            body["max_results"] = max_results
+        if max_distance is not None:
+            body["max_distance"] = max_distance
+        if max_duration is not None:
+            body["max_duration"] = max_duration
+        if min_distance is not None:
+            body["min_distance"] = min_distance
+        if min_duration is not None:
+            body["min_duration"] = min_duration
+        if order_by != DISTANCE_ORDER_BY_DISTANCE:
+            body["order_by"] = order_by
+        if sort_order != DISTANCE_SORT_ASC:
+            body["sort"] = sort_order
+
+        return _PreparedRequest("POST", endpoint, json=body, timeout=self.list_timeout)
 
     # ──────────────────────────────────────────────────────────────────────────
-    # Internal helpers
+    # Response helpers
     # ──────────────────────────────────────────────────────────────────────────
 
-    def _request(
+    def _retry_delay(
             self,
             method: str,
             endpoint: str,
-            params: Optional[dict] = None,
-            json: Optional[dict] = None,
-            files: Optional[dict] = None,
-            timeout: Optional[float] = None,
-    ) -> httpx.Response:
-        logger.debug(f"Making Request: {method} {endpoint}")
-        logger.debug(f"Params: {params}")
-        logger.debug(f"JSON body: {json}")
-        logger.debug(f"Files: {files}")
+            idempotent: Optional[bool],
+            attempt: int,
+            response: Optional[httpx.Response] = None,
+            exception: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying a failed attempt, or None to stop.
 
-        if timeout is None:
-            timeout = self.single_timeout
-        
-        # Set up authorization and user-agent headers
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "User-Agent": self.USER_AGENT
-        }
-        
-        logger.debug(f"Using timeout: {timeout}s")
-        resp = self._http.request(method, endpoint, params=params, json=json, files=files, headers=headers, timeout=timeout)
+        ``idempotent`` defaults to whether ``method`` is safe to repeat; the
+        lookup endpoints pass True for their POST bodies.
+        """
+        if exception is None and response is not None and response.status_code < 400:
+            return None
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+
+        policy = self.retry
+        if policy is None:
+            return None
+        delay = policy.get_retry_delay(
+            attempt, idempotent, response=response, exception=exception
+        )
+        if delay is None:
+            # Only a retryable failure that used up the attempts counts as exhausted
+            exhausted = attempt > 1 and attempt >= policy.max_attempts
+            if exhausted and policy.is_retryable(idempotent, response, exception):
+                self.retry_stats.record_exhausted()
+            return None
+
+        self.retry_stats.record_retry(attempt)
+        if exception is None and response is not None:
+            reason = f"HTTP {response.status_code}"
+        else:
+            reason = type(exception).__name__
+        logger.warning(
+            "Retrying %s %s after %s (attempt %d of %d) in %.2fs",
+            method, endpoint, reason, attempt, policy.max_attempts, delay,
+        )
+        return delay
 
-        logger.debug(f"Response status code: {resp.status_code}")
-        logger.debug(f"Response headers: {resp.headers}")
-        logger.debug(f"Response body: {resp.content}")
+    def _decode(self, response: httpx.Response) -> Any:
+        """Decode a JSON response body with the client's codec."""
+        return self.json_codec.loads(response.content)
 
-        resp = self._handle_error_response(resp)
+    @staticmethod
+    def _create_typed_decoder() -> Any:
+        # geocodio.typed needs msgspec at import time, so it is only imported
+        # when enabled
+        from geocodio.typed import TypedDecoder
+        return TypedDecoder()
+
+    def _parse_distance(self, response: httpx.Response) -> DistanceResponse:
+        if self._typed_decoder is not None:
+            return self._typed_decoder.distance(response.content)
+        return DistanceResponse.from_api(self._decode(response))
+
+    def _parse_distance_matrix(
+        self, response: httpx.Response
+    ) -> DistanceMatrixResponse:
+        if self._typed_decoder is not None:
+            return self._typed_decoder.distance_matrix(response.content)
+        return DistanceMatrixResponse.from_api(self._decode(response))
 
-        return resp
+    def _encode_body(self, json: Any, headers: Dict[str, str]) -> bytes:
+        """
+        Encode a JSON request body with the client's codec, setting its Content-
+        Type.
+        """
+        headers["Content-Type"] = "application/json"
+        return self.json_codec.dumps(json)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Debug logging
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _log_body(self, label: str, body: Any) -> None:
+        """Log a payload at DEBUG level, truncated, if body logging is enabled."""
+        if (
+            self.log_body_limit is not None
+            and body is not None
+            and logger.isEnabledFor(logging.DEBUG)
+        ):
+            logger.debug("%s: %s", label, TruncatedBody(body, self.log_body_limit))
+
+    def _log_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict],
+        timeout: float,
+        json: Any = None,
+        files: Any = None,
+    ) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Making Request: %s %s (timeout %ss)", method, endpoint, timeout)
+        logger.debug("Params: %s", params)
+        self._log_body("JSON body", json)
+        self._log_body("Files", files)
+
+    def _log_response(self, resp: httpx.Response, stream: bool) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Response status code: %s", resp.status_code)
+        logger.debug("Response headers: %s", resp.headers)
+        if not stream:
+            self._log_body("Response body", resp.content)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Lifecycle hooks
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _emit(self, hook: str, event: Union[RequestEvent, ParseEvent]) -> None:
+        """
+        Call ``hook`` on every registered ClientHooks; a failing hook never
+        fails the request.
+        """
+        for hooks in self.hooks:
+            try:
+                getattr(hooks, hook)(event)
+            except Exception:
+                logger.exception("%s hook of %r failed", hook, hooks)
+
+    def _start_attempt(
+        self, method: str, endpoint: str, lookups: int, attempt: int
+    ) -> Optional[RequestEvent]:
+        """A new event for one HTTP attempt, or None when no hooks are registered."""
+        if not self.hooks:
+            return None
+        return RequestEvent(method, endpoint, lookups, attempt)
+
+    def _finish_attempt(
+            self,
+            event: RequestEvent,
+            started: float,
+            response: Optional[httpx.Response] = None,
+            exception: Optional[BaseException] = None,
+    ) -> None:
+        event.timings["total"] = time.perf_counter() - started
+        event.exception = exception
+        if response is None:
+            return
+        event.status_code = response.status_code
+        event.bytes_received = response.num_bytes_downloaded
+        if not event.bytes_received and response.is_closed:
+            # Transports that hand over the body in one piece do not count
+            # downloaded bytes
+            event.bytes_received = len(response.content)
+        try:
+            content_length = response.request.headers.get("content-length")
+        except RuntimeError:  # responses built without a request
+            content_length = None
+        event.bytes_sent = int(content_length) if content_length is not None else None
+        self._emit("on_response", event)
+
+    def _retrying(self, event: Optional[RequestEvent], delay: float) -> None:
+        if event is not None:
+            event.retry_delay = delay
+            self._emit("on_retry", event)
+
+    def _failed(self, event: Optional[RequestEvent], exception: BaseException) -> None:
+        if event is not None:
+            event.exception = exception
+            self._emit("on_error", event)
+
+    def _parse_lookup(
+        self,
+        req: _PreparedRequest,
+        payload: Union[dict, bytes],
+        keys: Optional[List[str]] = None,
+    ) -> GeocodingResponse | BatchGeocodingResponse:
+        """
+        Parse a geocode/reverse payload, reporting the time taken to
+        ``on_parse_complete``.
+        """
+        return self._timed_parse(
+            req.endpoint,
+            self._lookup_count(req),
+            lambda: self._parse_lookup_payload(req, payload, keys),
+        )
+
+    def _timed_parse(self, endpoint: str, lookups: int, parse: Callable[[], _T]) -> _T:
+        """Return ``parse()``, reporting the time taken to ``on_parse_complete``."""
+        if not self.hooks:
+            return parse()
+        started = time.perf_counter()
+        result = parse()
+        elapsed = time.perf_counter() - started
+        self._emit(
+            "on_parse_complete",
+            ParseEvent(endpoint, lookups, result, {"parse": elapsed}),
+        )
+        return result
+
+    def _parse_lookup_payload(
+        self,
+        req: _PreparedRequest,
+        payload: Union[dict, bytes],
+        keys: Optional[List[str]],
+    ) -> GeocodingResponse | BatchGeocodingResponse:
+        if self._typed_decoder is not None:
+            return self._typed_decoder.geocoding(
+                payload, batch=req.json is not None, keys=keys
+            )
+        # Undecoded bodies are only requested for typed decoding
+        data = self.json_codec.loads(payload) if isinstance(payload, bytes) else payload
+        return self._parse_geocoding_response(data, keys=keys)
 
     def _handle_error_response(self, resp) -> httpx.Response:
         if resp.status_code < 400:
@@ -300,139 +1259,105 @@ class Geocodio:
 
         exception_mappings = self.get_status_exception_mappings()
         # dump the type and content of the exception mappings for debugging
-        logger.error(f"Error response: {resp.status_code} - {resp.text}")
+        logger.error("Error response: %s - %s", resp.status_code, resp.text)
         if resp.status_code in exception_mappings:
             exception_class = exception_mappings[resp.status_code]
+            if issubclass(exception_class, RateLimitError):
+                raise exception_class(
+                    resp.text,
+                    retry_after=parse_retry_after(resp.headers.get("Retry-After")),
+                )
             raise exception_class(resp.text)
         else:
             raise GeocodioServerError(f"Unrecognized status code {resp.status_code}: {resp.text}")
 
-    def _parse_geocoding_response(self, response_json: dict) -> GeocodingResponse:
-        logger.debug(f"Raw response: {response_json}")
+    def _parse_geocoding_result(
+        self, res: dict
+    ) -> GeocodingResult | LazyGeocodingResult:
+        if self.lazy_parsing:
+            return LazyGeocodingResult(res, self._parse_fields)
+        return GeocodingResult(
+            address_components=AddressComponents.from_api(res["address_components"]),
+            formatted_address=res["formatted_address"],
+            location=Location(**res["location"]),
+            accuracy=res.get("accuracy", 0.0),
+            accuracy_type=res.get("accuracy_type", ""),
+            source=res.get("source", ""),
+            fields=self._parse_fields(res.get("fields")),
+        )
+
+    def _parse_batch_item(self, res: dict, key: Optional[str]) -> BatchGeocodingItem:
+        response = res.get("response") or {}
+        return BatchGeocodingItem(
+            query=res.get("query"),
+            results=[
+                self._parse_geocoding_result(r) for r in response.get("results", [])
+            ],
+            key=key,
+            input=response.get("input", {}),
+            error=response.get("error"),
+        )
+
+    def _parse_geocoding_response(
+            self, response_json: dict, keys: Optional[List[str]] = None
+    ) -> GeocodingResponse | BatchGeocodingResponse:
+        self._log_body("Raw response", response_json)
+
+        raw_results = response_json.get("results", [])
+        # Keyed batches may come back as an object keyed by the custom keys
+        if isinstance(raw_results, dict):
+            keys = list(raw_results.keys())
+            raw_results = list(raw_results.values())
 
         # Handle batch response format
-        if "results" in response_json and isinstance(response_json["results"], list) and response_json[
-            "results"] and "response" in response_json["results"][0]:
-            results = [
-                GeocodingResult(
-                    address_components=AddressComponents.from_api(res["response"]["results"][0]["address_components"]),
-                    formatted_address=res["response"]["results"][0]["formatted_address"],
-                    location=Location(**res["response"]["results"][0]["location"]),
-                    accuracy=res["response"]["results"][0].get("accuracy", 0.0),
-                    accuracy_type=res["response"]["results"][0].get("accuracy_type", ""),
-                    source=res["response"]["results"][0].get("source", ""),
-                    fields=self._parse_fields(res["response"]["results"][0].get("fields")),
-                )
-                for res in response_json["results"]
+        if raw_results and "response" in raw_results[0]:
+            keys = keys or []
+            items = [
+                self._parse_batch_item(res, keys[i] if i < len(keys) else None)
+                for i, res in enumerate(raw_results)
             ]
-            return GeocodingResponse(input=response_json.get("input", {}), results=results)
+            return BatchGeocodingResponse(
+                input=response_json.get("input", {}),
+                results=[item.best for item in items],
+                items=items,
+            )
 
         # Handle single response format
         results = [
-            GeocodingResult(
-                address_components=AddressComponents.from_api(res["address_components"]),
-                formatted_address=res["formatted_address"],
-                location=Location(**res["location"]),
-                accuracy=res.get("accuracy", 0.0),
-                accuracy_type=res.get("accuracy_type", ""),
-                source=res.get("source", ""),
-                fields=self._parse_fields(res.get("fields")),
-            )
-            for res in response_json.get("results", [])
+            self._parse_geocoding_result(res)
+            for res in raw_results
         ]
         return GeocodingResponse(input=response_json.get("input", {}), results=results)
 
-    # ──────────────────────────────────────────────────────────────────────────
-    # List API methods
-    # ──────────────────────────────────────────────────────────────────────────
-
-    DIRECTION_FORWARD = "forward"
-    DIRECTION_REVERSE = "reverse"
-
-    def create_list(
-            self,
-            file: Optional[str] = None,
-            filename: Optional[str] = None,
-            direction: str = DIRECTION_FORWARD,
-            format_: Optional[str] = "{{A}}",
-            callback_url: Optional[str] = None,
-            fields: list[str] | None = None
+    @staticmethod
+    def _parse_list_response(
+        response_json: dict, response: Optional[httpx.Response] = None
     ) -> ListResponse:
         """
-        Create a new geocoding list.
+        Parse a response from the List API.
 
         Args:
-            file: The file content as a string. Required.
-            filename: The name of the file. Defaults to "file.csv".
-            direction: The direction of geocoding. Either "forward" or "reverse". Defaults to "forward".
-            format_: The format string for the output. Defaults to "{{A}}".
-            callback_url: Optional URL to call when processing is complete.
-            fields: Optional list of fields to include in the response. Valid fields include:
-                   - census2010, census2020, census2023
-                   - cd, cd113-cd119 (congressional districts)
-                   - stateleg, stateleg-next (state legislative districts)
-                   - school (school districts)
-                   - timezone
-                   - acs, acs-demographics, acs-economics, acs-families, acs-housing, acs-social
-                   - riding, provriding, provriding-next (Canadian data)
-                   - statcan (Statistics Canada data)
-                   - zip4 (ZIP+4 data)
-                   - ffiec (FFIEC data, beta)
-
-        Returns:
-            A ListResponse object containing the created list information.
-
-        Raises:
-            ValueError: If file is not provided.
-            InvalidRequestError: If the API request is invalid.
-            AuthenticationError: If the API key is invalid.
-            GeocodioServerError: If the server encounters an error.
-        """
-        params: Dict[str, Union[str, int]] = {}
-        endpoint = f"{self.BASE_PATH}/lists"
-
-        if not file:
-            raise ValueError("File data is required to create a list.")
-        filename = filename or "file.csv"
-        files = {
-            "file": (filename, file),
-        }
-        if direction:
-            params["direction"] = direction
-        if format_:
-            params["format"] = format_
-        if callback_url:
-            params["callback"] = callback_url
-        if fields:
-            # Join fields with commas as required by the API
-            params["fields"] = ",".join(fields)
-
-        response = self._request("POST", endpoint, params, files=files, timeout=self.list_timeout)
-        logger.debug(f"Response content: {response.text}")
-        return self._parse_list_response(response.json(), response=response)
-
-    def get_lists(self) -> PaginatedResponse:
-        """
-        Retrieve all lists.
+            response_json: The JSON response from the List API.
 
         Returns:
-            A ListResponse object containing all lists.
+            A ListResponse object.
         """
-        params: Dict[str, Union[str, int]] = {}
-        endpoint = f"{self.BASE_PATH}/lists"
-
-        response = self._request("GET", endpoint, params, timeout=self.list_timeout)
-        pagination_info = response.json()
-
-        logger.debug(f"Pagination info: {pagination_info}")
-
-        response_lists = []
-        for list_item in pagination_info.get("data", []):
-            logger.debug(f"List item: {list_item}")
-            response_lists.append(self._parse_list_response(list_item, response=response))
+        return ListResponse(
+            id=response_json.get("id"),
+            file=response_json.get("file"),
+            status=response_json.get("status"),
+            download_url=response_json.get("download_url"),
+            expires_at=response_json.get("expires_at"),
+            http_response=response,
+        )
 
+    @staticmethod
+    def _parse_paginated_response(
+        pagination_info: dict, items: list
+    ) -> PaginatedResponse:
+        """Wrap already-parsed page items with the pagination metadata."""
         return PaginatedResponse(
-            data=response_lists,
+            data=items,
             current_page=pagination_info.get("current_page", 1),
             from_=pagination_info.get("from", 0),
             to=pagination_info.get("to", 0),
@@ -443,55 +1368,198 @@ class Geocodio:
             prev_page_url=pagination_info.get("prev_page_url")
         )
 
-    def get_list(self, list_id: str) -> ListResponse:
+    @staticmethod
+    def _next_page_number(page: PaginatedResponse) -> Optional[int]:
+        """The page number ``next_page_url`` points to, or None on the last page."""
+        if not page.next_page_url or not page.data:
+            return None
+        try:
+            number = int(
+                httpx.URL(page.next_page_url).params.get("page", page.current_page + 1)
+            )
+        except (httpx.InvalidURL, ValueError):
+            number = page.current_page + 1
+        # A link that does not move forward would paginate forever
+        return number if number > page.current_page else None
+
+    def _parse_lists_page(self, response: httpx.Response) -> PaginatedResponse:
+        pagination_info = self._decode(response)
+        response_lists = [
+            self._parse_list_response(list_item, response=response)
+            for list_item in pagination_info.get("data", [])
+        ]
+
+        return self._parse_paginated_response(pagination_info, response_lists)
+
+    @staticmethod
+    def _created_list_ids(
+        results: List[Union[ListResponse, BaseException]],
+    ) -> Tuple[List[Any], Optional[BaseException]]:
         """
-        Retrieve a list by ID.
+        IDs of the lists that shard uploads created, and the first upload error,
+        if any.
+        """
+        list_ids = [
+            result.id for result in results if not isinstance(result, BaseException)
+        ]
+        errors = [result for result in results if isinstance(result, BaseException)]
+        return list_ids, errors[0] if errors else None
 
-        Args:
-            list_id: The ID of the list to retrieve.
+    @staticmethod
+    def _shard_upload_failed(
+        error: BaseException, list_ids: List[Any], remaining: List[Any]
+    ) -> BaseException:
+        """
+        Note on an upload error which lists were created before it and which
+        still exist.
+        """
+        if list_ids:
+            note = f"Lists created by the other shards: {list_ids}"
+            if remaining:
+                note += f"; not deleted: {remaining}"
+            error.add_note(note)
+            logger.warning(
+                "Uploading a shard failed; lists created by the other shards: %s, "
+                "not deleted: %s", list_ids, remaining,
+            )
+        return error
+
+    @staticmethod
+    def _check_list_finished(response: ListResponse) -> None:
+        """Raise if a list finished in the FAILED state."""
+        status = response.status or {}
+        if status.get("state") == LIST_STATE_FAILED:
+            raise GeocodioServerError(
+                f"List {response.id} failed: {status.get('message', 'no details')}"
+            )
+
+    @staticmethod
+    def _check_distance_job(
+        job_id: Union[str, int], job: DistanceJobResponse
+    ) -> DistanceJobResponse:
+        """Return a finished job, raising DistanceJobFailedError if it failed."""
+        if job.status == DistanceJobState.FAILED:
+            raise DistanceJobFailedError(
+                f"Distance matrix job {job_id} failed", job=job
+            )
+        return job
+
+    def _parse_distance_jobs_page(self, response: httpx.Response) -> PaginatedResponse:
+        pagination_info = self._decode(response)
+
+        job_responses = [
+            DistanceJobResponse.from_api(job_data)
+            for job_data in pagination_info.get("data", [])
+        ]
 
-        Returns:
-            A ListResponse object containing the retrieved list.
-        """
-        params: Dict[str, Union[str, int]] = {}
-        endpoint = f"{self.BASE_PATH}/lists/{list_id}"
+        # Reuse PaginatedResponse but with job data
+        return self._parse_paginated_response(pagination_info, job_responses)
 
-        response = self._request("GET", endpoint, params, timeout=self.list_timeout)
-        return self._parse_list_response(response.json(), response=response)
+    def _parse_distance_job_results(
+        self, response: httpx.Response
+    ) -> DistanceMatrixResponse:
+        # Check if response is JSON (success) or error
+        content_type = response.headers.get("content-type", "")
+        if "application/json" in content_type:
+            return self._parse_distance_matrix(response)
+        else:
+            raise GeocodioServerError(
+                f"Unexpected response format: {content_type}. "
+                f"Job may not be complete."
+            )
 
-    def delete_list(self, list_id: str) -> None:
-        """
-        Delete a list.
+    @staticmethod
+    def _is_download_error(response: httpx.Response) -> bool:
+        """List downloads report errors such as "still processing" as JSON."""
+        return response.headers.get("content-type", "").startswith("application/json")
 
-        Args:
-            list_id: The ID of the list to delete.
-        """
-        params: Dict[str, Union[str, int]] = {}
-        endpoint = f"{self.BASE_PATH}/lists/{list_id}"
+    def _raise_list_download_error(
+        self, list_id: Union[str, int], response: httpx.Response
+    ) -> None:
+        try:
+            error = self._decode(response)
+            logger.error("Error downloading list %s: %s", list_id, error)
+            raise GeocodioServerError(error.get("message", "Failed to download list."))
+        except Exception as e:
+            logger.error(
+                "Failed to parse error message from response: %s",
+                response.text,
+                exc_info=True,
+            )
+            raise GeocodioServerError(
+                "Failed to download list and could not parse error message."
+            ) from e
 
-        self._request("DELETE", endpoint, params, timeout=self.list_timeout)
+    def _save_list_download(self, list_id: str, response: httpx.Response) -> bytes:
+        """Return the content of a buffered list download."""
+        if self._is_download_error(response):
+            self._raise_list_download_error(list_id, response)
+        return response.content
 
     @staticmethod
-    def _parse_list_response(response_json: dict, response: httpx.Response = None) -> ListResponse:
-        """
-        Parse a response from the List API.
+    def _download_failed(
+        kind: str, ident: Union[str, int], error: OSError
+    ) -> GeocodioServerError:
+        logger.error("Failed to save %s %s: %s", kind, ident, error, exc_info=True)
+        return GeocodioServerError(f"Failed to save {kind}: {error}")
+
+    @classmethod
+    def _open_download_sink(
+            cls,
+            kind: str,
+            ident: Union[str, int],
+            destination: Destination,
+            progress: Optional[ProgressCallback],
+            offset: int,
+            total: Optional[int],
+            keep_partial: bool,
+            chunk_size: int,
+    ) -> DownloadSink:
+        if is_path(destination):
+            action = f"Resuming at byte {offset}" if offset else "Saving"
+            logger.debug(
+                "%s %s %s to %s", action, kind, ident,
+                os.path.abspath(os.fspath(destination)),
+            )
+        try:
+            return DownloadSink(
+                destination, progress, total, offset, keep_partial, chunk_size
+            )
+        except OSError as e:
+            raise cls._download_failed(kind, ident, e)
+
+    @classmethod
+    def _finish_download(
+        cls, kind: str, ident: Union[str, int], sink: DownloadSink
+    ) -> Union[str, BinaryIO]:
+        if not sink.complete:
+            sink.abort()
+            raise GeocodioServerError(
+                f"Incomplete {kind} download: "
+                f"received {sink.size} of {sink.total} bytes"
+            )
+        try:
+            saved = sink.commit()
+        except OSError as e:
+            sink.abort()
+            raise cls._download_failed(kind, ident, e)
+        logger.info("%s %s downloaded (%d bytes)", kind.capitalize(), ident, sink.size)
+        return saved
 
-        Args:
-            response_json: The JSON response from the List API.
+    def _normalize_coordinate(
+        self,
+        coord: Union[str, Tuple[float, float], Dict, "Coordinate"],
+    ) -> "Coordinate":
+        """Convert various input formats to Coordinate object."""
+        return Coordinate.from_input(coord)
 
-        Returns:
-            A ListResponse object.
-        """
-        logger.debug(f"{response_json}")
-        return ListResponse(
-            id=response_json.get("id"),
-            file=response_json.get("file"),
-            status=response_json.get("status"),
-            download_url=response_json.get("download_url"),
-            expires_at=response_json.get("expires_at"),
-            http_response=response,
-        )
+    def _coordinate_to_string(self, coord: "Coordinate") -> str:
+        """Convert Coordinate to string for GET requests: 'lat,lng' or 'lat,lng,id'."""
+        return coord.to_string()
 
+    def _coordinate_to_dict(self, coord: "Coordinate") -> Dict:
+        """Convert Coordinate to dict for POST requests."""
+        return coord.to_dict()
 
     @staticmethod
     def _parse_stateleg(data) -> list:
@@ -771,76 +1839,821 @@ class Geocodio:
             **acs_fields,  # Dynamically include all ACS metric fields
         )
 
-    # @TODO add a "keep_trying" parameter to download() to keep trying until the list is processed.
-    def download(self, list_id: str, filename: Optional[str] = None) -> str | bytes:
+
+class Geocodio(_BaseGeocodio):
+
+    def _create_http_client(self, options: Dict[str, Any]) -> httpx.Client:
+        return httpx.Client(**options)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Open connections to the API ahead of the first real request.
+
+        Sends ``connections`` concurrent ``HEAD`` requests to the API host so the
+        TCP and TLS handshakes are done and the connections sit in the keep-alive
+        pool. No lookups are made. Failures are logged rather than raised.
+
+        Args:
+            connections: Number of connections to open; set it to the expected
+                concurrency (e.g. ``batch_concurrency``). With ``http2=True`` one is
+                enough.
+
+        Returns:
+            The number of connections that were opened successfully.
+        """
+        count = self._warm_up_count(connections)
+
+        def ping(_: int) -> bool:
+            try:
+                self._http.request(
+                    "HEAD", "/", headers=self._headers(), timeout=self.single_timeout
+                )
+            except httpx.HTTPError as exc:
+                self._warm_up_failed(exc)
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            return sum(pool.map(ping, range(count)))
+
+    def __enter__(self) -> "Geocodio":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Public methods
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def geocode(
+        self,
+        address: Union[
+            str,
+            Dict[str, str],
+            List[Union[str, Dict[str, str]]],
+            Dict[str, Union[str, Dict[str, str]]],
+        ],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        country: Optional[str] = None,
+        # Distance parameters
+        destinations: Optional[
+            List[Union[str, Tuple[float, float], "Coordinate"]]
+        ] = None,
+        distance_mode: Optional[str] = None,
+        distance_units: Optional[str] = None,
+        distance_max_results: Optional[int] = None,
+        distance_max_distance: Optional[float] = None,
+        distance_max_duration: Optional[int] = None,
+        distance_min_distance: Optional[float] = None,
+        distance_min_duration: Optional[int] = None,
+        distance_order_by: Optional[str] = None,
+        distance_sort_order: Optional[str] = None,
+    ) -> GeocodingResponse:
+        req = self._build_geocode_request(
+            address, fields, limit, country, destinations,
+            distance_mode, distance_units, distance_max_results,
+            distance_max_distance, distance_max_duration,
+            distance_min_distance, distance_min_duration,
+            distance_order_by, distance_sort_order,
+        )
+        return self._parse_lookup(
+            req, self._send_lookup(req), keys=self._batch_keys(req)
+        )
+
+    def reverse(
+        self,
+        coordinate: Union[
+            str, Tuple[float, float], List[Union[str, Tuple[float, float]]]
+        ],
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        # Distance parameters
+        destinations: Optional[
+            List[Union[str, Tuple[float, float], "Coordinate"]]
+        ] = None,
+        distance_mode: Optional[str] = None,
+        distance_units: Optional[str] = None,
+        distance_max_results: Optional[int] = None,
+        distance_max_distance: Optional[float] = None,
+        distance_max_duration: Optional[int] = None,
+        distance_min_distance: Optional[float] = None,
+        distance_min_duration: Optional[int] = None,
+        distance_order_by: Optional[str] = None,
+        distance_sort_order: Optional[str] = None,
+    ) -> GeocodingResponse:
+        req = self._build_reverse_request(
+            coordinate, fields, limit, destinations,
+            distance_mode, distance_units, distance_max_results,
+            distance_max_distance, distance_max_duration,
+            distance_min_distance, distance_min_duration,
+            distance_order_by, distance_sort_order,
+        )
+        return self._parse_lookup(
+            req, self._send_lookup(req), keys=self._batch_keys(req)
+        )
+
+    def geocode_stream(
+            self,
+            addresses: Iterable[Union[str, Dict[str, str]]],
+            chunk_size: Optional[int] = None,
+            concurrency: Optional[int] = None,
+            ordered: bool = True,
+            **options,
+    ) -> Iterator[Tuple[int, BatchGeocodingItem]]:
+        """
+        Geocode an arbitrarily large iterable of addresses, yielding results as
+        they arrive.
+
+        Input is pulled lazily in chunks and at most ``concurrency`` chunks are in
+        flight at once, so memory use stays flat regardless of the input size.
+
+        Args:
+            addresses: Any iterable of address strings or structured address dicts,
+                e.g. a generator reading rows from a CSV file.
+            chunk_size: Lookups per batch request. Defaults to the client's
+                ``batch_size``.
+            concurrency: Maximum chunks in flight. Defaults to the client's
+                ``batch_concurrency``.
+            ordered: Yield results in input order (True) or as soon as each chunk
+                completes (False).
+            **options: Any other geocode() argument, e.g. ``fields`` or ``limit``.
+
+        Yields:
+            ``(index, item)`` pairs where ``index`` is the position of the address in
+            ``addresses`` and ``item`` is a ``BatchGeocodingItem`` with every candidate.
+
+        Example:
+            >>> with open("addresses.csv") as f:
+            ...     addresses = (row["address"] for row in csv.DictReader(f))
+            ...     for index, item in client.geocode_stream(addresses):
+            ...         print(index, item.best.formatted_address if item.best else None)
+        """
+        return self._stream_lookup(
+            self._build_geocode_request, addresses, chunk_size, concurrency, ordered,
+            options,
+        )
+
+    def reverse_stream(
+            self,
+            coordinates: Iterable[Union[str, Tuple[float, float]]],
+            chunk_size: Optional[int] = None,
+            concurrency: Optional[int] = None,
+            ordered: bool = True,
+            **options,
+    ) -> Iterator[Tuple[int, BatchGeocodingItem]]:
+        """
+        Reverse geocode an arbitrarily large iterable of coordinates, yielding
+        results as they arrive.
+
+        Accepts the same arguments as :meth:`geocode_stream`; ``**options`` are
+        passed to reverse().
+        """
+        return self._stream_lookup(
+            self._build_reverse_request, coordinates, chunk_size, concurrency, ordered,
+            options,
+        )
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Internal helpers
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _send_lookup(self, req: _PreparedRequest) -> Union[dict, bytes]:
+        """Send a geocode/reverse request through the cache, if one is configured."""
+        cache = self.cache
+        if cache is None:
+            return self._dispatch_lookup(req, raw=self.typed_decoding)
+
+        plan = self._plan_cached_lookup(cache, req)
+        payload = (
+            self._dispatch_lookup(plan.miss_request) if plan.miss_request else None
+        )
+        return self._complete_cached_lookup(cache, plan, payload)
+
+    def _stream_lookup(
+            self,
+            build: Callable[..., _PreparedRequest],
+            inputs: Iterable,
+            chunk_size: Optional[int],
+            concurrency: Optional[int],
+            ordered: bool,
+            options: dict,
+    ) -> Iterator[Tuple[int, BatchGeocodingItem]]:
+        chunk_size, concurrency = self._stream_settings(chunk_size, concurrency)
+        return self._stream_chunks(
+            build, iter_chunks(inputs, chunk_size), concurrency, ordered, options
+        )
+
+    def _stream_chunks(
+            self,
+            build: Callable[..., _PreparedRequest],
+            chunks: Iterator[Tuple[int, list]],
+            concurrency: int,
+            ordered: bool,
+            options: dict,
+    ) -> Iterator[Tuple[int, BatchGeocodingItem]]:
+        def run(offset: int, chunk: list) -> List[Tuple[int, BatchGeocodingItem]]:
+            req = build(chunk, **options)
+            response = self._parse_lookup(req, self._send_lookup(req))
+            return self._stream_pairs(offset, response)
+
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        pending: "deque[Future]" = deque()
+
+        def collect(keep: int) -> Iterator[Tuple[int, BatchGeocodingItem]]:
+            # Yield finished chunks until at most ``keep`` are still in flight
+            while len(pending) > keep:
+                if ordered:
+                    yield from pending.popleft().result()
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+
+        try:
+            for offset, chunk in chunks:
+                pending.append(pool.submit(run, offset, chunk))
+                yield from collect(concurrency - 1)
+            yield from collect(0)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @overload
+    def _dispatch_lookup(
+        self, req: _PreparedRequest, raw: Literal[False] = ...
+    ) -> dict:
+        ...
+
+    @overload
+    def _dispatch_lookup(self, req: _PreparedRequest, raw: bool) -> Union[dict, bytes]:
+        ...
+
+    def _dispatch_lookup(
+        self, req: _PreparedRequest, raw: bool = False
+    ) -> Union[dict, bytes]:
+        """
+        Send a geocode/reverse request and return the decoded JSON.
+
+        Batches larger than ``batch_size`` are split into chunks that are sent
+        over up to ``batch_concurrency`` connections, then merged in input order.
+        With ``raw``, a request sent in one piece returns the undecoded body.
+        """
+        chunks = self._split_batch_request(req) if req.json is not None else [req]
+        if len(chunks) == 1:
+            response = self._request(
+                req.method,
+                req.endpoint,
+                req.params,
+                json=req.json,
+                timeout=req.timeout,
+                idempotent=True,
+                lookups=self._lookup_count(req),
+            )
+            return response.content if raw else self._decode(response)
+
+        def send(chunk: _PreparedRequest) -> dict:
+            response = self._request(
+                chunk.method,
+                chunk.endpoint,
+                chunk.params,
+                json=chunk.json,
+                timeout=chunk.timeout,
+                idempotent=True,
+                lookups=self._lookup_count(chunk),
+            )
+            return self._decode(response)
+
+        logger.debug(
+            "Sending batch as %d chunks of up to %d lookups",
+            len(chunks),
+            self.batch_size,
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self.batch_concurrency, len(chunks))
+        ) as pool:
+            payloads = list(pool.map(send, chunks))
+        return merge_batch_payloads(payloads)
+
+    def _request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Optional[dict] = None,
+            json: Optional[Union[dict, list]] = None,
+            files: Optional[dict] = None,
+            timeout: Optional[float] = None,
+            idempotent: Optional[bool] = None,
+            lookups: int = 0,
+            headers: Optional[dict] = None,
+            content: Any = None,
+            stream: bool = False,
+    ) -> httpx.Response:
+        if timeout is None:
+            timeout = self.single_timeout
+        self._log_request(method, endpoint, params, timeout, json, files)
+
+        # Set up authorization and user-agent headers
+        headers = {**self._headers(), **(headers or {})}
+        if json is not None:
+            content = self._encode_body(json, headers)
+            json = None
+
+        attempt = 1
+        while True:
+            event = self._start_attempt(method, endpoint, lookups, attempt)
+            started = time.perf_counter()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(lookups)
+                if event is not None:
+                    event.timings["rate_limit"] = time.perf_counter() - started
+            extensions = None
+            if event is not None:
+                extensions = {"trace": PhaseTimer(event.timings).trace}
+                self._emit("on_request", event)
+            try:
+                if stream:
+                    request = self._http.build_request(
+                        method,
+                        endpoint,
+                        params=params,
+                        json=json,
+                        files=files,
+                        content=content,
+                        headers=headers,
+                        timeout=timeout,
+                        extensions=extensions,
+                    )
+                    resp = self._http.send(request, stream=True)
+                else:
+                    resp = self._http.request(
+                        method,
+                        endpoint,
+                        params=params,
+                        json=json,
+                        files=files,
+                        content=content,
+                        headers=headers,
+                        timeout=timeout,
+                        extensions=extensions,
+                    )
+            except Exception as exc:
+                if event is not None:
+                    self._finish_attempt(event, started, exception=exc)
+                delay = self._retry_delay(
+                    method, endpoint, idempotent, attempt, exception=exc
+                )
+                if delay is None:
+                    self._failed(event, exc)
+                    raise
+            else:
+                if event is not None:
+                    self._finish_attempt(event, started, response=resp)
+                delay = self._retry_delay(
+                    method, endpoint, idempotent, attempt, response=resp
+                )
+                if delay is None:
+                    break
+                resp.close()
+            self._retrying(event, delay)
+            time.sleep(delay)
+            attempt += 1
+
+        if stream and resp.status_code >= 400:
+            # Error bodies are small; read them so they can be reported
+            resp.read()
+
+        self._log_response(resp, stream)
+        try:
+            resp = self._handle_error_response(resp)
+        except GeocodioError as exc:
+            self._failed(event, exc)
+            raise
+
+        return resp
+
+    def _download_to(
+            self,
+            kind: str,
+            ident: Union[str, int],
+            endpoint: str,
+            destination: Destination,
+            progress: Optional[ProgressCallback],
+            chunk_size: int,
+            resume: bool,
+    ) -> Union[str, BinaryIO]:
+        """
+        Stream a download body to ``destination`` chunk by chunk.
+
+        With ``resume`` an existing partial file is continued with a ``Range``
+        request, and a connection dropped mid-body is resumed from the last
+        byte written whenever the retry policy allows another attempt.
+        """
+        if resume and not is_path(destination):
+            raise ValueError("resume=True requires a file path destination")
+        offset = partial_size(destination) if resume else 0
+        attempt = 1
+        restarted = False
+        while True:
+            # Ranges count bytes of the encoded body, so resumable downloads ask
+            # for it unencoded
+            headers = {"Accept-Encoding": "identity"} if resume else {}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            try:
+                response = self._request(
+                    "GET",
+                    endpoint,
+                    timeout=self.list_timeout,
+                    headers=headers,
+                    stream=True,
+                )
+            except RangeNotSatisfiableError:
+                # Only a ranged request can be answered by starting over, and only once
+                if not offset or restarted:
+                    raise
+                logger.info(
+                    "Partial %s %s does not match the remote file; "
+                    "downloading it again", kind, ident,
+                )
+                discard_partial(destination)
+                offset = 0
+                restarted = True
+                continue
+            try:
+                if kind == "list" and self._is_download_error(response):
+                    response.read()
+                    self._raise_list_download_error(ident, response)
+                position = resume_offset(response, offset)
+                if position is None:
+                    logger.info(
+                        "Server returned an unexpected range for %s %s; "
+                        "downloading it again", kind, ident,
+                    )
+                    discard_partial(destination)
+                    offset = 0
+                    continue
+                sink = self._open_download_sink(
+                    kind, ident, destination, progress,
+                    *position,
+                    keep_partial=resume,
+                    chunk_size=chunk_size,
+                )
+                try:
+                    # Unbuffered, so bytes received before a dropped connection are kept
+                    for chunk in response.iter_bytes():
+                        sink.write(chunk)
+                except httpx.TransportError as exc:
+                    sink.abort()
+                    delay = (
+                        self._retry_delay("GET", endpoint, True, attempt, exception=exc)
+                        if resume
+                        else None
+                    )
+                    if delay is None:
+                        raise
+                    offset = sink.size
+                    attempt += 1
+                    time.sleep(delay)
+                    continue
+                except BaseException as e:
+                    sink.abort()
+                    if isinstance(e, OSError):
+                        raise self._download_failed(kind, ident, e)
+                    raise
+                return self._finish_download(kind, ident, sink)
+            finally:
+                response.close()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # List API methods
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def create_list(
+            self,
+            file: Optional[UploadSource] = None,
+            filename: Optional[str] = None,
+            direction: str = _BaseGeocodio.DIRECTION_FORWARD,
+            format_: Optional[str] = "{{A}}",
+            callback_url: Optional[str] = None,
+            fields: list[str] | None = None,
+            compress: bool = False,
+    ) -> ListResponse:
+        """
+        Create a new geocoding list.
+
+        Paths, file objects and row iterables are streamed into the multipart
+        request as it is sent, so memory use stays constant for large files.
+
+        Args:
+            file: The file content as a string or bytes, a path
+                (``pathlib.Path`` or other ``os.PathLike``), a binary file
+                object, or an iterable of rows. Rows are written as CSV; a plain
+                string row is a single column. Required.
+            filename: The name of the file. Defaults to the path's or file
+                object's name, else "file.csv".
+            direction: The direction of geocoding. Either "forward" or "reverse". Defaults to "forward".
+            format_: The format string for the output. Defaults to "{{A}}".
+            callback_url: Optional URL to call when processing is complete.
+            fields: Optional list of fields to include in the response. Valid fields include:
+                   - census2010, census2020, census2023
+                   - cd, cd113-cd119 (congressional districts)
+                   - stateleg, stateleg-next (state legislative districts)
+                   - school (school districts)
+                   - timezone
+                   - acs, acs-demographics, acs-economics, acs-families, acs-housing, acs-social
+                   - riding, provriding, provriding-next (Canadian data)
+                   - statcan (Statistics Canada data)
+                   - zip4 (ZIP+4 data)
+                   - ffiec (FFIEC data, beta)
+            compress: Gzip the file while uploading and send it as ``<filename>.gz``.
+
+        Returns:
+            A ListResponse object containing the created list information.
+
+        Raises:
+            ValueError: If file is not provided.
+            InvalidRequestError: If the API request is invalid.
+            AuthenticationError: If the API key is invalid.
+            GeocodioServerError: If the server encounters an error.
+        """
+        req = self._build_create_list_request(
+            file, filename, direction, format_, callback_url, fields, compress
+        )
+        if req.upload is not None:
+            response = self._request(
+                req.method, req.endpoint, req.params, content=req.upload.iter_bytes(),
+                headers={"Content-Type": req.upload.content_type}, timeout=req.timeout,
+            )
+        else:
+            response = self._request(
+                req.method,
+                req.endpoint,
+                req.params,
+                files=req.files,
+                timeout=req.timeout,
+            )
+        return self._parse_list_response(self._decode(response), response=response)
+
+    def get_lists(self, page: int = 1) -> PaginatedResponse:
+        """
+        Retrieve one page of lists.
+
+        Args:
+            page: Page number for pagination.
+
+        Returns:
+            A PaginatedResponse whose ``data`` holds ListResponse objects.
+            Use :meth:`iter_lists` to walk every page.
+        """
+        params: Dict[str, Union[str, int]] = {}
+        if page > 1:
+            params["page"] = page
+        endpoint = f"{self.BASE_PATH}/lists"
+
+        response = self._request("GET", endpoint, params, timeout=self.list_timeout)
+        return self._parse_lists_page(response)
+
+    def iter_lists(self, prefetch: bool = True) -> Iterator[ListResponse]:
+        """
+        Iterate over every list on the account, one page at a time.
+
+        Pages are requested lazily by following ``next_page_url``, so
+        breaking out of the loop stops further requests.
+
+        Args:
+            prefetch: Request the next page in the background while the
+                current one is being consumed.
+
+        Yields:
+            ListResponse objects in the order the API returns them.
+
+        Example:
+            >>> for item in client.iter_lists():
+            ...     if item.status and item.status.get("state") == "FAILED":
+            ...         client.delete_list(item.id)
+        """
+        yield from self._iter_pages(self.get_lists, prefetch)
+
+    def _iter_pages(
+        self, fetch: Callable[[int], PaginatedResponse], prefetch: bool
+    ) -> Iterator[Any]:
+        """
+        Yield the items of each page from ``fetch(page)``, fetching at most one
+        page ahead.
+        """
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch(1)
+            while True:
+                number = self._next_page_number(page)
+                upcoming = (
+                    pool.submit(fetch, number) if pool is not None and number else None
+                )
+                yield from page.data
+                if number is None:
+                    return
+                page = upcoming.result() if upcoming is not None else fetch(number)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def get_list(self, list_id: str) -> ListResponse:
+        """
+        Retrieve a list by ID.
+
+        Args:
+            list_id: The ID of the list to retrieve.
+
+        Returns:
+            A ListResponse object containing the retrieved list.
+        """
+        params: Dict[str, Union[str, int]] = {}
+        endpoint = f"{self.BASE_PATH}/lists/{list_id}"
+
+        response = self._request("GET", endpoint, params, timeout=self.list_timeout)
+        return self._parse_list_response(self._decode(response), response=response)
+
+    def delete_list(self, list_id: str) -> None:
+        """
+        Delete a list.
+
+        Args:
+            list_id: The ID of the list to delete.
+        """
+        params: Dict[str, Union[str, int]] = {}
+        endpoint = f"{self.BASE_PATH}/lists/{list_id}"
+
+        self._request("DELETE", endpoint, params, timeout=self.list_timeout)
+
+    def _delete_list_quietly(self, list_id: str) -> bool:
+        """Delete a list during cleanup, logging instead of raising on failure."""
+        try:
+            self.delete_list(list_id)
+        except (GeocodioError, httpx.HTTPError):
+            logger.warning("Could not delete list %s", list_id, exc_info=True)
+            return False
+        return True
+
+    def download(
+            self,
+            list_id: str,
+            filename: Optional[Destination] = None,
+            progress: Optional[ProgressCallback] = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            resume: bool = False,
+    ) -> str | bytes | BinaryIO:
         """
         This will generate/retrieve the fully geocoded list as a CSV file, and either return the content as bytes
         or save the file to disk with the provided filename.
 
+        When ``filename`` is given the body is streamed in ``chunk_size`` pieces,
+        so memory use stays constant regardless of the list size. A path is
+        written to ``<filename>.part`` and renamed into place once complete; a
+        writable binary file object is written to directly.
+
         Args:
             list_id: The ID of the list to download.
             filename: filename to assign to the file (optional). If provided, the content will be saved to this file.
+                May also be a writable binary file object.
+            progress: Optional ``progress(bytes_written, total_bytes)`` callback;
+                ``total_bytes`` is None when the server does not announce the size.
+            chunk_size: Largest piece written to the destination (and reported
+                to ``progress``) at once.
+            resume: Continue an interrupted download from ``<filename>.part``
+                with an HTTP ``Range`` request and keep the partial file if this
+                download fails too. With a ``retry`` policy, connections dropped
+                mid-download are resumed from the last byte received. Falls back
+                to a full download when the server ignores the range. Requires a
+                file path.
 
         Returns:
-            The content of the file as a Bytes object, or the full file path string if filename is provided.
+            The content of the file as a Bytes object, the full file path string
+            if a filename is provided, or the file object it was given.
         Raises:
             GeocodioServerError if the list is still processing or another error occurs.
         """
-        params = {}
+        params: Dict[str, Any] = {}
         endpoint = f"{self.BASE_PATH}/lists/{list_id}/download"
 
-        response: httpx.Response = self._request("GET", endpoint, params, timeout=self.list_timeout)
-        if response.headers.get("content-type", "").startswith("application/json"):
-            try:
-                error = response.json()
-                logger.error(f"Error downloading list {list_id}: {error}")
-                raise GeocodioServerError(error.get("message", "Failed to download list."))
-            except Exception as e:
-                logger.error(f"Failed to parse error message from response: {response.text}", exc_info=True)
-                raise GeocodioServerError("Failed to download list and could not parse error message.") from e
-        else:
-            if filename:
-                # If a filename is provided, save the response content to a file of that name=
-                # get the absolute path of the file
-                if not os.path.isabs(filename):
-                    filename = os.path.abspath(filename)
-                # Ensure the directory exists
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
-                logger.debug(f"Saving list {list_id} to {filename}")
-
-                # do not check if the file exists, just overwrite it
-                if os.path.exists(filename):
-                    logger.debug(f"File {filename} already exists; it will be overwritten.")
+        if filename is None:
+            response: httpx.Response = self._request(
+                "GET", endpoint, params, timeout=self.list_timeout
+            )
+            return self._save_list_download(list_id, response)
 
-                try:
-                    with open(filename, "wb") as f:
-                        f.write(response.content)
-                    logger.info(f"List {list_id} downloaded and saved to {filename}")
-                    return filename  # Return the full path of the saved file
-                except IOError as e:
-                    logger.error(f"Failed to save list {list_id} to {filename}: {e}", exc_info=True)
-                    raise GeocodioServerError(f"Failed to save list: {e}")
-            else:  # return the bytes content directly
-                return response.content
+        return self._download_to(
+            "list", list_id, endpoint, filename, progress, chunk_size, resume
+        )
 
-    # ──────────────────────────────────────────────────────────────────────────
-    # Distance API methods
-    # ──────────────────────────────────────────────────────────────────────────
+    def geocode_file(
+            self,
+            path: Union[str, "os.PathLike[str]"],
+            output: Optional[Destination] = None,
+            shards: int = 4,
+            header: bool = True,
+            direction: str = _BaseGeocodio.DIRECTION_FORWARD,
+            format_: Optional[str] = "{{A}}",
+            fields: list[str] | None = None,
+            compress: bool = False,
+            timeout: Optional[float] = None,
+            min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+            max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+            keep_lists: bool = False,
+    ) -> str | BinaryIO:
+        """
+        Geocode a large CSV file by fanning it out across several lists.
 
-    def _normalize_coordinate(
-        self,
-        coord: Union[str, Tuple[float, float], Dict, "Coordinate"],
-    ) -> "Coordinate":
-        """Convert various input formats to Coordinate object."""
-        return Coordinate.from_input(coord)
+        The file is split at row boundaries into up to ``shards`` parts of
+        similar size. Each part is streamed from disk through
+        :meth:`create_list`, all lists are polled from one loop until they
+        finish, and the results are downloaded and merged into one CSV in the
+        original row order. The temporary lists are deleted once the merged
+        file is written.
 
-    def _coordinate_to_string(self, coord: "Coordinate") -> str:
-        """Convert Coordinate to string for GET requests: 'lat,lng' or 'lat,lng,id'."""
-        return coord.to_string()
+        Args:
+            path: The CSV file to geocode.
+            output: Where to write the merged results: a path or a writable binary
+                file object. Defaults to ``<name>.geocoded.csv`` next to ``path``.
+            shards: Maximum number of lists to create.
+            header: Whether the first row is a header. It is sent with every shard
+                and written once to the output.
+            direction: The direction of geocoding, as for :meth:`create_list`.
+            format_: The format string for the output, as for :meth:`create_list`.
+            fields: Optional fields to append, as for :meth:`create_list`.
+            compress: Gzip the shards while uploading.
+            timeout: Seconds to wait for all lists to finish, or None to wait forever.
+            min_interval: Shortest delay between status checks of one list.
+            max_interval: Longest delay between status checks of one list.
+            keep_lists: Keep the lists instead of deleting them.
 
-    def _coordinate_to_dict(self, coord: "Coordinate") -> Dict:
-        """Convert Coordinate to dict for POST requests."""
-        return coord.to_dict()
+        Returns:
+            The path of the merged file, or the file object it was given.
+
+        Raises:
+            ValueError: If the file has no rows.
+            GeocodioServerError: If a list fails; the lists are kept for inspection.
+            TimeoutError: If the lists did not finish within ``timeout``.
+
+        If uploading a shard fails, the lists created for the other shards are
+        deleted (unless ``keep_lists`` is set) and their IDs are added to the
+        raised exception as a note.
+
+        Example:
+            >>> client.geocode_file("addresses.csv", shards=8, fields=["timezone"])
+            '/data/addresses.geocoded.csv'
+        """
+        plan = split_csv(path, shards, header)
+        if output is None:
+            stem, _ = os.path.splitext(os.path.abspath(os.fspath(path)))
+            output = f"{stem}.geocoded.csv"
+
+        def upload(shard):
+            return self.create_list(
+                shard, shard.name, direction, format_, fields=fields, compress=compress,
+            )
+
+        with ThreadPoolExecutor(max_workers=len(plan.shards)) as pool:
+            futures = [pool.submit(upload, shard) for shard in plan.shards]
+        list_ids, error = self._created_list_ids(
+            [future.exception() or future.result() for future in futures]
+        )
+        if error is not None:
+            remaining = (
+                list_ids
+                if keep_lists
+                else [i for i in list_ids if not self._delete_list_quietly(i)]
+            )
+            raise self._shard_upload_failed(error, list_ids, remaining)
+        logger.info("Geocoding %s as %d lists: %s", path, len(list_ids), list_ids)
+
+        schedule = JobSchedule(
+            list_ids, timeout, min_interval, max_interval, label="Lists"
+        )
+        for finished in self._poll_until_finished(
+            schedule, self.get_list, list_progress, len(list_ids)
+        ):
+            self._check_list_finished(finished)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            parts = [os.path.join(tmp, f"{i}.csv") for i in range(len(list_ids))]
+            with ThreadPoolExecutor(max_workers=len(list_ids)) as pool:
+                list(pool.map(self.download, list_ids, parts))
+            merged = merge_csv_files(parts, output, skip_header=header)
+
+        if not keep_lists:
+            for list_id in list_ids:
+                self.delete_list(list_id)
+        return merged
+
+    # ──────────────────────────────────────────────────────────────────────────
+    # Distance API methods
+    # ──────────────────────────────────────────────────────────────────────────
 
     def distance(
         self,
@@ -859,7 +2672,8 @@ class Geocodio:
         """
         Calculate distance from single origin to multiple destinations.
 
-        Uses GET request with coordinates as query parameters.
+        Uses GET request with coordinates as query parameters. Straight-line
+        requests are computed locally when the client has ``local_straightline=True``.
 
         Args:
             origin: The origin coordinate (string, tuple, or Coordinate).
@@ -886,44 +2700,23 @@ class Geocodio:
             ... )
             >>> print(response.destinations[0].distance_miles)
         """
-        endpoint = f"{self.BASE_PATH}/distance"
-
-        # Normalize and convert origin to string
-        origin_coord = self._normalize_coordinate(origin)
-        origin_str = self._coordinate_to_string(origin_coord)
-
-        # Normalize and convert destinations to strings
-        dest_strs = [
-            self._coordinate_to_string(self._normalize_coordinate(d))
-            for d in destinations
-        ]
-
-        # Build params
-        params: Dict[str, Union[str, int, float, List[str]]] = {
-            "origin": origin_str,
-            "destinations[]": dest_strs,
-            "mode": normalize_distance_mode(mode),
-            "units": units,
-        }
-
-        # Add optional filter parameters
-        if max_results is not None:
-            params["max_results"] = max_results
-        if max_distance is not None:
-            params["max_distance"] = max_distance
-        if max_duration is not None:
-            params["max_duration"] = max_duration
-        if min_distance is not None:
-            params["min_distance"] = min_distance
-        if min_duration is not None:
-            params["min_duration"] = min_duration
-        if order_by != DISTANCE_ORDER_BY_DISTANCE:
-            params["order_by"] = order_by
-        if sort_order != DISTANCE_SORT_ASC:
-            params["sort"] = sort_order
+        local = self._local_distance_request(
+            [origin], destinations, mode, units, max_results, max_distance,
+            min_distance, sort_order,
+        )
+        if local is not None:
+            return self._single_origin_response(local)
 
-        response = self._request("GET", endpoint, params, timeout=self.single_timeout)
-        return DistanceResponse.from_api(response.json())
+        req = self._build_distance_request(
+            origin, destinations, mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        response = self._request(
+            req.method, req.endpoint, req.params, timeout=req.timeout
+        )
+        return self._timed_parse(
+            req.endpoint, 1 + len(destinations), lambda: self._parse_distance(response)
+        )
 
     def distance_matrix(
         self,
@@ -938,11 +2731,13 @@ class Geocodio:
         min_duration: Optional[int] = None,
         order_by: str = DISTANCE_ORDER_BY_DISTANCE,
         sort_order: str = DISTANCE_SORT_ASC,
-    ) -> DistanceMatrixResponse:
+        compact: bool = False,
+    ) -> Union[DistanceMatrixResponse, CompactDistanceMatrix]:
         """
         Calculate distance matrix (multiple origins × destinations).
 
-        Uses POST request with coordinates as objects in JSON body.
+        Uses POST request with coordinates as objects in JSON body. Straight-line
+        requests are computed locally when the client has ``local_straightline=True``.
 
         Args:
             origins: List of origin coordinates.
@@ -956,9 +2751,16 @@ class Geocodio:
             min_duration: Minimum duration filter (seconds, driving mode only).
             order_by: Sort results by 'distance' or 'duration'.
             sort_order: Sort direction ('asc' or 'desc').
+            compact: Return a ``CompactDistanceMatrix`` that stores cells in flat
+                arrays instead of one object per cell.
 
         Returns:
-            DistanceMatrixResponse with results for each origin.
+            DistanceMatrixResponse with results for each origin, or a
+            CompactDistanceMatrix when ``compact`` is True.
+
+        Matrices larger than ``matrix_tile_origins`` x ``matrix_tile_destinations``
+        are split into tiles sent concurrently; ``max_results`` and ordering are
+        reapplied across tiles so the result matches a single request.
 
         Example:
             >>> response = client.distance_matrix(
@@ -968,46 +2770,56 @@ class Geocodio:
             ... )
             >>> print(response.results[0].destinations[0].distance_miles)
         """
-        endpoint = f"{self.BASE_PATH}/distance-matrix"
-
-        # Normalize and convert origins to dicts for POST
-        origin_dicts = [
-            self._coordinate_to_dict(self._normalize_coordinate(o))
-            for o in origins
-        ]
-
-        # Normalize and convert destinations to dicts for POST
-        dest_dicts = [
-            self._coordinate_to_dict(self._normalize_coordinate(d))
-            for d in destinations
-        ]
+        local = self._local_distance_request(
+            origins, destinations, mode, units, max_results, max_distance, min_distance,
+            sort_order,
+        )
+        if local is not None:
+            return self._finish_matrix(local, destinations, compact)
 
-        # Build request body
-        body: Dict[str, Union[str, int, float, List[Dict]]] = {
-            "origins": origin_dicts,
-            "destinations": dest_dicts,
-            "mode": normalize_distance_mode(mode),
-            "units": units,
-        }
+        plan = self._plan_matrix_tiles(
+            origins, destinations, mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        if plan is not None:
+            def send(tile: _PreparedRequest) -> dict:
+                return self._decode(
+                    self._request(
+                        tile.method,
+                        tile.endpoint,
+                        json=tile.json,
+                        timeout=tile.timeout,
+                        idempotent=True,
+                    )
+                )
 
-        # Add optional filter parameters
-        if max_results is not None:
-            body["max_results"] = max_results
-        if max_distance is not None:
-            body["max_distance"] = max_distance
-        if max_duration is not None:
-            body["max_duration"] = max_duration
-        if min_distance is not None:
-            body["min_distance"] = min_distance
-        if min_duration is not None:
-            body["min_duration"] = min_duration
-        if order_by != DISTANCE_ORDER_BY_DISTANCE:
-            body["order_by"] = order_by
-        if sort_order != DISTANCE_SORT_ASC:
-            body["sort"] = sort_order
+            with ThreadPoolExecutor(
+                max_workers=min(self.batch_concurrency, len(plan.requests))
+            ) as pool:
+                payloads = list(pool.map(send, plan.requests))
+            return self._timed_parse(
+                plan.requests[0].endpoint, len(origins) + len(destinations),
+                lambda: self._merge_matrix_tiles(plan, payloads, compact),
+            )
 
-        response = self._request("POST", endpoint, json=body, timeout=self.batch_timeout)
-        return DistanceMatrixResponse.from_api(response.json())
+        req = self._build_distance_matrix_request(
+            origins, destinations, mode, units, max_results, max_distance,
+            max_duration, min_distance, min_duration, order_by, sort_order,
+        )
+        response = self._request(
+            req.method,
+            req.endpoint,
+            json=req.json,
+            timeout=req.timeout,
+            idempotent=True,
+        )
+        return self._timed_parse(
+            req.endpoint,
+            len(origins) + len(destinations),
+            lambda: self._finish_matrix(
+                self._parse_distance_matrix(response), destinations, compact
+            ),
+        )
 
     def create_distance_matrix_job(
         self,
@@ -1055,55 +2867,15 @@ class Geocodio:
             ... )
             >>> print(job.id, job.status)
         """
-        endpoint = f"{self.BASE_PATH}/distance-jobs"
-
-        # Handle origins - either list of coordinates or list ID
-        if isinstance(origins, int):
-            origins_data = origins
-        else:
-            origins_data = [
-                self._coordinate_to_dict(self._normalize_coordinate(o))
-                for o in origins
-            ]
-
-        # Handle destinations - either list of coordinates or list ID
-        if isinstance(destinations, int):
-            destinations_data = destinations
-        else:
-            destinations_data = [
-                self._coordinate_to_dict(self._normalize_coordinate(d))
-                for d in destinations
-            ]
-
-        # Build request body
-        body: Dict[str, Union[str, int, float, List[Dict]]] = {
-            "name": name,
-            "origins": origins_data,
-            "destinations": destinations_data,
-            "mode": normalize_distance_mode(mode),
-            "units": units,
-        }
-
-        # Add optional parameters
-        if callback_url:
-            body["callback_url"] = callback_url
-        if max_results is not None:
-            body["max_results"] = max_results
-        if max_distance is not None:
-            body["max_distance"] = max_distance
-        if max_duration is not None:
-            body["max_duration"] = max_duration
-        if min_distance is not None:
-            body["min_distance"] = min_distance
-        if min_duration is not None:
-            body["min_duration"] = min_duration
-        if order_by != DISTANCE_ORDER_BY_DISTANCE:
-            body["order_by"] = order_by
-        if sort_order != DISTANCE_SORT_ASC:
-            body["sort"] = sort_order
-
-        response = self._request("POST", endpoint, json=body, timeout=self.list_timeout)
-        return DistanceJobResponse.from_api(response.json())
+        req = self._build_create_distance_matrix_job_request(
+            name, origins, destinations, mode, units, callback_url, max_results,
+            max_distance, max_duration, min_distance, min_duration, order_by,
+            sort_order,
+        )
+        response = self._request(
+            req.method, req.endpoint, json=req.json, timeout=req.timeout
+        )
+        return DistanceJobResponse.from_api(self._decode(response))
 
     def distance_matrix_job_status(self, job_id: Union[str, int]) -> DistanceJobResponse:
         """
@@ -1121,7 +2893,7 @@ class Geocodio:
         """
         endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}"
         response = self._request("GET", endpoint, timeout=self.list_timeout)
-        return DistanceJobResponse.from_api(response.json())
+        return DistanceJobResponse.from_api(self._decode(response))
 
     def distance_matrix_jobs(self, page: int = 1) -> PaginatedResponse:
         """
@@ -1139,26 +2911,133 @@ class Geocodio:
             params["page"] = page
 
         response = self._request("GET", endpoint, params, timeout=self.list_timeout)
-        pagination_info = response.json()
+        return self._parse_distance_jobs_page(response)
 
-        job_responses = [
-            DistanceJobResponse.from_api(job_data)
-            for job_data in pagination_info.get("data", [])
-        ]
+    def iter_distance_jobs(
+        self, prefetch: bool = True
+    ) -> Iterator[DistanceJobResponse]:
+        """
+        Iterate over every distance matrix job, one page at a time.
 
-        # Reuse PaginatedResponse but with job data
-        return PaginatedResponse(
-            data=job_responses,  # type: ignore
-            current_page=pagination_info.get("current_page", 1),
-            from_=pagination_info.get("from", 0),
-            to=pagination_info.get("to", 0),
-            path=pagination_info.get("path", ""),
-            per_page=pagination_info.get("per_page", 10),
-            first_page_url=pagination_info.get("first_page_url"),
-            next_page_url=pagination_info.get("next_page_url"),
-            prev_page_url=pagination_info.get("prev_page_url"),
+        Works like :meth:`iter_lists`: pages are requested lazily and, with
+        ``prefetch``, one page ahead of the caller.
+
+        Yields:
+            DistanceJobResponse objects in the order the API returns them.
+        """
+        yield from self._iter_pages(self.distance_matrix_jobs, prefetch)
+
+    def wait_for_distance_job(
+        self,
+        job_id: Union[str, int],
+        timeout: Optional[float] = 600.0,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> DistanceJobResponse:
+        """
+        Poll a distance matrix job until it completes.
+
+        The delay between status checks adapts to the job: while the API
+        reports progress, the next check is scheduled from the observed
+        completion rate; otherwise the delay grows geometrically from
+        ``min_interval`` up to ``max_interval``.
+
+        Args:
+            job_id: The job ID (integer or string).
+            timeout: Seconds to wait before giving up, or None to wait forever.
+            min_interval: Shortest delay between status checks.
+            max_interval: Longest delay between status checks.
+
+        Returns:
+            The completed DistanceJobResponse.
+
+        Raises:
+            DistanceJobFailedError: If the job failed.
+            TimeoutError: If the job did not finish within ``timeout``.
+
+        Example:
+            >>> job = client.create_distance_matrix_job(...)
+            >>> client.wait_for_distance_job(job.id, timeout=300)
+            >>> results = client.get_distance_matrix_job_results(job.id)
+        """
+        jobs = self.iter_completed_distance_jobs(
+            [job_id], timeout, 1, min_interval, max_interval
+        )
+        try:
+            job = next(jobs)
+        finally:
+            # Shuts down the polling thread pool now rather than when the
+            # generator is collected
+            jobs.close()
+        return self._check_distance_job(job_id, job)
+
+    def iter_completed_distance_jobs(
+        self,
+        job_ids: Iterable[Union[str, int]],
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    ) -> Generator[DistanceJobResponse, None, None]:
+        """
+        Track several distance matrix jobs and yield each one as it finishes.
+
+        All jobs are polled from a single loop with the same adaptive schedule
+        as :meth:`wait_for_distance_job`; at most ``concurrency`` status checks
+        are in flight at once. Failed jobs are yielded too, so check
+        ``job.status`` against ``DistanceJobState.FAILED``.
+
+        Args:
+            job_ids: The jobs to track.
+            timeout: Seconds to wait for all jobs, or None to wait forever.
+            concurrency: Maximum simultaneous status checks. Defaults to
+                ``batch_concurrency``.
+            min_interval: Shortest delay between checks of one job.
+            max_interval: Longest delay between checks of one job.
+
+        Yields:
+            DistanceJobResponse objects in completion order.
+
+        Raises:
+            TimeoutError: If jobs are still pending after ``timeout`` seconds.
+
+        Example:
+            >>> for job in client.iter_completed_distance_jobs(job_ids, timeout=1800):
+            ...     results = client.get_distance_matrix_job_results(job.id)
+        """
+        schedule = JobSchedule(job_ids, timeout, min_interval, max_interval)
+        yield from self._poll_until_finished(
+            schedule, self.distance_matrix_job_status, distance_job_progress,
+            concurrency,
         )
 
+    def _poll_until_finished(
+        self,
+        schedule: JobSchedule,
+        fetch: Callable[[Any], Any],
+        progress: Callable[[Any], Tuple[bool, Optional[float]]],
+        concurrency: Optional[int],
+    ) -> Generator[Any, None, None]:
+        """
+        Poll everything in ``schedule`` from one loop, yielding each status once
+        it is finished.
+        """
+        concurrency = max(1, concurrency or self.batch_concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while schedule:
+                schedule.check_deadline()
+                due = schedule.pop_due(concurrency)
+                if not due:
+                    time.sleep(schedule.time_until_due())
+                    continue
+                if len(due) == 1:
+                    statuses = [fetch(due[0])]
+                else:
+                    statuses = list(pool.map(fetch, due))
+                for item_id, status in zip(due, statuses):
+                    if schedule.record(item_id, *progress(status)):
+                        yield status
+
     def get_distance_matrix_job_results(
         self, job_id: Union[str, int]
     ) -> DistanceMatrixResponse:
@@ -1181,51 +3060,40 @@ class Geocodio:
         """
         endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}/download"
         response = self._request("GET", endpoint, timeout=self.list_timeout)
-
-        # Check if response is JSON (success) or error
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            return DistanceMatrixResponse.from_api(response.json())
-        else:
-            raise GeocodioServerError(
-                f"Unexpected response format: {content_type}. "
-                f"Job may not be complete."
-            )
+        return self._parse_distance_job_results(response)
 
     def download_distance_matrix_job(
-        self, job_id: Union[str, int], filename: str
-    ) -> str:
+        self,
+        job_id: Union[str, int],
+        filename: Destination,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume: bool = False,
+    ) -> str | BinaryIO:
         """
         Download distance matrix job results to a file.
 
+        The body is streamed to disk in ``chunk_size`` pieces and renamed into
+        place once complete, so memory use stays constant; see :meth:`download`.
+
         Args:
             job_id: The job ID (integer or string).
-            filename: Path to save the results file.
+            filename: Path to save the results file, or a writable binary file object.
+            progress: Optional ``progress(bytes_written, total_bytes)`` callback.
+            chunk_size: Largest piece written to the destination at once.
+            resume: Continue an interrupted download from the partial file; see
+                :meth:`download`.
 
         Returns:
-            The absolute path to the saved file.
+            The absolute path to the saved file, or the file object it was given.
 
         Raises:
             GeocodioServerError: If the job is not complete or download fails.
         """
         endpoint = f"{self.BASE_PATH}/distance-jobs/{job_id}/download"
-        response = self._request("GET", endpoint, timeout=self.list_timeout)
-
-        # Get absolute path
-        if not os.path.isabs(filename):
-            filename = os.path.abspath(filename)
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-        try:
-            with open(filename, "wb") as f:
-                f.write(response.content)
-            logger.info(f"Distance job {job_id} downloaded to {filename}")
-            return filename
-        except IOError as e:
-            logger.error(f"Failed to save distance job {job_id} to {filename}: {e}")
-            raise GeocodioServerError(f"Failed to save distance job: {e}")
+        return self._download_to(
+            "distance job", job_id, endpoint, filename, progress, chunk_size, resume
+        )
 
     def delete_distance_matrix_job(self, job_id: Union[str, int]) -> None:
         """
@@ -0,0 +1,159 @@
+"""
+src/geocodio/codec.py
+Pluggable JSON encoding and decoding for request and response bodies.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Type, Union
+
+orjson: Any  # None when the optional dependency is not installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+msgspec: Any  # None when the optional dependency is not installed
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised when msgspec is not installed
+    msgspec = None
+
+
+class JSONCodec(ABC):
+    """
+    Encodes request bodies and decodes response bodies.
+
+    Subclass it to plug in another JSON library. ``dumps`` must return compact
+    UTF-8 bytes and ``loads`` must raise ``ValueError`` for invalid input.
+    """
+
+    name = "custom"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON."""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON ``data``, raising ``ValueError`` if it is invalid."""
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class StdlibCodec(JSONCodec):
+    """The standard library ``json`` module, encoding like httpx does."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """`orjson <https://github.com/ijl/orjson>`_, usually the fastest option."""
+
+    name = "orjson"
+
+    def __init__(self):
+        _require("orjson", orjson)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)  # orjson.JSONDecodeError is a ValueError
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    `msgspec <https://jcristharif.com/msgspec/>`_'s untyped JSON encoder and
+    decoder.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        _require("msgspec", msgspec)
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+_CODECS: Dict[str, Type[JSONCodec]] = {
+    "json": StdlibCodec,
+    "stdlib": StdlibCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def _require(name: str, module: Any) -> None:
+    if module is None:
+        raise ImportError(
+            f"The {name} JSON codec requires the '{name}' package. "
+            f"Install it with: pip install {name}"
+        )
+
+
+def fastest_codec() -> JSONCodec:
+    """orjson if installed, else msgspec, else the standard library."""
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return StdlibCodec()
+
+
+def get_codec(codec: Union[None, str, JSONCodec] = None) -> JSONCodec:
+    """
+    Resolve the client's ``json_codec`` option.
+
+    Args:
+        codec: A JSONCodec instance, one of ``"orjson"``, ``"msgspec"`` or
+            ``"json"``, ``"auto"`` for :func:`fastest_codec`, or None for the
+            standard library.
+
+    Raises:
+        ImportError: If the named library is not installed.
+        ValueError: For an unknown codec name.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return StdlibCodec()
+    if codec == "auto":
+        return fastest_codec()
+    try:
+        return _CODECS[codec]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown json_codec {codec!r}; "
+            f"expected one of {sorted(_CODECS)}, 'auto' or a JSONCodec"
+        ) from None
+
+
+__all__ = [
+    "JSONCodec",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "StdlibCodec",
+    "fastest_codec",
+    "get_codec",
+]
@@ -0,0 +1,180 @@
+"""
+src/geocodio/download.py
+Chunked, atomic and resumable writing of streamed download bodies.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import BinaryIO, Callable, Optional, Tuple, TypeGuard, Union
+
+import httpx
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+PARTIAL_SUFFIX = ".part"
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+PathDestination = Union[str, "os.PathLike[str]"]
+Destination = Union[PathDestination, BinaryIO]
+
+_CONTENT_RANGE = re.compile(r"^bytes (\d+)-(\d+)/(\d+|\*)$")
+
+
+def is_path(destination: Destination) -> TypeGuard[PathDestination]:
+    return isinstance(destination, (str, os.PathLike))
+
+
+def partial_path(destination: PathDestination) -> str:
+    return os.path.abspath(os.fspath(destination)) + PARTIAL_SUFFIX
+
+
+def partial_size(destination: Destination) -> int:
+    """Bytes already downloaded into the partial file for ``destination``, or 0."""
+    if not is_path(destination):
+        return 0
+    try:
+        return os.path.getsize(partial_path(destination))
+    except OSError:
+        return 0
+
+
+def discard_partial(destination: Destination) -> None:
+    if not is_path(destination):
+        return
+    try:
+        os.remove(partial_path(destination))
+    except FileNotFoundError:
+        pass
+
+
+def expected_size(response: httpx.Response) -> Optional[int]:
+    """Decoded body size announced by the response, if it can be known up front."""
+    if response.headers.get("content-encoding", "identity") != "identity":
+        return None
+    try:
+        return int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def parse_content_range(value: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    ``(first_byte, complete_length)`` from a ``Content-Range`` header; the length may be
+    None.
+    """
+    match = _CONTENT_RANGE.match((value or "").strip())
+    if match is None:
+        return None
+    total = match.group(3)
+    return int(match.group(1)), None if total == "*" else int(total)
+
+
+def resume_offset(
+    response: httpx.Response, requested: int
+) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Where to continue writing a ranged download, given the server's answer.
+
+    Returns ``(offset, total_size)``: ``offset`` is ``requested`` when the
+    server honoured the ``Range`` header and 0 when it sent the whole body.
+    Returns None for a partial response that does not start at ``requested``,
+    which cannot be appended safely.
+    """
+    if requested and response.status_code == 206:
+        content_range = parse_content_range(response.headers.get("content-range"))
+        if content_range is None or content_range[0] != requested:
+            return None
+        return requested, content_range[1]
+    return 0, expected_size(response)
+
+
+class DownloadSink:
+    """
+    Receives a download body chunk by chunk.
+
+    A path destination is written to ``<path>.part`` and renamed over ``path``
+    only by :meth:`commit`, so readers never see a half-written file and an
+    interrupted download leaves the original file untouched. A binary stream
+    destination is written to directly and left open.
+
+    Args:
+        destination: A file path or a writable binary file object.
+        progress: Optional ``progress(bytes_written, total_bytes)`` callback,
+            called after every chunk; ``total_bytes`` is None if unknown.
+        total: Expected final size in bytes, if known.
+        offset: Bytes already in the partial file; new chunks are appended.
+        keep_partial: Keep the partial file on :meth:`abort` so a later
+            download can resume from it.
+        chunk_size: Largest piece written (and reported) at once.
+    """
+
+    def __init__(
+            self,
+            destination: Destination,
+            progress: Optional[ProgressCallback] = None,
+            total: Optional[int] = None,
+            offset: int = 0,
+            keep_partial: bool = False,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.total = total
+        self.size = offset
+        self.keep_partial = keep_partial
+        if isinstance(destination, (str, os.PathLike)):
+            self.path: Optional[str] = os.path.abspath(os.fspath(destination))
+            self.temp_path: Optional[str] = partial_path(destination)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._file: BinaryIO = open(self.temp_path, "ab" if offset else "wb")
+        else:
+            self.path = self.temp_path = None
+            self._file = destination
+
+    @property
+    def complete(self) -> bool:
+        """False if the final size is known and was not reached."""
+        return self.total is None or self.size == self.total
+
+    def write(self, data: bytes) -> None:
+        """
+        Write ``data`` in pieces of at most ``chunk_size`` bytes, reporting progress
+        after each.
+        """
+        view = memoryview(data)
+        for start in range(0, len(view), self.chunk_size):
+            piece = view[start:start + self.chunk_size]
+            self._file.write(piece)
+            self.size += len(piece)
+            if self.progress is not None:
+                self.progress(self.size, self.total)
+
+    def commit(self) -> Union[str, BinaryIO]:
+        """Finish the download; returns the saved path or the destination stream."""
+        if self.path is None:
+            self._file.flush()
+            return self._file
+        self._file.close()
+        os.replace(partial_path(self.path), self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Stop writing; the partial file is removed unless ``keep_partial`` is set."""
+        if self.path is None:
+            return
+        self._file.close()
+        if not self.keep_partial:
+            discard_partial(self.path)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DownloadSink",
+    "expected_size",
+    "parse_content_range",
+    "partial_size",
+    "resume_offset",
+]
@@ -57,6 +57,45 @@ class GeocodioServerError(GeocodioError):
     """5xx – Geocodio internal error."""
 
 
+class RateLimitError(GeocodioServerError):
+    """
+    429 Too Many Requests – the API key's rate limit was exceeded.
+
+    ``retry_after`` is the delay in seconds requested by the API, if any.
+    Subclasses :class:`GeocodioServerError`, which 429s were raised as previously.
+    """
+
+    def __init__(
+        self,
+        detail: Union[str, GeocodioErrorDetail],
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(detail)
+        self.retry_after = retry_after
+
+
+class RangeNotSatisfiableError(GeocodioServerError):
+    """
+    416 Range Not Satisfiable – a resumed download asked for bytes past the
+    end of the file.
+
+    Subclasses :class:`GeocodioServerError`, which 416s were raised as previously.
+    """
+
+
+class DistanceJobFailedError(GeocodioError):
+    """
+    A distance matrix job finished in the FAILED state; ``job`` holds its last
+    status.
+    """
+
+    def __init__(
+        self, detail: Union[str, GeocodioErrorDetail], job: Optional[object] = None
+    ):
+        super().__init__(detail)
+        self.job = job
+
+
 class DefaultHTTPError(GeocodioError):
     """Other HTTP error – 4xx or 5xx, but not one of the above."""
 
@@ -68,5 +107,8 @@ __all__ = [
     "InvalidRequestError",
     "AuthenticationError",
     "GeocodioServerError",
+    "RateLimitError",
+    "RangeNotSatisfiableError",
+    "DistanceJobFailedError",
     "DefaultHTTPError",
 ]
@@ -0,0 +1,174 @@
+"""
+src/geocodio/hooks.py
+Request lifecycle hooks and the events passed to them.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+# httpcore trace steps, grouped into the phases reported in RequestEvent.timings
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "connect",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "receive",
+}
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """
+    One HTTP attempt made by the client.
+
+    The same event object is passed to every hook for that attempt, filled
+    in as the attempt progresses; a retried request gets a new event with
+    the next ``attempt`` number.
+
+    ``timings`` holds seconds per phase, as far as they are known:
+
+    - ``rate_limit``: waiting for the client's ``RateLimiter``
+    - ``connect``: DNS lookup, TCP connect and TLS handshake (only when a
+      new connection was opened)
+    - ``send``: writing the request
+    - ``wait``: waiting for the response headers, i.e. server time
+    - ``receive``: reading the response body
+    - ``total``: the whole attempt, including the phases above
+
+    Connection-level phases come from the httpcore ``trace`` extension and
+    are missing with transports that do not support it (such as
+    ``httpx.MockTransport``). For streamed downloads the body is read after
+    ``on_response``, so ``receive`` and ``bytes_received`` cover the headers only.
+    """
+
+    method: str
+    endpoint: str
+    lookups: int = 0
+    attempt: int = 1
+    bytes_sent: Optional[int] = None
+    bytes_received: Optional[int] = None
+    status_code: Optional[int] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    exception: Optional[BaseException] = None
+    retry_delay: Optional[float] = None
+
+
+@dataclass(slots=True)
+class ParseEvent:
+    """
+    Parsing of an API response into result models.
+
+    ``lookups`` is the number of inputs in the call (origins plus destinations
+    for distance calls), ``result`` the parsed response and
+    ``timings["parse"]`` the seconds spent building it.
+    """
+
+    endpoint: str
+    lookups: int
+    result: Any
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class ClientHooks:
+    """
+    Base class for request lifecycle hooks.
+
+    Subclass it and override the methods you need, then pass an instance (or
+    a list of them) as the client's ``hooks`` argument. Hooks run inline on
+    the request path, from worker threads for concurrent batches, so they
+    should be quick and thread-safe. Exceptions raised by a hook are logged
+    and otherwise ignored.
+
+    For each attempt ``on_request`` is called before sending, then either
+    ``on_response`` (any HTTP status) or, for a transport failure, neither.
+    ``on_retry`` follows when the attempt will be retried, with
+    ``retry_delay`` set. ``on_error`` is called once when the request finally
+    fails, with ``exception`` set, including for error statuses.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        pass
+
+    def on_response(self, event: RequestEvent) -> None:
+        pass
+
+    def on_retry(self, event: RequestEvent) -> None:
+        pass
+
+    def on_error(self, event: RequestEvent) -> None:
+        pass
+
+    def on_parse_complete(self, event: ParseEvent) -> None:
+        pass
+
+
+class CallbackHooks(ClientHooks):
+    """
+    Hooks built from plain functions.
+
+    Example:
+        >>> hooks = CallbackHooks(
+        ...     on_response=lambda e: statsd.timing(e.endpoint, e.timings["total"])
+        ... )
+        >>> client = Geocodio("YOUR_API_KEY", hooks=hooks)
+    """
+
+    def __init__(
+            self,
+            on_request: Optional[Callable[[RequestEvent], None]] = None,
+            on_response: Optional[Callable[[RequestEvent], None]] = None,
+            on_retry: Optional[Callable[[RequestEvent], None]] = None,
+            on_error: Optional[Callable[[RequestEvent], None]] = None,
+            on_parse_complete: Optional[Callable[[ParseEvent], None]] = None,
+    ):
+        callbacks = {
+            "on_request": on_request,
+            "on_response": on_response,
+            "on_retry": on_retry,
+            "on_error": on_error,
+            "on_parse_complete": on_parse_complete,
+        }
+        for name, callback in callbacks.items():
+            if callback is not None:
+                setattr(self, name, callback)
+
+
+class PhaseTimer:
+    """
+    httpcore ``trace`` extension that adds phase durations to ``timings``.
+
+    Use :meth:`trace` with sync clients and :meth:`atrace` with async ones.
+    """
+
+    __slots__ = ("timings", "_started")
+
+    def __init__(self, timings: Dict[str, float]):
+        self.timings = timings
+        self._started: Dict[str, float] = {}
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        step, _, state = name.rpartition(".")
+        phase = _TRACE_PHASES.get(step.rpartition(".")[2])
+        if phase is None:
+            return
+        if state == "started":
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            elapsed = time.perf_counter() - self._started.pop(step)
+            self.timings[phase] = self.timings.get(phase, 0.0) + elapsed
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self.trace(name, info)
+
+
+__all__ = [
+    "CallbackHooks",
+    "ClientHooks",
+    "ParseEvent",
+    "RequestEvent",
+]
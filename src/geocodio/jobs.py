@@ -0,0 +1,203 @@
+"""
+src/geocodio/jobs.py
+Polling schedules for waiting on distance matrix jobs.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from geocodio.models import DistanceJobResponse, DistanceJobState, ListResponse
+
+JobId = Union[str, int]
+
+DEFAULT_MIN_POLL_INTERVAL = 1.0
+DEFAULT_MAX_POLL_INTERVAL = 30.0
+
+LIST_STATE_COMPLETED = "COMPLETED"
+LIST_STATE_FAILED = "FAILED"
+
+
+class AdaptivePoller:
+    """
+    Picks the delay before the next status check of one job.
+
+    While the job reports progress (``calculations_completed`` out of
+    ``total_calculations``, or ``progress`` percent) the completion rate is
+    estimated from successive polls, and the next poll is scheduled for about
+    half of the estimated remaining time. Without usable progress the delay
+    grows geometrically. Delays stay within ``[min_interval, max_interval]``.
+    """
+
+    GROWTH = 1.5
+    ETA_FRACTION = 0.5
+
+    def __init__(
+            self,
+            min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+            max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+            clock: Optional[Callable[[], float]] = None,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError(
+                "Poll intervals must satisfy 0 < min_interval <= max_interval"
+            )
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._clock = clock or time.monotonic
+        self._fallback = min_interval
+        self._last: Optional[Tuple[float, float]] = None  # (time, fraction complete)
+
+    @staticmethod
+    def fraction_complete(job: DistanceJobResponse) -> Optional[float]:
+        """Completed share of the job between 0 and 1, if the API reported it."""
+        if job.calculations_completed is not None and job.total_calculations:
+            return min(1.0, job.calculations_completed / job.total_calculations)
+        if job.progress is not None:
+            return min(1.0, job.progress / 100)
+        return None
+
+    def next_delay(self, job: DistanceJobResponse) -> float:
+        return self.delay_for(self.fraction_complete(job))
+
+    def delay_for(self, fraction: Optional[float]) -> float:
+        """
+        Delay before the next check, given the completed share reported now (or None).
+        """
+        now = self._clock()
+        previous = self._last
+        self._last = (now, fraction) if fraction is not None else None
+
+        if (
+            fraction is not None
+            and previous is not None
+            and fraction > previous[1]
+            and now > previous[0]
+        ):
+            rate = (fraction - previous[1]) / (now - previous[0])
+            delay = (1.0 - fraction) / rate * self.ETA_FRACTION
+        else:
+            delay = self._fallback
+            self._fallback = min(self._fallback * self.GROWTH, self.max_interval)
+        return max(self.min_interval, min(delay, self.max_interval))
+
+
+def distance_job_progress(job: DistanceJobResponse) -> Tuple[bool, Optional[float]]:
+    """``(finished, fraction complete)`` for a distance matrix job status."""
+    finished = job.status in (DistanceJobState.COMPLETED, DistanceJobState.FAILED)
+    return finished, AdaptivePoller.fraction_complete(job)
+
+
+def list_progress(response: ListResponse) -> Tuple[bool, Optional[float]]:
+    """``(finished, fraction complete)`` for a List API status."""
+    status = response.status or {}
+    progress = status.get("progress")
+    fraction = min(1.0, progress / 100) if isinstance(progress, (int, float)) else None
+    return status.get("state") in (LIST_STATE_COMPLETED, LIST_STATE_FAILED), fraction
+
+
+class JobSchedule:
+    """
+    Tracks when each pending job is next due for a status check.
+
+    Used by ``wait_for_distance_job``, ``iter_completed_distance_jobs`` and
+    ``geocode_file`` so any number of jobs or lists is polled from a single loop.
+
+    Args:
+        job_ids: The jobs to track; all are due immediately.
+        timeout: Seconds until :meth:`check_deadline` raises, or None to wait forever.
+        min_interval: Shortest delay between checks of one job.
+        max_interval: Longest delay between checks of one job.
+        label: What is being tracked, for the timeout message.
+    """
+
+    def __init__(
+            self,
+            job_ids: Iterable[JobId],
+            timeout: Optional[float] = None,
+            min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+            max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+            clock: Optional[Callable[[], float]] = None,
+            label: str = "Distance jobs",
+    ):
+        self.label = label
+        self._clock = clock or time.monotonic
+        start = self._clock()
+        self.deadline = start + timeout if timeout is not None else None
+        self._pollers: Dict[JobId, AdaptivePoller] = {}
+        self._order: Dict[JobId, int] = {}
+        self._queue: List[Tuple[float, int, JobId]] = []
+        for job_id in job_ids:
+            if job_id in self._pollers:
+                continue
+            self._pollers[job_id] = AdaptivePoller(
+                min_interval, max_interval, self._clock
+            )
+            self._order[job_id] = len(self._order)
+            self._queue.append((start, self._order[job_id], job_id))
+        heapq.heapify(self._queue)
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    @property
+    def pending(self) -> List[JobId]:
+        return [job_id for _, _, job_id in sorted(self._queue)]
+
+    def pop_due(self, limit: int) -> List[JobId]:
+        """Remove and return up to ``limit`` jobs whose next check is due."""
+        now = self._clock()
+        due: List[JobId] = []
+        while self._queue and len(due) < limit and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[2])
+        return due
+
+    def time_until_due(self) -> float:
+        """Seconds until the next job is due, capped by the deadline."""
+        if not self._queue:
+            return 0.0
+        wait = max(0.0, self._queue[0][0] - self._clock())
+        if self.deadline is not None:
+            wait = min(wait, max(0.0, self.deadline - self._clock()))
+        return wait
+
+    def update(self, job_id: JobId, job: DistanceJobResponse) -> bool:
+        """
+        Record a distance matrix job status check.
+
+        Returns:
+            True if the job finished (completed or failed); otherwise the job
+            is rescheduled and False is returned.
+        """
+        return self.record(job_id, *distance_job_progress(job))
+
+    def record(
+        self, job_id: JobId, finished: bool, fraction: Optional[float] = None
+    ) -> bool:
+        """Record a status check of any kind of job; see :meth:`update`."""
+        if finished:
+            return True
+        delay = self._pollers[job_id].delay_for(fraction)
+        heapq.heappush(
+            self._queue, (self._clock() + delay, self._order[job_id], job_id)
+        )
+        return False
+
+    def check_deadline(self) -> None:
+        """Raise ``TimeoutError`` if the timeout passed with jobs still pending."""
+        if self.deadline is not None and self._queue and self._clock() >= self.deadline:
+            raise TimeoutError(
+                f"{self.label} {self.pending} did not finish before the timeout"
+            )
+
+
+__all__ = [
+    "AdaptivePoller",
+    "JobSchedule",
+    "distance_job_progress",
+    "list_progress",
+    "DEFAULT_MIN_POLL_INTERVAL",
+    "DEFAULT_MAX_POLL_INTERVAL",
+]
@@ -0,0 +1,260 @@
+"""
+src/geocodio/local_distance.py
+Local straight-line (great-circle) distance calculations.
+
+Computes the same responses as the Distance API's straightline mode without a
+network round-trip. Uses NumPy broadcasting when NumPy is installed and falls
+back to pure Python otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+from geocodio.distance import (
+    Coordinate,
+    DISTANCE_MODE_STRAIGHTLINE,
+    DISTANCE_UNITS_KM,
+    DISTANCE_UNITS_MILES,
+    DISTANCE_SORT_ASC,
+    DISTANCE_SORT_DESC,
+)
+from geocodio.models import (
+    DistanceDestination,
+    DistanceMatrixResponse,
+    DistanceMatrixResult,
+    DistanceOrigin,
+    DistanceResponse,
+)
+
+np: Any  # None when the optional dependency is not installed
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is not installed
+    np = None
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_MILE = 1.609344
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Distance kernels
+# ──────────────────────────────────────────────────────────────────────────────
+
+def haversine_km(
+        origins: Sequence[Tuple[float, float]],
+        destinations: Sequence[Tuple[float, float]],
+) -> Any:
+    """
+    Great-circle distances in kilometers between every origin and destination.
+
+    Args:
+        origins: ``(lat, lng)`` pairs in degrees.
+        destinations: ``(lat, lng)`` pairs in degrees.
+
+    Returns:
+        An ``len(origins) x len(destinations)`` matrix: a NumPy array when NumPy
+        is available, otherwise a list of lists.
+    """
+    if np is not None:
+        return _haversine_km_numpy(origins, destinations)
+    return _haversine_km_python(origins, destinations)
+
+
+def _haversine_km_numpy(origins, destinations):
+    o = np.radians(np.asarray(origins, dtype=np.float64).reshape(-1, 2))
+    d = np.radians(np.asarray(destinations, dtype=np.float64).reshape(-1, 2))
+    lat1, lng1 = o[:, 0:1], o[:, 1:2]
+    lat2, lng2 = d[:, 0], d[:, 1]
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _haversine_km_python(origins, destinations) -> List[List[float]]:
+    dests = [(math.radians(lat), math.radians(lng)) for lat, lng in destinations]
+    dest_cos = [math.cos(lat) for lat, _ in dests]
+    matrix = []
+    for lat, lng in origins:
+        lat1, lng1 = math.radians(lat), math.radians(lng)
+        cos1 = math.cos(lat1)
+        row = []
+        for (lat2, lng2), cos2 in zip(dests, dest_cos):
+            a = (
+                math.sin((lat2 - lat1) / 2) ** 2
+                + cos1 * cos2 * math.sin((lng2 - lng1) / 2) ** 2
+            )
+            row.append(2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0))))
+        matrix.append(row)
+    return matrix
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Filtering and ordering
+# ──────────────────────────────────────────────────────────────────────────────
+
+def select_destinations(
+        row: Any,
+        max_results: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        min_distance: Optional[float] = None,
+        sort_order: str = DISTANCE_SORT_ASC,
+) -> List[int]:
+    """
+    Indexes of the destinations the API would return for one origin.
+
+    ``row`` holds the distances in the requested units. Destinations outside
+    ``[min_distance, max_distance]`` (inclusive) are dropped, the rest are
+    sorted by distance (ties keep input order) and cut to ``max_results``.
+    """
+    if sort_order not in (DISTANCE_SORT_ASC, DISTANCE_SORT_DESC):
+        raise ValueError(
+            f"sort_order must be '{DISTANCE_SORT_ASC}' or '{DISTANCE_SORT_DESC}', "
+            f"got {sort_order!r}"
+        )
+    descending = sort_order == DISTANCE_SORT_DESC
+    if max_results is not None and max_results < 1:
+        return []
+
+    if np is not None and isinstance(row, np.ndarray):
+        mask = np.ones(row.shape, dtype=bool)
+        if max_distance is not None:
+            mask &= row <= max_distance
+        if min_distance is not None:
+            mask &= row >= min_distance
+        candidates = np.flatnonzero(mask)
+        keys = -row[candidates] if descending else row[candidates]
+        if max_results is not None and max_results < len(candidates):
+            # Partial selection keeps nearest-N queries O(n) on large destination sets
+            top = np.argpartition(keys, max_results - 1)[:max_results]
+            order = top[np.lexsort((top, keys[top]))]
+        else:
+            order = np.argsort(keys, kind="stable")
+        return candidates[order].tolist()
+
+    low = min_distance if min_distance is not None else -math.inf
+    high = max_distance if max_distance is not None else math.inf
+    selected = [j for j, value in enumerate(row) if low <= value <= high]
+    selected.sort(key=row.__getitem__, reverse=descending)
+    return selected[:max_results] if max_results is not None else selected
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Response builders
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _distance_rows(
+    origins: Sequence[Coordinate], destinations: Sequence[Coordinate], units: str
+):
+    if units not in (DISTANCE_UNITS_MILES, DISTANCE_UNITS_KM):
+        raise ValueError(
+            f"units must be '{DISTANCE_UNITS_MILES}' or '{DISTANCE_UNITS_KM}', "
+            f"got {units!r}"
+        )
+    matrix_km = haversine_km(
+        [(c.lat, c.lng) for c in origins],
+        [(c.lat, c.lng) for c in destinations],
+    )
+    if units == DISTANCE_UNITS_KM:
+        return matrix_km, matrix_km
+    if np is not None and isinstance(matrix_km, np.ndarray):
+        return matrix_km, matrix_km / KM_PER_MILE
+    return matrix_km, [[km / KM_PER_MILE for km in row] for row in matrix_km]
+
+
+def _origin_model(coord: Coordinate) -> DistanceOrigin:
+    return DistanceOrigin(
+        query=coord.to_string(), location=(coord.lat, coord.lng), id=coord.id
+    )
+
+
+def _destination_models(
+        destinations: Sequence[Coordinate],
+        row_km: Any,
+        indexes: List[int],
+) -> List[DistanceDestination]:
+    result = []
+    for j in indexes:
+        coord = destinations[j]
+        km = float(row_km[j])
+        result.append(DistanceDestination(
+            query=coord.to_string(),
+            location=(coord.lat, coord.lng),
+            distance_miles=km / KM_PER_MILE,
+            distance_km=km,
+            id=coord.id,
+        ))
+    return result
+
+
+def local_distance_matrix(
+        origins: Sequence[Coordinate],
+        destinations: Sequence[Coordinate],
+        units: str = DISTANCE_UNITS_MILES,
+        max_results: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        min_distance: Optional[float] = None,
+        sort_order: str = DISTANCE_SORT_ASC,
+) -> DistanceMatrixResponse:
+    """
+    Compute a straight-line distance matrix locally.
+
+    Accepts the same filters as :meth:`geocodio.Geocodio.distance_matrix`;
+    ``max_distance``/``min_distance`` are in ``units``. Distances are not
+    rounded. Duration filters and ``order_by="duration"`` do not apply to
+    straight-line distances, so results are always ordered by distance.
+
+    Returns:
+        A ``DistanceMatrixResponse`` shaped like the API's straightline response.
+    """
+    matrix_km, matrix_units = _distance_rows(origins, destinations, units)
+    results = []
+    for i, origin in enumerate(origins):
+        indexes = select_destinations(
+            matrix_units[i], max_results, max_distance, min_distance, sort_order
+        )
+        results.append(DistanceMatrixResult(
+            origin=_origin_model(origin),
+            destinations=_destination_models(destinations, matrix_km[i], indexes),
+        ))
+    return DistanceMatrixResponse(mode=DISTANCE_MODE_STRAIGHTLINE, results=results)
+
+
+def local_distance(
+        origin: Coordinate,
+        destinations: Sequence[Coordinate],
+        units: str = DISTANCE_UNITS_MILES,
+        max_results: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        min_distance: Optional[float] = None,
+        sort_order: str = DISTANCE_SORT_ASC,
+) -> DistanceResponse:
+    """
+    Compute straight-line distances from one origin locally.
+
+    See :func:`local_distance_matrix` for how filters are applied.
+    """
+    matrix = local_distance_matrix(
+        [origin], destinations, units, max_results, max_distance, min_distance,
+        sort_order,
+    )
+    result = matrix.results[0]
+    return DistanceResponse(
+        origin=result.origin,
+        mode=DISTANCE_MODE_STRAIGHTLINE,
+        destinations=result.destinations,
+    )
+
+
+__all__ = [
+    "EARTH_RADIUS_KM",
+    "KM_PER_MILE",
+    "haversine_km",
+    "select_destinations",
+    "local_distance",
+    "local_distance_matrix",
+]
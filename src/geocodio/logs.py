@@ -0,0 +1,64 @@
+"""
+src/geocodio/logs.py
+Lazily formatted, size-capped request and response bodies for debug logging.
+"""
+
+from __future__ import annotations
+
+import reprlib
+from typing import Any
+
+DEFAULT_LOG_BODY_LIMIT = 2048
+
+
+class TruncatedBody:
+    """
+    A log argument that renders at most ``limit`` characters of a payload.
+
+    Nothing is formatted until a handler actually emits the record, and even
+    then only a bounded prefix of the payload is decoded or repr'd, so a
+    10,000-address batch costs the same to log as a single lookup.
+
+    Args:
+        body: ``bytes``, ``str`` or any object (dicts and lists are rendered
+            with :mod:`reprlib`, which stops after a bounded number of items).
+        limit: Maximum number of characters rendered.
+    """
+
+    __slots__ = ("body", "limit")
+
+    def __init__(self, body: Any, limit: int = DEFAULT_LOG_BODY_LIMIT):
+        self.body = body
+        self.limit = limit
+
+    def __str__(self) -> str:
+        body = self.body
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            text = bytes(body[:self.limit]).decode("utf-8", "replace")
+        elif isinstance(body, str):
+            text = body[:self.limit]
+        else:
+            text = _repr(self.limit).repr(body)
+            return text if len(text) <= self.limit else f"{text[:self.limit]}..."
+        if len(body) > self.limit:
+            return f"{text}... ({len(body) - self.limit} more)"
+        return text
+
+    __repr__ = __str__
+
+
+def _repr(limit: int) -> reprlib.Repr:
+    formatter = reprlib.Repr()
+    items = max(1, limit // 16)
+    formatter.maxlevel = 4
+    formatter.maxdict = formatter.maxlist = formatter.maxtuple = formatter.maxset = (
+        items
+    )
+    formatter.maxstring = formatter.maxother = max(8, limit // 4)
+    return formatter
+
+
+__all__ = [
+    "DEFAULT_LOG_BODY_LIMIT",
+    "TruncatedBody",
+]
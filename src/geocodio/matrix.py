@@ -0,0 +1,556 @@
+"""
+src/geocodio/matrix.py
+Tiling of large distance matrices and compact matrix results.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from geocodio.distance import (
+    Coordinate,
+    DISTANCE_MODE_STRAIGHTLINE,
+    DISTANCE_ORDER_BY_DISTANCE,
+    DISTANCE_ORDER_BY_DURATION,
+    DISTANCE_SORT_ASC,
+    DISTANCE_SORT_DESC,
+    DISTANCE_UNITS_KM,
+    DISTANCE_UNITS_MILES,
+)
+from geocodio.local_distance import KM_PER_MILE, haversine_km
+from geocodio.models import (
+    DistanceDestination,
+    DistanceMatrixResponse,
+    DistanceMatrixResult,
+    DistanceOrigin,
+)
+
+np: Any  # None when the optional dependency is not installed
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is not installed
+    np = None
+
+Tile = Tuple[range, range]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Compact result
+# ──────────────────────────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class CompactDistanceMatrix:
+    """
+    Distance matrix stored as flat typed arrays instead of per-cell objects.
+
+    Rows use a CSR layout: the destinations returned for origin ``i`` are
+    ``indexes[offsets[i]:offsets[i + 1]]`` (positions in ``destinations``), in
+    result order, with their distances and durations at the same positions.
+    Missing durations (straight-line mode) are stored as NaN.
+
+    Attributes:
+        mode: The distance calculation mode used.
+        origins: The origins, in request order.
+        destinations: The destinations, in request order.
+        offsets: Row start positions, ``len(origins) + 1`` entries.
+        indexes: Destination index of each returned cell.
+        distances_miles: Distance of each returned cell in miles.
+        distances_km: Distance of each returned cell in kilometers.
+        durations: Driving duration of each returned cell in seconds, or NaN.
+        origin_details: The API's origin object for each origin, or None
+            where the API did not return it. Keeps its ``query`` and
+            ``extras`` when rows are expanded again.
+        destination_details: The API's first destination object for each
+            destination, or None, used the same way for every cell of
+            that destination.
+    """
+
+    mode: str
+    origins: List[Coordinate]
+    destinations: List[Coordinate]
+    offsets: array
+    indexes: array
+    distances_miles: array
+    distances_km: array
+    durations: array
+    origin_details: Optional[List[Optional[DistanceOrigin]]] = field(
+        default=None, repr=False
+    )
+    destination_details: Optional[List[Optional[DistanceDestination]]] = field(
+        default=None, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.origins)
+
+    @property
+    def cell_count(self) -> int:
+        """Number of origin/destination pairs in the result."""
+        return len(self.indexes)
+
+    def row(self, i: int) -> List[DistanceDestination]:
+        """The destinations for origin ``i`` as ``DistanceDestination`` objects."""
+        result = []
+        for pos in range(self.offsets[i], self.offsets[i + 1]):
+            j = self.indexes[pos]
+            coord = self.destinations[j]
+            duration = self.durations[pos]
+            detail = (
+                self.destination_details[j]
+                if self.destination_details is not None
+                else None
+            )
+            result.append(
+                DistanceDestination(
+                    query=detail.query if detail is not None else coord.to_string(),
+                    location=(
+                        (detail.location[0], detail.location[1])
+                        if detail is not None
+                        else (coord.lat, coord.lng)
+                    ),
+                    distance_miles=self.distances_miles[pos],
+                    distance_km=self.distances_km[pos],
+                    id=coord.id,
+                    duration_seconds=None if math.isnan(duration) else int(duration),
+                    extras=dict(getattr(detail, "extras", {})),
+                )
+            )
+        return result
+
+    def iter_rows(self) -> Iterator[Tuple[Coordinate, List[DistanceDestination]]]:
+        """Yield ``(origin, destinations)`` one row at a time."""
+        for i, origin in enumerate(self.origins):
+            yield origin, self.row(i)
+
+    def to_dense(self) -> "DenseDistanceMatrix":
+        """Convert to a NumPy-backed ``DenseDistanceMatrix``."""
+        return DenseDistanceMatrix.from_compact(self)
+
+    def to_response(self) -> DistanceMatrixResponse:
+        """Expand into a regular ``DistanceMatrixResponse``."""
+        return DistanceMatrixResponse(
+            mode=self.mode,
+            results=[
+                DistanceMatrixResult(
+                    origin=self._origin(i, origin), destinations=destinations
+                )
+                for i, (origin, destinations) in enumerate(self.iter_rows())
+            ],
+        )
+
+    def _origin(self, i: int, origin: Coordinate) -> DistanceOrigin:
+        detail = self.origin_details[i] if self.origin_details is not None else None
+        if detail is None:
+            return DistanceOrigin(
+                query=origin.to_string(),
+                location=(origin.lat, origin.lng),
+                id=origin.id,
+            )
+        # Typed (msgspec) origins have no extras
+        return DistanceOrigin(
+            query=detail.query,
+            location=(detail.location[0], detail.location[1]),
+            id=origin.id,
+            extras=dict(getattr(detail, "extras", {})),
+        )
+
+    @classmethod
+    def from_response(
+            cls,
+            response: DistanceMatrixResponse,
+            destinations: Optional[Sequence[Coordinate]] = None,
+    ) -> "CompactDistanceMatrix":
+        """
+        Build from a ``DistanceMatrixResponse``.
+
+        Args:
+            response: The response to convert.
+            destinations: The requested destinations, so cells can be stored as
+                indexes into this list. Defaults to the distinct destinations in
+                the response, in order of first appearance.
+        """
+        origins = [
+            Coordinate(r.origin.location[0], r.origin.location[1], r.origin.id)
+            for r in response.results
+        ]
+        positions: Dict[Any, int] = {}
+        dest_list: List[Coordinate] = (
+            list(destinations) if destinations is not None else []
+        )
+        for j, coord in enumerate(dest_list):
+            positions.setdefault(_destination_key(coord.id, (coord.lat, coord.lng)), j)
+
+        builder = _CompactBuilder()
+        dest_details: List[Optional[DistanceDestination]] = [None] * len(dest_list)
+        for result in response.results:
+            for dest in result.destinations:
+                key = _destination_key(dest.id, dest.location)
+                if key not in positions:
+                    positions[key] = len(dest_list)
+                    dest_list.append(
+                        Coordinate(dest.location[0], dest.location[1], dest.id)
+                    )
+                    dest_details.append(None)
+                j = positions[key]
+                if dest_details[j] is None:
+                    dest_details[j] = dest
+                builder.add(
+                    j, dest.distance_miles, dest.distance_km, dest.duration_seconds
+                )
+            builder.end_row()
+        return builder.build(
+            response.mode,
+            origins,
+            dest_list,
+            [r.origin for r in response.results],
+            dest_details,
+        )
+
+
+def _destination_key(dest_id: Optional[str], location: Tuple[float, float]) -> Any:
+    return (
+        ("id", dest_id)
+        if dest_id
+        else ("location", float(location[0]), float(location[1]))
+    )
+
+
+class _CompactBuilder:
+    """Appends cells row by row into the arrays of a ``CompactDistanceMatrix``."""
+
+    def __init__(self):
+        self.offsets = array("q", [0])
+        self.indexes = array("q")
+        self.miles = array("d")
+        self.km = array("d")
+        self.durations = array("d")
+
+    def add(
+        self, index: int, miles: float, km: float, duration: Optional[float]
+    ) -> None:
+        self.indexes.append(index)
+        self.miles.append(miles)
+        self.km.append(km)
+        self.durations.append(math.nan if duration is None else duration)
+
+    def end_row(self) -> None:
+        self.offsets.append(len(self.indexes))
+
+    def build(
+            self,
+            mode: str,
+            origins: List[Coordinate],
+            destinations: List[Coordinate],
+            origin_details: Optional[List[Optional[DistanceOrigin]]] = None,
+            destination_details: Optional[List[Optional[DistanceDestination]]] = None,
+    ) -> CompactDistanceMatrix:
+        return CompactDistanceMatrix(
+            mode=mode,
+            origins=origins,
+            destinations=destinations,
+            offsets=self.offsets,
+            indexes=self.indexes,
+            distances_miles=self.miles,
+            distances_km=self.km,
+            durations=self.durations,
+            origin_details=origin_details,
+            destination_details=destination_details,
+        )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tiling
+# ──────────────────────────────────────────────────────────────────────────────
+
+def plan_tiles(
+    n_origins: int, n_destinations: int, tile_origins: int, tile_destinations: int
+) -> List[Tile]:
+    """
+    Split an ``n_origins x n_destinations`` matrix into tiles.
+
+    Returns:
+        ``(origin_range, destination_range)`` pairs covering every cell once,
+        ordered by origin block, then destination block.
+    """
+    if tile_origins < 1 or tile_destinations < 1:
+        raise ValueError("Tile dimensions must be at least 1")
+    return [
+        (
+            range(o, min(o + tile_origins, n_origins)),
+            range(d, min(d + tile_destinations, n_destinations)),
+        )
+        for o in range(0, n_origins, tile_origins)
+        for d in range(0, n_destinations, tile_destinations)
+    ]
+
+
+def merge_tiles(
+        payloads: Sequence[Dict[str, Any]],
+        origins: Sequence[Coordinate],
+        destinations: Sequence[Coordinate],
+        mode: str,
+        units: str,
+        max_results: Optional[int],
+        order_by: str,
+        sort_order: str,
+) -> CompactDistanceMatrix:
+    """
+    Merge the JSON responses of tiled distance matrix requests.
+
+    Each tile must have been sent with origin and destination ``id`` set to
+    their global index (see :func:`tile_body_coordinates`), so cells can be
+    placed regardless of how the API ordered or filtered them. Per-origin
+    results are re-sorted across tiles and cut to ``max_results``. The API's
+    origin and destination objects are kept (with the caller's ids restored),
+    so expanded rows have the API's ``query`` and extra fields.
+    """
+    rows: List[List[Tuple[int, float, float, Optional[float]]]] = [[] for _ in origins]
+    origin_details: List[Optional[DistanceOrigin]] = [None] * len(origins)
+    dest_details: List[Optional[DistanceDestination]] = [None] * len(destinations)
+    for payload in payloads:
+        for result in payload.get("results", []):
+            i = int(result["origin"]["id"])
+            if origin_details[i] is None:
+                origin_details[i] = DistanceOrigin.from_api(result["origin"])
+            row = rows[i]
+            for dest in result.get("destinations", []):
+                j = int(dest["id"])
+                if dest_details[j] is None:
+                    dest_details[j] = DistanceDestination.from_api(dest)
+                row.append((
+                    j,
+                    dest.get("distance_miles", 0.0),
+                    dest.get("distance_km", 0.0),
+                    dest.get("duration_seconds"),
+                ))
+        mode = payload.get("mode", mode)
+
+    if order_by == DISTANCE_ORDER_BY_DURATION:
+        def sort_key(cell):
+            return cell[3] if cell[3] is not None else math.inf
+    elif units == DISTANCE_UNITS_KM:
+        def sort_key(cell):
+            return cell[2]
+    else:
+        def sort_key(cell):
+            return cell[1]
+
+    builder = _CompactBuilder()
+    for row in rows:
+        row.sort(key=lambda cell: cell[0])
+        row.sort(key=sort_key, reverse=sort_order == DISTANCE_SORT_DESC)
+        for index, miles, km, duration in (
+            row[:max_results] if max_results is not None else row
+        ):
+            builder.add(index, miles, km, duration)
+        builder.end_row()
+    return builder.build(
+        mode, list(origins), list(destinations), origin_details, dest_details
+    )
+
+
+def tile_body_coordinates(
+        coordinates: Sequence[Coordinate],
+        indexes: range,
+) -> List[Dict[str, Any]]:
+    """
+    Request-body coordinates for one tile, tagged with their global index as ``id``.
+    """
+    return [
+        {"lat": coordinates[k].lat, "lng": coordinates[k].lng, "id": str(k)}
+        for k in indexes
+    ]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Dense result
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "DenseDistanceMatrix requires NumPy. "
+            "Install it with: pip install geocodio-library-python[numpy]"
+        )
+
+
+def _array_from_numpy(typecode: str, values: Any) -> array:
+    result = array(typecode)
+    result.frombytes(
+        np.ascontiguousarray(
+            values, dtype=np.int64 if typecode == "q" else np.float64
+        ).tobytes()
+    )
+    return result
+
+
+@dataclass(slots=True)
+class DenseDistanceMatrix:
+    """
+    Distance matrix as contiguous ``len(origins) x len(destinations)`` NumPy arrays.
+
+    Cell ``[i, j]`` holds the distance from origin ``i`` to destination ``j``.
+    Cells the API did not return (filtered out by ``max_results``,
+    ``max_distance``, ...) and durations in straight-line mode are NaN. No
+    per-cell Python objects are created. Requires NumPy.
+
+    Attributes:
+        mode: The distance calculation mode used.
+        origins: The origins, in row order.
+        destinations: The destinations, in column order.
+        distances_miles: ``float64`` array of distances in miles.
+        distances_km: ``float64`` array of distances in kilometers.
+        durations: ``float64`` array of driving durations in seconds.
+    """
+
+    mode: str
+    origins: List[Coordinate]
+    destinations: List[Coordinate]
+    distances_miles: Any
+    distances_km: Any
+    durations: Any
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.origins), len(self.destinations))
+
+    @property
+    def origin_ids(self) -> Any:
+        """Origin IDs (or None) as an object array indexed like the rows."""
+        return np.array([c.id for c in self.origins], dtype=object)
+
+    @property
+    def destination_ids(self) -> Any:
+        """Destination IDs (or None) as an object array indexed like the columns."""
+        return np.array([c.id for c in self.destinations], dtype=object)
+
+    @property
+    def mask(self) -> Any:
+        """Boolean array, True where a cell holds a result."""
+        return ~np.isnan(self.distances_km)
+
+    @classmethod
+    def straightline(
+            cls,
+            origins: Sequence[Coordinate],
+            destinations: Sequence[Coordinate],
+    ) -> "DenseDistanceMatrix":
+        """Compute a full straight-line matrix locally, without calling the API."""
+        _require_numpy()
+        km = np.asarray(
+            haversine_km(
+                [(c.lat, c.lng) for c in origins],
+                [(c.lat, c.lng) for c in destinations],
+            )
+        )
+        km = km.reshape(len(origins), len(destinations))
+        return cls(
+            mode=DISTANCE_MODE_STRAIGHTLINE,
+            origins=list(origins),
+            destinations=list(destinations),
+            distances_miles=km / KM_PER_MILE,
+            distances_km=km,
+            durations=np.full(km.shape, np.nan),
+        )
+
+    @classmethod
+    def from_compact(cls, compact: CompactDistanceMatrix) -> "DenseDistanceMatrix":
+        """Scatter a ``CompactDistanceMatrix`` into dense arrays."""
+        _require_numpy()
+        shape = (len(compact.origins), len(compact.destinations))
+        rows = np.repeat(
+            np.arange(shape[0]), np.diff(np.frombuffer(compact.offsets, dtype=np.int64))
+        )
+        cols = np.frombuffer(compact.indexes, dtype=np.int64)
+        arrays = []
+        for values in (
+            compact.distances_miles,
+            compact.distances_km,
+            compact.durations,
+        ):
+            dense = np.full(shape, np.nan)
+            dense[rows, cols] = np.frombuffer(values, dtype=np.float64)
+            arrays.append(dense)
+        return cls(
+            compact.mode, list(compact.origins), list(compact.destinations), *arrays
+        )
+
+    @classmethod
+    def from_response(
+            cls,
+            response: DistanceMatrixResponse,
+            destinations: Optional[Sequence[Coordinate]] = None,
+    ) -> "DenseDistanceMatrix":
+        """
+        Build from a ``DistanceMatrixResponse``.
+
+        ``destinations`` fixes the column order; see
+        :meth:`CompactDistanceMatrix.from_response`.
+        """
+        return cls.from_compact(
+            CompactDistanceMatrix.from_response(response, destinations)
+        )
+
+    def to_compact(
+            self,
+            units: str = DISTANCE_UNITS_MILES,
+            order_by: str = DISTANCE_ORDER_BY_DISTANCE,
+            sort_order: str = DISTANCE_SORT_ASC,
+    ) -> CompactDistanceMatrix:
+        """
+        Gather the present cells into a ``CompactDistanceMatrix``.
+
+        Dense arrays do not keep the API's result order, so each row is sorted
+        by ``order_by``/``sort_order`` (ties in column order).
+        """
+        if order_by == DISTANCE_ORDER_BY_DURATION:
+            keys = np.where(np.isnan(self.durations), np.inf, self.durations)
+        else:
+            keys = (
+                self.distances_km
+                if units == DISTANCE_UNITS_KM
+                else self.distances_miles
+            )
+        rows, cols = np.nonzero(self.mask)
+        cell_keys = keys[rows, cols]
+        if sort_order == DISTANCE_SORT_DESC:
+            cell_keys = -cell_keys
+        order = np.lexsort((cols, cell_keys, rows))
+        rows, cols = rows[order], cols[order]
+        offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(rows, minlength=len(self.origins))))
+        )
+        return CompactDistanceMatrix(
+            mode=self.mode,
+            origins=list(self.origins),
+            destinations=list(self.destinations),
+            offsets=_array_from_numpy("q", offsets),
+            indexes=_array_from_numpy("q", cols),
+            distances_miles=_array_from_numpy("d", self.distances_miles[rows, cols]),
+            distances_km=_array_from_numpy("d", self.distances_km[rows, cols]),
+            durations=_array_from_numpy("d", self.durations[rows, cols]),
+        )
+
+    def to_response(
+            self,
+            units: str = DISTANCE_UNITS_MILES,
+            order_by: str = DISTANCE_ORDER_BY_DISTANCE,
+            sort_order: str = DISTANCE_SORT_ASC,
+    ) -> DistanceMatrixResponse:
+        """
+        Expand into a regular ``DistanceMatrixResponse``; rows are ordered as in
+        :meth:`to_compact`.
+        """
+        return self.to_compact(units, order_by, sort_order).to_response()
+
+
+__all__ = [
+    "CompactDistanceMatrix",
+    "DenseDistanceMatrix",
+    "plan_tiles",
+    "merge_tiles",
+    "tile_body_coordinates",
+]
@@ -0,0 +1,268 @@
+"""
+src/geocodio/metrics.py
+In-process request metrics collected through the client's lifecycle hooks.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+from geocodio.hooks import ClientHooks, ParseEvent, RequestEvent
+
+# Upper bounds in seconds, from 1ms to 2 minutes
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+BATCH_SIZE_BUCKETS = (1, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+_VERSION_SEGMENT = re.compile(r"^v\d+(\.\d+)*$")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_name(endpoint: str) -> str:
+    """
+    A low-cardinality name for an API path.
+
+    The version prefix is dropped and segments containing digits (list and
+    job IDs) become ``{id}``, e.g. ``/v1.11/lists/42/download`` is
+    ``lists/{id}/download``.
+    """
+    segments = [
+        "{id}" if any(c.isdigit() for c in segment) else segment
+        for segment in endpoint.strip("/").split("/")
+        if segment and not _VERSION_SEGMENT.match(segment)
+    ]
+    return "/".join(segments)
+
+
+class Histogram:
+    """
+    Counts of observations in fixed buckets, with estimated percentiles.
+
+    Recording is one binary search and a few additions. Percentiles are
+    interpolated linearly within the bucket that holds them, so their
+    accuracy depends on the bucket bounds. They are always clamped to the
+    observed minimum and maximum. Not thread-safe by itself.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimated value below which a fraction ``q`` of observations fall."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[i - 1] if i else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(max(estimate, self.min), self.max)
+            seen += count
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot: Dict[str, Any] = {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.total / self.count if self.count else None,
+        }
+        for q in PERCENTILES:
+            snapshot[f"p{q * 100:g}"] = self.percentile(q)
+        buckets = {str(bound): count for bound, count in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        snapshot["buckets"] = buckets
+        return snapshot
+
+
+class _EndpointMetrics:
+    __slots__ = (
+        "requests", "retries", "statuses", "errors", "bytes_sent", "bytes_received",
+        "latency", "parse", "lookups",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.parse = Histogram(LATENCY_BUCKETS)
+        self.lookups = Histogram(BATCH_SIZE_BUCKETS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": dict(self.errors),
+            "status_codes": {
+                str(status): count for status, count in sorted(self.statuses.items())
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.snapshot(),
+            "parse_time": self.parse.snapshot(),
+            "lookups_per_batch": self.lookups.snapshot(),
+        }
+
+
+class MetricsCollector(ClientHooks):
+    """
+    Per-endpoint request metrics, aggregated in memory.
+
+    Tracks, per endpoint (see :func:`endpoint_name`):
+
+    - request attempts, retries and responses by status code
+    - errors by exception class name (e.g. ``AuthenticationError``)
+    - lookups per batch
+    - latency and parse time histograms with estimated percentiles
+    - bytes sent and received
+
+    Cache hits come from the ``cache_stats`` of the clients the collector is
+    attached to. Each event costs one lock acquisition and a few counter
+    updates, so the collector can stay on in production.
+
+    Example:
+        >>> metrics = MetricsCollector().attach(client)
+        >>> client.geocode(addresses)
+        >>> metrics.snapshot()["endpoints"]["geocode"]["latency"]["p99"]
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._clients: List[Any] = []
+
+    def attach(self, client: Any) -> "MetricsCollector":
+        """
+        Register with a ``Geocodio`` or ``AsyncGeocodio`` client; returns the collector.
+        """
+        if self not in client.hooks:
+            client.hooks.append(self)
+        if all(c is not client for c in self._clients):
+            self._clients.append(client)
+        return self
+
+    def _endpoint(self, endpoint: str) -> _EndpointMetrics:
+        # Called with the lock held
+        name = endpoint_name(endpoint)
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints[name] = _EndpointMetrics()
+        return metrics
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoint(event.endpoint)
+            metrics.requests += 1
+            if event.attempt == 1 and event.lookups:
+                metrics.lookups.record(event.lookups)
+
+    def on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoint(event.endpoint)
+            if event.status_code is not None:
+                metrics.statuses[event.status_code] = (
+                    metrics.statuses.get(event.status_code, 0) + 1
+                )
+            metrics.bytes_sent += event.bytes_sent or 0
+            metrics.bytes_received += event.bytes_received or 0
+            metrics.latency.record(event.timings.get("total", 0.0))
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoint(event.endpoint)
+            metrics.retries += 1
+            self._record_failed_attempt(metrics, event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        name = type(event.exception).__name__
+        with self._lock:
+            metrics = self._endpoint(event.endpoint)
+            metrics.errors[name] = metrics.errors.get(name, 0) + 1
+            self._record_failed_attempt(metrics, event)
+
+    @staticmethod
+    def _record_failed_attempt(metrics: _EndpointMetrics, event: RequestEvent) -> None:
+        # Attempts without a response never reached on_response
+        if event.status_code is None and "total" in event.timings:
+            metrics.latency.record(event.timings["total"])
+
+    def on_parse_complete(self, event: ParseEvent) -> None:
+        with self._lock:
+            self._endpoint(event.endpoint).parse.record(event.timings.get("parse", 0.0))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        All metrics as plain dicts and numbers, ready for JSON or an exporter.
+
+        Latencies are in seconds. The ``totals`` entry sums requests, retries
+        and errors over all endpoints.
+        """
+        with self._lock:
+            endpoints = {
+                name: metrics.snapshot()
+                for name, metrics in sorted(self._endpoints.items())
+            }
+        hits = sum(client.cache_stats.hits for client in self._clients)
+        misses = sum(client.cache_stats.misses for client in self._clients)
+        errors: Dict[str, int] = {}
+        for metrics in endpoints.values():
+            for name, count in metrics["errors"].items():
+                errors[name] = errors.get(name, 0) + count
+        return {
+            "endpoints": endpoints,
+            "totals": {
+                "requests": sum(m["requests"] for m in endpoints.values()),
+                "retries": sum(m["retries"] for m in endpoints.values()),
+                "errors": errors,
+            },
+            "cache": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            },
+        }
+
+    def reset(self) -> None:
+        """Clear every counter (cache counters belong to the clients and are kept)."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+__all__ = [
+    "BATCH_SIZE_BUCKETS",
+    "LATENCY_BUCKETS",
+    "Histogram",
+    "MetricsCollector",
+    "endpoint_name",
+]
@@ -5,8 +5,10 @@ Dataclass representations of Geocodio API responses and related objects.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, List, Optional, Dict, Tuple, TypeVar, Type
+import copy
+from dataclasses import dataclass, field, fields as dataclass_fields
+from functools import cached_property
+from typing import Any, Callable, List, Optional, Dict, Tuple, TypeVar, Type
 
 import httpx
 
@@ -666,6 +668,199 @@ class GeocodingResult:
     fields: Optional[GeocodioFields] = None
 
 
+class _LazyField:
+    """
+    Class attribute of :class:`LazyGeocodioFields` that builds one field on
+    access.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._value(self.name)
+
+
+class LazyGeocodioFields(GeocodioFields):
+    """
+    Drop-in replacement for :class:`GeocodioFields` that keeps the raw ``fields``
+    dict and only builds each model (``census2020``, ``acs``, ``timezone``, ...)
+    the first time it is accessed. Every dataclass field is resolved on access,
+    so ``dataclasses.asdict`` and ``isinstance`` behave as for the eager model.
+    """
+
+    # Raw API keys that feed each GeocodioFields attribute.
+    _SOURCE_KEYS: Dict[str, Tuple[str, ...]] = {
+        "timezone": ("timezone",),
+        "congressional_districts": ("cd", "congressional_districts"),
+        "state_legislative_districts": ("stateleg", "state_legislative_districts"),
+        "state_legislative_districts_next": (
+            "stateleg-next",
+            "state_legislative_districts_next",
+        ),
+        "school_districts": ("school_districts", "school"),
+        "acs": ("acs",),
+        "demographics": ("acs", "acs-demographics"),
+        "economics": ("acs", "acs-economics"),
+        "families": ("acs", "acs-families"),
+        "housing": ("acs", "acs-housing"),
+        "social": ("acs", "acs-social"),
+        "zip4": ("zip4",),
+        "ffiec": ("ffiec",),
+        "riding": ("riding",),
+        "provriding": ("provriding",),
+        "provriding_next": ("provriding-next",),
+        "statcan": ("statcan",),
+    }
+
+    __slots__ = ("_raw", "_parser", "_parsed", "_full")
+
+    def __init__(
+        self,
+        raw: Dict[str, Any],
+        parser: Callable[[Dict[str, Any]], Optional[GeocodioFields]],
+    ):
+        # GeocodioFields is frozen
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_parser", parser)
+        object.__setattr__(self, "_parsed", {})
+        object.__setattr__(self, "_full", None)
+
+    def materialize(self) -> GeocodioFields:
+        """Build (once) and return the complete :class:`GeocodioFields`."""
+        if self._full is None:
+            object.__setattr__(self, "_full", self._parser(self._raw))
+        return self._full
+
+    def _parse_attribute(self, name: str, source_keys: Tuple[str, ...]) -> Any:
+        subset = {k: self._raw[k] for k in source_keys if k in self._raw}
+        if not subset:
+            return None
+        return getattr(self._parser(subset), name)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._value(name)
+
+    def _value(self, name: str) -> Any:
+        try:
+            return self._parsed[name]
+        except KeyError:
+            pass
+
+        if self._full is not None:
+            value = getattr(self._full, name)
+        elif name in self._SOURCE_KEYS:
+            value = self._parse_attribute(name, self._SOURCE_KEYS[name])
+        elif name.startswith("census") and len(name) > 6 and name[6:].isdigit():
+            value = self._parse_attribute(name, ("census", name))
+        else:
+            value = getattr(self.materialize(), name)
+        self._parsed[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyGeocodioFields(keys={list(self._raw)})"
+
+    def __reduce__(self):
+        return type(self), (self._raw, self._parser)
+
+    def __deepcopy__(self, memo):
+        # The parser is a client method; copies share it
+        return type(self)(copy.deepcopy(self._raw, memo), self._parser)
+
+
+# Shadow the class-level defaults of GeocodioFields so every field goes through
+# the lazy lookup
+for _field in dataclass_fields(GeocodioFields):
+    setattr(LazyGeocodioFields, _field.name, _LazyField(_field.name))
+
+
+class LazyGeocodingResult(GeocodingResult):
+    """
+    Drop-in replacement for :class:`GeocodingResult` built from a raw result dict.
+
+    Scalar attributes are read straight from the dict; ``address_components``,
+    ``location`` and ``fields`` are built on first access and then reused.
+    Being a subclass, it passes ``isinstance`` checks and works with
+    ``dataclasses.asdict``.
+    """
+
+    _raw: Dict[str, Any]
+    _fields_parser: Callable[[Dict[str, Any]], Optional[GeocodioFields]]
+
+    def __init__(
+        self,
+        raw: Dict[str, Any],
+        fields_parser: Callable[[Dict[str, Any]], Optional[GeocodioFields]],
+    ):
+        # GeocodingResult is frozen
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_fields_parser", fields_parser)
+
+    @property
+    def formatted_address(self) -> str:
+        return self._raw["formatted_address"]
+
+    @property
+    def accuracy(self) -> float:
+        return self._raw.get("accuracy", 0.0)
+
+    @property
+    def accuracy_type(self) -> str:
+        return self._raw.get("accuracy_type", "")
+
+    @property
+    def source(self) -> str:
+        return self._raw.get("source", "")
+
+    @cached_property
+    def address_components(self) -> AddressComponents:
+        return AddressComponents.from_api(self._raw["address_components"])
+
+    @cached_property
+    def location(self) -> Location:
+        return Location(**self._raw["location"])
+
+    @cached_property
+    def fields(self) -> Optional[LazyGeocodioFields]:
+        fields_data = self._raw.get("fields")
+        if not fields_data:
+            return None
+        return LazyGeocodioFields(fields_data, self._fields_parser)
+
+    def materialize(self) -> GeocodingResult:
+        """Build the equivalent eager :class:`GeocodingResult`."""
+        return GeocodingResult(
+            address_components=self.address_components,
+            formatted_address=self.formatted_address,
+            location=self.location,
+            accuracy=self.accuracy,
+            accuracy_type=self.accuracy_type,
+            source=self.source,
+            fields=self.fields.materialize() if self.fields is not None else None,
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyGeocodingResult):
+            return self._raw == other._raw
+        if isinstance(other, GeocodingResult):
+            return self.materialize() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyGeocodingResult(formatted_address={self.formatted_address!r})"
+
+    def __reduce__(self):
+        return type(self), (self._raw, self._fields_parser)
+
+    def __deepcopy__(self, memo):
+        return type(self)(copy.deepcopy(self._raw, memo), self._fields_parser)
+
+
 @dataclass(slots=True, frozen=True)
 class GeocodingResponse:
     """
@@ -673,7 +868,58 @@ class GeocodingResponse:
     """
 
     input: Dict[str, Optional[str]]
-    results: List[GeocodingResult] = field(default_factory=list)
+    results: List[GeocodingResult | LazyGeocodingResult] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class BatchGeocodingItem:
+    """
+    The outcome of one input in a batch geocode/reverse request.
+
+    Attributes:
+        query: The address or coordinate that was sent for this input.
+        results: Every candidate result returned for the input, best first.
+        key: The custom key for keyed batches, otherwise None.
+        input: The parsed input echoed back by the API.
+        error: The error message when the API could not process this input.
+    """
+
+    query: Any
+    results: List[GeocodingResult | LazyGeocodingResult] = field(default_factory=list)
+    key: Optional[str] = None
+    input: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the API returned no candidates for this input."""
+        return not self.results
+
+    @property
+    def best(self) -> Optional[GeocodingResult | LazyGeocodingResult]:
+        """The highest ranked candidate, or None if there were no results."""
+        return self.results[0] if self.results else None
+
+
+@dataclass(slots=True, frozen=True)
+class BatchGeocodingResponse(GeocodingResponse):
+    """
+    Returned by client.geocode() / client.reverse() for batch input.
+
+    ``items`` has exactly one entry per input, in input order, with all of its
+    candidates. ``results`` has the top candidate of each input at the same
+    position, or None for an input that returned no candidates.
+    """
+
+    results: List[
+        Optional[GeocodingResult | LazyGeocodingResult]
+    ] = field(default_factory=list)  # type: ignore[assignment]
+    items: List[BatchGeocodingItem] = field(default_factory=list)
+
+    @property
+    def empty_items(self) -> List[BatchGeocodingItem]:
+        """Inputs that returned no candidates."""
+        return [item for item in self.items if item.is_empty]
 
 
 @dataclass(slots=True, frozen=True)
@@ -686,6 +932,17 @@ class ListProcessingState:
     PROCESSING = "PROCESSING"
 
 
+@dataclass(slots=True, frozen=True)
+class DistanceJobState:
+    """
+    Constants for distance matrix job states returned by the Geocodio API.
+    """
+    ENQUEUED = "ENQUEUED"
+    PROCESSING = "PROCESSING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
 @dataclass(slots=True, frozen=True)
 class ListResponse:
     """
@@ -0,0 +1,127 @@
+"""
+src/geocodio/ratelimit.py
+Client-side token-bucket rate limiting for requests and lookups.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import List, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve tokens up front and then wait out any deficit, so waiters
+    are served in the order they arrived and the lock is never held while
+    sleeping. A request for more tokens than ``capacity`` is still granted,
+    after waiting for the bucket to refill.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum burst size. Defaults to ``rate`` (one second's worth).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        if self.capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take ``tokens`` from the bucket and return the seconds to wait before
+        using them.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+
+class RateLimiter:
+    """
+    Limits requests per second and lookups per second across threads and calls.
+
+    Share a single instance between clients (e.g. worker threads using the same
+    API key) to keep their combined traffic under the limits. Throttled callers
+    block (or await, for ``AsyncGeocodio``) instead of failing. A batch request
+    counts as one request and as one lookup per address or coordinate.
+
+    Args:
+        requests_per_second: Maximum HTTP requests per second, or None for no
+            limit.
+        lookups_per_second: Maximum geocode/reverse lookups per second, or None
+            for no limit.
+        burst: Seconds' worth of tokens that may be spent at once after being
+            idle.
+    """
+
+    def __init__(
+            self,
+            requests_per_second: Optional[float] = None,
+            lookups_per_second: Optional[float] = None,
+            burst: float = 1.0,
+    ):
+        if requests_per_second is None and lookups_per_second is None:
+            raise ValueError("Set requests_per_second, lookups_per_second or both")
+        if burst <= 0:
+            raise ValueError(f"burst must be positive, got {burst}")
+        self.requests = self._bucket("requests_per_second", requests_per_second, burst)
+        self.lookups = self._bucket("lookups_per_second", lookups_per_second, burst)
+
+    @staticmethod
+    def _bucket(
+            name: str, rate: Optional[float], burst: float,
+    ) -> Optional[TokenBucket]:
+        if rate is None:
+            return None
+        if rate <= 0:
+            raise ValueError(f"{name} must be positive or None, got {rate}")
+        return TokenBucket(rate, rate * burst)
+
+    def _reserve(self, lookups: int) -> float:
+        delays: List[float] = [0.0]
+        if self.requests is not None:
+            delays.append(self.requests.reserve(1))
+        if self.lookups is not None and lookups:
+            delays.append(self.lookups.reserve(lookups))
+        return max(delays)
+
+    def acquire(self, lookups: int = 0) -> float:
+        """
+        Block until one request carrying ``lookups`` lookups may be sent.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        delay = self._reserve(lookups)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, lookups: int = 0) -> float:
+        """Async counterpart of :meth:`acquire` that awaits instead of blocking."""
+        delay = self._reserve(lookups)
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+
+__all__ = [
+    "TokenBucket",
+    "RateLimiter",
+]
@@ -0,0 +1,155 @@
+"""
+src/geocodio/retry.py
+Retry policy for transient Geocodio API failures.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional, Tuple, Type
+
+import httpx
+
+# Methods that can be repeated without side effects on the API.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how often a failed request is retried.
+
+    Delays grow exponentially: ``backoff_factor * 2 ** (attempt - 1)``, capped at
+    ``max_backoff``. With ``jitter`` enabled the delay is drawn uniformly from
+    ``[0, delay]`` ("full jitter") so concurrent clients do not retry in lockstep.
+    A ``Retry-After`` header on the response takes precedence over the computed
+    delay when ``respect_retry_after`` is set.
+
+    Only idempotent requests are retried: GET/DELETE style methods, plus the
+    lookup POSTs (batch geocode/reverse, distance matrix) which have no side
+    effects. Requests that create resources, such as lists or distance jobs,
+    are never retried.
+
+    Attributes:
+        max_attempts: Total attempts including the first one; 1 disables retries.
+        backoff_factor: Base delay in seconds.
+        max_backoff: Upper bound on the computed delay in seconds.
+        jitter: Randomize delays with full jitter.
+        retry_statuses: HTTP status codes that are retried.
+        retry_exceptions: Transport exceptions that are retried.
+        respect_retry_after: Honor the ``Retry-After`` response header.
+        max_retry_after: Upper bound in seconds on a server-provided ``Retry-After``.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,)
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError(
+                f"max_attempts must be at least 1, got {self.max_attempts}"
+            )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after the given (1-based) failed attempt."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def is_retryable(
+            self,
+            idempotent: bool,
+            response: Optional[httpx.Response] = None,
+            exception: Optional[BaseException] = None,
+    ) -> bool:
+        """
+        Whether a failed attempt is of a kind this policy retries, ignoring the attempt
+        limit.
+        """
+        if not idempotent:
+            return False
+        if exception is not None:
+            return isinstance(exception, self.retry_exceptions)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def get_retry_delay(
+            self,
+            attempt: int,
+            idempotent: bool,
+            response: Optional[httpx.Response] = None,
+            exception: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Returns:
+            The number of seconds to wait before the next attempt, or None if
+            the request must not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(
+            idempotent, response, exception
+        ):
+            return None
+        if exception is not None:
+            return self.backoff(attempt)
+
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryStats:
+    """Counters for retries performed by a client."""
+
+    retries: int = 0
+    retried_requests: int = 0
+    exhausted: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_retry(self, attempt: int) -> None:
+        with self._lock:
+            self.retries += 1
+            if attempt == 1:
+                self.retried_requests += 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+
+__all__ = [
+    "IDEMPOTENT_METHODS",
+    "RetryPolicy",
+    "RetryStats",
+    "parse_retry_after",
+]
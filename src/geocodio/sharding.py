@@ -0,0 +1,183 @@
+"""
+src/geocodio/sharding.py
+Splitting CSV files into row-aligned shards and merging the geocoded shards
+back into one file.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Union
+
+from geocodio.download import DEFAULT_CHUNK_SIZE, Destination, DownloadSink
+
+
+def iter_row_ends(f: BinaryIO) -> Iterator[int]:
+    """
+    Byte offsets just past the end of each CSV record in ``f``.
+
+    A newline ends a record only when the quotes seen so far are balanced, so
+    quoted fields containing line breaks stay in one record (escaped quotes
+    are doubled and do not change the balance).
+    """
+    offset = 0
+    quotes = 0
+    for line in iter(f.readline, b""):
+        offset += len(line)
+        quotes += line.count(b'"')
+        if quotes % 2 == 0:
+            quotes = 0
+            yield offset
+    if quotes:
+        yield offset  # unterminated quote: the rest of the file is one record
+
+
+def skip_row(f: BinaryIO) -> None:
+    """Advance ``f`` past its next CSV record."""
+    next(iter_row_ends(f), None)
+
+
+class CsvShard:
+    """
+    A byte range of a CSV file, optionally preceded by the header row.
+
+    Reads like a binary file object, so it can be passed straight to
+    ``create_list`` and is streamed from disk during the upload.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        start: int,
+        end: int,
+        header: bytes = b"",
+        name: str = "file.csv",
+    ):
+        self.path = path
+        self.start = start
+        self.end = end
+        self.header = header
+        self.name = name
+        self._pending_header = header
+        self._position = start
+        self._file: Optional[BinaryIO] = None
+
+    def read(self, size: int = -1) -> bytes:
+        if self._pending_header:
+            data, self._pending_header = self._pending_header, b""
+            return data
+        remaining = self.end - self._position
+        if remaining <= 0:
+            return b""
+        if self._file is None:
+            self._file = open(self.path, "rb")
+            self._file.seek(self._position)
+        data = self._file.read(
+            remaining if size is None or size < 0 else min(size, remaining)
+        )
+        self._position = self._position + len(data) if data else self.end
+        if self._position >= self.end:
+            self.close()
+        return data
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclass(slots=True, frozen=True)
+class CsvSplit:
+    """The shards of one CSV file; ``header`` is empty for headerless files."""
+
+    header: bytes
+    shards: List[CsvShard]
+
+
+def split_csv(
+    path: Union[str, "os.PathLike[str]"], shards: int, header: bool = True
+) -> CsvSplit:
+    """
+    Split a CSV file into up to ``shards`` contiguous, row-aligned byte ranges.
+
+    Shards are balanced by size in a single streaming pass. With ``header``
+    the first row is kept out of the ranges and prepended to every shard.
+
+    Raises:
+        ValueError: If ``shards`` is less than 1 or the file has no data rows.
+    """
+    if shards < 1:
+        raise ValueError(f"shards must be at least 1, got {shards}")
+    path = os.path.abspath(os.fspath(path))
+    size = os.path.getsize(path)
+    stem, ext = os.path.splitext(os.path.basename(path))
+
+    with open(path, "rb") as f:
+        row_ends = iter_row_ends(f)
+        body_start = next(row_ends, 0) if header else 0
+        f.seek(0)
+        header_row = f.read(body_start)
+        f.seek(body_start)
+
+        boundaries = [body_start]
+        targets = [
+            body_start + (size - body_start) * i / shards for i in range(1, shards)
+        ]
+        for end in iter_row_ends(f):
+            offset = body_start + end
+            while targets and offset >= targets[0]:
+                targets.pop(0)
+                if offset > boundaries[-1] and offset < size:
+                    boundaries.append(offset)
+    boundaries.append(size)
+
+    if size <= body_start:
+        raise ValueError(f"{path} has no rows to geocode")
+    if header_row and not header_row.endswith(b"\n"):
+        header_row += b"\n"
+    ranges = [(a, b) for a, b in zip(boundaries, boundaries[1:]) if b > a]
+    return CsvSplit(header_row, [
+        CsvShard(path, a, b, header_row, name=f"{stem}.part{i + 1}{ext or '.csv'}")
+        for i, (a, b) in enumerate(ranges)
+    ])
+
+
+def merge_csv_files(
+        paths: Sequence[Union[str, "os.PathLike[str]"]],
+        destination: Destination,
+        skip_header: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Union[str, BinaryIO]:
+    """
+    Concatenate CSV files in order, keeping only the first file's header row.
+
+    Streams in ``chunk_size`` pieces; a path destination is written atomically.
+
+    Returns:
+        The saved path, or the destination stream.
+    """
+    sink = DownloadSink(destination, chunk_size=chunk_size)
+    try:
+        last = b""
+        for i, path in enumerate(paths):
+            with open(path, "rb") as f:
+                if skip_header and i:
+                    skip_row(f)
+                if last and last != b"\n":
+                    sink.write(b"\n")
+                while chunk := f.read(chunk_size):
+                    sink.write(chunk)
+                    last = chunk[-1:]
+        return sink.commit()
+    except BaseException:
+        sink.abort()
+        raise
+
+
+__all__ = [
+    "CsvShard",
+    "CsvSplit",
+    "split_csv",
+    "merge_csv_files",
+]
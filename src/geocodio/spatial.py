@@ -0,0 +1,369 @@
+"""
+src/geocodio/spatial.py
+Spatial index for repeated nearest-destination queries against a fixed set
+of destinations.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union, overload
+
+from geocodio.distance import (
+    Coordinate,
+    DISTANCE_MODE_DRIVING,
+    DISTANCE_UNITS_KM,
+    DISTANCE_UNITS_MILES,
+)
+from geocodio.local_distance import EARTH_RADIUS_KM, KM_PER_MILE
+from geocodio.models import DistanceDestination
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # pragma: no cover - exercised when SciPy is not installed
+    cKDTree = None
+
+CoordinateInput = Union[str, Tuple[float, float], Coordinate]
+Vector = Tuple[float, float, float]
+
+
+def to_unit_vector(lat: float, lng: float) -> Vector:
+    """Convert degrees to a point on the unit sphere."""
+    phi, lam = math.radians(lat), math.radians(lng)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+def _km_to_chord(km: float) -> float:
+    return 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# KD-tree
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _KDTree:
+    """
+    Static 3-d tree over unit vectors, used when SciPy is not installed.
+
+    Euclidean (chord) distance between unit vectors is monotonic in the
+    great-circle distance, so nearest neighbours in 3-d are nearest on the
+    sphere and a great-circle radius maps to a chord radius.
+    """
+
+    LEAF_SIZE = 16
+
+    def __init__(self, points: Sequence[Vector]):
+        self.points = points
+        self.root = self._build(list(range(len(points))))
+
+    def _build(self, indexes: List[int]) -> Any:
+        if len(indexes) <= self.LEAF_SIZE:
+            return indexes
+        spreads = [
+            max(self.points[i][axis] for i in indexes)
+            - min(self.points[i][axis] for i in indexes)
+            for axis in range(3)
+        ]
+        axis = spreads.index(max(spreads))
+        indexes.sort(key=lambda i: self.points[i][axis])
+        mid = len(indexes) // 2
+        split = self.points[indexes[mid]][axis]
+        return (axis, split, self._build(indexes[:mid]), self._build(indexes[mid:]))
+
+    def _dist2(self, query: Vector, i: int) -> float:
+        p = self.points[i]
+        return (p[0] - query[0]) ** 2 + (p[1] - query[1]) ** 2 + (p[2] - query[2]) ** 2
+
+    def nearest(
+        self, query: Vector, k: int, max_chord: float = math.inf
+    ) -> List[Tuple[float, int]]:
+        """Up to ``k`` ``(chord, index)`` pairs within ``max_chord``, nearest first."""
+        heap: List[Tuple[float, int]] = []  # max-heap of (-dist2, -index)
+        bound = max_chord ** 2 if max_chord != math.inf else math.inf
+
+        def visit(node):
+            nonlocal bound
+            if isinstance(node, list):
+                for i in node:
+                    d2 = self._dist2(query, i)
+                    if d2 > bound:
+                        continue
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d2, -i))
+                    elif (-d2, -i) > heap[0]:
+                        heapq.heapreplace(heap, (-d2, -i))
+                    if len(heap) == k:
+                        bound = min(bound, -heap[0][0])
+                return
+            axis, split, left, right = node
+            diff = query[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if diff * diff <= bound:
+                visit(far)
+
+        visit(self.root)
+        return sorted((math.sqrt(-d2), -i) for d2, i in heap)
+
+    def within(self, query: Vector, max_chord: float) -> List[Tuple[float, int]]:
+        """All ``(chord, index)`` pairs within ``max_chord``, nearest first."""
+        bound = max_chord ** 2
+        found: List[Tuple[float, int]] = []
+
+        def visit(node):
+            if isinstance(node, list):
+                for i in node:
+                    d2 = self._dist2(query, i)
+                    if d2 <= bound:
+                        found.append((math.sqrt(d2), i))
+                return
+            axis, split, left, right = node
+            diff = query[axis] - split
+            if diff < 0 or diff * diff <= bound:
+                visit(left)
+            if diff >= 0 or diff * diff <= bound:
+                visit(right)
+
+        visit(self.root)
+        found.sort()
+        return found
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Destination index
+# ──────────────────────────────────────────────────────────────────────────────
+
+class DestinationIndex:
+    """
+    Reusable index over a fixed set of destinations.
+
+    Answers k-nearest and radius queries locally, so the same destination list
+    does not have to be sent to the Distance API for every origin. Results are
+    ``DistanceDestination`` objects with great-circle distances, nearest first.
+    Uses SciPy's ``cKDTree`` when SciPy is installed and a built-in KD-tree
+    otherwise.
+
+    Args:
+        destinations: Destination coordinates (``Coordinate``, ``"lat,lng[,id]"``
+            strings or ``(lat, lng[, id])`` tuples).
+
+    Example:
+        >>> index = DestinationIndex(stores)
+        >>> index.nearest((38.8977, -77.0365), k=3)
+        >>> index.within((38.8977, -77.0365), radius=10, units="km")
+    """
+
+    def __init__(self, destinations: Iterable[CoordinateInput]):
+        self.destinations: List[Coordinate] = [
+            Coordinate.from_input(d) for d in destinations
+        ]
+        points = [to_unit_vector(c.lat, c.lng) for c in self.destinations]
+        self._scipy_tree: Any = (
+            cKDTree(points) if cKDTree is not None and points else None
+        )
+        self._tree = _KDTree(points) if self._scipy_tree is None else None
+
+    def __len__(self) -> int:
+        return len(self.destinations)
+
+    @overload
+    @staticmethod
+    def _to_km(distance: float, units: str) -> float:
+        ...
+
+    @overload
+    @staticmethod
+    def _to_km(distance: None, units: str) -> None:
+        ...
+
+    @overload
+    @staticmethod
+    def _to_km(distance: Optional[float], units: str) -> Optional[float]:
+        ...
+
+    @staticmethod
+    def _to_km(distance: Optional[float], units: str) -> Optional[float]:
+        if units not in (DISTANCE_UNITS_MILES, DISTANCE_UNITS_KM):
+            raise ValueError(
+                f"units must be '{DISTANCE_UNITS_MILES}' or '{DISTANCE_UNITS_KM}', "
+                f"got {units!r}"
+            )
+        if distance is None:
+            return None
+        return distance * KM_PER_MILE if units == DISTANCE_UNITS_MILES else distance
+
+    def _destination(self, chord: float, index: int) -> DistanceDestination:
+        coord = self.destinations[index]
+        km = _chord_to_km(chord)
+        return DistanceDestination(
+            query=coord.to_string(),
+            location=(coord.lat, coord.lng),
+            distance_miles=km / KM_PER_MILE,
+            distance_km=km,
+            id=coord.id,
+        )
+
+    def _query_nearest(
+        self, vector: Vector, k: int, max_km: Optional[float]
+    ) -> List[Tuple[float, int]]:
+        k = min(k, len(self.destinations))
+        if k < 1:
+            return []
+        max_chord = _km_to_chord(max_km) if max_km is not None else math.inf
+        if self._tree is not None:
+            return self._tree.nearest(vector, k, max_chord)
+        dists, idxs = self._scipy_tree.query(
+            vector, k=k, distance_upper_bound=max_chord * (1 + 1e-12)
+        )
+        if k == 1:
+            dists, idxs = [dists], [idxs]
+        return sorted(
+            (float(d), int(i))
+            for d, i in zip(dists, idxs)
+            if i < len(self.destinations)
+        )
+
+    def _query_within(self, vector: Vector, max_km: float) -> List[Tuple[float, int]]:
+        max_chord = _km_to_chord(max_km)
+        if self._tree is not None:
+            return self._tree.within(vector, max_chord)
+        if not self.destinations:
+            return []
+        idxs = self._scipy_tree.query_ball_point(vector, max_chord * (1 + 1e-12))
+        return sorted((math.dist(vector, self._scipy_tree.data[i]), i) for i in idxs)
+
+    def nearest(
+            self,
+            origin: CoordinateInput,
+            k: int = 1,
+            max_distance: Optional[float] = None,
+            units: str = DISTANCE_UNITS_MILES,
+    ) -> List[DistanceDestination]:
+        """
+        The ``k`` destinations closest to ``origin``, nearest first.
+
+        Args:
+            origin: The origin coordinate.
+            k: Maximum number of destinations to return.
+            max_distance: Only return destinations within this distance.
+            units: Units of ``max_distance`` ('miles' or 'km').
+        """
+        coord = Coordinate.from_input(origin)
+        pairs = self._query_nearest(
+            to_unit_vector(coord.lat, coord.lng), k, self._to_km(max_distance, units)
+        )
+        return [self._destination(chord, i) for chord, i in pairs]
+
+    def within(
+            self,
+            origin: CoordinateInput,
+            radius: float,
+            units: str = DISTANCE_UNITS_MILES,
+            max_results: Optional[int] = None,
+    ) -> List[DistanceDestination]:
+        """
+        Every destination within ``radius`` of ``origin``, nearest first.
+
+        Args:
+            origin: The origin coordinate.
+            radius: Search radius.
+            units: Units of ``radius`` ('miles' or 'km').
+            max_results: Optionally keep only the nearest ``max_results``.
+        """
+        coord = Coordinate.from_input(origin)
+        pairs = self._query_within(
+            to_unit_vector(coord.lat, coord.lng), self._to_km(radius, units)
+        )
+        if max_results is not None:
+            pairs = pairs[:max_results]
+        return [self._destination(chord, i) for chord, i in pairs]
+
+    def nearest_many(
+            self,
+            origins: Iterable[CoordinateInput],
+            k: int = 1,
+            max_distance: Optional[float] = None,
+            units: str = DISTANCE_UNITS_MILES,
+    ) -> List[List[DistanceDestination]]:
+        """Run :meth:`nearest` for each origin; one result list per origin."""
+        coords = [Coordinate.from_input(o) for o in origins]
+        max_km = self._to_km(max_distance, units)
+        k = min(k, len(self.destinations))
+        if self._scipy_tree is None or k < 1 or not coords:
+            return [self.nearest(c, k, max_distance, units) for c in coords]
+
+        # One vectorized tree query for the whole batch
+        max_chord = _km_to_chord(max_km) if max_km is not None else math.inf
+        dists, idxs = self._scipy_tree.query(
+            [to_unit_vector(c.lat, c.lng) for c in coords],
+            k=k,
+            distance_upper_bound=max_chord * (1 + 1e-12),
+        )
+        dists, idxs = dists.reshape(len(coords), k), idxs.reshape(len(coords), k)
+        return [
+            [
+                self._destination(float(d), int(i))
+                for d, i in zip(row_d, row_i)
+                if i < len(self.destinations)
+            ]
+            for row_d, row_i in zip(dists, idxs)
+        ]
+
+    def within_many(
+            self,
+            origins: Iterable[CoordinateInput],
+            radius: float,
+            units: str = DISTANCE_UNITS_MILES,
+            max_results: Optional[int] = None,
+    ) -> List[List[DistanceDestination]]:
+        """Run :meth:`within` for each origin; one result list per origin."""
+        return [self.within(origin, radius, units, max_results) for origin in origins]
+
+    def shortlist(self, origin: CoordinateInput, k: int) -> List[Coordinate]:
+        """
+        The ``k`` nearest destinations as ``Coordinate`` objects, ready to send
+        to the API.
+        """
+        coord = Coordinate.from_input(origin)
+        return [
+            self.destinations[i]
+            for _, i in self._query_nearest(
+                to_unit_vector(coord.lat, coord.lng), k, None
+            )
+        ]
+
+    def driving(
+        self, client: Any, origin: CoordinateInput, candidates: int = 10, **options: Any
+    ) -> Any:
+        """
+        Driving distances to the nearest destinations only.
+
+        Shortlists the ``candidates`` nearest destinations by straight-line
+        distance and sends just those to ``client.distance(..., mode="driving")``.
+        Works with both ``Geocodio`` and ``AsyncGeocodio`` (await the result).
+
+        Args:
+            client: A ``Geocodio`` or ``AsyncGeocodio`` client.
+            origin: The origin coordinate.
+            candidates: How many straight-line nearest destinations to forward.
+            **options: Extra arguments for ``distance()``, e.g. ``max_results``,
+                ``order_by="duration"`` or ``units``.
+        """
+        return client.distance(
+            origin,
+            self.shortlist(origin, candidates),
+            mode=DISTANCE_MODE_DRIVING,
+            **options,
+        )
+
+
+__all__ = [
+    "DestinationIndex",
+    "to_unit_vector",
+]
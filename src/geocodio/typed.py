@@ -0,0 +1,626 @@
+"""
+src/geocodio/typed.py
+msgspec structs for geocoding and distance responses, decoded from JSON bytes
+in one pass.
+
+Each struct has the declared attributes of its dataclass counterpart in
+:mod:`geocodio.models`, but is built by msgspec's decoder directly from the
+response body instead of going through intermediate dicts. The structs are
+not subclasses of the dataclasses, so ``isinstance`` checks against
+:mod:`geocodio.models` and ``dataclasses.asdict`` do not apply to them
+(use ``msgspec.structs.asdict``). Keys a struct does not declare are skipped
+by the decoder, so unlike the dataclasses the nested models have no
+``extras`` (``GeocodioFields.extras`` is kept).
+
+Used by the clients when ``typed_decoding=True``; importing this module
+requires msgspec.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import msgspec
+except ImportError as exc:  # pragma: no cover - exercised when msgspec is not installed
+    raise ImportError(
+        "Typed decoding requires the 'msgspec' package. "
+        "Install it with: pip install geocodio-library-python[msgspec]"
+    ) from exc
+
+_CENSUS_KEY = re.compile(r"^census\d+$")
+
+
+class _Struct(msgspec.Struct, frozen=True, gc=False):
+    """
+    Immutable and not tracked by the garbage collector, which makes decoding cheaper.
+    Subclasses repeat ``frozen=True`` so type checkers see them as frozen too.
+    """
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Geocoding models
+# ──────────────────────────────────────────────────────────────────────────────
+
+class Location(_Struct, frozen=True):
+    lat: float
+    lng: float
+
+
+class AddressComponents(_Struct, frozen=True):
+    number: Optional[str] = None
+    predirectional: Optional[str] = None
+    street: Optional[str] = None
+    suffix: Optional[str] = None
+    postdirectional: Optional[str] = None
+    formatted_street: Optional[str] = None
+    city: Optional[str] = None
+    county: Optional[str] = None
+    state: Optional[str] = None
+    zip: Optional[str] = None
+    postal_code: Optional[str] = None
+    country: Optional[str] = None
+
+
+class Timezone(_Struct, frozen=True):
+    name: str
+    utc_offset: int
+    observes_dst: Optional[bool] = None
+
+
+class CongressionalDistrict(_Struct, frozen=True):
+    name: str
+    district_number: Any = None
+    congress_number: Optional[str] = None
+    ocd_id: Optional[str] = None
+
+
+class StateLegislativeDistrict(_Struct, frozen=True):
+    name: str
+    district_number: Any = None
+    chamber: Optional[str] = None
+    ocd_id: Optional[str] = None
+    proportion: Optional[float] = None
+
+
+class CensusData(_Struct, frozen=True):
+    census_year: Optional[int] = None
+    block_code: Optional[str] = None
+    block_group: Optional[str] = None
+    tract_code: Optional[str] = None
+    full_fips: Optional[str] = None
+    county_fips: Optional[str] = None
+    state_fips: Optional[str] = None
+    place: Optional[Dict[str, Any]] = None
+    metro_micro_statistical_area: Optional[Dict[str, Any]] = None
+    combined_statistical_area: Optional[Dict[str, Any]] = None
+    metropolitan_division: Optional[Dict[str, Any]] = None
+    county_subdivision: Optional[Dict[str, Any]] = None
+    source: Optional[str] = None
+    block: Optional[str] = None
+    blockgroup: Optional[str] = None
+    tract: Optional[str] = None
+    msa_code: Optional[str] = None
+    csa_code: Optional[str] = None
+
+    def __post_init__(self):
+        # Older field names stay populated, as in models.CensusData
+        for old, new in (
+            ("block", "block_code"),
+            ("blockgroup", "block_group"),
+            ("tract", "tract_code"),
+        ):
+            if getattr(self, old) is None and getattr(self, new) is not None:
+                msgspec.structs.force_setattr(self, old, getattr(self, new))
+
+
+class ACSSurveyData(_Struct, frozen=True):
+    population: Optional[int] = None
+    households: Optional[int] = None
+    median_income: Optional[int] = None
+    median_age: Optional[float] = None
+
+
+class SchoolDistrict(_Struct, frozen=True):
+    name: str
+    district_number: Optional[str] = None
+    lea_id: Optional[str] = None
+    lea_code: Optional[str] = None
+    nces_id: Optional[str] = None
+    grade_low: Optional[str] = None
+    grade_high: Optional[str] = None
+
+
+# The API reports ACS metrics as value/margin_of_error objects, so they are left
+# untyped.
+
+class Demographics(_Struct, frozen=True):
+    total_population: Any = None
+    male_population: Any = None
+    female_population: Any = None
+    median_age: Any = None
+    white_population: Any = None
+    black_population: Any = None
+    asian_population: Any = None
+    hispanic_population: Any = None
+
+
+class Economics(_Struct, frozen=True):
+    median_household_income: Any = None
+    mean_household_income: Any = None
+    per_capita_income: Any = None
+    poverty_rate: Any = None
+    unemployment_rate: Any = None
+
+
+class Families(_Struct, frozen=True):
+    total_households: Any = None
+    family_households: Any = None
+    nonfamily_households: Any = None
+    married_couple_households: Any = None
+    single_male_households: Any = None
+    single_female_households: Any = None
+    average_household_size: Any = None
+
+
+class Housing(_Struct, frozen=True):
+    total_housing_units: Any = None
+    occupied_housing_units: Any = None
+    vacant_housing_units: Any = None
+    owner_occupied_units: Any = None
+    renter_occupied_units: Any = None
+    median_home_value: Any = None
+    median_rent: Any = None
+
+
+class Social(_Struct, frozen=True):
+    high_school_graduate_or_higher: Any = None
+    bachelors_degree_or_higher: Any = None
+    graduate_degree_or_higher: Any = None
+    veterans: Any = None
+    veterans_percentage: Any = None
+
+
+class ZIP4Data(_Struct, frozen=True):
+    record_type: Optional[Dict[str, Any]] = None
+    residential: Optional[bool] = None
+    carrier_route: Optional[Dict[str, Any]] = None
+    plus4: Optional[List[str]] = None
+    zip9: Optional[List[str]] = None
+    facility_code: Optional[Dict[str, Any]] = None
+    city_delivery: Optional[bool] = None
+    valid_delivery_area: Optional[bool] = None
+    exact_match: Optional[bool] = None
+    building_or_firm_name: Optional[str] = None
+    government_building: Optional[bool] = None
+
+
+class FederalRiding(_Struct, frozen=True):
+    code: str
+    name_english: str
+    name_french: str
+    ocd_id: str
+    year: int
+    source: str
+
+
+class ProvincialRiding(_Struct, frozen=True):
+    name_english: str
+    name_french: str
+    ocd_id: str
+    is_upcoming_district: bool
+    source: str
+
+
+class StatisticsCanadaData(_Struct, frozen=True):
+    division: Dict[str, Any]
+    consolidated_subdivision: Dict[str, Any]
+    subdivision: Dict[str, Any]
+    economic_region: str
+    statistical_area: Dict[str, Any]
+    cma_ca: Dict[str, Any]
+    tract: str
+    population_centre: Dict[str, Any]
+    dissemination_area: Dict[str, Any]
+    dissemination_block: Dict[str, Any]
+    census_year: int
+    designated_place: Optional[Dict[str, Any]] = None
+
+
+class FFIECData(_Struct, frozen=True):
+    collection_year: Optional[int] = None
+    msa_md_code: Optional[str] = None
+    fips_state_code: Optional[str] = None
+    fips_county_code: Optional[str] = None
+    census_tract: Optional[str] = None
+    principal_city: Optional[bool] = None
+    small_county: Optional[Dict[str, Any]] = None
+    split_tract: Optional[Dict[str, Any]] = None
+    demographic_data: Optional[Dict[str, Any]] = None
+    urban_rural_flag: Optional[Dict[str, Any]] = None
+    msa_md_median_family_income: Optional[int] = None
+    msa_md_median_household_income: Optional[int] = None
+    tract_median_family_income_percentage: Optional[float] = None
+    ffiec_estimated_msa_md_median_family_income: Optional[int] = None
+    income_indicator: Optional[str] = None
+    cra_poverty_criteria: Optional[bool] = None
+    cra_unemployment_criteria: Optional[bool] = None
+    cra_distressed_criteria: Optional[bool] = None
+    cra_remote_rural_low_density_criteria: Optional[bool] = None
+    previous_year_cra_distressed_criteria: Optional[bool] = None
+    previous_year_cra_underserved_criterion: Optional[bool] = None
+    meets_current_previous_criteria: Optional[bool] = None
+
+
+class GeocodioFields(_Struct, frozen=True):
+    """
+    Field appends of one result. Census years are available as ``census2020``
+    etc. and unknown keys as ``extras``, like :class:`geocodio.models.GeocodioFields`.
+    """
+
+    timezone: Optional[Timezone] = None
+    congressional_districts: Optional[List[CongressionalDistrict]] = None
+    state_legislative_districts: Optional[List[StateLegislativeDistrict]] = None
+    state_legislative_districts_next: Optional[List[StateLegislativeDistrict]] = None
+    school_districts: Optional[List[SchoolDistrict]] = None
+    acs: Optional[ACSSurveyData] = None
+    demographics: Optional[Demographics] = None
+    economics: Optional[Economics] = None
+    families: Optional[Families] = None
+    housing: Optional[Housing] = None
+    social: Optional[Social] = None
+    zip4: Optional[ZIP4Data] = None
+    ffiec: Optional[FFIECData] = None
+    riding: Optional[FederalRiding] = None
+    provriding: Optional[ProvincialRiding] = None
+    provriding_next: Optional[ProvincialRiding] = None
+    statcan: Optional[StatisticsCanadaData] = None
+    extras: Dict[str, Any] = {}
+    _census: Dict[str, CensusData] = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith("census") and name[6:].isdigit():
+            return self._census.get(name)
+        if name in self.extras:
+            return self.extras[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+
+class GeocodingResult(_Struct, frozen=True):
+    address_components: AddressComponents
+    formatted_address: str
+    location: Location
+    accuracy: float = 0.0
+    accuracy_type: str = ""
+    source: str = ""
+    # Decoded as raw JSON per key, then replaced by GeocodioFields in __post_init__
+    fields: Optional[Dict[str, msgspec.Raw]] = None
+
+    def __post_init__(self):
+        if self.fields is not None:
+            msgspec.structs.force_setattr(
+                self, "fields", _build_fields(self.fields) if self.fields else None
+            )
+
+
+class GeocodingResponse(_Struct, frozen=True):
+    input: Dict[str, Any] = {}
+    results: List[GeocodingResult] = []
+
+
+class BatchGeocodingItem(_Struct, frozen=True):
+    query: Any
+    results: List[GeocodingResult] = []
+    key: Optional[str] = None
+    input: Dict[str, Any] = {}
+    error: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the API returned no candidates for this input."""
+        return not self.results
+
+    @property
+    def best(self) -> Optional[GeocodingResult]:
+        """The highest ranked candidate, or None if there were no results."""
+        return self.results[0] if self.results else None
+
+
+class BatchGeocodingResponse(GeocodingResponse, frozen=True):
+    results: List[Optional[GeocodingResult]] = []  # type: ignore[assignment]
+    items: List[BatchGeocodingItem] = []
+
+    @property
+    def empty_items(self) -> List[BatchGeocodingItem]:
+        """Inputs that returned no candidates."""
+        return [item for item in self.items if item.is_empty]
+
+
+# Wire shapes of a batch response, turned into BatchGeocodingItem by TypedDecoder
+
+class _ItemResponse(_Struct, frozen=True):
+    input: Dict[str, Any] = {}
+    results: List[GeocodingResult] = []
+    error: Optional[str] = None
+
+
+class _BatchItem(_Struct, frozen=True):
+    query: Any = None
+    response: Optional[_ItemResponse] = None
+
+
+class _BatchPayload(_Struct, frozen=True):
+    input: Dict[str, Any] = {}
+    results: Union[List[_BatchItem], Dict[str, _BatchItem]] = []
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Field appends
+# ──────────────────────────────────────────────────────────────────────────────
+
+_Stateleg = Union[
+    List[StateLegislativeDistrict], Dict[str, List[StateLegislativeDistrict]]
+]
+_Schools = Union[List[SchoolDistrict], Dict[str, SchoolDistrict]]
+_ACS_METRICS = {
+    "demographics": Demographics,
+    "economics": Economics,
+    "families": Families,
+    "housing": Housing,
+    "social": Social,
+}
+
+
+def _stateleg(data: Any) -> List[StateLegislativeDistrict]:
+    if isinstance(data, list):
+        return data
+    # {house: [...], senate: [...]}
+    return [
+        (
+            district
+            if district.chamber is not None
+            else msgspec.structs.replace(district, chamber=chamber)
+        )
+        for chamber, districts in data.items()
+        for district in districts
+    ]
+
+
+def _schools(data: Any) -> List[SchoolDistrict]:
+    return data if isinstance(data, list) else list(data.values())
+
+
+def _spec(attr: str, type_: Any, convert: Any = None, primary: bool = True) -> tuple:
+    return attr, msgspec.json.Decoder(type_, strict=False), convert, primary
+
+
+# API key -> (attribute, decoder, conversion, primary). A primary key wins
+# over an alternative spelling of the same field, as in Geocodio._parse_fields.
+_FIELD_SPECS = {
+    "timezone": _spec("timezone", Timezone),
+    "cd": _spec("congressional_districts", List[CongressionalDistrict]),
+    "congressional_districts": _spec(
+        "congressional_districts", List[CongressionalDistrict], primary=False
+    ),
+    "stateleg": _spec("state_legislative_districts", _Stateleg, _stateleg),
+    "state_legislative_districts": _spec(
+        "state_legislative_districts", _Stateleg, _stateleg, False
+    ),
+    "stateleg-next": _spec("state_legislative_districts_next", _Stateleg, _stateleg),
+    "state_legislative_districts_next": _spec(
+        "state_legislative_districts_next", _Stateleg, _stateleg, False
+    ),
+    "school_districts": _spec("school_districts", _Schools, _schools),
+    "school": _spec("school_districts", _Schools, _schools, False),
+    # Flat ACS keys; the nested "acs" object takes precedence
+    "acs-demographics": _spec("demographics", Demographics, primary=False),
+    "acs-economics": _spec("economics", Economics, primary=False),
+    "acs-families": _spec("families", Families, primary=False),
+    "acs-housing": _spec("housing", Housing, primary=False),
+    "acs-social": _spec("social", Social, primary=False),
+    "zip4": _spec("zip4", ZIP4Data),
+    "ffiec": _spec("ffiec", FFIECData),
+    "riding": _spec("riding", FederalRiding),
+    "provriding": _spec("provriding", ProvincialRiding),
+    "provriding-next": _spec("provriding_next", ProvincialRiding),
+    "statcan": _spec("statcan", StatisticsCanadaData),
+}
+_RAW_OBJECT = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+_CENSUS_YEARS = msgspec.json.Decoder(Dict[str, CensusData], strict=False)
+_CENSUS = msgspec.json.Decoder(CensusData, strict=False)
+_ACS_SURVEY = msgspec.json.Decoder(ACSSurveyData, strict=False)
+_ACS_METRIC_DECODERS = {
+    metric: msgspec.json.Decoder(model, strict=False)
+    for metric, model in _ACS_METRICS.items()
+}
+
+
+def _build_fields(raw: Dict[str, msgspec.Raw]) -> GeocodioFields:
+    """
+    Decode each field append with its own typed decoder; the raw values are slices of
+    the body.
+    """
+    values: Dict[str, Any] = {}
+    census: Dict[str, CensusData] = {}
+    extras: Dict[str, Any] = {}
+    for key, value in raw.items():
+        spec = _FIELD_SPECS.get(key)
+        if spec is not None:
+            attr, decoder, convert, primary = spec
+            if primary or attr not in values:
+                decoded = decoder.decode(value)
+                values[attr] = convert(decoded) if convert is not None else decoded
+        elif key == "acs":
+            _decode_acs(value, values)
+        elif key == "census":
+            for year, data in _CENSUS_YEARS.decode(value).items():
+                census[f"census{year}"] = data
+        elif _CENSUS_KEY.match(key):
+            census.setdefault(key, _CENSUS.decode(value))
+        else:
+            extras[key] = msgspec.json.decode(value)
+    return GeocodioFields(**values, extras=extras, _census=census)
+
+
+def _decode_acs(value: msgspec.Raw, values: Dict[str, Any]) -> None:
+    try:
+        metrics = _RAW_OBJECT.decode(value)
+    except msgspec.ValidationError:  # not an object
+        return
+    nested = [metric for metric in _ACS_METRICS if metric in metrics]
+    if not nested:
+        # Simple structure: acs: {population: ..., households: ..., median_income: ...}
+        values["acs"] = _ACS_SURVEY.decode(value)
+    for metric in nested:
+        values[metric] = _ACS_METRIC_DECODERS[metric].decode(metrics[metric])
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Distance models
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _as_tuple(location: Union[Tuple[float, float], Location]) -> Tuple[float, float]:
+    return (location.lat, location.lng) if isinstance(location, Location) else location
+
+
+class DistanceOrigin(_Struct, frozen=True):
+    query: str = ""
+    # [lat, lng] or {"lat": ..., "lng": ...}; always a tuple after decoding
+    location: Union[Tuple[float, float], Location] = (0.0, 0.0)
+    id: Optional[str] = None
+
+    def __post_init__(self):
+        if isinstance(self.location, Location):
+            msgspec.structs.force_setattr(self, "location", _as_tuple(self.location))
+
+
+class DistanceDestination(_Struct, frozen=True):
+    query: str = ""
+    location: Union[Tuple[float, float], Location] = (0.0, 0.0)
+    distance_miles: float = 0.0
+    distance_km: float = 0.0
+    id: Optional[str] = None
+    duration_seconds: Optional[int] = None
+
+    def __post_init__(self):
+        if isinstance(self.location, Location):
+            msgspec.structs.force_setattr(self, "location", _as_tuple(self.location))
+
+
+class DistanceResponse(_Struct, frozen=True):
+    origin: DistanceOrigin = DistanceOrigin()
+    mode: str = ""
+    destinations: List[DistanceDestination] = []
+
+
+class DistanceMatrixResult(_Struct, frozen=True):
+    origin: DistanceOrigin = DistanceOrigin()
+    destinations: List[DistanceDestination] = []
+
+
+class DistanceMatrixResponse(_Struct, frozen=True):
+    mode: str = ""
+    results: List[DistanceMatrixResult] = []
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Decoder
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TypedDecoder:
+    """
+    Decodes response bodies into the structs of this module.
+
+    Every method accepts the raw body (``bytes`` or ``str``) or an
+    already-decoded payload, such as a cached or merged batch, which is
+    re-encoded first. Invalid JSON or a payload of the wrong shape raises
+    ``ValueError``, like the client's JSON codecs.
+    """
+
+    def __init__(self):
+        self._single = msgspec.json.Decoder(GeocodingResponse, strict=False)
+        self._batch = msgspec.json.Decoder(_BatchPayload, strict=False)
+        self._distance = msgspec.json.Decoder(DistanceResponse, strict=False)
+        self._matrix = msgspec.json.Decoder(DistanceMatrixResponse, strict=False)
+
+    @staticmethod
+    def _decode(decoder: msgspec.json.Decoder, data: Any) -> Any:
+        if not isinstance(data, (bytes, bytearray, memoryview, str)):
+            data = msgspec.json.encode(data)
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    def geocoding(
+            self, data: Any, batch: bool = False, keys: Optional[List[str]] = None,
+    ) -> Union[GeocodingResponse, BatchGeocodingResponse]:
+        """A geocode/reverse response; ``batch`` selects the batch response shape."""
+        if not batch:
+            return self._decode(self._single, data)
+
+        payload = self._decode(self._batch, data)
+        raw_items = payload.results
+        # Keyed batches may come back as an object keyed by the custom keys
+        if isinstance(raw_items, dict):
+            keys = list(raw_items)
+            raw_items = list(raw_items.values())
+        keys = keys or []
+        empty = _ItemResponse()
+        items = []
+        for i, raw in enumerate(raw_items):
+            response = raw.response or empty
+            items.append(BatchGeocodingItem(
+                query=raw.query,
+                results=response.results,
+                key=keys[i] if i < len(keys) else None,
+                input=response.input,
+                error=response.error,
+            ))
+        return BatchGeocodingResponse(
+            input=payload.input,
+            results=[item.best for item in items],
+            items=items,
+        )
+
+    def distance(self, data: Any) -> DistanceResponse:
+        return self._decode(self._distance, data)
+
+    def distance_matrix(self, data: Any) -> DistanceMatrixResponse:
+        return self._decode(self._matrix, data)
+
+
+__all__ = [
+    "ACSSurveyData",
+    "AddressComponents",
+    "BatchGeocodingItem",
+    "BatchGeocodingResponse",
+    "CensusData",
+    "CongressionalDistrict",
+    "Demographics",
+    "DistanceDestination",
+    "DistanceMatrixResponse",
+    "DistanceMatrixResult",
+    "DistanceOrigin",
+    "DistanceResponse",
+    "Economics",
+    "FFIECData",
+    "Families",
+    "FederalRiding",
+    "GeocodingResponse",
+    "GeocodingResult",
+    "GeocodioFields",
+    "Housing",
+    "Location",
+    "ProvincialRiding",
+    "SchoolDistrict",
+    "Social",
+    "StateLegislativeDistrict",
+    "StatisticsCanadaData",
+    "Timezone",
+    "TypedDecoder",
+    "ZIP4Data",
+]
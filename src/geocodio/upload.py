@@ -0,0 +1,175 @@
+"""
+src/geocodio/upload.py
+Streaming multipart bodies for list uploads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import os
+import uuid
+import zlib
+from typing import (
+    Any, AsyncIterator, Generator, Iterable, Iterator, Optional, Protocol, Sequence,
+    Union,
+)
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+Row = Union[str, Sequence[Any]]
+
+
+class Readable(Protocol):
+    """
+    A binary or text file object, or anything else with ``read(size)`` (e.g. a
+    ``CsvShard``).
+    """
+
+    def read(self, size: int = ..., /) -> Union[bytes, str]:
+        ...
+
+
+UploadSource = Union[str, bytes, "os.PathLike[str]", Readable, Iterable[Row]]
+
+
+def is_streaming_source(source: UploadSource) -> bool:
+    """True for sources read lazily: paths, file objects and row iterables."""
+    return not isinstance(source, (str, bytes))
+
+
+def source_filename(source: UploadSource) -> Optional[str]:
+    """The file name a path or named file object was opened with, if any."""
+    if isinstance(source, os.PathLike):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None) if hasattr(source, "read") else None
+    return os.path.basename(name) if isinstance(name, str) else None
+
+
+def iter_fileobj(fileobj: Any, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a binary (or text) file object in ``chunk_size`` pieces."""
+    while chunk := fileobj.read(chunk_size):
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def iter_csv_rows(
+    rows: Iterable[Row], chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode rows as CSV, yielding about ``chunk_size`` bytes at a time.
+
+    Sequences become one CSV record each; a plain string is a single-column
+    row, e.g. one address per line.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow([row] if isinstance(row, str) else row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_source(
+    source: UploadSource, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """The bytes of an upload source, produced lazily."""
+    if isinstance(source, str):
+        yield source.encode("utf-8")
+    elif isinstance(source, bytes):
+        yield source
+    elif isinstance(source, os.PathLike):
+        with open(source, "rb") as f:
+            yield from iter_fileobj(f, chunk_size)
+    elif hasattr(source, "read"):
+        yield from iter_fileobj(source, chunk_size)
+    else:
+        yield from iter_csv_rows(source, chunk_size)
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a stream of byte chunks incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
+
+
+class MultipartUpload:
+    """
+    A ``multipart/form-data`` body with a single file field, generated lazily.
+
+    The file part is read from its source chunk by chunk as the request is
+    sent, so memory use does not depend on the file size.
+
+    Args:
+        source: CSV content (``str``/``bytes``), a path, a binary file object
+            or an iterable of rows (see :func:`iter_csv_rows`).
+        filename: File name sent to the API.
+        compress: Gzip the file part and add ``.gz`` to its name.
+        chunk_size: Bytes read from the source at a time.
+    """
+
+    def __init__(
+            self,
+            source: UploadSource,
+            filename: str = "file.csv",
+            compress: bool = False,
+            chunk_size: int = UPLOAD_CHUNK_SIZE,
+            field: str = "file",
+    ):
+        self.source = source
+        self.compress = compress
+        self.filename = (
+            f"{filename}.gz" if compress and not filename.endswith(".gz") else filename
+        )
+        self.chunk_size = chunk_size
+        self.field = field
+        self.boundary = uuid.uuid4().hex
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _head(self) -> bytes:
+        part_type = "application/gzip" if self.compress else "text/csv"
+        filename = self.filename.replace("\\", "\\\\").replace('"', '\\"')
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{self.field}"; '
+            f'filename="{filename}"\r\n'
+            f"Content-Type: {part_type}\r\n\r\n"
+        ).encode("utf-8")
+
+    def iter_bytes(self) -> Generator[bytes, None, None]:
+        yield self._head()
+        chunks = iter_source(self.source, self.chunk_size)
+        if self.compress:
+            chunks = gzip_chunks(chunks)
+        for chunk in chunks:
+            if chunk:
+                yield chunk
+        yield f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        # Reading and gzipping block, so each chunk is produced in a worker thread
+        chunks = self.iter_bytes()
+        try:
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            chunks.close()
+
+
+__all__ = [
+    "UPLOAD_CHUNK_SIZE",
+    "MultipartUpload",
+    "gzip_chunks",
+    "iter_csv_rows",
+    "iter_source",
+]
@@ -0,0 +1,169 @@
+"""
+Tests for the AsyncGeocodio client
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, __version__
+from geocodio.exceptions import AuthenticationError, InvalidRequestError
+
+
+def single_payload() -> dict:
+    return {
+        "input": {"formatted_address": "1109 N Highland St, Arlington, VA"},
+        "results": [{
+            "address_components": {
+                "number": "1109",
+                "street": "N Highland St",
+                "city": "Arlington",
+                "state": "VA"
+            },
+            "formatted_address": "1109 N Highland St, Arlington, VA 22201",
+            "location": {"lat": 38.886672, "lng": -77.094735},
+            "accuracy": 1,
+            "accuracy_type": "rooftop",
+            "source": "Arlington",
+            "fields": {"timezone": {"name": "America/New_York", "utc_offset": -5}},
+        }],
+    }
+
+
+def test_async_client_requires_api_key(monkeypatch):
+    monkeypatch.delenv("GEOCODIO_API_KEY", raising=False)
+    with pytest.raises(AuthenticationError):
+        AsyncGeocodio()
+
+
+def test_async_geocode_single(httpx_mock):
+    httpx_mock.add_response(
+        url=httpx.URL(
+            "https://api.test/v1.11/geocode",
+            params={"q": "1109 N Highland St, Arlington, VA"},
+        ),
+        match_headers={
+            "Authorization": "Bearer TEST_KEY",
+            "User-Agent": f"geocodio-library-python/{__version__}",
+        },
+        json=single_payload(),
+    )
+
+    async def run():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await client.geocode("1109 N Highland St, Arlington, VA")
+
+    resp = asyncio.run(run())
+    assert resp.results[0].address_components.city == "Arlington"
+    assert resp.results[0].fields.timezone.name == "America/New_York"
+
+
+def test_async_geocode_batch_posts_body(httpx_mock):
+    def callback(request):
+        assert request.method == "POST"
+        assert request.read() == b'["Address 1","Address 2"]'
+        return httpx.Response(200, json={"results": []})
+
+    httpx_mock.add_callback(callback, url=httpx.URL("https://api.test/v1.11/geocode"))
+
+    async def run():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await client.geocode(["Address 1", "Address 2"])
+
+    assert asyncio.run(run()).results == []
+
+
+def test_async_concurrent_reverse(httpx_mock):
+    httpx_mock.add_response(
+        url=httpx.URL(
+            "https://api.test/v1.11/reverse", params={"q": "38.886672,-77.094735"}
+        ),
+        json=single_payload(),
+        is_reusable=True,
+    )
+
+    async def run():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await asyncio.gather(*[
+                client.reverse((38.886672, -77.094735)) for _ in range(5)
+            ])
+
+    responses = asyncio.run(run())
+    assert len(responses) == 5
+    assert all(r.results[0].location.lat == 38.886672 for r in responses)
+
+
+def test_async_distance(httpx_mock):
+    def callback(request):
+        assert request.url.params["origin"] == "38.8977,-77.0365,white_house"
+        return httpx.Response(
+            200,
+            json={
+                "origin": {
+                    "query": "38.8977,-77.0365,white_house",
+                    "location": [38.8977, -77.0365],
+                    "id": "white_house",
+                },
+                "mode": "straightline",
+                "destinations": [
+                    {
+                        "query": "38.9072,-77.0369,capitol",
+                        "location": [38.9072, -77.0369],
+                        "id": "capitol",
+                        "distance_miles": 0.7,
+                        "distance_km": 1.1,
+                    }
+                ],
+            },
+        )
+
+    httpx_mock.add_callback(callback)
+
+    async def run():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await client.distance(
+                "38.8977,-77.0365,white_house", ["38.9072,-77.0369,capitol"]
+            )
+
+    resp = asyncio.run(run())
+    assert resp.origin.id == "white_house"
+    assert resp.destinations[0].distance_km == 1.1
+
+
+def test_async_error_mapping(httpx_mock):
+    httpx_mock.add_response(status_code=422, text="Could not geocode address")
+
+    async def run():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            await client.geocode("nowhere")
+
+    with pytest.raises(InvalidRequestError, match="Could not geocode address"):
+        asyncio.run(run())
+
+
+def test_async_large_batch_is_chunked(httpx_mock):
+    def callback(request):
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"results": [
+            {"query": q, "response": {"results": [{
+                "address_components": {},
+                "formatted_address": q,
+                "location": {"lat": 1.0, "lng": 2.0},
+            }]}}
+            for q in body
+        ]})
+
+    httpx_mock.add_callback(
+        callback, url=httpx.URL("https://api.test/v1.11/geocode"), is_reusable=True
+    )
+
+    async def run():
+        async with AsyncGeocodio(
+            api_key="TEST_KEY", hostname="api.test", batch_size=2
+        ) as client:
+            return await client.geocode(["a", "b", "c", "d", "e"])
+
+    resp = asyncio.run(run())
+    assert [r.formatted_address for r in resp.results] == ["a", "b", "c", "d", "e"]
@@ -0,0 +1,120 @@
+"""
+Tests for chunked batch geocoding
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from geocodio import Geocodio
+from geocodio.batch import chunk_batch_payload, merge_batch_payloads
+
+
+def batch_item(query: str) -> dict:
+    return {
+        "query": query,
+        "response": {
+            "results": [{
+                "address_components": {"city": query},
+                "formatted_address": query,
+                "location": {"lat": 1.0, "lng": 2.0},
+                "accuracy": 1,
+                "accuracy_type": "rooftop",
+                "source": "test",
+            }]
+        },
+    }
+
+
+def test_chunk_list_payload():
+    assert chunk_batch_payload(["a", "b", "c", "d", "e"], 2) == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+
+
+def test_chunk_keyed_payload_keeps_keys_paired():
+    payload = {
+        "addresses": [{"city": "a"}, {"city": "b"}, {"city": "c"}],
+        "keys": ["k1", "k2", "k3"],
+    }
+    assert chunk_batch_payload(payload, 2) == [
+        {"addresses": [{"city": "a"}, {"city": "b"}], "keys": ["k1", "k2"]},
+        {"addresses": [{"city": "c"}], "keys": ["k3"]},
+    ]
+
+
+def test_chunk_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        chunk_batch_payload(["a"], 0)
+
+
+def test_merge_keyed_results_in_order():
+    merged = merge_batch_payloads([
+        {"results": {"k1": batch_item("a")}},
+        {"results": {"k2": batch_item("b")}},
+    ])
+    assert list(merged["results"]) == ["k1", "k2"]
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        Geocodio("TEST_KEY", batch_size=10001)
+    with pytest.raises(ValueError):
+        Geocodio("TEST_KEY", batch_concurrency=0)
+
+
+def test_geocode_large_batch_is_chunked_and_reassembled(httpx_mock):
+    addresses = [f"address {i}" for i in range(7)]
+    seen_bodies = []
+    lock = threading.Lock()
+
+    def callback(request):
+        body = json.loads(request.content)
+        with lock:
+            seen_bodies.append(body)
+        return httpx.Response(200, json={"results": [batch_item(q) for q in body]})
+
+    httpx_mock.add_callback(
+        callback, url=httpx.URL("https://api.test/v1.11/geocode"), is_reusable=True
+    )
+
+    client = Geocodio(
+        "TEST_KEY", hostname="api.test", batch_size=3, batch_concurrency=2
+    )
+    resp = client.geocode(addresses)
+
+    assert sorted(len(b) for b in seen_bodies) == [1, 3, 3]
+    assert [r.formatted_address for r in resp.results] == addresses
+
+
+def test_reverse_large_batch_is_chunked(httpx_mock):
+    coords = [(float(i), float(i)) for i in range(5)]
+
+    def callback(request):
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"results": [batch_item(q) for q in body]})
+
+    httpx_mock.add_callback(
+        callback, url=httpx.URL("https://api.test/v1.11/reverse"), is_reusable=True
+    )
+
+    client = Geocodio("TEST_KEY", hostname="api.test", batch_size=2)
+    resp = client.reverse(coords)
+
+    assert [r.formatted_address for r in resp.results] == [
+        f"{c[0]},{c[1]}" for c in coords
+    ]
+
+
+def test_small_batch_is_sent_as_one_request(httpx_mock):
+    httpx_mock.add_response(
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        json={"results": [batch_item("a"), batch_item("b")]},
+    )
+
+    client = Geocodio("TEST_KEY", hostname="api.test", batch_size=2)
+    assert len(client.geocode(["a", "b"]).results) == 2
@@ -0,0 +1,131 @@
+"""
+Tests for per-input batch responses
+"""
+
+import httpx
+
+from geocodio import Geocodio
+from geocodio.models import BatchGeocodingResponse, GeocodingResponse
+
+
+def candidate(address: str, accuracy: float) -> dict:
+    return {
+        "address_components": {"city": "Arlington"},
+        "formatted_address": address,
+        "location": {"lat": 38.88, "lng": -77.09},
+        "accuracy": accuracy,
+        "accuracy_type": "rooftop",
+        "source": "Arlington",
+    }
+
+
+def batch_payload() -> dict:
+    return {
+        "results": [
+            {
+                "query": "1109 N Highland St, Arlington VA",
+                "response": {
+                    "input": {"formatted_address": "1109 N Highland St, Arlington, VA"},
+                    "results": [
+                        candidate("1109 N Highland St, Arlington, VA 22201", 1),
+                        candidate("1109 Highland St, Arlington, VA 22201", 0.8),
+                    ],
+                },
+            },
+            {"query": "asdfghjkl", "response": {"input": {}, "results": []}},
+            {"query": "", "response": {"error": "Could not parse address"}},
+            {
+                "query": "525 University Ave, Toronto",
+                "response": {
+                    "results": [candidate("525 University Ave, Toronto, ON", 1)]
+                },
+            },
+        ]
+    }
+
+
+def test_batch_response_has_one_item_per_input_with_all_candidates(client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload())
+
+    resp = client.geocode(
+        [
+            "1109 N Highland St, Arlington VA", "asdfghjkl", "",
+            "525 University Ave, Toronto",
+        ]
+    )
+
+    assert isinstance(resp, BatchGeocodingResponse)
+    assert isinstance(resp, GeocodingResponse)
+    assert len(resp.items) == 4
+    first, empty, failed, last = resp.items
+    assert first.query == "1109 N Highland St, Arlington VA"
+    assert [r.accuracy for r in first.results] == [1, 0.8]
+    assert first.best.formatted_address == "1109 N Highland St, Arlington, VA 22201"
+    assert first.input["formatted_address"] == "1109 N Highland St, Arlington, VA"
+    assert empty.is_empty and empty.best is None
+    assert failed.is_empty and failed.error == "Could not parse address"
+    assert not last.is_empty
+    assert resp.empty_items == [empty, failed]
+
+
+def test_batch_response_results_align_with_inputs(client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload())
+
+    resp = client.geocode(["a", "b", "c", "d"])
+
+    assert [r and r.formatted_address for r in resp.results] == [
+        "1109 N Highland St, Arlington, VA 22201",
+        None,
+        None,
+        "525 University Ave, Toronto, ON",
+    ]
+
+
+def test_empty_input_followed_by_hit(client, httpx_mock):
+    httpx_mock.add_response(json={"results": [
+        {"query": "bad", "response": {"input": {}, "results": []}},
+        {"query": "good", "response": {"results": [candidate("G", 1)]}},
+    ]})
+
+    resp = client.geocode(["bad", "good"])
+
+    assert resp.results[0] is None
+    assert resp.results[1].formatted_address == "G"
+    assert [item.best for item in resp.items] == resp.results
+
+
+def test_keyed_batch_items_carry_keys(client, httpx_mock):
+    httpx_mock.add_response(json={"results": [
+        {"query": "a", "response": {"results": [candidate("A", 1)]}},
+        {"query": "b", "response": {"results": []}},
+    ]})
+
+    resp = client.geocode({"first": {"street": "a"}, "second": {"street": "b"}})
+
+    assert [item.key for item in resp.items] == ["first", "second"]
+    assert resp.items[1].is_empty
+
+
+def test_keyed_results_object(client, httpx_mock):
+    httpx_mock.add_response(json={"results": {
+        "first": {"query": "a", "response": {"results": [candidate("A", 1)]}},
+        "second": {"query": "b", "response": {"results": [candidate("B", 1)]}},
+    }})
+
+    resp = client.geocode({"first": {"street": "a"}, "second": {"street": "b"}})
+
+    assert [(item.key, item.best.formatted_address) for item in resp.items] == [
+        ("first", "A"),
+        ("second", "B"),
+    ]
+
+
+def test_single_lookup_still_returns_plain_response(client, httpx_mock):
+    httpx_mock.add_response(
+        json={"input": {}, "results": [candidate("A", 1), candidate("B", 0.5)]}
+    )
+
+    resp = client.geocode("a")
+
+    assert type(resp) is GeocodingResponse
+    assert len(resp.results) == 2
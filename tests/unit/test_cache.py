@@ -0,0 +1,299 @@
+"""
+Tests for response caching
+"""
+
+import gc
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from geocodio import Geocodio, MemoryCache, SQLiteCache
+from geocodio.cache import CacheBackend, make_cache_key
+
+
+def single_payload(address: str) -> dict:
+    return {
+        "input": {"formatted_address": address},
+        "results": [{
+            "address_components": {"city": "Arlington"},
+            "formatted_address": address,
+            "location": {"lat": 38.886672, "lng": -77.094735},
+            "accuracy": 1,
+            "accuracy_type": "rooftop",
+            "source": "Arlington",
+        }],
+    }
+
+
+def batch_payload(queries) -> dict:
+    return {"results": [{"query": q, "response": single_payload(q)} for q in queries]}
+
+
+@pytest.fixture
+def cached_client():
+    return Geocodio("TEST_KEY", hostname="api.test", cache=MemoryCache())
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(max_size=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    cache.get("a")
+    cache.set("c", {"v": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert len(cache) == 2
+
+
+def test_memory_cache_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("geocodio.cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache(ttl=10)
+    cache.set("a", {"v": 1})
+    now[0] += 5
+    assert cache.get("a") == {"v": 1}
+    now[0] += 6
+    assert cache.get("a") is None
+
+
+def test_memory_cache_does_not_share_values():
+    cache = MemoryCache()
+    value = {"input": {"formatted_address": "a"}, "results": []}
+    cache.set("a", value)
+    value["input"]["formatted_address"] = "changed"
+    cache.get("a")["results"].append(1)
+    assert cache.get("a") == {"input": {"formatted_address": "a"}, "results": []}
+
+
+def test_mutating_a_response_does_not_change_cached_lookups(cached_client, httpx_mock):
+    httpx_mock.add_response(json=single_payload("1 Main St"))
+    httpx_mock.add_response(json=batch_payload(["2 Main St"]))
+
+    first = cached_client.geocode("1 Main St")
+    first.input["formatted_address"] = "MUTATED"
+    batch = cached_client.geocode(["2 Main St"])
+    batch.items[0].input["formatted_address"] = "MUTATED"
+
+    assert cached_client.geocode("1 Main St").input == {
+        "formatted_address": "1 Main St"
+    }
+    assert cached_client.geocode("2 Main St").input == {
+        "formatted_address": "2 Main St"
+    }
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_backend_must_implement_clear():
+    class NoClear(CacheBackend):
+        def get(self, key):
+            return None
+
+        def set(self, key, value):
+            pass
+
+    with pytest.raises(TypeError, match="clear"):
+        NoClear()
+
+
+def test_cache_key_normalization():
+    assert make_cache_key("geocode", " 1109 N  Highland St ", {}) == make_cache_key(
+        "geocode", "1109 n highland st", {}
+    )
+    assert make_cache_key("reverse", (38.9, -77.0), {}) == make_cache_key(
+        "reverse", "38.9, -77", {}
+    )
+    assert make_cache_key("geocode", "a", {"fields": "cd"}) != make_cache_key(
+        "geocode", "a", {"fields": "timezone"}
+    )
+    assert make_cache_key("geocode", "a", {}) != make_cache_key("reverse", "a", {})
+
+
+def test_single_geocode_is_served_from_cache(cached_client, httpx_mock):
+    httpx_mock.add_response(json=single_payload("1109 N Highland St, Arlington, VA"))
+
+    first = cached_client.geocode("1109 N Highland St, Arlington, VA")
+    second = cached_client.geocode("1109 n highland st,  arlington, va")
+
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+    assert (cached_client.cache_stats.hits, cached_client.cache_stats.misses) == (1, 1)
+
+
+def test_different_fields_are_cached_separately(cached_client, httpx_mock):
+    httpx_mock.add_response(json=single_payload("a"), is_reusable=True)
+
+    cached_client.geocode("a", fields=["cd"])
+    cached_client.geocode("a", fields=["timezone"])
+    cached_client.geocode("a", fields=["cd"])
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_batch_sends_only_misses_and_merges_in_place(cached_client, httpx_mock):
+    def callback(request):
+        return httpx.Response(200, json=batch_payload(json.loads(request.content)))
+
+    httpx_mock.add_callback(
+        callback, url=httpx.URL("https://api.test/v1.11/geocode"), is_reusable=True
+    )
+
+    cached_client.geocode(["b", "d"])
+    resp = cached_client.geocode(["a", "b", "c", "d"])
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert json.loads(requests[1].content) == ["a", "c"]
+    assert [r.formatted_address for r in resp.results] == ["a", "b", "c", "d"]
+    assert (cached_client.cache_stats.hits, cached_client.cache_stats.misses) == (2, 4)
+
+
+def test_batch_fully_cached_makes_no_request(cached_client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(["a", "b"]))
+
+    cached_client.geocode(["a", "b"])
+    resp = cached_client.geocode(["b", "a"])
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert [r.formatted_address for r in resp.results] == ["b", "a"]
+
+
+def test_single_lookup_hits_entry_cached_by_batch(cached_client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(["38.9,-77.0"]))
+
+    cached_client.reverse([(38.9, -77.0)])
+    resp = cached_client.reverse("38.9,-77.0")
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert resp.results[0].formatted_address == "38.9,-77.0"
+
+
+def test_empty_results_are_not_cached(cached_client, httpx_mock):
+    httpx_mock.add_response(json={"input": {}, "results": []}, is_reusable=True)
+
+    cached_client.geocode("nowhere")
+    cached_client.geocode("nowhere")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# SQLite backend
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def test_sqlite_cache_roundtrip_and_persistence(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = SQLiteCache(path)
+    cache.set("a", single_payload("a"))
+    cache.close()
+
+    reopened = SQLiteCache(path)
+    assert reopened.get("a") == single_payload("a")
+    assert reopened.get("missing") is None
+
+
+def test_sqlite_cache_bulk_access(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.set_many({f"k{i}": {"i": i} for i in range(2000)})
+
+    found = cache.get_many([f"k{i}" for i in range(0, 2500, 5)])
+
+    assert len(found) == 400
+    assert found["k1995"] == {"i": 1995}
+
+
+def test_sqlite_cache_max_entries_evicts_oldest(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("geocodio.cache.time.time", lambda: now[0])
+    cache = SQLiteCache(tmp_path / "cache.db", max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, {"k": key})
+        now[0] += 1
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == {"k": "c"}
+
+
+def test_sqlite_cache_counts_rows_without_scanning(tmp_path, monkeypatch):
+    path = tmp_path / "cache.db"
+    cache = SQLiteCache(path, max_entries=3)
+    cache.set_many({"a": {}, "b": {}})
+    cache.set("a", {"v": 2})  # an update, not a new row
+    assert len(cache) == 2
+    cache.set_many({"c": {}, "d": {}, "e": {}})
+    assert len(cache) == 3
+    cache.clear()
+    assert len(cache) == 0
+    cache.close()
+
+    # A database written before the row count existed is counted once when opened
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "DROP TRIGGER geocodio_cache_count_insert;"
+        "DROP TRIGGER geocodio_cache_count_delete;"
+        "DROP TABLE geocodio_cache_count;"
+        "INSERT INTO geocodio_cache VALUES ('x', '{}', 1, NULL), ('y', '{}', 2, NULL);"
+    )
+    conn.close()
+    assert len(SQLiteCache(path)) == 2
+
+
+def test_sqlite_cache_closes_connections_of_finished_threads(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    for _ in range(3):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: cache.get(f"k{i}"), range(16)))
+    gc.collect()
+
+    assert len(cache._connections) == 1  # the creating thread's
+
+
+def test_sqlite_cache_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("geocodio.cache.time.time", lambda: now[0])
+    cache = SQLiteCache(tmp_path / "cache.db", ttl=10)
+    cache.set("a", {"v": 1})
+    now[0] += 11
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_concurrent_readers(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.set_many({f"k{i}": {"i": i} for i in range(100)})
+    errors = []
+
+    def read():
+        try:
+            assert len(cache.get_many([f"k{i}" for i in range(100)])) == 100
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+
+
+def test_client_with_sqlite_cache(tmp_path, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(["a", "b"]))
+
+    client = Geocodio(
+        "TEST_KEY", hostname="api.test", cache=SQLiteCache(tmp_path / "cache.db")
+    )
+    client.geocode(["a", "b"])
+
+    rerun = Geocodio(
+        "TEST_KEY", hostname="api.test", cache=SQLiteCache(tmp_path / "cache.db")
+    )
+    resp = rerun.geocode(["a", "b"])
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert [r.formatted_address for r in resp.results] == ["a", "b"]
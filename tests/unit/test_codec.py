@@ -0,0 +1,140 @@
+"""
+Tests for pluggable JSON codecs
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, Geocodio
+from geocodio.codec import JSONCodec, StdlibCodec, fastest_codec, get_codec
+
+PAYLOAD = {
+    "addresses": ["1109 N Highland St, Arlington VA", "Montréal, QC"],
+    "n": 1.5,
+    "ok": True,
+    "none": None,
+}
+
+
+class CountingCodec(StdlibCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.dumped = []
+        self.loaded = 0
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded += 1
+        return super().loads(data)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_round_trip(name):
+    pytest.importorskip(name)
+    codec = get_codec(name)
+
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode()) == PAYLOAD
+    with pytest.raises(ValueError):
+        codec.loads(b'{"results": [')
+
+
+def test_stdlib_codec_matches_httpx_encoding():
+    expected = httpx.Request("POST", "https://api.test", json=PAYLOAD).content
+    assert StdlibCodec().dumps(PAYLOAD) == expected
+
+
+def test_get_codec():
+    codec = CountingCodec()
+    assert get_codec(codec) is codec
+    assert type(get_codec("auto")) is type(fastest_codec())
+    assert type(get_codec(None)) is StdlibCodec
+    assert get_codec("stdlib").name == "json"
+    with pytest.raises(ValueError, match="Unknown json_codec"):
+        get_codec("yaml")
+    with pytest.raises(TypeError, match="abstract"):
+        JSONCodec()
+
+
+def test_default_is_stdlib():
+    assert Geocodio("TEST_KEY", hostname="api.test").json_codec.name == "json"
+
+
+def test_auto_prefers_installed_fast_codecs():
+    try:
+        import orjson  # noqa: F401
+        expected = "orjson"
+    except ImportError:
+        try:
+            import msgspec  # noqa: F401
+            expected = "msgspec"
+        except ImportError:
+            expected = "json"
+    client = Geocodio("TEST_KEY", hostname="api.test", json_codec="auto")
+    assert client.json_codec.name == expected
+
+
+def test_client_encodes_and_decodes_with_codec(httpx_mock):
+    addresses = ["1109 N Highland St, Arlington VA", "525 University Ave, Toronto, ON"]
+    httpx_mock.add_response(json={"results": [
+        {"query": a, "response": {"input": {}, "results": []}} for a in addresses
+    ]})
+    codec = CountingCodec()
+    client = Geocodio("TEST_KEY", hostname="api.test", json_codec=codec)
+
+    response = client.geocode(addresses)
+
+    request = httpx_mock.get_request()
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == addresses
+    assert codec.dumped == [addresses]
+    assert codec.loaded == 1
+    assert [item.query for item in response.items] == addresses
+
+
+def test_codec_applies_to_list_and_distance_apis(httpx_mock):
+    httpx_mock.add_response(json={"id": 7, "file": {}})
+    httpx_mock.add_response(
+        json={
+            "id": 3,
+            "identifier": "",
+            "status": "COMPLETED",
+            "name": "job",
+            "created_at": "",
+            "origins_count": 1,
+            "destinations_count": 1,
+            "total_calculations": 1,
+            "progress": 100,
+        }
+    )
+    codec = CountingCodec()
+    client = Geocodio("TEST_KEY", hostname="api.test", json_codec=codec)
+
+    assert client.get_list("7").id == 7
+    assert client.distance_matrix_job_status(3).status == "COMPLETED"
+    assert codec.loaded == 2
+
+
+def test_async_client_uses_codec(httpx_mock):
+    httpx_mock.add_response(json={"input": {}, "results": []})
+    codec = CountingCodec()
+
+    async def main():
+        async with AsyncGeocodio(
+            api_key="TEST_KEY", hostname="api.test", json_codec=codec
+        ) as client:
+            return await client.geocode("1109 N Highland St, Arlington VA")
+
+    assert asyncio.run(main()).results == []
+    assert codec.loaded == 1
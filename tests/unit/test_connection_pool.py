@@ -0,0 +1,101 @@
+"""
+Tests for connection pool, HTTP/2 and transport options
+"""
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, Geocodio
+
+
+def test_pool_options_are_passed_to_httpx():
+    client = Geocodio("TEST_KEY", hostname="api.test")
+    options = client._http_client_options(
+        True,
+        max_connections=50,
+        max_keepalive_connections=25,
+        keepalive_expiry=30.0,
+        http2=False,
+        transport=None,
+    )
+
+    assert options["limits"] == httpx.Limits(
+        max_connections=50, max_keepalive_connections=25, keepalive_expiry=30.0
+    )
+    assert options["base_url"] == "https://api.test"
+    assert "transport" not in options
+
+
+def test_pool_defaults_match_httpx():
+    client = Geocodio("TEST_KEY", hostname="api.test")
+    options = client._http_client_options(True, None, None, None, False, None)
+
+    assert options["limits"] == httpx.Limits()
+
+
+def test_custom_transport_is_used():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"input": {}, "results": []})
+
+    client = Geocodio(
+        "TEST_KEY", hostname="api.test", transport=httpx.MockTransport(handler)
+    )
+    client.geocode("1 Main St")
+
+    assert seen[0].url.host == "api.test"
+    assert seen[0].headers["Authorization"] == "Bearer TEST_KEY"
+
+
+def test_async_custom_transport_is_used():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"input": {}, "results": []})
+
+    async def run():
+        async with AsyncGeocodio(
+            "TEST_KEY", hostname="api.test", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.geocode("1 Main St")
+
+    assert asyncio.run(run()).results == []
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("h2") is not None, reason="h2 is installed"
+)
+def test_http2_without_h2_raises_helpful_error():
+    with pytest.raises(ImportError, match=r"geocodio-library-python\[http2\]"):
+        Geocodio("TEST_KEY", hostname="api.test", http2=True)
+
+
+def test_warm_up_opens_connections(client, httpx_mock):
+    httpx_mock.add_response(method="HEAD", url="https://api.test/", is_reusable=True)
+
+    assert client.warm_up(connections=3) == 3
+    assert [r.method for r in httpx_mock.get_requests()] == ["HEAD"] * 3
+
+
+def test_warm_up_logs_failures(client, httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError("refused"))
+
+    assert client.warm_up() == 0
+
+
+def test_warm_up_rejects_invalid_count(client):
+    with pytest.raises(ValueError):
+        client.warm_up(connections=0)
+
+
+def test_async_warm_up(httpx_mock):
+    httpx_mock.add_response(method="HEAD", url="https://api.test/", is_reusable=True)
+
+    async def run():
+        async with AsyncGeocodio("TEST_KEY", hostname="api.test") as client:
+            return await client.warm_up(connections=2)
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,102 @@
+"""
+Tests for DenseDistanceMatrix
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from geocodio import Coordinate  # noqa: E402
+from geocodio.local_distance import local_distance_matrix  # noqa: E402
+from geocodio.matrix import CompactDistanceMatrix, DenseDistanceMatrix  # noqa: E402
+from geocodio.models import (  # noqa: E402
+    DistanceDestination, DistanceMatrixResponse, DistanceMatrixResult, DistanceOrigin,
+)
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(11)
+    origins = [
+        Coordinate(rng.uniform(30, 45), rng.uniform(-120, -75), f"o{n}")
+        for n in range(4)
+    ]
+    dests = [
+        Coordinate(rng.uniform(30, 45), rng.uniform(-120, -75), f"d{n}")
+        for n in range(6)
+    ]
+    return origins, dests
+
+
+def test_straightline_matches_local_engine(points):
+    origins, dests = points
+    dense = DenseDistanceMatrix.straightline(origins, dests)
+    response = local_distance_matrix(origins, dests)
+
+    assert dense.shape == (4, 6)
+    assert dense.distances_km.flags["C_CONTIGUOUS"]
+    assert list(dense.origin_ids) == ["o0", "o1", "o2", "o3"]
+    assert dense.mask.all()
+    assert np.isnan(dense.durations).all()
+    assert dense.to_response() == response
+
+
+def test_from_response_leaves_missing_cells_nan(points):
+    origins, dests = points
+    response = local_distance_matrix(origins, dests, max_results=2)
+
+    dense = DenseDistanceMatrix.from_response(response, dests)
+
+    assert dense.mask.sum(axis=1).tolist() == [2, 2, 2, 2]
+    first = response.results[0].destinations[0]
+    column = list(dense.destination_ids).index(first.id)
+    assert dense.distances_miles[0, column] == first.distance_miles
+    assert dense.to_response() == response
+
+
+def test_compact_round_trip_and_durations():
+    response = DistanceMatrixResponse(
+        mode="driving",
+        results=[
+            DistanceMatrixResult(
+                origin=DistanceOrigin(query="1,1", location=(1.0, 1.0), id="a"),
+                destinations=[
+                    DistanceDestination(
+                        query="2,2,x",
+                        location=(2.0, 2.0),
+                        distance_miles=3.0,
+                        distance_km=4.8,
+                        id="x",
+                        duration_seconds=500,
+                    ),
+                    DistanceDestination(
+                        query="3,3,y",
+                        location=(3.0, 3.0),
+                        distance_miles=2.0,
+                        distance_km=3.2,
+                        id="y",
+                        duration_seconds=900,
+                    ),
+                ],
+            ),
+        ],
+    )
+    compact = CompactDistanceMatrix.from_response(response)
+    dense = compact.to_dense()
+
+    assert dense.durations.tolist() == [[500.0, 900.0]]
+    by_duration = dense.to_response(order_by="duration")
+    assert [d.id for d in by_duration.results[0].destinations] == ["x", "y"]
+    by_distance_desc = dense.to_compact(sort_order="desc")
+    assert list(by_distance_desc.indexes) == [0, 1]
+    assert list(dense.to_compact().indexes) == [1, 0]
+    assert isinstance(by_distance_desc.indexes[0], int)
+
+
+def test_requires_numpy(monkeypatch, points):
+    from geocodio import matrix
+    monkeypatch.setattr(matrix, "np", None)
+    with pytest.raises(ImportError, match="numpy"):
+        DenseDistanceMatrix.straightline(*points)
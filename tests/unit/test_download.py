@@ -0,0 +1,318 @@
+"""
+Tests for streaming list and distance job downloads
+"""
+
+import asyncio
+import io
+
+import httpx
+import pytest
+from pytest_httpx import IteratorStream
+
+from geocodio import AsyncGeocodio
+from geocodio.exceptions import GeocodioServerError, RangeNotSatisfiableError
+
+CSV = b"address,lat,lng\n" + b"".join(
+    b"%d Main St,38.9,-77.0\n" % i for i in range(5000)
+)
+
+
+def chunks(data, size=4096):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_download_streams_to_file(client, httpx_mock, tmp_path):
+    httpx_mock.add_response(
+        url="https://api.test/v1.11/lists/42/download",
+        stream=IteratorStream(chunks(CSV)),
+        headers={"content-type": "text/csv", "content-length": str(len(CSV))},
+    )
+    progress = []
+    target = tmp_path / "out" / "list.csv"
+
+    path = client.download(
+        "42", str(target), progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert path == str(target)
+    assert target.read_bytes() == CSV
+    assert not (tmp_path / "out" / "list.csv.part").exists()
+    assert len(progress) > 1
+    assert progress[-1] == (len(CSV), len(CSV))
+    assert all(a[0] < b[0] for a, b in zip(progress, progress[1:]))
+
+
+def test_download_reads_in_bounded_chunks(client, httpx_mock, tmp_path):
+    httpx_mock.add_response(
+        stream=IteratorStream(chunks(CSV, 50_000)), headers={"content-type": "text/csv"}
+    )
+    sizes = []
+
+    client.download(
+        "42",
+        tmp_path / "list.csv",
+        progress=lambda done, total: sizes.append(done),
+        chunk_size=1024,
+    )
+
+    steps = [b - a for a, b in zip([0] + sizes, sizes)]
+    assert max(steps) <= 1024
+    assert sizes[-1] == len(CSV)
+
+
+def test_download_to_binary_stream(client, httpx_mock):
+    httpx_mock.add_response(
+        stream=IteratorStream(chunks(CSV)), headers={"content-type": "text/csv"}
+    )
+    buffer = io.BytesIO()
+
+    assert client.download("42", buffer) is buffer
+    assert buffer.getvalue() == CSV
+    assert not buffer.closed
+
+
+def test_download_without_filename_still_returns_bytes(client, httpx_mock):
+    httpx_mock.add_response(content=CSV, headers={"content-type": "text/csv"})
+    assert client.download("42") == CSV
+
+
+def test_download_interrupted_keeps_existing_file(client, httpx_mock, tmp_path):
+    target = tmp_path / "list.csv"
+    target.write_bytes(b"previous export")
+
+    def broken_body():
+        yield CSV[:1000]
+        raise httpx.ReadError("connection reset")
+
+    httpx_mock.add_response(
+        stream=IteratorStream(broken_body()), headers={"content-type": "text/csv"}
+    )
+
+    with pytest.raises(httpx.ReadError):
+        client.download("42", target)
+    assert target.read_bytes() == b"previous export"
+    assert not (tmp_path / "list.csv.part").exists()
+
+
+def test_download_error_payload_is_raised(client, httpx_mock, tmp_path):
+    httpx_mock.add_response(json={"message": "List is still processing"})
+
+    with pytest.raises(GeocodioServerError):
+        client.download("42", tmp_path / "list.csv")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_write_failure(client, httpx_mock, tmp_path):
+    class Full(io.RawIOBase):
+        def writable(self):
+            return True
+
+        def write(self, data):
+            raise OSError(28, "No space left on device")
+
+    httpx_mock.add_response(
+        stream=IteratorStream(chunks(CSV)), headers={"content-type": "text/csv"}
+    )
+
+    with pytest.raises(GeocodioServerError, match="Failed to save list"):
+        client.download("42", Full())
+
+
+def test_download_distance_matrix_job_streams(client, httpx_mock, tmp_path):
+    body = b'{"data": [' + b",".join(b'{"origin": %d}' % i for i in range(2000)) + b"]}"
+    httpx_mock.add_response(
+        url="https://api.test/v1.11/distance-jobs/7/download",
+        stream=IteratorStream(chunks(body)),
+        headers={"content-type": "application/json", "content-length": str(len(body))},
+    )
+    progress = []
+
+    path = client.download_distance_matrix_job(
+        7, tmp_path / "job.json", progress=lambda *p: progress.append(p)
+    )
+
+    assert path == str(tmp_path / "job.json")
+    assert (tmp_path / "job.json").read_bytes() == body
+    assert progress[-1] == (len(body), len(body))
+
+
+def test_download_distance_matrix_job_error(client, httpx_mock, tmp_path):
+    httpx_mock.add_response(status_code=422, json={"error": "Job is not complete"})
+
+    with pytest.raises(Exception, match="Job is not complete"):
+        client.download_distance_matrix_job(7, tmp_path / "job.json")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_async_download_streams(httpx_mock, tmp_path):
+    httpx_mock.add_response(
+        stream=IteratorStream(chunks(CSV)),
+        headers={"content-type": "text/csv"},
+        is_reusable=True,
+    )
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            path = await client.download("42", tmp_path / "list.csv")
+            buffer = io.BytesIO()
+            await client.download_distance_matrix_job(7, buffer)
+            return path, buffer.getvalue()
+
+    path, job_body = asyncio.run(main())
+    assert open(path, "rb").read() == CSV
+    assert job_body == CSV
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Resumable downloads
+# ──────────────────────────────────────────────────────────────────────────────
+
+def range_server(data, honour_ranges=True, drop_after=None):
+    """
+    Serve ``data`` like a file server; optionally drop the first connection after
+    ``drop_after`` bytes.
+    """
+    seen = []
+
+    def body(payload):
+        if drop_after is not None and len(seen) == 1:
+            yield payload[:drop_after]
+            raise httpx.ReadError("connection reset")
+        yield from chunks(payload)
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        requested = request.headers.get("range")
+        seen.append(requested)
+        headers = {"content-type": "text/csv"}
+        if requested and honour_ranges:
+            start = int(requested[len("bytes="):-1])
+            if start >= len(data):
+                return httpx.Response(
+                    416, headers={"content-range": f"bytes */{len(data)}"}
+                )
+            headers["content-range"] = f"bytes {start}-{len(data) - 1}/{len(data)}"
+            headers["content-length"] = str(len(data) - start)
+            return httpx.Response(
+                206, stream=IteratorStream(body(data[start:])), headers=headers
+            )
+        headers["content-length"] = str(len(data))
+        return httpx.Response(200, stream=IteratorStream(body(data)), headers=headers)
+
+    return callback, seen
+
+
+def test_resume_continues_partial_file(client, httpx_mock, tmp_path):
+    callback, seen = range_server(CSV)
+    httpx_mock.add_callback(callback)
+    (tmp_path / "list.csv.part").write_bytes(CSV[:10_000])
+    progress = []
+
+    client.download(
+        "42", tmp_path / "list.csv", resume=True, progress=lambda *p: progress.append(p)
+    )
+
+    assert seen == ["bytes=10000-"]
+    assert httpx_mock.get_requests()[0].headers["accept-encoding"] == "identity"
+    assert (tmp_path / "list.csv").read_bytes() == CSV
+    assert not (tmp_path / "list.csv.part").exists()
+    assert progress[0][0] > 10_000
+    assert progress[-1] == (len(CSV), len(CSV))
+
+
+def test_resume_falls_back_when_ranges_are_ignored(client, httpx_mock, tmp_path):
+    callback, seen = range_server(CSV, honour_ranges=False)
+    httpx_mock.add_callback(callback)
+    (tmp_path / "list.csv.part").write_bytes(b"stale bytes")
+
+    client.download("42", tmp_path / "list.csv", resume=True)
+
+    assert seen == ["bytes=11-"]
+    assert (tmp_path / "list.csv").read_bytes() == CSV
+
+
+def test_resume_restarts_when_range_not_satisfiable(client, httpx_mock, tmp_path):
+    callback, seen = range_server(CSV)
+    httpx_mock.add_callback(callback, is_reusable=True)
+    (tmp_path / "list.csv.part").write_bytes(CSV + b"extra")
+
+    client.download("42", tmp_path / "list.csv", resume=True)
+
+    assert seen == [f"bytes={len(CSV) + 5}-", None]
+    assert (tmp_path / "list.csv").read_bytes() == CSV
+
+
+@pytest.mark.parametrize("partial", [None, CSV + b"extra"])
+def test_range_not_satisfiable_is_not_retried_forever(
+    client, httpx_mock, tmp_path, partial
+):
+    httpx_mock.add_response(status_code=416, is_reusable=True)
+    if partial is not None:
+        (tmp_path / "list.csv.part").write_bytes(partial)
+
+    with pytest.raises(RangeNotSatisfiableError):
+        client.download("42", tmp_path / "list.csv", resume=True)
+
+    # A 416 to a request without a Range header is raised; a ranged request restarts
+    # once
+    assert len(httpx_mock.get_requests()) == (1 if partial is None else 2)
+
+
+def test_resume_after_dropped_connection_fetches_only_missing_bytes(
+    httpx_mock, tmp_path, monkeypatch
+):
+    from geocodio import Geocodio, RetryPolicy
+
+    monkeypatch.setattr("geocodio.client.time.sleep", lambda seconds: None)
+    callback, seen = range_server(CSV, drop_after=30_000)
+    httpx_mock.add_callback(callback, is_reusable=True)
+    client = Geocodio(
+        api_key="TEST_KEY", hostname="api.test", retry=RetryPolicy(max_attempts=3)
+    )
+
+    client.download_distance_matrix_job(7, tmp_path / "job.csv", resume=True)
+
+    assert seen == [None, "bytes=30000-"]
+    assert (tmp_path / "job.csv").read_bytes() == CSV
+    assert client.retry_stats.retries == 1
+
+
+def test_failed_resumable_download_keeps_partial_file(client, httpx_mock, tmp_path):
+    callback, _ = range_server(CSV, drop_after=30_000)
+    httpx_mock.add_callback(callback)
+
+    with pytest.raises(httpx.ReadError):
+        client.download("42", tmp_path / "list.csv", resume=True)
+    assert (tmp_path / "list.csv.part").read_bytes() == CSV[:30_000]
+    assert not (tmp_path / "list.csv").exists()
+
+
+def test_download_verifies_final_size(client, httpx_mock, tmp_path):
+    httpx_mock.add_response(
+        stream=IteratorStream(chunks(CSV)),
+        headers={"content-type": "text/csv", "content-length": str(len(CSV) + 100)},
+    )
+
+    with pytest.raises(
+        GeocodioServerError, match=f"received {len(CSV)} of {len(CSV) + 100} bytes"
+    ):
+        client.download("42", tmp_path / "list.csv", resume=True)
+    assert not (tmp_path / "list.csv").exists()
+    assert (tmp_path / "list.csv.part").stat().st_size == len(CSV)
+
+
+def test_resume_requires_a_path(client):
+    with pytest.raises(ValueError, match="file path"):
+        client.download("42", io.BytesIO(), resume=True)
+
+
+def test_async_resume(httpx_mock, tmp_path):
+    callback, seen = range_server(CSV)
+    httpx_mock.add_callback(callback)
+    (tmp_path / "list.csv.part").write_bytes(CSV[:5_000])
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await client.download("42", tmp_path / "list.csv", resume=True)
+
+    assert open(asyncio.run(main()), "rb").read() == CSV
+    assert seen == ["bytes=5000-"]
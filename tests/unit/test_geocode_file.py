@@ -0,0 +1,298 @@
+"""
+Tests for sharded CSV geocoding through the List API
+"""
+
+import asyncio
+import csv
+import io
+import re
+import threading
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio
+from geocodio.exceptions import GeocodioServerError
+from geocodio.sharding import merge_csv_files, split_csv
+
+
+def make_csv(rows=100):
+    lines = ["address,note\n"]
+    for i in range(rows):
+        note = f'"unit {i}\nrear ""B"""' if i % 9 == 0 else "plain"
+        lines.append(f'"{i} Main St, Springfield IL",{note}\n')
+    return "".join(lines).encode()
+
+
+def geocoded(content, header=True):
+    """What the fake List API returns for an uploaded CSV: two appended columns."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    for n, row in enumerate(csv.reader(io.StringIO(content.decode()))):
+        if header and n == 0:
+            writer.writerow(row + ["Latitude", "Longitude"])
+        else:
+            writer.writerow(row + ["38.9", f"-77.{len(row[0])}"])
+    return out.getvalue().encode()
+
+
+class FakeListApi:
+    def __init__(self, fail=None, header=True, fail_upload=None):
+        self.uploads = {}
+        self.polls = {}
+        self.deleted = []
+        self.fail = fail
+        self.header = header
+        self.fail_upload = fail_upload
+        self.posts = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST":
+            boundary = re.search(
+                r"boundary=(\S+)", request.headers["content-type"]
+            ).group(1)
+            body = request.read()
+            content = body.partition(b"\r\n\r\n")[2]
+            self.posts += 1
+            if self.fail_upload is not None and self.fail_upload in body:
+                return httpx.Response(500, json={"error": "Upload failed"})
+            list_id = self.posts
+            self.uploads[list_id] = content[
+                : content.rindex(f"\r\n--{boundary}--".encode())
+            ]
+            self.polls[list_id] = 0
+            return httpx.Response(
+                200, json={"id": list_id, "file": {}, "status": {"state": "PROCESSING"}}
+            )
+        list_id = int(re.search(r"/lists/(\d+)", path).group(1))
+        if request.method == "DELETE":
+            self.deleted.append(list_id)
+            return httpx.Response(200, json={"success": True})
+        if path.endswith("/download"):
+            return httpx.Response(
+                200,
+                content=geocoded(self.uploads[list_id], self.header),
+                headers={"content-type": "text/csv"},
+            )
+        self.polls[list_id] += 1
+        if self.polls[list_id] < 1 + list_id % 3:
+            status = {"state": "PROCESSING", "progress": 50}
+        elif list_id == self.fail:
+            status = {"state": "FAILED", "message": "Bad input"}
+        else:
+            status = {"state": "COMPLETED", "progress": 100}
+        return httpx.Response(200, json={"id": list_id, "file": {}, "status": status})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("geocodio.jobs.time.monotonic", clock)
+    monkeypatch.setattr("geocodio.client.time.sleep", clock.sleep)
+    monkeypatch.setattr("geocodio.async_client.asyncio.sleep", clock.async_sleep)
+    return clock
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Splitting and merging
+# ──────────────────────────────────────────────────────────────────────────────
+
+def test_split_csv_keeps_records_whole(tmp_path):
+    data = make_csv(200)
+    path = tmp_path / "in.csv"
+    path.write_bytes(data)
+
+    plan = split_csv(path, 5)
+
+    assert plan.header == b"address,note\n"
+    assert len(plan.shards) == 5
+    bodies = [
+        b"".join(iter(shard.read, b""))[len(plan.header) :] for shard in plan.shards
+    ]
+    assert plan.header + b"".join(bodies) == data
+    for body in bodies:
+        assert len(list(csv.reader(io.StringIO(body.decode())))) == body.count(
+            b"Main St"
+        )
+    assert max(map(len, bodies)) < 2 * min(map(len, bodies))
+
+
+def test_split_csv_more_shards_than_rows(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_bytes(b"address\n1 Main St\n2 Main St")
+
+    plan = split_csv(path, 10)
+
+    assert [b"".join(iter(s.read, b"")) for s in plan.shards] == [
+        b"address\n1 Main St\n",
+        b"address\n2 Main St",
+    ]
+
+
+def test_split_csv_requires_rows(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_bytes(b"address\n")
+    with pytest.raises(ValueError, match="no rows"):
+        split_csv(path, 2)
+    with pytest.raises(ValueError):
+        split_csv(path, 0, header=False)
+
+
+def test_merge_csv_files_skips_repeated_headers(tmp_path):
+    parts = []
+    for i, content in enumerate([b'a,b\n1,"x\ny"\n', b'a,b\n2,z', b'a,b\n3,w\n']):
+        parts.append(tmp_path / f"{i}.csv")
+        parts[-1].write_bytes(content)
+
+    merge_csv_files(parts, tmp_path / "out.csv")
+
+    assert (tmp_path / "out.csv").read_bytes() == b'a,b\n1,"x\ny"\n2,z\n3,w\n'
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Client
+# ──────────────────────────────────────────────────────────────────────────────
+
+def test_geocode_file(client, httpx_mock, tmp_path, no_sleep):
+    data = make_csv(300)
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(data)
+    api = FakeListApi()
+    httpx_mock.add_callback(api, is_reusable=True)
+
+    output = client.geocode_file(path, shards=4, fields=["timezone"])
+
+    assert output == str(tmp_path / "addresses.geocoded.csv")
+    assert (tmp_path / "addresses.geocoded.csv").read_bytes() == geocoded(data)
+    assert len(api.uploads) == 4
+    assert all(upload.startswith(b"address,note\n") for upload in api.uploads.values())
+    assert sorted(api.deleted) == [1, 2, 3, 4]
+    posts = [r for r in httpx_mock.get_requests() if r.method == "POST"]
+    assert {r.url.params["fields"] for r in posts} == {"timezone"}
+    filenames = {re.search(rb'filename="([^"]+)"', r.content).group(1) for r in posts}
+    assert filenames == {b"addresses.part%d.csv" % i for i in range(1, 5)}
+
+
+def test_geocode_file_without_header(client, httpx_mock, tmp_path, no_sleep):
+    data = b"".join(b"%d Main St\n" % i for i in range(50))
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(data)
+    api = FakeListApi(header=False)
+    httpx_mock.add_callback(api, is_reusable=True)
+    buffer = io.BytesIO()
+
+    assert (
+        client.geocode_file(path, buffer, shards=3, header=False, keep_lists=True)
+        is buffer
+    )
+
+    assert buffer.getvalue() == geocoded(data, header=False)
+    assert api.deleted == []
+
+
+def test_geocode_file_failed_list_keeps_lists(client, httpx_mock, tmp_path, no_sleep):
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(make_csv(40))
+    api = FakeListApi(fail=2)
+    httpx_mock.add_callback(api, is_reusable=True)
+
+    with pytest.raises(GeocodioServerError, match="List 2 failed: Bad input"):
+        client.geocode_file(path, shards=2)
+    assert api.deleted == []
+    assert not (tmp_path / "addresses.geocoded.csv").exists()
+
+
+@pytest.mark.parametrize("keep_lists", [False, True])
+def test_geocode_file_failed_upload_cleans_up(
+    client, httpx_mock, tmp_path, no_sleep, keep_lists
+):
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(make_csv(30))
+    api = FakeListApi(fail_upload=b"addresses.part2.csv")
+    httpx_mock.add_callback(api, is_reusable=True)
+
+    with pytest.raises(GeocodioServerError) as exc_info:
+        client.geocode_file(path, shards=3, keep_lists=keep_lists)
+
+    created = sorted(api.uploads)
+    assert len(created) == 2
+    assert sorted(api.deleted) == ([] if keep_lists else created)
+    note = exc_info.value.__notes__[0]
+    assert all(str(list_id) in note for list_id in created)
+    assert ("not deleted" in note) is keep_lists
+
+
+def test_async_geocode_file_failed_upload_cleans_up(httpx_mock, tmp_path, no_sleep):
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(make_csv(30))
+    api = FakeListApi(fail_upload=b"addresses.part1.csv")
+    httpx_mock.add_callback(api, is_reusable=True)
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            await client.geocode_file(path, shards=3)
+
+    with pytest.raises(GeocodioServerError):
+        asyncio.run(main())
+    assert len(api.uploads) == 2
+    assert sorted(api.deleted) == sorted(api.uploads)
+
+
+def test_async_geocode_file(httpx_mock, tmp_path, no_sleep):
+    data = make_csv(120)
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(data)
+    api = FakeListApi()
+    httpx_mock.add_callback(api, is_reusable=True)
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await client.geocode_file(path, tmp_path / "out.csv", shards=3)
+
+    assert asyncio.run(main()) == str(tmp_path / "out.csv")
+    assert (tmp_path / "out.csv").read_bytes() == geocoded(data)
+    assert sorted(api.deleted) == [1, 2, 3]
+
+
+def test_async_geocode_file_splits_and_merges_off_the_event_loop(
+    httpx_mock, tmp_path, no_sleep, monkeypatch
+):
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(make_csv(30))
+    httpx_mock.add_callback(FakeListApi(), is_reusable=True)
+    threads = {}
+
+    def recorded(name, func):
+        def wrapper(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return func(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr("geocodio.async_client.split_csv", recorded("split", split_csv))
+    monkeypatch.setattr(
+        "geocodio.async_client.merge_csv_files", recorded("merge", merge_csv_files)
+    )
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            await client.geocode_file(path, tmp_path / "out.csv", shards=2)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(main())
+    assert set(threads) == {"split", "merge"}
+    assert loop_thread not in threads.values()
@@ -0,0 +1,257 @@
+"""
+Tests for request lifecycle hooks
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, CallbackHooks, ClientHooks, Geocodio, RetryPolicy
+from geocodio.exceptions import AuthenticationError
+from geocodio.hooks import PhaseTimer
+
+
+def single_payload(address: str) -> dict:
+    return {
+        "input": {"formatted_address": address},
+        "results": [{
+            "address_components": {"city": "Arlington"},
+            "formatted_address": address,
+            "location": {"lat": 38.886672, "lng": -77.094735},
+            "accuracy": 1,
+            "accuracy_type": "rooftop",
+            "source": "Arlington",
+        }],
+    }
+
+
+def batch_payload(addresses) -> dict:
+    return {"results": [{"query": a, "response": single_payload(a)} for a in addresses]}
+
+
+class Recorder(ClientHooks):
+    def __init__(self):
+        self.calls = []
+
+    def on_request(self, event):
+        self.calls.append(("request", event.attempt))
+
+    def on_response(self, event):
+        self.calls.append(("response", event.status_code))
+        self.response = event
+
+    def on_retry(self, event):
+        self.calls.append(("retry", event.retry_delay))
+
+    def on_error(self, event):
+        self.calls.append(("error", type(event.exception).__name__))
+        self.error = event
+
+    def on_parse_complete(self, event):
+        self.calls.append(("parse", event.lookups))
+        self.parse = event
+
+
+class TracingTransport(httpx.BaseTransport):
+    """Calls the httpcore ``trace`` extension the way a real connection would."""
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def handle_request(self, request):
+        trace = request.extensions.get("trace")
+        for step in (
+            "connection.connect_tcp", "connection.start_tls",
+            "http11.send_request_headers", "http11.send_request_body",
+            "http11.receive_response_headers",
+        ):
+            trace(f"{step}.started", {})
+            trace(f"{step}.complete", {})
+        response = self.handler(request)
+        trace("http11.receive_response_body.started", {})
+        trace("http11.receive_response_body.complete", {})
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr("geocodio.client.time.sleep", delays.append)
+    return delays
+
+
+def test_hooks_see_request_response_and_parse():
+    addresses = ["1109 N Highland St, Arlington VA", "525 University Ave, Toronto, ON"]
+    recorder = Recorder()
+    transport = TracingTransport(
+        lambda request: httpx.Response(200, json=batch_payload(addresses))
+    )
+    client = Geocodio(
+        "TEST_KEY", hostname="api.test", transport=transport, hooks=recorder
+    )
+
+    response = client.geocode(addresses)
+
+    assert recorder.calls == [("request", 1), ("response", 200), ("parse", 2)]
+    event = recorder.response
+    assert event.method == "POST"
+    assert event.endpoint.endswith("/geocode")
+    assert event.lookups == 2
+    assert event.bytes_sent > 0
+    assert event.bytes_received == len(
+        httpx.Response(200, json=batch_payload(addresses)).content
+    )
+    assert set(event.timings) == {"connect", "send", "wait", "receive", "total"}
+    assert event.timings["total"] >= event.timings["wait"]
+    assert recorder.parse.result is response
+    assert recorder.parse.timings["parse"] > 0
+
+
+def test_hooks_report_retries_and_final_error(httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=503)
+    recorder = Recorder()
+    client = Geocodio("TEST_KEY", hostname="api.test", hooks=[recorder],
+                      retry=RetryPolicy(max_attempts=3, jitter=False))
+
+    with pytest.raises(Exception):
+        client.geocode("1109 N Highland St, Arlington VA")
+
+    assert recorder.calls == [
+        ("request", 1), ("response", 503), ("retry", sleeps[0]),
+        ("request", 2), ("response", 503), ("retry", sleeps[1]),
+        ("request", 3), ("response", 503), ("error", "GeocodioServerError"),
+    ]
+    assert recorder.error.attempt == 3
+
+
+def test_hooks_report_error_status(client, httpx_mock):
+    httpx_mock.add_response(status_code=403, json={"error": "Invalid API key"})
+    recorder = Recorder()
+    client.hooks.append(recorder)
+
+    with pytest.raises(AuthenticationError):
+        client.geocode("1109 N Highland St, Arlington VA")
+
+    assert recorder.calls == [
+        ("request", 1),
+        ("response", 403),
+        ("error", "AuthenticationError"),
+    ]
+    assert isinstance(recorder.error.exception, AuthenticationError)
+
+
+def test_hooks_report_transport_errors(client, httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError("refused"))
+    recorder = Recorder()
+    client.hooks.append(recorder)
+
+    with pytest.raises(httpx.ConnectError):
+        client.geocode("1109 N Highland St, Arlington VA")
+
+    assert recorder.calls == [("request", 1), ("error", "ConnectError")]
+    assert recorder.error.status_code is None
+    assert "total" in recorder.error.timings
+
+
+def test_failing_hook_does_not_break_requests(httpx_mock):
+    httpx_mock.add_response(json=single_payload("1109 N Highland St, Arlington VA"))
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("metrics backend down")
+
+    client = Geocodio(
+        "TEST_KEY",
+        hostname="api.test",
+        hooks=[
+            CallbackHooks(on_request=broken),
+            CallbackHooks(on_response=seen.append),
+        ],
+    )
+
+    assert client.geocode("1109 N Highland St, Arlington VA").results
+    assert [event.status_code for event in seen] == [200]
+
+
+def test_phase_timer_accumulates_phases():
+    timings = {}
+    timer = PhaseTimer(timings)
+    for step in (
+        "http11.send_request_headers",
+        "http11.send_request_body",
+        "connection.connect_tcp",
+    ):
+        timer.trace(f"{step}.started", {})
+        timer.trace(f"{step}.complete", {})
+    timer.trace("http11.receive_response_headers.started", {})
+    timer.trace("http11.receive_response_headers.failed", {"exception": OSError()})
+    timer.trace("http11.response_closed.started", {})
+
+    assert set(timings) == {"send", "connect", "wait"}
+
+
+def test_async_hooks(httpx_mock):
+    address = "1109 N Highland St, Arlington VA"
+    httpx_mock.add_response(json=single_payload(address))
+    recorder = Recorder()
+
+    async def main():
+        async with AsyncGeocodio(
+            api_key="TEST_KEY", hostname="api.test", hooks=recorder
+        ) as client:
+            return await client.reverse("38.886672,-77.094735")
+
+    asyncio.run(main())
+
+    assert recorder.calls == [("request", 1), ("response", 200), ("parse", 1)]
+    assert recorder.response.method == "GET"
+    assert recorder.parse.endpoint.endswith("/reverse")
+
+
+def distance_payload() -> dict:
+    return {
+        "origin": {"query": "38.8977,-77.0365", "location": [38.8977, -77.0365]},
+        "mode": "driving",
+        "destinations": [
+            {
+                "query": "38.9072,-77.0369",
+                "location": [38.9072, -77.0369],
+                "distance_miles": 0.7,
+                "distance_km": 1.1,
+            },
+        ],
+    }
+
+
+def test_hooks_see_distance_parse(httpx_mock):
+    httpx_mock.add_response(json=distance_payload())
+    recorder = Recorder()
+    client = Geocodio("TEST_KEY", hostname="api.test", hooks=recorder)
+
+    response = client.distance("38.8977,-77.0365", ["38.9072,-77.0369"], mode="driving")
+
+    assert recorder.calls == [("request", 1), ("response", 200), ("parse", 2)]
+    assert recorder.parse.endpoint.endswith("/distance")
+    assert recorder.parse.result is response
+    assert recorder.parse.timings["parse"] > 0
+
+
+def test_async_hooks_see_distance_parse(httpx_mock):
+    httpx_mock.add_response(json=distance_payload())
+    recorder = Recorder()
+
+    async def main():
+        async with AsyncGeocodio(
+            api_key="TEST_KEY", hostname="api.test", hooks=recorder
+        ) as client:
+            return await client.distance(
+                "38.8977,-77.0365", ["38.9072,-77.0369"], mode="driving"
+            )
+
+    response = asyncio.run(main())
+
+    assert recorder.calls == [("request", 1), ("response", 200), ("parse", 2)]
+    assert recorder.parse.result is response
@@ -0,0 +1,272 @@
+"""
+Tests for waiting on distance matrix jobs with adaptive polling
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, DistanceJobState
+from geocodio.exceptions import DistanceJobFailedError
+from geocodio.jobs import AdaptivePoller, JobSchedule
+from geocodio.models import DistanceJobResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr("geocodio.jobs.time.monotonic", fake)
+    monkeypatch.setattr("geocodio.client.time.sleep", fake.sleep)
+    return fake
+
+
+def job(status, completed=None, total=1000, progress=None, job_id=1):
+    return DistanceJobResponse(
+        id=job_id,
+        identifier="",
+        status=status,
+        name="",
+        created_at="",
+        origins_count=0,
+        destinations_count=0,
+        total_calculations=total,
+        calculations_completed=completed,
+        progress=progress,
+    )
+
+
+def job_payload(job_id, status, **extra):
+    return {
+        "data": {"id": job_id, "status": status, "total_calculations": 1000, **extra}
+    }
+
+
+def job_api(timelines):
+    """Serve each job's statuses in order; the last one repeats."""
+    calls = {job_id: 0 for job_id in timelines}
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        job_id = int(request.url.path.rsplit("/", 1)[-1])
+        statuses = timelines[job_id]
+        payload = statuses[min(calls[job_id], len(statuses) - 1)]
+        calls[job_id] += 1
+        return httpx.Response(200, json=payload)
+
+    return callback, calls
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Poll scheduling
+# ──────────────────────────────────────────────────────────────────────────────
+
+def test_poller_backs_off_without_progress():
+    clock = FakeClock()
+    poller = AdaptivePoller(min_interval=1, max_interval=5, clock=clock)
+    delays = [poller.next_delay(job(DistanceJobState.ENQUEUED)) for _ in range(6)]
+    assert delays == [1, 1.5, 2.25, 3.375, 5, 5]
+
+
+def test_poller_follows_reported_progress():
+    clock = FakeClock()
+    poller = AdaptivePoller(min_interval=1, max_interval=60, clock=clock)
+    poller.next_delay(job(DistanceJobState.PROCESSING, completed=100))
+    clock.now = 10.0
+    # 100 calculations per 10s leaves ~80s; the next poll comes at half of that
+    assert poller.next_delay(
+        job(DistanceJobState.PROCESSING, completed=200)
+    ) == pytest.approx(40.0)
+    clock.now = 20.0
+    assert poller.next_delay(
+        job(DistanceJobState.PROCESSING, progress=99)
+    ) == pytest.approx(1.0)
+
+
+def test_poller_rejects_invalid_intervals():
+    with pytest.raises(ValueError):
+        AdaptivePoller(min_interval=0)
+    with pytest.raises(ValueError):
+        AdaptivePoller(min_interval=5, max_interval=1)
+
+
+def test_schedule_orders_jobs_by_due_time():
+    clock = FakeClock()
+    schedule = JobSchedule([1, 2, 2, 3], min_interval=1, max_interval=10, clock=clock)
+    assert schedule.pending == [1, 2, 3]
+    assert schedule.pop_due(2) == [1, 2]
+    assert not schedule.update(1, job(DistanceJobState.PROCESSING))
+    assert schedule.update(2, job(DistanceJobState.COMPLETED))
+    assert schedule.pop_due(5) == [3]
+    assert schedule.pop_due(5) == []
+    assert schedule.time_until_due() == 1
+    assert schedule.pending == [1]
+
+
+def test_schedule_deadline():
+    clock = FakeClock()
+    schedule = JobSchedule(
+        [7], timeout=5, min_interval=10, max_interval=10, clock=clock
+    )
+    schedule.update(schedule.pop_due(1)[0], job(DistanceJobState.PROCESSING))
+    assert schedule.time_until_due() == 5
+    clock.now = 5
+    with pytest.raises(TimeoutError, match=r"\[7\]"):
+        schedule.check_deadline()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Client
+# ──────────────────────────────────────────────────────────────────────────────
+
+def test_wait_for_distance_job(client, httpx_mock, clock):
+    callback, calls = job_api(
+        {
+            1: [
+                job_payload(1, "ENQUEUED"),
+                job_payload(1, "PROCESSING", calculations_completed=250),
+                job_payload(1, "PROCESSING", calculations_completed=500),
+                job_payload(
+                    1,
+                    "COMPLETED",
+                    calculations_completed=1000,
+                    download_url="https://x",
+                ),
+            ]
+        }
+    )
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    result = client.wait_for_distance_job(
+        1, timeout=600, min_interval=1, max_interval=30
+    )
+
+    assert result.status == "COMPLETED"
+    assert result.download_url == "https://x"
+    assert calls[1] == 4
+    # Backoff before progress is known, then half the estimated remaining time
+    assert clock.sleeps[:2] == [1, 1.5]
+    assert clock.sleeps[2] == pytest.approx(1.5)
+
+
+def test_wait_for_distance_job_shuts_down_poller(client, httpx_mock, clock, mocker):
+    callback, _ = job_api({1: [job_payload(1, "COMPLETED")]})
+    httpx_mock.add_callback(callback, is_reusable=True)
+    shutdown = mocker.spy(ThreadPoolExecutor, "shutdown")
+    check = mocker.patch.object(
+        client,
+        "_check_distance_job",
+        side_effect=lambda job_id, job: shutdown.call_count,
+    )
+
+    # The polling pool is shut down before the result is checked, not when the generator
+    # is collected
+    assert client.wait_for_distance_job(1) == 1
+    assert check.call_count == 1
+
+
+def test_wait_for_distance_job_failed(client, httpx_mock, clock):
+    callback, _ = job_api({1: [job_payload(1, "PROCESSING"), job_payload(1, "FAILED")]})
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    with pytest.raises(DistanceJobFailedError) as excinfo:
+        client.wait_for_distance_job(1)
+    assert excinfo.value.job.status == "FAILED"
+
+
+def test_wait_for_distance_job_timeout(client, httpx_mock, clock):
+    callback, calls = job_api({1: [job_payload(1, "PROCESSING")]})
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    with pytest.raises(TimeoutError):
+        client.wait_for_distance_job(1, timeout=20, min_interval=2, max_interval=4)
+    assert clock.now == 20
+    assert (
+        calls[1] == 6
+    )  # t = 0, 2, 5, 9, 13, 17; the next poll would land after the deadline
+
+
+def test_iter_completed_distance_jobs_yields_in_completion_order(
+    client, httpx_mock, clock
+):
+    callback, calls = job_api({
+        1: [job_payload(1, "PROCESSING")] * 4 + [job_payload(1, "COMPLETED")],
+        2: [job_payload(2, "COMPLETED")],
+        3: [job_payload(3, "PROCESSING"), job_payload(3, "FAILED")],
+    })
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    finished = [
+        (j.id, j.status)
+        for j in client.iter_completed_distance_jobs([1, 2, 3], concurrency=2)
+    ]
+
+    assert finished == [(2, "COMPLETED"), (3, "FAILED"), (1, "COMPLETED")]
+    assert calls == {1: 5, 2: 1, 3: 2}
+
+
+def test_iter_completed_distance_jobs_bounds_concurrency(client, mocker, clock):
+    in_flight = []
+    statuses = {}
+
+    def status(job_id):
+        statuses[job_id] = statuses.get(job_id, 0) + 1
+        return job(
+            (
+                DistanceJobState.COMPLETED
+                if statuses[job_id] > 1
+                else DistanceJobState.PROCESSING
+            ),
+            job_id=job_id,
+        )
+
+    mocker.patch.object(client, "distance_matrix_job_status", side_effect=status)
+    original = JobSchedule.pop_due
+
+    def pop_due(self, limit):
+        due = original(self, limit)
+        in_flight.append(len(due))
+        return due
+
+    mocker.patch.object(JobSchedule, "pop_due", pop_due)
+    done = list(client.iter_completed_distance_jobs(range(10), concurrency=3))
+
+    assert sorted(j.id for j in done) == list(range(10))
+    assert max(in_flight) == 3
+
+
+def test_async_wait_for_distance_job(httpx_mock, clock, monkeypatch):
+    monkeypatch.setattr("geocodio.async_client.asyncio.sleep", clock.async_sleep)
+    callback, _ = job_api({
+        1: [job_payload(1, "PROCESSING", progress=50), job_payload(1, "COMPLETED")],
+        2: [job_payload(2, "PROCESSING"), job_payload(2, "FAILED")],
+    })
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            done = await client.wait_for_distance_job(1)
+            with pytest.raises(DistanceJobFailedError):
+                await client.wait_for_distance_job(2)
+            tracked = [j.id async for j in client.iter_completed_distance_jobs([1, 2])]
+            return done, tracked
+
+    done, tracked = asyncio.run(main())
+    assert done.status == "COMPLETED"
+    assert sorted(tracked) == [1, 2]
@@ -0,0 +1,147 @@
+"""
+Tests for lazy result parsing
+"""
+
+import copy
+import dataclasses
+
+import httpx
+import pytest
+
+from geocodio import Geocodio
+from geocodio.models import GeocodingResult, GeocodioFields, LazyGeocodingResult
+
+
+def rich_result(n: int) -> dict:
+    return {
+        "address_components": {
+            "number": str(n),
+            "street": "Main",
+            "city": "Springfield",
+            "state": "IL",
+        },
+        "formatted_address": f"{n} Main St, Springfield, IL",
+        "location": {"lat": 39.78 + n, "lng": -89.64},
+        "accuracy": 0.9,
+        "accuracy_type": "rooftop",
+        "source": "Sangamon",
+        "fields": {
+            "timezone": {
+                "name": "America/Chicago",
+                "utc_offset": -6,
+                "observes_dst": True,
+            },
+            "cd": [
+                {
+                    "name": "Illinois's 13th congressional district",
+                    "district_number": 13,
+                }
+            ],
+            "census": {
+                "2020": {
+                    "census_year": 2020,
+                    "tract_code": "000100",
+                    "block_code": "1000",
+                },
+            },
+            "census2010": {"census_year": 2010, "tract": "000200"},
+            "acs": {
+                "demographics": {"total_population": 1200},
+                "economics": {"median_household_income": 55000},
+            },
+            "unknown_field": {"a": 1},
+        },
+    }
+
+
+def batch_payload(count: int) -> dict:
+    return {
+        "results": [
+            {"query": str(i), "response": {"results": [rich_result(i)]}}
+            for i in range(count)
+        ]
+    }
+
+
+@pytest.fixture
+def lazy_client():
+    return Geocodio("TEST_KEY", hostname="api.test", lazy_parsing=True)
+
+
+def test_lazy_results_match_eager_results(lazy_client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(3), is_reusable=True)
+    eager = Geocodio("TEST_KEY", hostname="api.test").geocode(["0", "1", "2"])
+    lazy = lazy_client.geocode(["0", "1", "2"])
+
+    assert all(isinstance(r, LazyGeocodingResult) for r in lazy.results)
+    for lazy_result, eager_result in zip(lazy.results, eager.results):
+        assert lazy_result.formatted_address == eager_result.formatted_address
+        assert lazy_result.location == eager_result.location
+        assert lazy_result.address_components == eager_result.address_components
+        assert lazy_result.fields.census2020 == eager_result.fields.census2020
+        assert lazy_result.fields.census2010 == eager_result.fields.census2010
+        assert lazy_result.fields.demographics == eager_result.fields.demographics
+        assert (
+            lazy_result.fields.congressional_districts
+            == eager_result.fields.congressional_districts
+        )
+        assert lazy_result.fields.unknown_field == {"a": 1}
+        assert lazy_result.materialize() == eager_result
+        assert lazy_result == eager_result
+
+
+def test_lazy_results_are_geocoding_results(lazy_client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(2), is_reusable=True)
+    eager = Geocodio("TEST_KEY", hostname="api.test").geocode(["0", "1"])
+    lazy = lazy_client.geocode(["0", "1"])
+
+    result = lazy.results[1]
+    assert isinstance(result, GeocodingResult)
+    assert isinstance(result.fields, GeocodioFields)
+    assert dataclasses.is_dataclass(result)
+    assert dataclasses.asdict(result) == dataclasses.asdict(eager.results[1])
+    assert eager.results[1] == result
+    assert copy.deepcopy(result) == eager.results[1]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.accuracy = 0.5
+    with pytest.raises(TypeError):
+        hash(result)
+
+
+def test_fields_are_not_parsed_until_accessed(lazy_client, httpx_mock, mocker):
+    httpx_mock.add_response(json=batch_payload(50))
+    parse_fields = mocker.spy(Geocodio, "_parse_fields")
+
+    resp = lazy_client.geocode([str(i) for i in range(50)])
+    assert [r.location.lat for r in resp.results][:2] == [39.78, 40.78]
+    assert parse_fields.call_count == 0
+
+    tract = resp.results[0].fields.census2020.tract
+    assert tract == "000100"
+    assert parse_fields.call_count == 1
+    # Only the census data was handed to the parser.
+    assert set(parse_fields.call_args.args[1]) == {"census"}
+
+    # Repeated access is served from the cached model.
+    resp.results[0].fields.census2020
+    assert parse_fields.call_count == 1
+
+
+def test_missing_field_is_none(lazy_client, httpx_mock):
+    httpx_mock.add_response(json={"results": [rich_result(1)]})
+
+    fields = lazy_client.geocode("1 Main St").results[0].fields
+    assert fields.zip4 is None
+    assert fields.census2031 is None
+    with pytest.raises(AttributeError):
+        fields.not_a_field
+
+
+def test_result_without_fields(lazy_client, httpx_mock):
+    result = rich_result(1)
+    del result["fields"]
+    httpx_mock.add_response(json={"results": [result]})
+
+    lazy = lazy_client.geocode("1 Main St").results[0]
+    assert lazy.fields is None
+    assert isinstance(lazy.materialize(), GeocodingResult)
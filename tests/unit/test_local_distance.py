@@ -0,0 +1,154 @@
+"""
+Tests for the local straight-line distance engine
+"""
+
+import asyncio
+
+import pytest
+
+from geocodio import AsyncGeocodio, Coordinate, Geocodio
+from geocodio import local_distance as engine
+from geocodio.local_distance import (
+    haversine_km, local_distance, local_distance_matrix, select_destinations,
+)
+from geocodio.models import DistanceMatrixResponse, DistanceResponse
+
+WHITE_HOUSE = Coordinate(38.8977, -77.0365, "white_house")
+CAPITOL = Coordinate(38.8899, -77.0091, "capitol")
+MONUMENT = Coordinate(38.8895, -77.0353, "monument")
+NEW_YORK = Coordinate(40.7128, -74.0060, "nyc")
+STORES = [CAPITOL, NEW_YORK, MONUMENT]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(engine, "np", None)
+    return request.param
+
+
+def test_haversine_known_distance(backend):
+    # Washington, DC to New York City is about 328 km
+    matrix = haversine_km(
+        [(38.8977, -77.0365)], [(40.7128, -74.0060), (38.8977, -77.0365)]
+    )
+    assert float(matrix[0][0]) == pytest.approx(328.4, abs=0.5)
+    assert float(matrix[0][1]) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_local_distance_sorted_ascending(backend):
+    response = local_distance(WHITE_HOUSE, STORES)
+
+    assert isinstance(response, DistanceResponse)
+    assert response.mode == "straightline"
+    assert response.origin.id == "white_house"
+    assert [d.id for d in response.destinations] == ["monument", "capitol", "nyc"]
+    assert response.destinations[0].query == "38.8895,-77.0353,monument"
+    assert response.destinations[0].location == (38.8895, -77.0353)
+    assert response.destinations[2].distance_km == pytest.approx(
+        response.destinations[2].distance_miles * 1.609344
+    )
+
+
+def test_filters_and_limits(backend):
+    response = local_distance(WHITE_HOUSE, STORES, max_distance=100, sort_order="desc")
+    assert [d.id for d in response.destinations] == ["capitol", "monument"]
+
+    response = local_distance(WHITE_HOUSE, STORES, min_distance=1.0)
+    assert [d.id for d in response.destinations] == ["capitol", "nyc"]
+
+    response = local_distance(WHITE_HOUSE, STORES, max_results=1)
+    assert [d.id for d in response.destinations] == ["monument"]
+
+
+def test_distance_filters_use_requested_units(backend):
+    miles = local_distance(WHITE_HOUSE, STORES, units="miles", max_distance=210)
+    km = local_distance(WHITE_HOUSE, STORES, units="km", max_distance=210)
+    assert [d.id for d in miles.destinations] == ["monument", "capitol", "nyc"]
+    assert [d.id for d in km.destinations] == ["monument", "capitol"]
+
+
+def test_ties_keep_input_order(backend):
+    a = Coordinate(39.0, -77.0, "a")
+    b = Coordinate(39.0, -77.0, "b")
+    c = Coordinate(39.0, -77.0, "c")
+    row = local_distance(WHITE_HOUSE, [a, b, c], max_results=2).destinations
+    assert [d.id for d in row] == ["a", "b"]
+
+
+def test_select_destinations_partial_sort_matches_full_sort(backend):
+    import random
+    random.seed(7)
+    values = [random.uniform(0, 100) for _ in range(500)]
+    if backend == "numpy":
+        import numpy as np
+        values = np.asarray(values)
+    full = select_destinations(values)
+    assert select_destinations(values, max_results=10) == full[:10]
+    assert (
+        select_destinations(values, max_results=10, sort_order="desc")
+        == full[::-1][:10]
+    )
+
+
+def test_matrix_matches_per_origin_calls(backend):
+    matrix = local_distance_matrix(
+        [WHITE_HOUSE, NEW_YORK], STORES, units="km", max_results=2
+    )
+
+    assert isinstance(matrix, DistanceMatrixResponse)
+    assert [r.origin.id for r in matrix.results] == ["white_house", "nyc"]
+    for result in matrix.results:
+        single = local_distance(
+            Coordinate(*result.origin.location, result.origin.id),
+            STORES,
+            units="km",
+            max_results=2,
+        )
+        assert result.destinations == single.destinations
+
+
+def test_invalid_units_and_sort():
+    with pytest.raises(ValueError):
+        local_distance(WHITE_HOUSE, STORES, units="furlongs")
+    with pytest.raises(ValueError):
+        local_distance(WHITE_HOUSE, STORES, sort_order="sideways")
+
+
+def test_client_computes_straightline_locally(httpx_mock):
+    client = Geocodio("TEST_KEY", hostname="api.test", local_straightline=True)
+
+    response = client.distance(
+        "38.8977,-77.0365,white_house",
+        ["38.8899,-77.0091,capitol", (38.8895, -77.0353)],
+    )
+    matrix = client.distance_matrix(
+        [(38.8977, -77.0365)], [(40.7128, -74.0060)], mode="haversine"
+    )
+
+    assert [d.id for d in response.destinations] == [None, "capitol"]
+    assert len(matrix.results[0].destinations) == 1
+    assert httpx_mock.get_requests() == []
+
+
+def test_client_still_calls_api_for_driving(httpx_mock):
+    httpx_mock.add_response(json={"origin": {}, "mode": "driving", "destinations": []})
+    client = Geocodio("TEST_KEY", hostname="api.test", local_straightline=True)
+
+    client.distance((38.8977, -77.0365), [(38.8899, -77.0091)], mode="driving")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_async_client_computes_straightline_locally(httpx_mock):
+    async def run():
+        async with AsyncGeocodio(
+            "TEST_KEY", hostname="api.test", local_straightline=True
+        ) as client:
+            return await client.distance_matrix([WHITE_HOUSE], STORES, max_results=1)
+
+    matrix = asyncio.run(run())
+    assert matrix.results[0].destinations[0].id == "monument"
+    assert httpx_mock.get_requests() == []
@@ -0,0 +1,77 @@
+"""
+Tests for debug logging of requests and responses
+"""
+
+import logging
+
+import pytest
+
+from geocodio import Geocodio
+from geocodio.logs import TruncatedBody
+
+
+def batch_response(size):
+    return {
+        "results": [
+            {"query": f"{i} Main St", "response": {"input": {}, "results": []}}
+            for i in range(size)
+        ]
+    }
+
+
+@pytest.fixture
+def batch_api(httpx_mock):
+    httpx_mock.add_response(json=batch_response(500), is_reusable=True)
+
+
+def test_truncated_body_limits_output():
+    assert str(TruncatedBody(b"x" * 100, 10)) == "xxxxxxxxxx... (90 more)"
+    assert str(TruncatedBody("short", 10)) == "short"
+    assert str(TruncatedBody("café".encode(), 4)).startswith("caf")
+
+    rendered = str(TruncatedBody({"results": list(range(100_000))}, 200))
+    assert rendered.startswith("{'results': [0, 1, 2")
+    assert len(rendered) <= 203
+
+
+def test_no_payload_formatting_at_info(client, batch_api, caplog, mocker):
+    formatted = mocker.spy(TruncatedBody, "__str__")
+    caplog.set_level(logging.INFO, logger="geocodio")
+
+    client.geocode([f"{i} Main St" for i in range(500)])
+
+    assert [r for r in caplog.records if r.name == "geocodio"] == []
+    assert formatted.call_count == 0
+
+
+def test_debug_logging_omits_bodies_by_default(client, batch_api, caplog):
+    caplog.set_level(logging.DEBUG, logger="geocodio")
+
+    client.geocode([f"{i} Main St" for i in range(500)])
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("Making Request: POST") for m in messages)
+    assert any(m == "Response status code: 200" for m in messages)
+    assert not any("body" in m or "Raw response" in m for m in messages)
+
+
+def test_debug_logging_truncates_bodies(batch_api, caplog):
+    client = Geocodio(api_key="TEST_KEY", hostname="api.test", log_body_limit=64)
+    caplog.set_level(logging.DEBUG, logger="geocodio")
+
+    client.geocode([f"{i} Main St" for i in range(500)])
+
+    bodies = {
+        record.getMessage().partition(": ")[0]: record.getMessage()
+        for record in caplog.records
+        if record.getMessage().partition(": ")[0]
+        in ("JSON body", "Response body", "Raw response")
+    }
+    assert set(bodies) == {"JSON body", "Response body", "Raw response"}
+    assert all(len(message) < 120 for message in bodies.values())
+    assert bodies["Response body"].endswith("more)")
+
+
+def test_log_body_limit_must_not_be_negative():
+    with pytest.raises(ValueError):
+        Geocodio(api_key="TEST_KEY", log_body_limit=-1)
@@ -0,0 +1,299 @@
+"""
+Tests for distance matrix tiling and CompactDistanceMatrix
+"""
+
+import asyncio
+import json
+import math
+import random
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, CallbackHooks, Coordinate, Geocodio
+from geocodio.local_distance import local_distance_matrix
+from geocodio.matrix import CompactDistanceMatrix, plan_tiles
+
+
+def fake_matrix_api(request: httpx.Request) -> httpx.Response:
+    """
+    Answer /distance-matrix like the API, with driving durations derived from distance.
+    """
+    body = json.loads(request.content)
+    origins = [Coordinate(o["lat"], o["lng"], o.get("id")) for o in body["origins"]]
+    dests = [Coordinate(d["lat"], d["lng"], d.get("id")) for d in body["destinations"]]
+    units = body.get("units", "miles")
+    matrix = local_distance_matrix(
+        origins, dests, units=units, max_distance=body.get("max_distance")
+    )
+    order_by = body.get("order_by", "distance")
+    results = []
+    for result in matrix.results:
+        destinations = [
+            {
+                "query": d.query, "location": list(d.location), "id": d.id,
+                "distance_miles": d.distance_miles, "distance_km": d.distance_km,
+                "duration_seconds": int(d.distance_km * 40) % 997,
+            }
+            for d in result.destinations
+        ]
+        key = (
+            "duration_seconds"
+            if order_by == "duration"
+            else ("distance_km" if units == "km" else "distance_miles")
+        )
+        destinations.sort(key=lambda d: d[key], reverse=body.get("sort") == "desc")
+        if "max_results" in body:
+            destinations = destinations[:body["max_results"]]
+        results.append(
+            {
+                "origin": {
+                    "query": result.origin.query,
+                    "location": list(result.origin.location),
+                    "id": result.origin.id,
+                },
+                "destinations": destinations,
+            }
+        )
+    return httpx.Response(200, json={"mode": "driving", "results": results})
+
+
+@pytest.fixture
+def points():
+    rng = random.Random(3)
+    origins = [
+        Coordinate(rng.uniform(30, 45), rng.uniform(-120, -75), f"o{n}")
+        for n in range(7)
+    ]
+    dests = [
+        Coordinate(rng.uniform(30, 45), rng.uniform(-120, -75), f"d{n}")
+        for n in range(23)
+    ]
+    return origins, dests
+
+
+def test_plan_tiles_covers_every_cell_once():
+    tiles = plan_tiles(5, 7, 2, 3)
+    cells = [
+        (o, d)
+        for origin_range, dest_range in tiles
+        for o in origin_range
+        for d in dest_range
+    ]
+    assert len(tiles) == 9
+    assert sorted(cells) == [(o, d) for o in range(5) for d in range(7)]
+    with pytest.raises(ValueError):
+        plan_tiles(5, 7, 0, 3)
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"max_results": 3},
+    {"max_results": 2, "sort_order": "desc"},
+    {"max_results": 4, "order_by": "duration"},
+    {"units": "km", "max_distance": 900},
+])
+def test_tiled_matrix_matches_single_request(points, httpx_mock, options):
+    origins, dests = points
+    httpx_mock.add_callback(fake_matrix_api, is_reusable=True)
+
+    single = Geocodio("TEST_KEY", hostname="api.test").distance_matrix(
+        origins, dests, mode="driving", **options
+    )
+    tiled_client = Geocodio(
+        "TEST_KEY",
+        hostname="api.test",
+        matrix_tile_origins=3,
+        matrix_tile_destinations=5,
+    )
+    tiled = tiled_client.distance_matrix(origins, dests, mode="driving", **options)
+
+    assert len(httpx_mock.get_requests()) == 1 + 3 * 5
+    assert [r.origin.id for r in tiled.results] == [o.id for o in origins]
+    for expected, actual in zip(single.results, tiled.results):
+        assert [d.id for d in actual.destinations] == [
+            d.id for d in expected.destinations
+        ]
+        assert [d.duration_seconds for d in actual.destinations] == [
+            d.duration_seconds for d in expected.destinations
+        ]
+
+
+def test_tiles_restore_caller_ids(httpx_mock):
+    httpx_mock.add_callback(fake_matrix_api, is_reusable=True)
+    client = Geocodio("TEST_KEY", hostname="api.test", matrix_tile_destinations=1)
+
+    response = client.distance_matrix(
+        [(38.9, -77.0)], [(39.0, -77.0), "38.95,-77.0,named"], mode="driving"
+    )
+
+    assert [d.id for d in response.results[0].destinations] == ["named", None]
+    assert response.results[0].origin.id is None
+    sent = [
+        json.loads(r.content)["destinations"][0]["id"]
+        for r in httpx_mock.get_requests()
+    ]
+    assert sent == ["0", "1"]
+
+
+def test_tiles_keep_api_queries_and_extras(httpx_mock):
+    def api(request):
+        payload = json.loads(fake_matrix_api(request).content)
+        for result in payload["results"]:
+            result["origin"].update(query="Origin St", zone="A")
+            for dest in result["destinations"]:
+                dest.update(query=f"Stop {dest['id']}", toll=True)
+        return httpx.Response(200, json=payload)
+
+    httpx_mock.add_callback(api, is_reusable=True)
+    client = Geocodio("TEST_KEY", hostname="api.test", matrix_tile_destinations=1)
+
+    response = client.distance_matrix(
+        [Coordinate(1.0, 2.0, "a")], [(1.5, 2.0), (3.0, 2.0)], mode="driving"
+    )
+    compact = client.distance_matrix(
+        [Coordinate(1.0, 2.0, "a")],
+        [(1.5, 2.0), (3.0, 2.0)],
+        mode="driving",
+        compact=True,
+    )
+
+    origin = response.results[0].origin
+    assert (origin.query, origin.id, origin.extras) == ("Origin St", "a", {"zone": "A"})
+    # Tile-local ids are replaced by the caller's ids; the API's query and extras are
+    # kept
+    assert [(d.query, d.id, d.extras) for d in response.results[0].destinations] == [
+        ("Stop 0", None, {"toll": True}), ("Stop 1", None, {"toll": True}),
+    ]
+    assert compact.to_response() == response
+
+
+def test_small_matrix_is_not_tiled(httpx_mock):
+    httpx_mock.add_callback(fake_matrix_api)
+    client = Geocodio(
+        "TEST_KEY",
+        hostname="api.test",
+        matrix_tile_origins=10,
+        matrix_tile_destinations=10,
+    )
+
+    client.distance_matrix([(38.9, -77.0)], [(39.0, -77.0)], mode="driving")
+
+    assert (
+        "id" not in json.loads(httpx_mock.get_requests()[0].content)["destinations"][0]
+    )
+
+
+def test_invalid_tile_size():
+    with pytest.raises(ValueError):
+        Geocodio("TEST_KEY", hostname="api.test", matrix_tile_origins=0)
+
+
+def test_compact_output(points, httpx_mock):
+    origins, dests = points
+    httpx_mock.add_callback(fake_matrix_api, is_reusable=True)
+    client = Geocodio(
+        "TEST_KEY",
+        hostname="api.test",
+        matrix_tile_origins=4,
+        matrix_tile_destinations=10,
+    )
+
+    compact = client.distance_matrix(
+        origins, dests, mode="driving", max_results=5, compact=True
+    )
+
+    assert isinstance(compact, CompactDistanceMatrix)
+    assert len(compact) == 7
+    assert compact.cell_count == 35
+    assert list(compact.offsets) == [0, 5, 10, 15, 20, 25, 30, 35]
+    assert compact.to_response().results[1].destinations == compact.row(1)
+    assert compact.row(0)[0].id == dests[compact.indexes[0]].id
+
+
+def test_compact_from_response_round_trip(points):
+    origins, dests = points
+    response = local_distance_matrix(origins, dests, max_results=4)
+
+    compact = CompactDistanceMatrix.from_response(response, dests)
+
+    assert compact.destinations == dests
+    assert all(math.isnan(d) for d in compact.durations)
+    assert compact.to_response() == response
+
+
+def test_compact_without_tiling(httpx_mock):
+    httpx_mock.add_callback(fake_matrix_api)
+    client = Geocodio("TEST_KEY", hostname="api.test")
+
+    compact = client.distance_matrix(
+        [(38.9, -77.0)], [(39.0, -77.0), (38.0, -77.0)], mode="driving", compact=True
+    )
+
+    assert list(compact.indexes) == [0, 1]
+    assert compact.durations[0] == int(compact.distances_km[0] * 40) % 997
+
+
+def test_async_tiled_matrix(points, httpx_mock):
+    origins, dests = points
+    httpx_mock.add_callback(fake_matrix_api, is_reusable=True)
+
+    async def run():
+        async with AsyncGeocodio(
+            "TEST_KEY",
+            hostname="api.test",
+            matrix_tile_origins=2,
+            matrix_tile_destinations=8,
+            batch_concurrency=3,
+        ) as client:
+            return await client.distance_matrix(
+                origins, dests, mode="driving", max_results=2
+            )
+
+    response = asyncio.run(run())
+    assert len(httpx_mock.get_requests()) == 4 * 3
+    assert all(len(r.destinations) == 2 for r in response.results)
+
+
+@pytest.mark.parametrize(
+    "tiles", [{}, {"matrix_tile_origins": 3, "matrix_tile_destinations": 5}]
+)
+@pytest.mark.parametrize("compact", [False, True])
+def test_matrix_reports_parse_time(points, httpx_mock, tiles, compact):
+    origins, dests = points
+    httpx_mock.add_callback(fake_matrix_api, is_reusable=True)
+    events = []
+    client = Geocodio(
+        "TEST_KEY",
+        hostname="api.test",
+        hooks=CallbackHooks(on_parse_complete=events.append),
+        **tiles,
+    )
+
+    response = client.distance_matrix(origins, dests, mode="driving", compact=compact)
+
+    [event] = events
+    assert event.endpoint.endswith("/distance-matrix")
+    assert event.lookups == len(origins) + len(dests)
+    assert event.result is response
+    assert event.timings["parse"] > 0
+
+
+def test_async_tiled_matrix_reports_parse_time(points, httpx_mock):
+    origins, dests = points
+    httpx_mock.add_callback(fake_matrix_api, is_reusable=True)
+    events = []
+
+    async def run():
+        async with AsyncGeocodio(
+            "TEST_KEY",
+            hostname="api.test",
+            matrix_tile_origins=2,
+            hooks=CallbackHooks(on_parse_complete=events.append),
+        ) as client:
+            return await client.distance_matrix(
+                origins, dests, mode="driving", compact=True
+            )
+
+    response = asyncio.run(run())
+    assert [event.result for event in events] == [response]
@@ -0,0 +1,170 @@
+"""
+Tests for the in-process metrics collector
+"""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, Geocodio, MemoryCache, MetricsCollector, RetryPolicy
+from geocodio.exceptions import AuthenticationError
+from geocodio.hooks import RequestEvent
+from geocodio.metrics import Histogram, endpoint_name
+
+
+def single_payload(address: str) -> dict:
+    return {
+        "input": {"formatted_address": address},
+        "results": [{
+            "address_components": {"city": "Arlington"},
+            "formatted_address": address,
+            "location": {"lat": 38.886672, "lng": -77.094735},
+            "accuracy": 1,
+            "accuracy_type": "rooftop",
+            "source": "Arlington",
+        }],
+    }
+
+
+def batch_payload(addresses) -> dict:
+    return {"results": [{"query": a, "response": single_payload(a)} for a in addresses]}
+
+
+def batch_api(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=batch_payload(json.loads(request.content)))
+
+
+def test_endpoint_name():
+    assert endpoint_name("/v1.11/geocode") == "geocode"
+    assert endpoint_name("/v1.11/lists/42/download") == "lists/{id}/download"
+    assert endpoint_name("/v1.11/distance-jobs/job_7f3a") == "distance-jobs/{id}"
+
+
+def test_histogram_percentiles():
+    histogram = Histogram([1, 2, 5, 10])
+    for value in range(1, 101):
+        histogram.record(value / 10)
+
+    assert histogram.count == 100
+    assert histogram.min == pytest.approx(0.1)
+    assert histogram.max == pytest.approx(10.0)
+    assert histogram.percentile(0.5) == pytest.approx(5.0)
+    assert 9.0 <= histogram.percentile(0.99) <= 10.0
+    assert Histogram([1]).percentile(0.5) is None
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 10, "2": 10, "5": 30, "10": 50, "+Inf": 0}
+    assert snapshot["p50"] == pytest.approx(5.0)
+
+
+def test_collects_requests_lookups_and_latency(httpx_mock):
+    httpx_mock.add_callback(batch_api, is_reusable=True)
+    client = Geocodio("TEST_KEY", hostname="api.test", batch_size=40)
+    metrics = MetricsCollector().attach(client)
+
+    client.geocode([f"{i} Main St" for i in range(100)])
+    client.geocode([f"{i} Oak St" for i in range(10)])
+
+    geocode = metrics.snapshot()["endpoints"]["geocode"]
+    assert geocode["requests"] == 4
+    assert geocode["status_codes"] == {"200": 4}
+    assert geocode["lookups_per_batch"]["count"] == 4
+    assert geocode["lookups_per_batch"]["sum"] == 110
+    assert geocode["lookups_per_batch"]["max"] == 40
+    assert geocode["latency"]["count"] == 4
+    assert geocode["latency"]["p50"] > 0
+    assert geocode["parse_time"]["count"] == 2
+    assert geocode["bytes_received"] > geocode["bytes_sent"] > 0
+    json.dumps(metrics.snapshot())
+
+
+def test_counts_errors_retries_and_cache_hits(httpx_mock, monkeypatch):
+    monkeypatch.setattr("geocodio.client.time.sleep", lambda seconds: None)
+    address = "1109 N Highland St, Arlington VA"
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(json=single_payload(address))
+    httpx_mock.add_response(status_code=403, json={"error": "Invalid API key"})
+    client = Geocodio("TEST_KEY", hostname="api.test", cache=MemoryCache(),
+                      retry=RetryPolicy(max_attempts=3, jitter=False))
+    metrics = MetricsCollector()
+    metrics.attach(client)
+    metrics.attach(client)
+
+    client.geocode(address)
+    client.geocode(address)
+    with pytest.raises(AuthenticationError):
+        client.reverse("38.886672,-77.094735")
+
+    snapshot = metrics.snapshot()
+    assert client.hooks == [metrics]
+    assert snapshot["endpoints"]["geocode"]["requests"] == 2
+    assert snapshot["endpoints"]["geocode"]["retries"] == 1
+    assert snapshot["endpoints"]["geocode"]["status_codes"] == {"200": 1, "503": 1}
+    assert snapshot["endpoints"]["reverse"]["errors"] == {"AuthenticationError": 1}
+    assert snapshot["totals"] == {
+        "requests": 3,
+        "retries": 1,
+        "errors": {"AuthenticationError": 1},
+    }
+    assert snapshot["cache"] == {
+        "hits": 1,
+        "misses": 2,
+        "hit_rate": pytest.approx(1 / 3),
+    }
+
+    metrics.reset()
+    assert metrics.snapshot()["endpoints"] == {}
+
+
+def test_transport_errors_are_counted(client, httpx_mock):
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"))
+    metrics = MetricsCollector().attach(client)
+
+    with pytest.raises(httpx.ReadTimeout):
+        client.geocode("1109 N Highland St, Arlington VA")
+
+    geocode = metrics.snapshot()["endpoints"]["geocode"]
+    assert geocode["errors"] == {"ReadTimeout": 1}
+    assert geocode["latency"]["count"] == 1
+    assert geocode["status_codes"] == {}
+
+
+def test_collector_is_thread_safe():
+    metrics = MetricsCollector()
+    event = RequestEvent(
+        "POST", "/v1.11/geocode", lookups=10, status_code=200, timings={"total": 0.02}
+    )
+
+    def work():
+        for _ in range(2000):
+            metrics.on_request(event)
+            metrics.on_response(event)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    geocode = metrics.snapshot()["endpoints"]["geocode"]
+    assert geocode["requests"] == 16000
+    assert geocode["latency"]["count"] == 16000
+    assert geocode["lookups_per_batch"]["sum"] == 160000
+
+
+def test_async_client(httpx_mock):
+    address = "1109 N Highland St, Arlington VA"
+    httpx_mock.add_response(json=single_payload(address))
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            metrics = MetricsCollector().attach(client)
+            await client.geocode(address)
+            return metrics.snapshot()
+
+    snapshot = asyncio.run(main())
+    assert snapshot["endpoints"]["geocode"]["requests"] == 1
+    assert snapshot["endpoints"]["geocode"]["lookups_per_batch"]["sum"] == 1
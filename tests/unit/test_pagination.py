@@ -0,0 +1,167 @@
+"""
+Tests for lazy pagination over lists and distance matrix jobs
+"""
+
+import asyncio
+import re
+import threading
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio
+from geocodio.exceptions import GeocodioServerError
+
+
+def paged_api(pages, per_page=3, kind="lists", fail_on=None):
+    """A fake paginated endpoint serving ``pages`` pages of ``per_page`` items."""
+    requested = []
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        requested.append(page)
+        if page == fail_on:
+            return httpx.Response(500, json={"error": "Server error"})
+        base = f"https://api.test/v1.9/{kind}"
+        if kind == "lists":
+            data = [
+                {"id": (page - 1) * per_page + i, "file": {}} for i in range(per_page)
+            ]
+        else:
+            data = [
+                {
+                    "id": (page - 1) * per_page + i,
+                    "identifier": "",
+                    "status": "COMPLETED",
+                    "name": f"job {i}",
+                    "created_at": "",
+                    "origins_count": 1,
+                    "destinations_count": 1,
+                    "total_calculations": 1,
+                    "progress": 100,
+                }
+                for i in range(per_page)
+            ]
+        return httpx.Response(200, json={
+            "current_page": page,
+            "data": data,
+            "from": (page - 1) * per_page + 1,
+            "to": page * per_page,
+            "path": base,
+            "per_page": per_page,
+            "first_page_url": f"{base}?page=1",
+            "next_page_url": f"{base}?page={page + 1}" if page < pages else None,
+            "prev_page_url": f"{base}?page={page - 1}" if page > 1 else None,
+        })
+
+    return callback, requested
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_lists_follows_every_page(client, httpx_mock, prefetch):
+    callback, requested = paged_api(pages=4)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    ids = [item.id for item in client.iter_lists(prefetch=prefetch)]
+
+    assert ids == list(range(12))
+    assert requested == [1, 2, 3, 4]
+
+
+def test_iter_lists_is_lazy_and_stops_early(client, httpx_mock):
+    callback, requested = paged_api(pages=100)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    items = client.iter_lists(prefetch=False)
+    assert requested == []
+    for item in items:
+        if item.id == 4:
+            break
+    items.close()
+
+    assert requested == [1, 2]
+
+
+def test_iter_lists_prefetches_one_page_ahead(client, httpx_mock):
+    callback, requested = paged_api(pages=100)
+    httpx_mock.add_callback(callback, is_reusable=True)
+    seen = []
+
+    for item in client.iter_lists():
+        seen.append(item.id)
+        if item.id == 0:
+            # The next page is being fetched while this one is consumed
+            while 2 not in requested:
+                threading.Event().wait(0.001)
+        if item.id == 4:
+            break
+
+    assert seen == [0, 1, 2, 3, 4]
+    # Page 3 may have been requested ahead, but nothing beyond it
+    assert sorted(requested) in ([1, 2], [1, 2, 3])
+
+
+def test_iter_lists_stops_on_last_or_empty_page(client, httpx_mock):
+    callback, requested = paged_api(pages=1)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    assert len(list(client.iter_lists())) == 3
+    assert requested == [1]
+
+
+def test_iter_lists_propagates_page_errors(client, httpx_mock):
+    callback, _ = paged_api(pages=5, fail_on=2)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    seen = []
+    with pytest.raises(GeocodioServerError):
+        for item in client.iter_lists():
+            seen.append(item.id)
+    assert seen == [0, 1, 2]
+
+
+def test_get_lists_page_parameter(client, httpx_mock):
+    callback, requested = paged_api(pages=3)
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    page = client.get_lists(page=2)
+
+    assert requested == [2]
+    assert page.current_page == 2
+    assert page.next_page_url.endswith("page=3")
+
+
+def test_iter_distance_jobs(client, httpx_mock):
+    callback, requested = paged_api(pages=2, kind="distance-jobs")
+    httpx_mock.add_callback(callback, is_reusable=True)
+
+    jobs = list(client.iter_distance_jobs())
+
+    assert [job.id for job in jobs] == list(range(6))
+    assert jobs[0].status == "COMPLETED"
+    assert requested == [1, 2]
+    assert all(r.url.path.endswith("/distance-jobs") for r in httpx_mock.get_requests())
+
+
+def test_async_iter_lists_and_distance_jobs(httpx_mock):
+    callback, requested = paged_api(pages=3)
+    httpx_mock.add_callback(callback, url=re.compile(r".*/lists.*"), is_reusable=True)
+    job_callback, _ = paged_api(pages=2, kind="distance-jobs")
+    httpx_mock.add_callback(
+        job_callback, url=re.compile(r".*/distance-jobs.*"), is_reusable=True
+    )
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            ids = [item.id async for item in client.iter_lists()]
+            jobs = [job.id async for job in client.iter_distance_jobs(prefetch=False)]
+            early = client.iter_lists(prefetch=False)
+            async for item in early:
+                break
+            await early.aclose()
+            return ids, jobs
+
+    ids, jobs = asyncio.run(main())
+    assert ids == list(range(9))
+    assert jobs == list(range(6))
+    assert requested == [1, 2, 3, 1]
@@ -0,0 +1,142 @@
+"""
+Tests for client-side rate limiting and 429 handling
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from geocodio import AsyncGeocodio, Geocodio, RateLimiter
+from geocodio.exceptions import GeocodioServerError, RateLimitError
+from geocodio.ratelimit import TokenBucket
+
+
+def single_payload(address: str) -> dict:
+    return {"input": {"formatted_address": address}, "results": []}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that advances when the limiter sleeps."""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr("geocodio.ratelimit.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("geocodio.ratelimit.time.sleep", sleep)
+    return sleeps
+
+
+def test_token_bucket_allows_burst_then_throttles(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_validates_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter()
+
+
+@pytest.mark.parametrize("limits", [
+    {"requests_per_second": 0},
+    {"lookups_per_second": 0},
+    {"requests_per_second": 10, "lookups_per_second": -1},
+])
+def test_rate_limiter_rejects_non_positive_rates(limits):
+    with pytest.raises(ValueError):
+        RateLimiter(**limits)
+
+
+def test_rate_limiter_none_means_unlimited(clock):
+    limiter = RateLimiter(requests_per_second=None, lookups_per_second=1)
+    assert limiter.requests is None
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+
+
+def test_batch_counts_as_many_lookups(clock):
+    limiter = RateLimiter(lookups_per_second=100)
+    assert limiter.acquire(lookups=100) == 0
+    assert limiter.acquire(lookups=50) == pytest.approx(0.5)
+    assert clock == [pytest.approx(0.5)]
+
+
+def test_requests_and_lookups_limits_combine(clock):
+    limiter = RateLimiter(requests_per_second=1, lookups_per_second=1000)
+    limiter.acquire(lookups=10)
+    assert limiter.acquire(lookups=10) == pytest.approx(1.0)
+
+
+def test_limiter_is_thread_safe():
+    bucket = TokenBucket(rate=1, capacity=1000)
+
+    def take():
+        for _ in range(100):
+            bucket.reserve()
+
+    threads = [threading.Thread(target=take) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bucket._tokens == pytest.approx(0, abs=0.1)
+
+
+def test_client_throttles_before_sending(clock, httpx_mock):
+    httpx_mock.add_response(json=single_payload("1 Main St"), is_reusable=True)
+    client = Geocodio(
+        "TEST_KEY", hostname="api.test", rate_limiter=RateLimiter(requests_per_second=1)
+    )
+
+    client.geocode("1 Main St")
+    client.geocode("1 Main St")
+
+    assert clock == [pytest.approx(1.0)]
+
+
+def test_client_counts_batch_lookups(httpx_mock, mocker):
+    httpx_mock.add_response(json={"results": []})
+    limiter = RateLimiter(lookups_per_second=1000)
+    spy = mocker.spy(limiter, "acquire")
+    client = Geocodio("TEST_KEY", hostname="api.test", rate_limiter=limiter)
+
+    client.geocode(["a", "b", "c"])
+
+    spy.assert_called_once_with(3)
+
+
+def test_async_client_awaits_limiter(httpx_mock, mocker):
+    httpx_mock.add_response(json=single_payload("1 Main St"))
+    limiter = RateLimiter(requests_per_second=10)
+    spy = mocker.spy(limiter, "acquire_async")
+
+    async def run():
+        async with AsyncGeocodio(
+            "TEST_KEY", hostname="api.test", rate_limiter=limiter
+        ) as client:
+            await client.geocode("1 Main St")
+
+    asyncio.run(run())
+    spy.assert_called_once_with(1)
+
+
+def test_429_raises_rate_limit_error(client, httpx_mock):
+    httpx_mock.add_response(
+        status_code=429, headers={"Retry-After": "12"}, text="Too many requests"
+    )
+
+    with pytest.raises(RateLimitError) as excinfo:
+        client.geocode("1 Main St")
+
+    assert excinfo.value.retry_after == 12.0
+    assert isinstance(excinfo.value, GeocodioServerError)
@@ -0,0 +1,185 @@
+"""
+Tests for retrying transient failures
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, Geocodio, RetryPolicy
+from geocodio.exceptions import GeocodioServerError, InvalidRequestError
+from geocodio.retry import parse_retry_after
+
+
+def single_payload(address: str) -> dict:
+    return {
+        "input": {"formatted_address": address},
+        "results": [{
+            "address_components": {"city": "Arlington"},
+            "formatted_address": address,
+            "location": {"lat": 38.886672, "lng": -77.094735},
+            "accuracy": 1,
+            "accuracy_type": "rooftop",
+            "source": "Arlington",
+        }],
+    }
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr("geocodio.client.time.sleep", delays.append)
+    return delays
+
+
+@pytest.fixture
+def retry_client():
+    return Geocodio(
+        "TEST_KEY", hostname="api.test", retry=RetryPolicy(max_attempts=3, jitter=False)
+    )
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_jitter_stays_within_backoff():
+    policy = RetryPolicy(backoff_factor=1.0, jitter=True)
+    for _ in range(50):
+        assert 0 <= policy.backoff(3) <= 4.0
+
+
+def test_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_retries_server_errors_then_succeeds(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=502)
+    httpx_mock.add_response(json=single_payload("1 Main St"))
+
+    response = retry_client.geocode("1 Main St")
+
+    assert response.results[0].formatted_address == "1 Main St"
+    assert len(httpx_mock.get_requests()) == 3
+    assert sleeps == [0.5, 1.0]
+    assert retry_client.retry_stats.retries == 2
+    assert retry_client.retry_stats.retried_requests == 1
+
+
+def test_gives_up_after_max_attempts(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=500, is_reusable=True)
+
+    with pytest.raises(GeocodioServerError):
+        retry_client.geocode("1 Main St")
+
+    assert len(httpx_mock.get_requests()) == 3
+    assert retry_client.retry_stats.exhausted == 1
+
+
+def test_non_retryable_failure_after_a_retry_is_not_exhausted(
+    retry_client, httpx_mock, sleeps
+):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=422, json={"error": "bad address"})
+
+    with pytest.raises(InvalidRequestError):
+        retry_client.geocode("1 Main St")
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert retry_client.retry_stats.retries == 1
+    assert retry_client.retry_stats.exhausted == 0
+
+
+def test_honors_retry_after(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "4"})
+    httpx_mock.add_response(json=single_payload("1 Main St"))
+
+    retry_client.geocode("1 Main St")
+
+    assert sleeps == [4.0]
+
+
+def test_retries_transport_errors(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_exception(httpx.ConnectTimeout("timed out"))
+    httpx_mock.add_response(json=single_payload("1 Main St"))
+
+    retry_client.geocode("1 Main St")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_batch_post_is_retried(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(json={"results": [
+        {"query": "1 Main St", "response": single_payload("1 Main St")},
+    ]})
+
+    response = retry_client.geocode(["1 Main St"])
+
+    assert len(response.results) == 1
+    assert [r.method for r in httpx_mock.get_requests()] == ["POST", "POST"]
+
+
+def test_client_errors_are_not_retried(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=422, text="bad input")
+
+    with pytest.raises(Exception):
+        retry_client.geocode("1 Main St")
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert retry_client.retry_stats.retries == 0
+
+
+def test_resource_creating_posts_are_not_retried(retry_client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=503)
+
+    with pytest.raises(GeocodioServerError):
+        retry_client.create_distance_matrix_job(
+            "job", origins=[(38.9, -77.0)], destinations=[(38.8, -77.1)]
+        )
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_retries_disabled_by_default(client, httpx_mock, sleeps):
+    httpx_mock.add_response(status_code=503)
+
+    with pytest.raises(GeocodioServerError):
+        client.geocode("1 Main St")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_async_client_retries(httpx_mock, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("geocodio.async_client.asyncio.sleep", fake_sleep)
+    httpx_mock.add_response(status_code=504)
+    httpx_mock.add_response(json=single_payload("1 Main St"))
+
+    async def run():
+        async with AsyncGeocodio(
+            "TEST_KEY", hostname="api.test", retry=RetryPolicy(jitter=False)
+        ) as client:
+            response = await client.geocode("1 Main St")
+            return client, response
+
+    client, response = asyncio.run(run())
+
+    assert response.results[0].formatted_address == "1 Main St"
+    assert delays == [0.5]
+    assert client.retry_stats.retries == 1
@@ -0,0 +1,124 @@
+"""
+Tests for DestinationIndex
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from geocodio import AsyncGeocodio, Coordinate, DestinationIndex, Geocodio
+from geocodio import spatial
+from geocodio.local_distance import local_distance
+
+
+@pytest.fixture(params=["kdtree", "scipy"])
+def backend(request, monkeypatch):
+    if request.param == "scipy":
+        pytest.importorskip("scipy")
+    else:
+        monkeypatch.setattr(spatial, "cKDTree", None)
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def stores():
+    rng = random.Random(42)
+    return [
+        Coordinate(rng.uniform(25, 49), rng.uniform(-124, -67), f"store_{n}")
+        for n in range(500)
+    ]
+
+
+ORIGINS = [
+    (38.8977, -77.0365),
+    (34.0522, -118.2437),
+    (47.6062, -122.3321),
+    (25.7617, -80.1918),
+]
+
+
+def test_nearest_matches_brute_force(backend, stores):
+    index = DestinationIndex(stores)
+    for origin in ORIGINS:
+        expected = local_distance(
+            Coordinate(*origin), stores, max_results=5
+        ).destinations
+        result = index.nearest(origin, k=5)
+        assert [d.id for d in result] == [d.id for d in expected]
+        assert [d.distance_km for d in result] == pytest.approx(
+            [d.distance_km for d in expected]
+        )
+
+
+def test_nearest_respects_max_distance(backend, stores):
+    index = DestinationIndex(stores)
+    result = index.nearest(ORIGINS[0], k=50, max_distance=150, units="km")
+    expected = local_distance(
+        Coordinate(*ORIGINS[0]), stores, units="km", max_distance=150, max_results=50
+    )
+    assert [d.id for d in result] == [d.id for d in expected.destinations]
+    assert all(d.distance_km <= 150 for d in result)
+
+
+def test_within_matches_brute_force(backend, stores):
+    index = DestinationIndex(stores)
+    for origin in ORIGINS:
+        expected = local_distance(
+            Coordinate(*origin), stores, max_distance=200
+        ).destinations
+        assert [d.id for d in index.within(origin, radius=200)] == [
+            d.id for d in expected
+        ]
+    assert len(index.within(ORIGINS[0], radius=200, max_results=2)) == min(
+        2, len(expected)
+    )
+
+
+def test_batched_queries(backend, stores):
+    index = DestinationIndex(stores)
+    batches = index.nearest_many(ORIGINS, k=3)
+    assert len(batches) == len(ORIGINS)
+    for origin, batch in zip(ORIGINS, batches):
+        assert batch == index.nearest(origin, k=3)
+    assert index.within_many(ORIGINS, radius=100) == [
+        index.within(o, radius=100) for o in ORIGINS
+    ]
+
+
+def test_k_larger_than_index_and_empty_index(backend):
+    index = DestinationIndex([(38.9, -77.0, "a"), "39.0,-77.1,b"])
+    assert [d.id for d in index.nearest((38.9, -77.0), k=10)] == ["a", "b"]
+    assert DestinationIndex([]).nearest((38.9, -77.0), k=3) == []
+    assert DestinationIndex([]).within((38.9, -77.0), radius=10) == []
+
+
+def test_invalid_units(stores):
+    with pytest.raises(ValueError):
+        DestinationIndex(stores).nearest((38.9, -77.0), max_distance=1, units="leagues")
+
+
+def test_driving_forwards_only_shortlisted_candidates(stores, mocker):
+    client = Geocodio("TEST_KEY", hostname="api.test")
+    distance = mocker.patch.object(client, "distance")
+    index = DestinationIndex(stores)
+
+    index.driving(client, ORIGINS[0], candidates=4, max_results=2)
+
+    args, kwargs = distance.call_args
+    assert args[0] == ORIGINS[0]
+    assert args[1] == index.shortlist(ORIGINS[0], 4)
+    assert len(args[1]) == 4
+    assert kwargs == {"mode": "driving", "max_results": 2}
+
+
+def test_driving_with_async_client(stores, httpx_mock):
+    httpx_mock.add_response(json={"origin": {}, "mode": "driving", "destinations": []})
+    index = DestinationIndex(stores)
+
+    async def run():
+        async with AsyncGeocodio("TEST_KEY", hostname="api.test") as client:
+            return await index.driving(client, ORIGINS[0], candidates=3)
+
+    assert asyncio.run(run()).mode == "driving"
+    assert len(httpx_mock.get_requests()[0].url.params.get_list("destinations[]")) == 3
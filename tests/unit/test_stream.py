@@ -0,0 +1,205 @@
+"""
+Tests for streaming batch geocoding
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio, Geocodio
+
+
+def batch_response(request) -> httpx.Response:
+    body = json.loads(request.content)
+    return httpx.Response(200, json={"results": [
+        {"query": q, "response": {"results": [] if q == "nowhere" else [{
+            "address_components": {},
+            "formatted_address": f"{q} (geocoded)",
+            "location": {"lat": 1.0, "lng": 2.0},
+        }]}}
+        for q in body
+    ]})
+
+
+@pytest.fixture
+def stream_client():
+    return Geocodio("TEST_KEY", hostname="api.test")
+
+
+def test_geocode_stream_yields_indexed_items_in_order(stream_client, httpx_mock):
+    httpx_mock.add_callback(
+        batch_response,
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        is_reusable=True,
+    )
+
+    addresses = (f"address {i}" for i in range(10))
+    pairs = list(stream_client.geocode_stream(addresses, chunk_size=3, concurrency=2))
+
+    assert [index for index, _ in pairs] == list(range(10))
+    assert pairs[7][1].query == "address 7"
+    assert pairs[7][1].best.formatted_address == "address 7 (geocoded)"
+    assert len(httpx_mock.get_requests()) == 4
+
+
+def test_geocode_stream_reports_empty_results(stream_client, httpx_mock):
+    httpx_mock.add_callback(
+        batch_response,
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        is_reusable=True,
+    )
+
+    pairs = dict(stream_client.geocode_stream(["a", "nowhere", "b"], chunk_size=2))
+
+    assert pairs[1].is_empty
+    assert not pairs[2].is_empty
+
+
+def test_geocode_stream_unordered_returns_every_item(stream_client, httpx_mock):
+    def slow_first_chunk(request):
+        if json.loads(request.content)[0] == "a0":
+            time.sleep(0.2)
+        return batch_response(request)
+
+    httpx_mock.add_callback(
+        slow_first_chunk,
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        is_reusable=True,
+    )
+
+    pairs = list(
+        stream_client.geocode_stream(
+            [f"a{i}" for i in range(4)], chunk_size=2, concurrency=2, ordered=False
+        )
+    )
+
+    assert [index for index, _ in pairs] == [2, 3, 0, 1]
+
+
+def test_geocode_stream_pulls_input_lazily(stream_client, httpx_mock):
+    httpx_mock.add_callback(
+        batch_response,
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        is_reusable=True,
+    )
+    pulled = []
+
+    def source():
+        for i in range(1000):
+            pulled.append(i)
+            yield f"address {i}"
+
+    stream = stream_client.geocode_stream(source(), chunk_size=10, concurrency=2)
+    next(stream)
+    stream.close()
+
+    # Only the chunks in flight (plus the one being read) were consumed
+    assert len(pulled) <= 30
+
+
+def test_geocode_stream_bounds_requests_in_flight(stream_client, httpx_mock):
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def callback(request):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        return batch_response(request)
+
+    httpx_mock.add_callback(
+        callback, url=httpx.URL("https://api.test/v1.11/geocode"), is_reusable=True
+    )
+
+    list(
+        stream_client.geocode_stream(
+            (str(i) for i in range(40)), chunk_size=2, concurrency=3
+        )
+    )
+
+    assert max(peak) <= 3
+
+
+def test_reverse_stream_forwards_options(stream_client, httpx_mock):
+    def callback(request):
+        assert request.url.params["fields"] == "timezone"
+        return batch_response(request)
+
+    httpx_mock.add_callback(
+        callback,
+        url=httpx.URL("https://api.test/v1.11/reverse", params={"fields": "timezone"}),
+    )
+
+    pairs = list(stream_client.reverse_stream([(1.0, 2.0)], fields=["timezone"]))
+
+    assert pairs[0][1].query == "1.0,2.0"
+
+
+def test_geocode_stream_rejects_bad_settings(stream_client):
+    with pytest.raises(ValueError):
+        stream_client.geocode_stream(["a"], chunk_size=0)
+
+
+def test_async_geocode_stream_accepts_async_iterables(httpx_mock):
+    httpx_mock.add_callback(
+        batch_response,
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        is_reusable=True,
+    )
+
+    async def source():
+        for i in range(5):
+            yield f"address {i}"
+
+    async def run():
+        async with AsyncGeocodio("TEST_KEY", hostname="api.test") as client:
+            return [
+                pair
+                async for pair in client.geocode_stream(
+                    source(), chunk_size=2, concurrency=2
+                )
+            ]
+
+    pairs = asyncio.run(run())
+    assert [index for index, _ in pairs] == [0, 1, 2, 3, 4]
+    assert pairs[4][1].query == "address 4"
+
+
+def test_async_geocode_stream_waits_for_cancelled_requests(httpx_mock):
+    cancelled = []
+
+    async def slow_after_first(request):
+        if json.loads(request.content) != ["address 0"]:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+        return batch_response(request)
+
+    httpx_mock.add_callback(
+        slow_after_first,
+        url=httpx.URL("https://api.test/v1.11/geocode"),
+        is_reusable=True,
+    )
+
+    async def run():
+        async with AsyncGeocodio("TEST_KEY", hostname="api.test") as client:
+            stream = client.geocode_stream(
+                [f"address {i}" for i in range(4)], chunk_size=1, concurrency=3
+            )
+            first = await anext(stream)
+            await stream.aclose()
+            return first, len(cancelled)
+
+    first, cancelled_on_close = asyncio.run(run())
+    assert first[0] == 0
+    assert cancelled_on_close == 2
@@ -0,0 +1,372 @@
+"""
+Tests for typed msgspec decoding
+"""
+
+import asyncio
+import dataclasses
+import json
+
+import httpx
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from geocodio import AsyncGeocodio, CallbackHooks, Geocodio  # noqa: E402
+from geocodio import models, typed  # noqa: E402
+from geocodio.cache import MemoryCache  # noqa: E402
+from geocodio.matrix import CompactDistanceMatrix  # noqa: E402
+from geocodio.models import DistanceMatrixResponse, DistanceResponse  # noqa: E402
+
+
+def rich_result(n: int) -> dict:
+    return {
+        "address_components": {
+            "number": str(n),
+            "street": "Main",
+            "suffix": "St",
+            "city": "Springfield",
+            "state": "IL",
+            "zip": "62701",
+            "country": "US",
+            "unknown": 1,
+        },
+        "formatted_address": f"{n} Main St, Springfield, IL",
+        "location": {"lat": 39.78 + n, "lng": -89.64},
+        "accuracy": 1,
+        "accuracy_type": "rooftop",
+        "source": "Sangamon",
+        "fields": {
+            "timezone": {
+                "name": "America/Chicago",
+                "utc_offset": -6,
+                "observes_dst": True,
+            },
+            "cd": [
+                {
+                    "name": "Illinois's 13th congressional district",
+                    "district_number": 13,
+                    "congress_number": "119th",
+                    "current_legislators": [],
+                }
+            ],
+            "stateleg": {
+                "house": [{"name": "House District 96", "district_number": "96"}],
+                "senate": [
+                    {
+                        "name": "Senate District 48",
+                        "district_number": "48",
+                        "chamber": "upper",
+                    }
+                ],
+            },
+            "school_districts": {
+                "unified": {
+                    "name": "Springfield School District 186",
+                    "lea_code": "37320",
+                }
+            },
+            "census": {
+                "2020": {
+                    "census_year": 2020,
+                    "tract_code": "000100",
+                    "block_code": "1000",
+                }
+            },
+            "census2010": {"census_year": 2010, "tract": "000200"},
+            "acs": {
+                "demographics": {
+                    "total_population": {"value": 1200, "margin_of_error": 50}
+                },
+                "economics": {"median_household_income": 55000},
+            },
+            "acs-housing": {"median_rent": 900},
+            "unknown_field": {"a": 1},
+        },
+    }
+
+
+def batch_payload(count: int) -> dict:
+    return {
+        "results": [
+            {"query": str(i), "response": {"input": {}, "results": [rich_result(i)]}}
+            for i in range(count)
+        ]
+    }
+
+
+def assert_same(struct, model):
+    """
+    A typed struct has the same public attribute values as its dataclass counterpart.
+    """
+    if isinstance(struct, list):
+        assert len(struct) == len(model)
+        for s, m in zip(struct, model):
+            assert_same(s, m)
+    elif isinstance(struct, msgspec.Struct):
+        for name in struct.__struct_fields__:
+            if name not in ("extras", "_census"):
+                assert_same(getattr(struct, name), getattr(model, name))
+    else:
+        assert struct == model
+
+
+@pytest.fixture
+def typed_client():
+    return Geocodio("TEST_KEY", hostname="api.test", typed_decoding=True)
+
+
+def test_typed_results_match_models(typed_client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(3), is_reusable=True)
+    eager = Geocodio("TEST_KEY", hostname="api.test").geocode(["0", "1", "2"])
+
+    response = typed_client.geocode(["0", "1", "2"])
+
+    assert isinstance(response, typed.BatchGeocodingResponse)
+    assert len(response.items) == 3 and response.empty_items == []
+    assert_same(response.items, eager.items)
+    assert_same(response.results, eager.results)
+    fields = response.results[0].fields
+    assert isinstance(fields, typed.GeocodioFields)
+    assert fields.census2020.tract == "000100"
+    assert fields.census2010 == typed.CensusData(census_year=2010, tract="000200")
+    assert fields.census2031 is None
+    assert fields.unknown_field == {"a": 1}
+    assert [d.chamber for d in fields.state_legislative_districts] == ["house", "upper"]
+    assert fields.demographics.total_population == {
+        "value": 1200,
+        "margin_of_error": 50,
+    }
+    assert fields.housing.median_rent == 900
+    assert response.items[0].best is response.results[0]
+    # Documented incompatibilities with the dataclass models
+    assert not isinstance(response.results[0], models.GeocodingResult)
+    assert not hasattr(response.results[0].address_components, "extras")
+    with pytest.raises(AttributeError):
+        fields.nonexistent
+
+
+def test_keyed_batch_and_errors(typed_client, httpx_mock):
+    httpx_mock.add_response(
+        json={
+            "results": {
+                "home": {
+                    "query": "1 Main St",
+                    "response": {"input": {}, "results": [rich_result(1)]},
+                },
+                "work": {
+                    "query": "???",
+                    "response": {"error": "Could not geocode address"},
+                },
+            }
+        }
+    )
+
+    response = typed_client.geocode(
+        {"home": {"street": "1 Main St"}, "work": {"street": "???"}}
+    )
+
+    assert [item.key for item in response.items] == ["home", "work"]
+    assert response.items[1].error == "Could not geocode address"
+    assert response.items[1].is_empty
+    assert response.empty_items == [response.items[1]]
+    assert response.results[1] is None
+
+
+def test_single_lookup_and_empty_fields(typed_client, httpx_mock):
+    result = {**rich_result(0), "fields": {}}
+    httpx_mock.add_response(
+        json={"input": {"formatted_address": "0 Main St"}, "results": [result]}
+    )
+
+    response = typed_client.reverse((39.78, -89.64))
+
+    assert isinstance(response, typed.GeocodingResponse)
+    assert response.input == {"formatted_address": "0 Main St"}
+    assert response.results[0].location == typed.Location(39.78, -89.64)
+    assert response.results[0].accuracy == 1.0
+    assert response.results[0].fields is None
+
+
+def test_chunked_and_cached_payloads_are_converted(httpx_mock):
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(200, json=batch_payload(2)), is_reusable=True
+    )
+    client = Geocodio(
+        "TEST_KEY",
+        hostname="api.test",
+        typed_decoding=True,
+        batch_size=2,
+        cache=MemoryCache(),
+    )
+
+    first = client.geocode(["0", "1", "2", "3"])
+    second = client.geocode(["0", "1", "2", "3"])
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert [item.query for item in first.items] == ["0", "1", "2", "3"]
+    assert second == first
+    assert isinstance(second.results[0], typed.GeocodingResult)
+
+
+def test_stream_yields_typed_items(typed_client, httpx_mock):
+    httpx_mock.add_response(json=batch_payload(2), is_reusable=True)
+
+    pairs = list(typed_client.geocode_stream(["a", "b", "c", "d"], chunk_size=2))
+
+    assert [index for index, _ in pairs] == [0, 1, 2, 3]
+    assert all(isinstance(item, typed.BatchGeocodingItem) for _, item in pairs)
+
+
+def test_parse_hook_covers_typed_decoding(httpx_mock):
+    httpx_mock.add_response(json=batch_payload(2))
+    events = []
+    client = Geocodio("TEST_KEY", hostname="api.test", typed_decoding=True,
+                      hooks=CallbackHooks(on_parse_complete=events.append))
+
+    response = client.geocode(["0", "1"])
+
+    assert events[0].result is response
+    assert events[0].lookups == 2
+
+
+DISTANCE = {
+    "origin": {
+        "query": "38.8977,-77.0365",
+        "location": [38.8977, -77.0365],
+        "id": "white_house",
+    },
+    "mode": "driving",
+    "destinations": [
+        {
+            "query": "38.8895,-77.0353",
+            "location": {"lat": 38.8895, "lng": -77.0353},
+            "id": "monument",
+            "distance_miles": 0.6,
+            "distance_km": 1.0,
+            "duration_seconds": 120,
+            "extra": True,
+        },
+        {
+            "query": "39.2904,-76.6122",
+            "location": [39.2904, -76.6122],
+            "distance_miles": 38.2,
+            "distance_km": 61.5,
+        },
+    ],
+}
+
+
+def test_distance_responses(typed_client, httpx_mock):
+    matrix = {
+        "mode": "driving",
+        "results": [
+            {"origin": DISTANCE["origin"], "destinations": DISTANCE["destinations"]}
+        ],
+    }
+    httpx_mock.add_response(json=DISTANCE)
+    httpx_mock.add_response(json=matrix, is_reusable=True)
+
+    single = typed_client.distance(
+        (38.8977, -77.0365), [(38.8895, -77.0353), (39.2904, -76.6122)]
+    )
+    full = typed_client.distance_matrix(
+        [(38.8977, -77.0365)], [(38.8895, -77.0353), (39.2904, -76.6122)]
+    )
+    compact = typed_client.distance_matrix(
+        [(38.8977, -77.0365)], [(38.8895, -77.0353), (39.2904, -76.6122)], compact=True
+    )
+
+    assert isinstance(single, typed.DistanceResponse)
+    assert_same(single, DistanceResponse.from_api(DISTANCE))
+    assert single.destinations[0].location == (38.8895, -77.0353)
+    assert isinstance(full, typed.DistanceMatrixResponse)
+    assert_same(full, DistanceMatrixResponse.from_api(matrix))
+    assert isinstance(compact, CompactDistanceMatrix)
+    assert compact.to_response().results[0].destinations[1].distance_km == 61.5
+
+
+def test_tiled_matrix_is_typed(httpx_mock):
+    def api(request):
+        body = json.loads(request.content)
+        results = []
+        for o in body["origins"]:
+            destinations = sorted(
+                (
+                    {
+                        "query": f"{d['lat']},{d['lng']}",
+                        "location": [d["lat"], d["lng"]],
+                        "id": d.get("id"),
+                        "distance_miles": abs(o["lat"] - d["lat"]),
+                        "distance_km": abs(o["lat"] - d["lat"]) * 1.6,
+                    }
+                    for d in body["destinations"]
+                ),
+                key=lambda d: d["distance_miles"],
+            )
+            results.append(
+                {
+                    "origin": {
+                        "query": f"{o['lat']},{o['lng']}",
+                        "location": [o["lat"], o["lng"]],
+                        "id": o.get("id"),
+                    },
+                    "destinations": destinations[: body.get("max_results")],
+                }
+            )
+        return httpx.Response(200, json={"mode": "driving", "results": results})
+
+    httpx_mock.add_callback(api, is_reusable=True)
+    origins = [(38.0 + i, -77.0) for i in range(3)]
+    destinations = [(39.0 + i / 10, -76.0) for i in range(5)]
+    untiled = Geocodio("TEST_KEY", hostname="api.test", typed_decoding=True)
+    tiled = Geocodio("TEST_KEY", hostname="api.test", typed_decoding=True,
+                     matrix_tile_origins=2, matrix_tile_destinations=2)
+
+    expected = untiled.distance_matrix(
+        origins, destinations, mode="driving", max_results=3
+    )
+    response = tiled.distance_matrix(
+        origins, destinations, mode="driving", max_results=3
+    )
+
+    assert len(httpx_mock.get_requests()) == 1 + 2 * 3
+    assert isinstance(response, typed.DistanceMatrixResponse)
+    assert [[d.query for d in r.destinations] for r in response.results] == \
+        [[d.query for d in r.destinations] for r in expected.results]
+
+
+def test_invalid_payloads_raise_value_error():
+    decoder = typed.TypedDecoder()
+    with pytest.raises(ValueError):
+        decoder.geocoding(b'{"results": [')
+    with pytest.raises(ValueError):
+        decoder.geocoding(b'{"results": [{"formatted_address": 1}]}')
+    with pytest.raises(ValueError):
+        decoder.distance({"origin": {"location": "nowhere"}})
+
+
+def test_typed_decoding_options():
+    with pytest.raises(ValueError, match="cannot be combined"):
+        Geocodio("TEST_KEY", typed_decoding=True, lazy_parsing=True)
+    assert Geocodio("TEST_KEY").typed_decoding is False
+
+
+def test_models_are_immutable():
+    location = typed.Location(1.0, 2.0)
+    with pytest.raises(AttributeError):
+        location.lat = 3.0
+    assert not dataclasses.is_dataclass(location)
+
+
+def test_async_client_typed_decoding(httpx_mock):
+    httpx_mock.add_response(json=batch_payload(2))
+
+    async def main():
+        async with AsyncGeocodio(
+            api_key="TEST_KEY", hostname="api.test", typed_decoding=True
+        ) as client:
+            return await client.geocode(["0", "1"])
+
+    response = asyncio.run(main())
+    assert isinstance(response, typed.BatchGeocodingResponse)
+    assert response.results[1].fields.timezone.name == "America/Chicago"
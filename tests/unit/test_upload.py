@@ -0,0 +1,171 @@
+"""
+Tests for streaming list uploads
+"""
+
+import asyncio
+import gzip
+import io
+import re
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from geocodio import AsyncGeocodio
+from geocodio.upload import MultipartUpload, iter_csv_rows
+
+CSV = b"address\n" + b"".join(b"%d Main St, Springfield IL\n" % i for i in range(2000))
+
+
+def list_api(captured):
+    def callback(request: httpx.Request) -> httpx.Response:
+        boundary = re.search(r"boundary=(\S+)", request.headers["content-type"]).group(
+            1
+        )
+        body = request.read()
+        head, _, rest = body.partition(b"\r\n\r\n")
+        captured["head"] = head.decode()
+        captured["content"] = rest[:rest.rindex(f"\r\n--{boundary}--".encode())]
+        captured["params"] = dict(request.url.params)
+        return httpx.Response(
+            200,
+            json={
+                "id": 11,
+                "file": {"filename": "file.csv"},
+                "status": {"state": "QUEUED"},
+            },
+        )
+
+    return callback
+
+
+def test_create_list_from_path_streams_file(client, httpx_mock, tmp_path, mocker):
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(CSV)
+    captured = {}
+    httpx_mock.add_callback(list_api(captured))
+    reads = mocker.spy(MultipartUpload, "iter_bytes")
+
+    response = client.create_list(path, fields=["timezone"])
+
+    assert response.id == 11
+    assert reads.call_count == 1
+    assert captured["content"] == CSV
+    assert 'filename="addresses.csv"' in captured["head"]
+    assert "Content-Type: text/csv" in captured["head"]
+    assert captured["params"]["fields"] == "timezone"
+    assert "content-length" not in httpx_mock.get_requests()[0].headers
+
+
+def test_create_list_from_binary_file_object(client, httpx_mock):
+    captured = {}
+    httpx_mock.add_callback(list_api(captured))
+
+    client.create_list(io.BytesIO(CSV), filename="upload.csv")
+
+    assert captured["content"] == CSV
+    assert 'filename="upload.csv"' in captured["head"]
+
+
+def test_create_list_from_row_iterator(client, httpx_mock):
+    captured = {}
+    httpx_mock.add_callback(list_api(captured))
+    rows = iter(
+        [
+            ["address", "zip"],
+            ["1109 N Highland St, Arlington", "22201"],
+            ['Suite "B", 1 Main St', ""],
+        ]
+    )
+
+    client.create_list(rows)
+
+    assert captured["content"] == (
+        b'address,zip\n"1109 N Highland St, Arlington",22201\n'
+        b'"Suite ""B"", 1 Main St",\n'
+    )
+    assert 'filename="file.csv"' in captured["head"]
+
+
+def test_create_list_compressed(client, httpx_mock, tmp_path):
+    path = tmp_path / "addresses.csv"
+    path.write_bytes(CSV)
+    captured = {}
+    httpx_mock.add_callback(list_api(captured))
+
+    client.create_list(path, compress=True)
+
+    assert gzip.decompress(captured["content"]) == CSV
+    assert len(captured["content"]) < len(CSV) / 4
+    assert 'filename="addresses.csv.gz"' in captured["head"]
+    assert "Content-Type: application/gzip" in captured["head"]
+
+
+def test_create_list_string_content_is_unchanged(client, httpx_mock):
+    captured = {}
+    httpx_mock.add_callback(list_api(captured))
+
+    client.create_list("address\n1 Main St\n", filename="small.csv")
+
+    assert captured["content"] == b"address\n1 Main St\n"
+    assert 'filename="small.csv"' in captured["head"]
+
+
+def test_create_list_requires_data(client):
+    with pytest.raises(ValueError):
+        client.create_list()
+    with pytest.raises(ValueError):
+        client.create_list("")
+
+
+def test_upload_body_is_generated_in_bounded_chunks():
+    rows = ([f"{i} Main St, Springfield IL"] for i in range(200_000))
+    upload = MultipartUpload(rows, chunk_size=16 * 1024)
+
+    sizes = [len(chunk) for chunk in upload.iter_bytes()]
+
+    assert len(sizes) > 100
+    assert max(sizes) < 16 * 1024 + 100
+
+
+def test_iter_csv_rows_single_column_strings():
+    assert b"".join(iter_csv_rows(["a", "b, c"])) == b'a\n"b, c"\n'
+
+
+def test_async_create_list_streams(httpx_mock, tmp_path):
+    path = Path(tmp_path / "addresses.csv")
+    path.write_bytes(CSV)
+    captured = {}
+    httpx_mock.add_callback(list_api(captured))
+
+    async def main():
+        async with AsyncGeocodio(api_key="TEST_KEY", hostname="api.test") as client:
+            return await client.create_list(path, compress=True)
+
+    assert asyncio.run(main()).id == 11
+    assert gzip.decompress(captured["content"]) == CSV
+
+
+def test_async_upload_body_is_read_off_the_event_loop():
+    threads = set()
+
+    def rows():
+        for i in range(5000):
+            threads.add(threading.get_ident())
+            yield [f"{i} Main St"]
+
+    upload = MultipartUpload(rows(), chunk_size=16 * 1024, compress=True)
+
+    async def main():
+        return (
+            b"".join([chunk async for chunk in upload.aiter_bytes()]),
+            threading.get_ident(),
+        )
+
+    body, loop_thread = asyncio.run(main())
+    assert threads and loop_thread not in threads
+    content = body.partition(b"\r\n\r\n")[2].rpartition(b"\r\n--")[0]
+    assert gzip.decompress(content) == b"".join(
+        b"%d Main St\n" % i for i in range(5000)
+    )